@@ -0,0 +1,54 @@
+"""Benchmark parallel vs batched review scoring on a fixed corpus.
+
+Reviews each draft with one LLM call per dimension and with all dimensions
+in one call, then reports per-dimension score deltas, verdict agreement,
+LLM calls and latency. Thin wrapper over second_brain.review_benchmark;
+nothing is written to review history.
+
+Usage:
+    python scripts/benchmark_review_modes.py [--corpus drafts.json] [--json]
+"""
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import sys
+
+from second_brain.deps import create_deps
+from second_brain.models import get_agent_model
+from second_brain.review_benchmark import (
+    BENCHMARK_CORPUS,
+    compare_review_modes,
+    format_report,
+    load_corpus,
+    summarize,
+)
+
+if sys.platform == "win32" and sys.stdout.encoding != "utf-8":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
+
+async def main(corpus_path: str | None, as_json: bool):
+    deps = create_deps()
+    model = get_agent_model("review", deps.config)
+    corpus = load_corpus(corpus_path) if corpus_path else BENCHMARK_CORPUS
+    comparisons = await compare_review_modes(deps, model, corpus)
+    summary = summarize(comparisons)
+    if as_json:
+        print(json.dumps({
+            "samples": [dataclasses.asdict(c) for c in comparisons],
+            "summary": summary,
+        }, indent=2))
+    else:
+        print(format_report(comparisons, summary))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help='JSON list of {"content", "content_type"} drafts')
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON")
+    args = parser.parse_args()
+    asyncio.run(main(args.corpus, args.json))
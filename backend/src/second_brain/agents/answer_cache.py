@@ -0,0 +1,166 @@
+"""Semantic answer cache for the ask agent.
+
+Users ask /api/ask and the MCP `ask` tool the same question in slightly
+different wording many times a day, and every one is a full agent run. The
+question is embedded with the brain's EmbeddingService and matched by
+cosine similarity against recent answers:
+
+    lookup = await lookup_answer(deps, question)
+    if lookup and lookup.answer:
+        return lookup.answer            # served with lookup.age_seconds
+    result = await ask_agent.run(question, deps=deps, model=model)
+    store_answer(deps, lookup, result.output)
+
+Answers are tied to the brain write generation they were computed at
+(services.write_generation): any learn, memory, pattern, example or
+knowledge write in this process makes every cached answer stale. Entries
+also expire after ANSWER_CACHE_TTL_SECONDS, which bounds staleness from
+writes made by other processes. Hit rate: answer_cache_stats(), served on
+GET /api/health/runtime.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from second_brain.deps import BrainDeps
+from second_brain.schemas import AskResult
+from second_brain.services.write_generation import write_generation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    question: str
+    vector: list[float]  # unit length, so cosine similarity is a dot product
+    answer: AskResult
+    generation: int
+    stored_at: float
+
+
+@dataclass
+class AnswerLookup:
+    """One cache lookup; pass it back to store_answer() after a miss."""
+
+    question: str
+    vector: list[float]
+    generation: int
+    answer: AskResult | None = None
+    age_seconds: float = 0.0
+    similarity: float = 0.0
+
+    def response_fields(self) -> dict:
+        """Fields marking an API response as served from the cache."""
+        if self.answer is None:
+            return {}
+        return {"cached": True, "cache_age_seconds": round(self.age_seconds, 1)}
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else []
+
+
+_lock = threading.Lock()
+_entries: list[_Entry] = []
+_stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0, "errors": 0}
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def _enabled(deps: BrainDeps) -> bool:
+    return deps.config.answer_cache_enabled and deps.embedding_service is not None
+
+
+async def lookup_answer(deps: BrainDeps, question: str) -> AnswerLookup | None:
+    """The closest cached answer above the similarity threshold, if any.
+
+    None when the cache is disabled or the question could not be embedded;
+    otherwise a lookup whose `answer` is set on a hit.
+    """
+    if not _enabled(deps):
+        return None
+    try:
+        async with asyncio.timeout(deps.config.service_timeout_seconds):
+            vector = _normalize(await deps.embedding_service.embed_query(question))
+    except Exception as e:
+        _count("errors")
+        logger.warning("Answer cache embedding failed: %s", type(e).__name__)
+        logger.debug("Answer cache error detail: %s", e)
+        return None
+    if not vector:
+        return None
+
+    generation = write_generation()
+    lookup = AnswerLookup(question=question, vector=vector, generation=generation)
+    now = time.monotonic()
+    ttl = deps.config.answer_cache_ttl_seconds
+    best: _Entry | None = None
+    with _lock:
+        fresh = [e for e in _entries if e.generation == generation and now - e.stored_at < ttl]
+        if len(fresh) < len(_entries):
+            _stats["invalidations"] += len(_entries) - len(fresh)
+            _entries[:] = fresh
+        for entry in fresh:
+            if len(entry.vector) != len(vector):
+                continue
+            similarity = sum(a * b for a, b in zip(entry.vector, vector))
+            if similarity > lookup.similarity:
+                best, lookup.similarity = entry, similarity
+        hit = best is not None and lookup.similarity >= deps.config.answer_cache_similarity
+        _stats["hits" if hit else "misses"] += 1
+    if hit:
+        lookup.answer = best.answer.model_copy(deep=True)
+        lookup.age_seconds = now - best.stored_at
+        logger.debug(
+            "Answer cache hit (%.3f) for %r: cached for %r", lookup.similarity, question, best.question,
+        )
+    return lookup
+
+
+def store_answer(deps: BrainDeps, lookup: AnswerLookup | None, answer: AskResult) -> None:
+    """Cache a freshly computed answer; skipped for errors and small talk.
+
+    Dropped when the brain changed while the answer was being computed.
+    """
+    if lookup is None or lookup.answer is not None:
+        return
+    if answer.error or answer.is_conversational or lookup.generation != write_generation():
+        return
+    entry = _Entry(
+        question=lookup.question,
+        vector=lookup.vector,
+        answer=answer.model_copy(deep=True),
+        generation=lookup.generation,
+        stored_at=time.monotonic(),
+    )
+    with _lock:
+        _entries.append(entry)
+        overflow = len(_entries) - deps.config.answer_cache_max_entries
+        if overflow > 0:
+            del _entries[:overflow]
+        _stats["stores"] += 1
+
+
+def answer_cache_stats() -> dict:
+    with _lock:
+        stats = dict(_stats)
+        stats["entries"] = len(_entries)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def clear_answer_cache() -> None:
+    """Drop all cached answers and counters (tests)."""
+    with _lock:
+        _entries.clear()
+        for key in _stats:
+            _stats[key] = 0
@@ -4,6 +4,7 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import (
     all_tools_failed,
     format_memories,
@@ -94,6 +95,7 @@ async def validate_ask(ctx: RunContext[BrainDeps], output: AskResult) -> AskResu
 
 
 @ask_agent.tool
+@run_memoized
 async def load_brain_context(ctx: RunContext[BrainDeps]) -> str:
     """Load core brain context: company info, customer profile, and positioning."""
     try:
@@ -118,6 +120,7 @@ async def load_brain_context(ctx: RunContext[BrainDeps]) -> str:
 
 
 @ask_agent.tool
+@run_memoized
 async def find_relevant_patterns(
     ctx: RunContext[BrainDeps], query: str, voice_user_id: str = ""
 ) -> str:
@@ -192,6 +195,7 @@ async def find_relevant_patterns(
 
 
 @ask_agent.tool
+@run_memoized
 async def find_similar_experiences(
     ctx: RunContext[BrainDeps], query: str, voice_user_id: str = ""
 ) -> str:
@@ -230,6 +234,7 @@ async def find_similar_experiences(
 
 
 @ask_agent.tool
+@run_memoized
 async def search_knowledge(
     ctx: RunContext[BrainDeps], category: str | None = None
 ) -> str:
@@ -9,6 +9,8 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.fast_router import fast_route
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, classify_query_complexity, format_memories, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import RoutingDecision
@@ -55,7 +57,12 @@ chief_of_staff = Agent(
         "- LinkedIn content: ['linkedin_writer', 'review']\n"
         "- Learn from content: ['review', 'learn']\n"
         "- Research + answer: ['recall', 'ask']\n"
-        "- Full content pipeline: ['recall', 'create', 'review', 'learn']\n\n"
+        "- Full content pipeline: ['recall', 'create', 'review', 'learn']\n"
+        "Steps run in order by default. When some steps don't need each other's "
+        "output, fill pipeline_dependencies (step -> steps it needs) so they run in "
+        "parallel; steps without an entry start immediately. Example: steps "
+        "['create', 'review', 'clarity'] with {'review': ['create'], 'clarity': ['create']} "
+        "reviews and clarity-checks the same draft concurrently.\n\n"
         "Always explain your routing reasoning. Load brain context first to "
         "make informed routing decisions.\n\n"
         "USER PROFILE ROUTING:\n"
@@ -109,6 +116,7 @@ async def validate_routing(
 
 
 @chief_of_staff.tool
+@run_memoized
 async def load_brain_overview(ctx: RunContext[BrainDeps]) -> str:
     """Load a high-level overview of what the brain contains."""
     try:
@@ -153,6 +161,7 @@ async def load_brain_overview(ctx: RunContext[BrainDeps]) -> str:
 
 
 @chief_of_staff.tool
+@run_memoized
 async def search_brain_context(
     ctx: RunContext[BrainDeps], query: str, voice_user_id: str = ""
 ) -> str:
@@ -170,6 +179,7 @@ async def search_brain_context(
 
 
 @chief_of_staff.tool
+@run_memoized
 async def check_active_projects(ctx: RunContext[BrainDeps]) -> str:
     """Check for active projects that might inform routing."""
     try:
@@ -201,3 +211,17 @@ async def classify_complexity(
         return f"Complexity: {complexity}"
     except Exception as e:
         return tool_error("classify_complexity", e)
+
+
+async def route_request(request: str, deps: BrainDeps, model=None) -> tuple[RoutingDecision, str]:
+    """Route a request: fast-path rules first, the Chief of Staff LLM only when they are unsure.
+
+    Returns (decision, router) where router is "fast" or "llm".
+    """
+    config = deps.config
+    if config.fast_router_enabled:
+        decision = fast_route(request, config.complex_query_word_threshold)
+        if decision is not None:
+            return decision, "fast"
+    result = await chief_of_staff.run(request, deps=deps, model=model)
+    return result.output, "llm"
@@ -6,6 +6,7 @@ Produces severity-ranked findings with specific improvement suggestions.
 
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, load_voice_context, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import ClarityResult
@@ -86,6 +87,7 @@ async def validate_clarity(ctx: RunContext[BrainDeps], output: ClarityResult) ->
 
 
 @clarity_agent.tool
+@run_memoized
 async def load_audience_context(ctx: RunContext[BrainDeps]) -> str:
     """Load audience information to calibrate clarity assessment."""
     try:
@@ -100,6 +102,7 @@ async def load_audience_context(ctx: RunContext[BrainDeps]) -> str:
 
 
 @clarity_agent.tool
+@run_memoized
 async def load_voice_reference(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load voice/style guide for language level calibration.
     Pass voice_user_id to load a specific user's voice profile."""
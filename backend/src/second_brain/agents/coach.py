@@ -8,6 +8,7 @@ Uses CalendarService and TaskManagementService when available.
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.tools import ToolDefinition
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, format_memories, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import CoachSession
@@ -87,6 +88,7 @@ async def validate_session(ctx: RunContext[BrainDeps], output: CoachSession) ->
 
 
 @coach_agent.tool
+@run_memoized
 async def load_goals_context(ctx: RunContext[BrainDeps]) -> str:
     """Load business goals and priorities from brain memory."""
     try:
@@ -101,6 +103,7 @@ async def load_goals_context(ctx: RunContext[BrainDeps]) -> str:
 
 
 @coach_agent.tool
+@run_memoized
 async def search_past_sessions(ctx: RunContext[BrainDeps], query: str = "daily session") -> str:
     """Search for past coaching sessions and learnings."""
     try:
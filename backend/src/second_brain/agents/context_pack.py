@@ -0,0 +1,289 @@
+"""Brain context packs for the content-creation and review agents.
+
+create, linkedin_writer, hook_writer and email each expose tools for the
+voice guide, examples, templates, patterns, topic knowledge and audience;
+review_agent has voice, positioning, benchmark and graph tools.
+The model calls them one per turn, so a draft costs 5-7 model round trips
+before any writing starts. A context pack fetches all of that in parallel
+before the run, trims it to a token budget and hands it to the agent via
+`@agent.instructions`:
+
+    deps = await with_context_pack(deps, "linkedin_writer", topic, voice_user_id)
+    result = await linkedin_writer_agent.run(prompt, deps=deps, model=model)
+
+run_full_review() builds one review pack and shares it across all of its
+parallel dimension runs. The pack rides on a per-run copy of BrainDeps, so
+the shared deps are never mutated. Sections that failed, timed out or did not fit the budget are left
+out; the agents keep their tools as the fallback for anything missing.
+"""
+
+import asyncio
+import dataclasses
+import logging
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass, field
+
+from pydantic_ai import RunContext
+
+from second_brain.agents.utils import (
+    format_memories,
+    format_relations,
+    load_voice_context,
+    search_with_graph_fallback,
+)
+from second_brain.deps import BrainDeps
+from second_brain.services.voyage import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Budget priority: earlier sections are kept whole before later ones are trimmed
+SECTION_ORDER = (
+    "voice", "examples", "templates", "patterns", "knowledge", "audience", "positioning", "graph",
+)
+
+# agent -> (default content type, sections the agent has tools for)
+AGENT_SECTIONS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "create": ("", ("voice", "examples", "patterns", "knowledge", "audience")),
+    "linkedin_writer": ("linkedin", ("voice", "examples", "templates", "patterns", "knowledge")),
+    "hook_writer": ("linkedin", ("voice", "templates", "knowledge")),
+    "email": ("email", ("voice", "examples")),
+    "review": ("", ("voice", "examples", "positioning", "graph")),
+}
+
+# Sections squeezed below this many tokens are dropped rather than truncated
+_MIN_SECTION_TOKENS = 100
+
+
+@dataclass
+class ContextPack:
+    """Pre-fetched brain context for one content-creation run."""
+
+    content_type: str
+    sections: dict[str, str] = field(default_factory=dict)
+    truncated: list[str] = field(default_factory=list)
+
+    def render(self, include: Iterable[str] | None = None) -> str:
+        """The pack as an instructions block, limited to `include` sections."""
+        wanted = set(include) if include is not None else set(SECTION_ORDER)
+        parts = [self.sections[name] for name in SECTION_ORDER if name in wanted and name in self.sections]
+        if not parts:
+            return ""
+        label = self.content_type or "general"
+        return (
+            f"## BRAIN CONTEXT PACK ({label})\n"
+            "Pre-loaded from the brain for this request: use it directly and only call "
+            "a context tool for something missing here.\n\n"
+            + "\n\n".join(parts)
+        )
+
+
+def _fit(sections: dict[str, str], token_budget: int) -> tuple[dict[str, str], list[str]]:
+    """Keep sections in SECTION_ORDER until the budget runs out; trim the one that overflows."""
+    kept: dict[str, str] = {}
+    truncated: list[str] = []
+    remaining = token_budget
+    for name in SECTION_ORDER:
+        text = sections.get(name)
+        if not text:
+            continue
+        tokens = estimate_tokens(text)
+        if tokens <= remaining:
+            kept[name] = text
+            remaining -= tokens
+        elif remaining >= _MIN_SECTION_TOKENS:
+            kept[name] = text[:remaining * 4].rsplit("\n", 1)[0] + "\n[...truncated to fit context budget]"
+            truncated.append(name)
+            remaining = 0
+        else:
+            truncated.append(name)
+    return kept, truncated
+
+
+async def _voice(deps: BrainDeps, voice_user_id: str | None) -> str:
+    return await load_voice_context(deps, include_graph=True, voice_user_id=voice_user_id)
+
+
+async def _examples(deps: BrainDeps, content_type: str, voice_user_id: str | None) -> str:
+    if not content_type:
+        return ""
+    examples = await deps.storage_service.get_examples(
+        content_type=content_type, override_user_id=voice_user_id,
+    )
+    if not examples:
+        return ""
+    sections = []
+    for ex in examples[:deps.config.experience_limit]:
+        title = ex.get("title", "Untitled")
+        text = ex.get("content", "")[:deps.config.content_preview_limit]
+        sections.append(f"### {title}\n{text}")
+    return f"## Reference Examples ({content_type})\n" + "\n\n".join(sections)
+
+
+async def _templates(deps: BrainDeps, content_type: str) -> str:
+    if not content_type:
+        return ""
+    templates = await deps.storage_service.get_templates(content_type=content_type)
+    if not templates:
+        return ""
+    lines = [f"## Templates ({content_type})"]
+    for t in templates[:10]:
+        lines.append(f"### {t.get('name', 'Untitled')}")
+        for label, key in (("", "description"), ("Structure: ", "structure_hint"), ("When to use: ", "when_to_use")):
+            if t.get(key):
+                lines.append(f"  {label}{t[key]}")
+    return "\n".join(lines)
+
+
+async def _patterns(deps: BrainDeps, topic: str, content_type: str, voice_user_id: str | None) -> str:
+    filters: dict = {"category": "pattern"}
+    if content_type:
+        filters = {"AND": [filters, {"applicable_content_types": {"contains": content_type}}]}
+    semantic, registry = await asyncio.gather(
+        deps.memory_service.search_with_filters(
+            topic, metadata_filters=filters, limit=10, override_user_id=voice_user_id,
+        ),
+        deps.storage_service.get_patterns(),
+    )
+    if content_type and registry:
+        registry = [
+            p for p in registry
+            if p.get("applicable_content_types") is None
+            or content_type in (p.get("applicable_content_types") or [])
+        ]
+    sections = []
+    if semantic.memories:
+        sections.append("## Semantically Matched Patterns\n" + format_memories(semantic.memories))
+    if registry:
+        lines = ["## Pattern Registry"]
+        for p in registry:
+            text = p.get("pattern_text", "")[:deps.config.pattern_preview_limit]
+            lines.append(f"- [{p.get('confidence', 'LOW')}] **{p.get('name', 'Untitled')}**: {text}")
+        sections.append("\n".join(lines))
+    rel_text = format_relations(semantic.relations or [])
+    if rel_text:
+        sections.append(rel_text)
+    return "\n\n".join(sections)
+
+
+async def _knowledge(deps: BrainDeps, topic: str) -> str:
+    result = await deps.memory_service.search(topic)
+    lines = [f"- {m.get('memory', m.get('result', ''))}" for m in result.memories[:5]]
+    sections = ["## Topic Knowledge\n" + "\n".join(lines)] if lines else []
+    rel_text = format_relations(result.relations or [])
+    if rel_text:
+        sections.append(rel_text)
+    return "\n\n".join(sections)
+
+
+async def _audience(deps: BrainDeps) -> str:
+    audience, customers = await asyncio.gather(
+        deps.storage_service.get_memory_content("audience"),
+        deps.storage_service.get_memory_content("customers"),
+    )
+    sections = []
+    for label, items in (("Audience", audience), ("Customers", customers)):
+        if items:
+            lines = [f"## {label}"]
+            for item in items:
+                text = item.get("content", "")[:deps.config.content_preview_limit]
+                lines.append(f"### {item.get('title', 'Untitled')}\n{text}")
+            sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+async def _positioning(deps: BrainDeps) -> str:
+    categories = (("company", "Company"), ("personal", "Personal"), ("customers", "Customers"))
+    results = await asyncio.gather(
+        *(deps.storage_service.get_memory_content(category) for category, _ in categories)
+    )
+    sections = []
+    for (_, label), items in zip(categories, results):
+        if items:
+            lines = [f"### {label}"]
+            for item in items:
+                text = item.get("content", "")[:deps.config.content_preview_limit]
+                lines.append(f"#### {item.get('title', 'Untitled')}\n{text}")
+            sections.append("\n".join(lines))
+    return "## Positioning Context\n" + "\n\n".join(sections) if sections else ""
+
+
+async def _graph(deps: BrainDeps, topic: str) -> str:
+    result = await deps.memory_service.search(topic, limit=5, enable_graph=True)
+    relations = await search_with_graph_fallback(deps, topic, list(result.relations or []))
+    rel_text = format_relations(relations)
+    return f"## Graph Context\n{rel_text}" if rel_text else ""
+
+
+async def _guarded(name: str, fetch: Awaitable[str], timeout: float) -> str:
+    """One section's text, or "" when its backend fails or times out."""
+    try:
+        async with asyncio.timeout(timeout):
+            return await fetch
+    except Exception as e:
+        logger.warning("Context pack %s failed: %s", name, type(e).__name__)
+        logger.debug("Context pack %s error detail: %s", name, e)
+        return ""
+
+
+async def build_context_pack(
+    deps: BrainDeps,
+    content_type: str,
+    topic: str,
+    voice_user_id: str | None = None,
+    sections: Iterable[str] = SECTION_ORDER,
+) -> ContextPack:
+    """Fetch the requested sections in parallel and fit them to the token budget."""
+    wanted = [name for name in SECTION_ORDER if name in set(sections)]
+    fetchers = {
+        "voice": lambda: _voice(deps, voice_user_id),
+        "examples": lambda: _examples(deps, content_type, voice_user_id),
+        "templates": lambda: _templates(deps, content_type),
+        "patterns": lambda: _patterns(deps, topic, content_type, voice_user_id),
+        "knowledge": lambda: _knowledge(deps, topic),
+        "audience": lambda: _audience(deps),
+        "positioning": lambda: _positioning(deps),
+        "graph": lambda: _graph(deps, topic),
+    }
+    timeout = deps.config.service_timeout_seconds
+    texts = await asyncio.gather(*(_guarded(name, fetchers[name](), timeout) for name in wanted))
+    kept, truncated = _fit(dict(zip(wanted, texts)), deps.config.context_pack_token_budget)
+    if truncated:
+        logger.debug("Context pack over budget, trimmed: %s", ", ".join(truncated))
+    return ContextPack(content_type=content_type, sections=kept, truncated=truncated)
+
+
+async def with_context_pack(
+    deps: BrainDeps,
+    agent_name: str,
+    topic: str,
+    voice_user_id: str | None = None,
+    content_type: str | None = None,
+    exclude: Iterable[str] = (),
+) -> BrainDeps:
+    """A copy of `deps` carrying a context pack for `agent_name`'s run.
+
+    Returns `deps` unchanged for agents without a pack or when packs are
+    disabled. `exclude` skips sections the caller already put in the prompt.
+    """
+    if agent_name not in AGENT_SECTIONS or not deps.config.context_pack_enabled:
+        return deps
+    default_type, sections = AGENT_SECTIONS[agent_name]
+    skipped = set(exclude)
+    pack = await build_context_pack(
+        deps,
+        content_type if content_type is not None else default_type,
+        topic,
+        voice_user_id=voice_user_id or None,
+        sections=[name for name in sections if name not in skipped],
+    )
+    # Create the lazy registry first so the copy shares it (and its cache)
+    deps.get_content_type_registry()
+    return dataclasses.replace(deps, context_pack=pack)
+
+
+def context_pack_instructions(ctx: RunContext[BrainDeps], agent_name: str) -> str:
+    """The run's context pack rendered for `agent_name`, or "" when there is none."""
+    pack = ctx.deps.context_pack
+    if pack is None:
+        return ""
+    return pack.render(AGENT_SECTIONS[agent_name][1])
@@ -4,6 +4,8 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.context_pack import context_pack_instructions
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import (
     all_tools_failed,
     format_memories,
@@ -38,8 +40,9 @@ create_agent = Agent(
         "- The voice guide IS the voice. Do not default to generic 'professional' or 'casual' tone.\n"
         "- If no voice guide is provided, write in a clear, direct, conversational tone.\n\n"
         "PROCESS:\n"
-        "1. Study the voice guide and reference examples in your prompt.\n"
-        "2. Use find_applicable_patterns to find topic-specific writing patterns.\n"
+        "1. Study the voice guide and reference examples in your prompt or BRAIN CONTEXT PACK.\n"
+        "2. Use the patterns in the BRAIN CONTEXT PACK; call find_applicable_patterns "
+        "only if it has none.\n"
         "3. Follow the Five Writing Laws: active voice, remove needless words, no adverbs, "
         "write simply, hit the reader with the first sentence.\n"
         "4. AVOID AI patterns: no em dashes for drama, no 'Here's the thing:', "
@@ -47,7 +50,7 @@ create_agent = Agent(
         "no generic intros ('In today's fast-paced world...').\n"
         "5. Let the content be as long or short as it needs to be. "
         "Follow the length guidance but don't pad or truncate artificially.\n"
-        "6. Call validate_draft to check structure requirements.\n"
+        "6. Call validate_draft only if unsure the draft meets the structure requirements.\n"
         "7. Produce a DRAFT for human editing, not final copy.\n\n"
         "USER PROFILE ROUTING:\n"
         "- Your prompt may include 'Voice profile: <user_id>'.\n"
@@ -101,6 +104,12 @@ async def inject_content_types(ctx: RunContext[BrainDeps]) -> str:
         return "Content type registry unavailable. Use default types."
 
 
+@create_agent.instructions
+def inject_context_pack(ctx: RunContext[BrainDeps]) -> str:
+    """Prefetched brain context for this run (see agents.context_pack)."""
+    return context_pack_instructions(ctx, "create")
+
+
 @create_agent.output_validator
 async def validate_create(ctx: RunContext[BrainDeps], output: CreateResult) -> CreateResult:
     """Validate draft completeness and quality — accept degraded output on backend errors."""
@@ -157,6 +166,7 @@ async def validate_create(ctx: RunContext[BrainDeps], output: CreateResult) -> C
 
 
 @create_agent.tool
+@run_memoized
 async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load the user's voice and tone guide from the brain for style matching.
     Pass voice_user_id to load a specific user's voice profile."""
@@ -168,6 +178,7 @@ async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "")
 
 
 @create_agent.tool
+@run_memoized
 async def load_content_examples(
     ctx: RunContext[BrainDeps], content_type: str, voice_user_id: str = ""
 ) -> str:
@@ -193,6 +204,7 @@ async def load_content_examples(
 
 
 @create_agent.tool
+@run_memoized
 async def find_applicable_patterns(
     ctx: RunContext[BrainDeps], topic: str, content_type: str = "",
     voice_user_id: str = ""
@@ -287,6 +299,7 @@ async def find_applicable_patterns(
 
 
 @create_agent.tool
+@run_memoized
 async def load_audience_context(ctx: RunContext[BrainDeps]) -> str:
     """Load audience and customer context from the brain for targeting."""
     try:
@@ -3,6 +3,8 @@
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.tools import ToolDefinition
+from second_brain.agents.context_pack import context_pack_instructions
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, load_voice_context, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import EmailAction
@@ -17,8 +19,8 @@ email_agent = Agent(
         "You are an Email Agent. Compose, search, and organize emails "
         "with brand voice consistency.\n\n"
         "BEFORE WRITING ANY EMAIL:\n"
-        "1. Load voice guide for brand tone\n"
-        "2. Search for relevant templates/examples\n"
+        "1. Load voice guide for brand tone (from the BRAIN CONTEXT PACK when present)\n"
+        "2. Search for relevant templates/examples (also in the pack when present)\n"
         "3. Check for past thread context if following up\n"
         "4. Apply appropriate formality for recipient\n\n"
         "EMAIL STRUCTURE:\n"
@@ -32,6 +34,12 @@ email_agent = Agent(
 )
 
 
+@email_agent.instructions
+def inject_context_pack(ctx: RunContext[BrainDeps]) -> str:
+    """Prefetched brain context for this run (see agents.context_pack)."""
+    return context_pack_instructions(ctx, "email")
+
+
 @email_agent.output_validator
 async def validate_email(ctx: RunContext[BrainDeps], output: EmailAction) -> EmailAction:
     """Validate email action with deterministic error detection."""
@@ -73,6 +81,7 @@ async def validate_email(ctx: RunContext[BrainDeps], output: EmailAction) -> Ema
 
 
 @email_agent.tool
+@run_memoized
 async def load_email_voice(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load email-specific voice and style guidelines.
     Pass voice_user_id to load a specific user's voice profile."""
@@ -99,6 +108,7 @@ async def _email_available(ctx: RunContext[BrainDeps], tool_def: ToolDefinition)
 
 
 @email_agent.tool(prepare=_email_available)
+@run_memoized
 async def search_email_history(ctx: RunContext[BrainDeps], query: str) -> str:
     """Search past emails for context."""
     try:
@@ -0,0 +1,188 @@
+"""Deterministic fast-path router in front of the Chief of Staff.
+
+Routing through chief_of_staff costs a full LLM run (plus its brain-context
+tools) before any real work starts, even for greetings and obvious
+"recall X" requests. fast_route() resolves the high-confidence cases with
+zero-latency rules and returns None for everything else, so callers fall
+through to the LLM router only when the request is ambiguous:
+
+- conversational messages (is_conversational) route to 'conversational';
+- requests that open with an unambiguous intent phrase and its object
+  ("recall my ...", "write a LinkedIn post ...", "review this draft ...")
+  route to that agent;
+- multi-step requests, and requests matching more than one intent, are
+  left to the Chief of Staff.
+
+Hit/fall-through counts per route: fast_router_stats(), served on
+GET /api/health/runtime.
+"""
+
+import re
+import threading
+from collections import Counter
+
+from second_brain.agents.utils import classify_query_complexity, is_conversational
+from second_brain.schemas import RoutingDecision
+
+# Politeness / delegation prefixes stripped before matching intent phrases
+_PREFIX = re.compile(
+    r"^(?:(?:please|pls|hey|ok|okay|can you|could you|would you|will you|help me|"
+    r"i need you to|i want you to|i'd like you to|i would like you to)[\s,]+)+"
+)
+
+# Sequencing language means a pipeline — the Chief of Staff plans those
+_MULTI_STEP = re.compile(r"\b(?:and then|after that|afterwards|followed by|once done|step \d)\b|,\s*then\b")
+
+_CONTENT_WORDS = (
+    r"post|email|newsletter|article|essay|blog|caption|"
+    r"announcement|bio|tweet|outline|proposal"
+)
+_CONTENT_NOUNS = r"(?:" + _CONTENT_WORDS + r")s?"
+
+# Nouns that only name a piece of writing behind a content qualifier: a
+# "sales script" or "follow-up message" is content, a "python script" or
+# "message queue" is not
+_QUALIFIED_WORDS = r"script|message|thread|copy"
+_QUALIFIED_NOUNS = r"(?:" + _QUALIFIED_WORDS + r")s?"
+_CONTENT_QUALIFIERS = (
+    r"(?:linkedin|twitter|x|slack|text|email|newsletter|website|landing-page|video|youtube|"
+    r"podcast|sales|marketing|ad|product|launch|promo|welcome|thank-you|follow-up|outreach|cold)"
+)
+
+# A content noun heading a compound names something else ("email account",
+# "post request")
+_NOT_CONTENT = (
+    r"(?!\s+(?:account|address|alias|filter|rule|server|client|queue|pool|request|handler|endpoint)s?\b)"
+)
+
+# What can be reviewed or checked for clarity: a draft, not a calendar or a plan
+_DRAFT_NOUNS = (
+    r"(?:draft|content|writing|piece|text|paragraph|" + _CONTENT_WORDS + r"|" + _QUALIFIED_WORDS + r")s?"
+)
+
+# Where recall looks: the brain, not the web or a flight search
+_BRAIN_NOUNS = r"(?:brain|memory|memories|notes|knowledge(?: base)?|patterns|experiences)"
+
+# (route, pattern matched against the start of the normalized request).
+# Each keyword is anchored to its object ("recall my ...", "review this
+# draft"): a bare verb ("remind me to ...", "review my calendar", "recall is
+# low ...") is left to the Chief of Staff. 'create' allows one free word
+# before its noun ("a short launch email"), not an arbitrary gap.
+_INTENTS: list[tuple[str, re.Pattern]] = [
+    ("recall", re.compile(
+        r"(?:recall (?:my|our|what|when|how|why|who|everything|anything|all)|"
+        r"remember when (?:i|we)|"
+        r"remind me (?:what|how|why|when|of what) (?:i|we)|"
+        r"(?:search|look up|look through|check) (?:in )?(?:my |our |the )?" + _BRAIN_NOUNS + r"|"
+        r"find (?:my |our |the )?(?:notes|memories|patterns|experiences)|"
+        r"what do (?:i|we) know about|what did (?:i|we) (?:say|write|learn|decide|note))\b"
+    )),
+    ("linkedin_engagement", re.compile(
+        r"(?:write|draft|suggest|reply|respond)\b.{0,40}\bcomments?\b.{0,40}\blinkedin\b|"
+        r"(?:reply|respond) to (?:this|a|the) linkedin\b"
+    )),
+    ("linkedin_writer", re.compile(
+        r"(?:write|draft|compose|create)\s+(?:me\s+)?(?:a|an|the|my)?\s*linkedin\s+(?:post|article)\b"
+    )),
+    ("create", re.compile(
+        r"(?:write|draft|compose|create)\s+(?:me\s+)?(?:a|an|the|my|some)?\s*(?!content types?\b)"
+        r"(?:[\w-]+\s+)?(?:" + _CONTENT_QUALIFIERS + r"\s+(?:" + _CONTENT_NOUNS + r"|" + _QUALIFIED_NOUNS + r")|"
+        + _CONTENT_NOUNS + r")\b" + _NOT_CONTENT
+    )),
+    ("review", re.compile(
+        r"(?:review|critique|grade|score)\s+(?:this|my|the following)\s+(?:[\w-]+\s+){0,2}"
+        + _DRAFT_NOUNS + r"\b|(?:review|critique|grade|score)\s+(?:this|the following)\s*:"
+    )),
+    ("clarity", re.compile(
+        r"(?:check|analy[sz]e|assess)\s+(?:the\s+)?(?:clarity|readability)\b|is this (?:clear|readable)\b"
+    )),
+    ("coach", re.compile(r"(?:plan|organi[sz]e) my (?:day|morning|afternoon|week)\b|daily (?:plan|check-in)\b")),
+    ("pmo", re.compile(r"prioriti[sz]e (?:my |these |the )?(?:tasks|todos|to-dos|backlog|work|projects)\b")),
+    ("email", re.compile(r"(?:check|read|summari[sz]e|triage) (?:my |the )?(?:email|emails|inbox|mail)\b")),
+    ("learn", re.compile(
+        r"(?:learn from|extract (?:the )?(?:patterns|lessons|learnings) from) (?:this|these|my|the|our)\s+"
+        r"(?:[\w-]+\s+){0,2}(?:(?:session|transcript|review|feedback|conversation|call|meeting|"
+        r"experience|project|launch|note)s?|" + _DRAFT_NOUNS + r")\b"
+    )),
+    ("template_builder", re.compile(r"(?:find|identify|extract|spot) (?:reusable )?templates?\b")),
+]
+
+_lock = threading.Lock()
+_counts: Counter = Counter()
+
+
+def _normalize(message: str) -> str:
+    text = " ".join(message.lower().split())
+    return _PREFIX.sub("", text)
+
+
+def _match_intents(text: str) -> dict[str, int]:
+    """Routes whose intent phrase opens the request, with where the phrase ends.
+
+    LinkedIn rules shadow the generic 'create' rule.
+    """
+    routes = {}
+    for route, pattern in _INTENTS:
+        match = pattern.match(text)
+        if match:
+            routes[route] = match.end()
+    if "linkedin_writer" in routes or "linkedin_engagement" in routes:
+        routes.pop("create", None)
+    return routes
+
+
+def _record(route: str | None) -> None:
+    with _lock:
+        _counts[route or "fallthrough"] += 1
+
+
+def fast_route(message: str, complex_word_threshold: int = 8) -> RoutingDecision | None:
+    """Route `message` without an LLM call, or None when the Chief of Staff should decide."""
+    if is_conversational(message):
+        _record("conversational")
+        return RoutingDecision(
+            target_agent="conversational",
+            reasoning="Fast path: greeting or small talk.",
+            confidence="HIGH",
+            query_complexity="simple",
+        )
+    text = _normalize(message)
+    if not text or _MULTI_STEP.search(text):
+        _record(None)
+        return None
+    routes = _match_intents(text)
+    if len(routes) != 1:
+        _record(None)
+        return None
+    intent, end = next(iter(routes.items()))
+    # Classify the subject, not the intent phrase ("recall" would match "all")
+    complexity = classify_query_complexity(text[end:].strip(" :,") or text, complex_word_threshold)
+    route = "recall_deep" if intent == "recall" and complexity == "complex" else intent
+    _record(route)
+    return RoutingDecision(
+        target_agent=route,
+        reasoning=f"Fast path: request opens with an unambiguous '{intent}' intent.",
+        confidence="HIGH",
+        query_complexity=complexity,
+    )
+
+
+def fast_router_stats() -> dict:
+    """Fast-path hits per route and fall-throughs to the Chief of Staff."""
+    with _lock:
+        counts = dict(_counts)
+    fallthrough = counts.pop("fallthrough", 0)
+    hits = sum(counts.values())
+    total = hits + fallthrough
+    return {
+        "fast": hits,
+        "fallthrough": fallthrough,
+        "fast_ratio": round(hits / total, 3) if total else 0.0,
+        "routes": counts,
+    }
+
+
+def reset_fast_router_stats() -> None:
+    """Drop all counters (tests)."""
+    with _lock:
+        _counts.clear()
@@ -4,6 +4,8 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.context_pack import context_pack_instructions
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, load_voice_context, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import HookWriterResult
@@ -49,7 +51,8 @@ hook_writer_agent = Agent(
         "- Generate 3-7 hook variations\n"
         "- Each hook must work BEFORE LinkedIn's 'see more' truncation (~210 chars)\n"
         "- Hooks must be specific to the topic, not generic\n"
-        "- Match the user's voice/tone if voice guide is available\n"
+        "- Match the user's voice/tone if voice guide is available (BRAIN CONTEXT PACK "
+        "first, load_voice_guide only if it has none)\n"
         "- Never start with 'I'm excited to announce' or similar AI-sounding phrases\n"
         "- Vary the categories — don't generate 5 hooks of the same type\n"
         "- The hook_type field should reflect the PRIMARY category used across hooks"
@@ -57,6 +60,12 @@ hook_writer_agent = Agent(
 )
 
 
+@hook_writer_agent.instructions
+def inject_context_pack(ctx: RunContext[BrainDeps]) -> str:
+    """Prefetched brain context for this run (see agents.context_pack)."""
+    return context_pack_instructions(ctx, "hook_writer")
+
+
 @hook_writer_agent.output_validator
 async def validate_hooks(
     ctx: RunContext[BrainDeps], output: HookWriterResult
@@ -97,6 +106,7 @@ async def validate_hooks(
 
 
 @hook_writer_agent.tool
+@run_memoized
 async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load the user's voice and tone guide to match hook style."""
     try:
@@ -107,6 +117,7 @@ async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "")
 
 
 @hook_writer_agent.tool
+@run_memoized
 async def search_hook_examples(ctx: RunContext[BrainDeps], topic: str = "") -> str:
     """Search template bank for LinkedIn templates with hook patterns."""
     try:
@@ -129,6 +140,7 @@ async def search_hook_examples(ctx: RunContext[BrainDeps], topic: str = "") -> s
 
 
 @hook_writer_agent.tool
+@run_memoized
 async def search_past_content(ctx: RunContext[BrainDeps], topic: str = "") -> str:
     """Search memory for past LinkedIn content and hooks."""
     try:
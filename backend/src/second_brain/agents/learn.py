@@ -6,6 +6,7 @@ from datetime import date
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import LearnResult
@@ -115,6 +116,7 @@ async def validate_learn(ctx: RunContext[BrainDeps], output: LearnResult) -> Lea
 
 
 @learn_agent.tool
+@run_memoized
 async def search_existing_patterns(
     ctx: RunContext[BrainDeps], query: str
 ) -> str:
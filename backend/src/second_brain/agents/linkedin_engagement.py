@@ -4,6 +4,7 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import (
     all_tools_failed,
     format_memories,
@@ -129,6 +130,7 @@ async def validate_engagement(
 
 
 @linkedin_engagement_agent.tool
+@run_memoized
 async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load the user's conversational voice guide for comment style matching.
     Pass voice_user_id for a specific user's voice profile."""
@@ -140,6 +142,7 @@ async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "")
 
 
 @linkedin_engagement_agent.tool
+@run_memoized
 async def load_expertise_context(
     ctx: RunContext[BrainDeps], voice_user_id: str = "",
 ) -> str:
@@ -173,6 +176,7 @@ async def load_expertise_context(
 
 
 @linkedin_engagement_agent.tool
+@run_memoized
 async def search_relevant_knowledge(ctx: RunContext[BrainDeps], topic: str) -> str:
     """Search memory for relevant knowledge, experiences, and meeting notes.
     This gives you real anecdotes and data points to reference in comments."""
@@ -216,6 +220,7 @@ async def search_relevant_knowledge(ctx: RunContext[BrainDeps], topic: str) -> s
 
 
 @linkedin_engagement_agent.tool
+@run_memoized
 async def search_past_engagement(
     ctx: RunContext[BrainDeps], topic: str = "",
 ) -> str:
@@ -236,6 +241,7 @@ async def search_past_engagement(
 
 
 @linkedin_engagement_agent.tool
+@run_memoized
 async def load_content_examples(
     ctx: RunContext[BrainDeps], voice_user_id: str = "",
 ) -> str:
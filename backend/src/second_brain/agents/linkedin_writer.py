@@ -4,6 +4,8 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.context_pack import context_pack_instructions
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import (
     all_tools_failed,
     format_memories,
@@ -32,14 +34,14 @@ linkedin_writer_agent = Agent(
     retries=3,
     instructions=(
         "You are a LinkedIn content specialist. Your process is ALWAYS:\n"
-        "1. Load voice guide via load_voice_guide\n"
-        "2. Load examples via load_linkedin_examples and templates via search_linkedin_templates\n"
-        "3. Find topic patterns via find_linkedin_patterns\n"
+        "1-3. Read the voice guide, examples, templates and topic patterns from the "
+        "BRAIN CONTEXT PACK. Only for sections missing from it, call load_voice_guide, "
+        "load_linkedin_examples, search_linkedin_templates or find_linkedin_patterns\n"
         "4. Generate hooks via generate_hooks\n"
         "5. Pick the STRONGEST hook as your opening line\n"
         "6. Select a post structure that fits the topic\n"
         "7. Write the full post\n"
-        "8. Validate via validate_draft\n\n"
+        "8. Call validate_draft only if unsure about length or formatting\n\n"
         "HOOK INTEGRATION (CRITICAL):\n"
         "You MUST call generate_hooks before writing. Pick the strongest hook and "
         "use it as the FIRST LINE of your draft. The hook_used field must match "
@@ -74,6 +76,12 @@ linkedin_writer_agent = Agent(
 )
 
 
+@linkedin_writer_agent.instructions
+def inject_context_pack(ctx: RunContext[BrainDeps]) -> str:
+    """Prefetched brain context for this run (see agents.context_pack)."""
+    return context_pack_instructions(ctx, "linkedin_writer")
+
+
 @linkedin_writer_agent.output_validator
 async def validate_linkedin_post(
     ctx: RunContext[BrainDeps], output: LinkedInPostResult
@@ -168,6 +176,7 @@ async def generate_hooks(
 
 
 @linkedin_writer_agent.tool
+@run_memoized
 async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load the user's voice and tone guide for style matching.
     Pass voice_user_id for a specific user's voice profile."""
@@ -179,6 +188,7 @@ async def load_voice_guide(ctx: RunContext[BrainDeps], voice_user_id: str = "")
 
 
 @linkedin_writer_agent.tool
+@run_memoized
 async def load_linkedin_examples(
     ctx: RunContext[BrainDeps], voice_user_id: str = "",
 ) -> str:
@@ -203,6 +213,7 @@ async def load_linkedin_examples(
 
 
 @linkedin_writer_agent.tool
+@run_memoized
 async def find_linkedin_patterns(
     ctx: RunContext[BrainDeps], topic: str, voice_user_id: str = "",
 ) -> str:
@@ -277,6 +288,7 @@ async def find_linkedin_patterns(
 
 
 @linkedin_writer_agent.tool
+@run_memoized
 async def search_linkedin_templates(ctx: RunContext[BrainDeps]) -> str:
     """Search the template bank for LinkedIn post templates.
     Returns template names, structures, and when-to-use guidance."""
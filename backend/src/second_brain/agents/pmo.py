@@ -6,6 +6,7 @@ Alignment 15%, Momentum 10%) to help users decide what to work on.
 
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import PMOResult
@@ -85,6 +86,7 @@ async def validate_pmo(ctx: RunContext[BrainDeps], output: PMOResult) -> PMOResu
 
 
 @pmo_agent.tool
+@run_memoized
 async def load_strategic_context(ctx: RunContext[BrainDeps]) -> str:
     """Load strategic goals and priorities from brain."""
     try:
@@ -103,6 +105,7 @@ async def load_strategic_context(ctx: RunContext[BrainDeps]) -> str:
 
 
 @pmo_agent.tool
+@run_memoized
 async def get_scoring_weights(ctx: RunContext[BrainDeps]) -> str:
     """Get the configured priority scoring weights."""
     weights = ctx.deps.config.pmo_score_weights
@@ -5,6 +5,7 @@ import logging
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import (
     TOOL_ERROR_PREFIX,
     all_tools_failed,
@@ -97,6 +98,7 @@ async def validate_recall(ctx: RunContext[BrainDeps], output: RecallResult) -> R
 
 
 @recall_agent.tool
+@run_memoized
 async def search_semantic_memory(
     ctx: RunContext[BrainDeps], query: str, voice_user_id: str = ""
 ) -> str:
@@ -191,6 +193,7 @@ async def search_semantic_memory(
 
 
 @recall_agent.tool
+@run_memoized
 async def search_patterns(
     ctx: RunContext[BrainDeps], topic: str | None = None, voice_user_id: str = ""
 ) -> str:
@@ -306,6 +309,7 @@ async def search_patterns(
 
 
 @recall_agent.tool
+@run_memoized
 async def search_experiences(
     ctx: RunContext[BrainDeps], query: str | None = None, category: str | None = None
 ) -> str:
@@ -351,6 +355,7 @@ async def search_experiences(
 
 
 @recall_agent.tool
+@run_memoized
 async def search_examples(
     ctx: RunContext[BrainDeps], query: str | None = None, content_type: str | None = None,
     voice_user_id: str = ""
@@ -403,6 +408,7 @@ async def search_examples(
 
 
 @recall_agent.tool
+@run_memoized
 async def search_projects(
     ctx: RunContext[BrainDeps],
     lifecycle_stage: str | None = None,
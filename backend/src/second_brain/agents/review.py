@@ -1,4 +1,4 @@
-"""ReviewAgent — 6-dimension quality assessment."""
+"""ReviewAgent — 6-dimension quality assessment, per dimension or batched."""
 
 import asyncio
 import logging
@@ -8,7 +8,10 @@ from pydantic_ai import Agent, ModelRetry, RunContext
 
 if TYPE_CHECKING:
     from pydantic_ai.models import Model
+    from pydantic_ai.usage import UsageLimits
 
+from second_brain.agents.context_pack import context_pack_instructions, with_context_pack
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import (
     all_tools_failed,
     format_relations,
@@ -18,12 +21,14 @@ from second_brain.agents.utils import (
 )
 from second_brain.deps import BrainDeps
 from second_brain.schemas import (
-    DimensionScore, ReviewResult, REVIEW_DIMENSIONS,
+    BatchedReviewOutput, ContentTypeConfig, DimensionScore, ReviewResult, REVIEW_DIMENSIONS,
     DEFAULT_REVIEW_DIMENSIONS, ReviewDimensionConfig,
 )
 
 logger = logging.getLogger(__name__)
 
+REVIEW_MODES = ("parallel", "batched")
+
 # NOTE: When using ClaudeSDKModel (subscription auth), Pydantic AI tools
 # are NOT called. Instead, the SDK process calls service MCP tools directly.
 # The agent instructions and output schema validation still apply.
@@ -39,41 +44,33 @@ review_agent = Agent(
         "or issues (must-fix problems). "
         "Be specific — cite exact phrases or sections in your findings. "
         "Use brain context (voice guide, patterns, examples) when available to ground your evaluation. "
+        "It is pre-loaded in the BRAIN CONTEXT PACK when present: use it directly and call "
+        "the load_* tools only for context missing from it. "
         "Set the dimension field to the dimension name you are reviewing. "
         "Set the status field: 'pass' if score >= 7, 'warning' if score 5-6, 'issue' if score <= 4."
     ),
 )
 
 
-@review_agent.output_validator
-async def validate_review(ctx: RunContext[BrainDeps], output: DimensionScore) -> DimensionScore:
-    """Validate review output with deterministic error detection.
+@review_agent.instructions
+def inject_context_pack(ctx: RunContext[BrainDeps]) -> str:
+    """Review context shared by all dimension runs of one review (see run_full_review)."""
+    return context_pack_instructions(ctx, "review")
 
-    Uses deterministic error detection: checks if ALL tool outputs
-    contain TOOL_ERROR_PREFIX, rather than relying on LLM setting the error field.
-    This prevents death spirals when all backends are down.
-    """
-    # Early return if error already set
-    if output.error:
-        return output
 
-    # Deterministic check: extract tool outputs from ctx.messages
+def _backends_failed(ctx: RunContext[BrainDeps]) -> bool:
+    """True when every tool output in the run is a TOOL_ERROR_PREFIX error."""
     tool_outputs = []
     for msg in ctx.messages:
         if hasattr(msg, "parts"):
             for part in msg.parts:
                 if hasattr(part, "content") and isinstance(part.content, str):
                     tool_outputs.append(part.content)
+    return bool(tool_outputs) and all_tools_failed(tool_outputs)
 
-    # If all tools failed, set error and return (prevents retry)
-    if tool_outputs and all_tools_failed(tool_outputs):
-        if not output.error:
-            output = output.model_copy(update={
-                "error": "All review backends unavailable. Review skipped.",
-            })
-        return output
 
-    # Normal validation (only if no error)
+def _check_score(output: DimensionScore) -> None:
+    """Raise ModelRetry when a dimension score is out of range or inconsistent."""
     if output.score < 1 or output.score > 10:
         raise ModelRetry(
             f"Score {output.score} is out of range. Use 1-10 scale. "
@@ -94,10 +91,32 @@ async def validate_review(ctx: RunContext[BrainDeps], output: DimensionScore) ->
             "You must identify at least one strength or issue. "
             "If tools failed, set the error field instead of retrying."
         )
+
+
+@review_agent.output_validator
+async def validate_review(ctx: RunContext[BrainDeps], output: DimensionScore) -> DimensionScore:
+    """Validate review output with deterministic error detection.
+
+    Uses deterministic error detection: checks if ALL tool outputs
+    contain TOOL_ERROR_PREFIX, rather than relying on LLM setting the error field.
+    This prevents death spirals when all backends are down.
+    """
+    # Early return if error already set
+    if output.error:
+        return output
+
+    # If all tools failed, set error and return (prevents retry)
+    if _backends_failed(ctx):
+        return output.model_copy(update={
+            "error": "All review backends unavailable. Review skipped.",
+        })
+
+    _check_score(output)
     return output
 
 
 @review_agent.tool
+@run_memoized
 async def load_voice_reference(ctx: RunContext[BrainDeps], voice_user_id: str = "") -> str:
     """Load the user's voice and tone guide for evaluating brand voice consistency.
     Pass voice_user_id to load a specific user's voice profile."""
@@ -109,6 +128,7 @@ async def load_voice_reference(ctx: RunContext[BrainDeps], voice_user_id: str =
 
 
 @review_agent.tool
+@run_memoized
 async def load_positioning_context(ctx: RunContext[BrainDeps]) -> str:
     """Load company, personal, and customer positioning context for evaluating market alignment."""
     try:
@@ -130,6 +150,7 @@ async def load_positioning_context(ctx: RunContext[BrainDeps]) -> str:
 
 
 @review_agent.tool
+@run_memoized
 async def load_example_benchmarks(ctx: RunContext[BrainDeps], content_type: str | None = None) -> str:
     """Load content examples as quality benchmarks for comparison."""
     try:
@@ -148,6 +169,7 @@ async def load_example_benchmarks(ctx: RunContext[BrainDeps], content_type: str
 
 
 @review_agent.tool
+@run_memoized
 async def load_graph_context(
     ctx: RunContext[BrainDeps], content_summary: str
 ) -> str:
@@ -180,19 +202,261 @@ async def load_graph_context(
         return tool_error("load_graph_context", e)
 
 
+batched_review_agent = Agent(
+    deps_type=BrainDeps,
+    output_type=BatchedReviewOutput,
+    retries=3,
+    tools=[load_voice_reference, load_positioning_context, load_example_benchmarks, load_graph_context],
+    instructions=(
+        "You are a content reviewer scoring SEVERAL dimensions of content quality in one pass. "
+        "You will be given the dimensions to evaluate with their specific criteria. "
+        "Score each dimension independently, as if it were the only one you were reviewing. "
+        "Score 1-10: 9-10 excellent, 7-8 good, 5-6 acceptable, 3-4 needs work, 1-2 major issues. "
+        "Classify findings as strengths (well done), suggestions (nice-to-have improvements), "
+        "or issues (must-fix problems), and keep each finding under the dimension it belongs to. "
+        "Be specific — cite exact phrases or sections in your findings. "
+        "Use brain context (voice guide, patterns, examples) when available to ground your evaluation. "
+        "It is pre-loaded in the BRAIN CONTEXT PACK when present: use it directly and call "
+        "the load_* tools only for context missing from it. "
+        "Return exactly one score per dimension with the dimension field set to its exact name. "
+        "Set each status field: 'pass' if score >= 7, 'warning' if score 5-6, 'issue' if score <= 4."
+    ),
+)
+
+batched_review_agent.instructions(inject_context_pack)
+
+
+@batched_review_agent.output_validator
+async def validate_batched_review(
+    ctx: RunContext[BrainDeps], output: BatchedReviewOutput,
+) -> BatchedReviewOutput:
+    """Apply validate_review's checks to every dimension of a batched review."""
+    if output.error:
+        return output
+
+    if _backends_failed(ctx):
+        return output.model_copy(update={
+            "error": "All review backends unavailable. Review skipped.",
+        })
+
+    if not output.scores:
+        raise ModelRetry(
+            "Return one score per requested dimension. "
+            "If tools failed, set the error field instead of retrying."
+        )
+    for score in output.scores:
+        try:
+            _check_score(score)
+        except ModelRetry as e:
+            raise ModelRetry(f"{score.dimension}: {e.message}") from None
+    return output
+
+
+def resolve_review_mode(
+    content: str,
+    deps: BrainDeps,
+    type_config: ContentTypeConfig | None = None,
+    mode: str | None = None,
+) -> str:
+    """Pick "parallel" or "batched" scoring for one review.
+
+    An explicit `mode` wins, then the content type's review_mode, then the
+    REVIEW_MODE config. "auto" batches drafts of up to review_batched_max_words
+    words: short posts and emails gain little from six separate calls that
+    each re-read the same draft and context, long documents do.
+    """
+    chosen = mode or (type_config.review_mode if type_config else "") or deps.config.review_mode
+    if chosen == "auto":
+        words = len(content.split())
+        return "batched" if words <= deps.config.review_batched_max_words else "parallel"
+    if chosen not in REVIEW_MODES:
+        logger.warning("Unknown review mode %r, using parallel", chosen)
+        return "parallel"
+    return chosen
+
+
+def _failed_score(dimension: str, error: Exception) -> DimensionScore:
+    return DimensionScore(
+        dimension=dimension,
+        score=0,
+        status="issue",
+        issues=[f"Review failed: {error}"],
+    )
+
+
+async def _score_parallel(
+    content: str,
+    content_type: str | None,
+    configs: list[ReviewDimensionConfig],
+    deps: BrainDeps,
+    model: "Model | None",
+    limits: "UsageLimits",
+) -> list[DimensionScore]:
+    """One review_agent run per dimension, all concurrent."""
+    dim_details = {d["name"]: d for d in REVIEW_DIMENSIONS}
+    prompts = []
+    for dc in configs:
+        detail = dim_details[dc.name]
+        prompt = (
+            f"Review the following content for the **{detail['name']}** dimension.\n"
+            f"Focus: {detail['focus']}\n"
+            f"Checks: {detail['checks']}\n\n"
+            f"Content to review:\n{content}"
+        )
+        if content_type:
+            prompt += f"\nContent type: {content_type}"
+        prompts.append(prompt)
+
+    results = await asyncio.gather(
+        *[
+            review_agent.run(prompt, deps=deps, model=model, usage_limits=limits)
+            for prompt in prompts
+        ],
+        return_exceptions=True,
+    )
+
+    scores: list[DimensionScore] = []
+    for dc, result in zip(configs, results):
+        if isinstance(result, Exception):
+            logger.warning("Dimension %s failed: %s", dc.name, result)
+            scores.append(_failed_score(dc.name, result))
+        else:
+            scores.append(result.output)
+    return scores
+
+
+async def _score_batched(
+    content: str,
+    content_type: str | None,
+    configs: list[ReviewDimensionConfig],
+    deps: BrainDeps,
+    model: "Model | None",
+    limits: "UsageLimits",
+) -> list[DimensionScore]:
+    """All dimensions in one batched_review_agent run.
+
+    Dimensions the model leaves out are scored with per-dimension runs, so
+    the scorecard always covers every requested dimension.
+    """
+    dim_details = {d["name"]: d for d in REVIEW_DIMENSIONS}
+    lines = [
+        "Review the following content on each of these dimensions, "
+        "scoring every one independently:\n"
+    ]
+    for i, dc in enumerate(configs, 1):
+        detail = dim_details[dc.name]
+        lines.append(
+            f"{i}. **{detail['name']}** — Focus: {detail['focus']}\n"
+            f"   Checks: {detail['checks']}"
+        )
+    prompt = "\n".join(lines) + f"\n\nContent to review:\n{content}"
+    if content_type:
+        prompt += f"\nContent type: {content_type}"
+
+    try:
+        result = await batched_review_agent.run(prompt, deps=deps, model=model, usage_limits=limits)
+    except Exception as e:
+        logger.warning("Batched review failed: %s", e)
+        return [_failed_score(dc.name, e) for dc in configs]
+
+    output = result.output
+    returned = {s.dimension.strip().lower(): s for s in output.scores}
+    scored: dict[str, DimensionScore] = {}
+    missing: list[ReviewDimensionConfig] = []
+    for dc in configs:
+        score = returned.get(dc.name.lower())
+        if score is not None:
+            scored[dc.name] = score.model_copy(update={"dimension": dc.name})
+        elif output.error:
+            scored[dc.name] = DimensionScore(
+                dimension=dc.name, score=0, status="issue", error=output.error,
+            )
+        else:
+            missing.append(dc)
+    if missing:
+        logger.warning(
+            "Batched review skipped %s, scoring separately",
+            ", ".join(dc.name for dc in missing),
+        )
+        fallback = await _score_parallel(content, content_type, missing, deps, model, limits)
+        scored.update(zip((dc.name for dc in missing), fallback))
+    return [scored[dc.name] for dc in configs]
+
+
+async def _record_review(
+    content: str,
+    deps: BrainDeps,
+    content_type: str | None,
+    overall_score: float,
+    verdict: str,
+    scores: list[DimensionScore],
+    top_strengths: list[str],
+    critical_issues: list[str],
+) -> None:
+    """Review history and pattern failure tracking; failures are non-critical."""
+    # Record review history (non-blocking)
+    try:
+        await deps.storage_service.add_review_history({
+            "content_type": content_type or "",
+            "overall_score": overall_score,
+            "verdict": verdict,
+            "dimension_scores": [
+                {"dimension": s.dimension, "score": s.score, "status": s.status}
+                for s in scores
+            ],
+            "dimension_details": {s.dimension: s.score for s in scores if s.score is not None},
+            "top_strengths": top_strengths,
+            "critical_issues": critical_issues,
+            "content_preview": content[:200] if content else "",
+        })
+    except Exception:
+        logger.debug("Failed to record review history")
+
+    # Track pattern failures for confidence downgrade
+    try:
+        patterns = await deps.storage_service.get_patterns()
+        tasks = []
+        if overall_score < deps.config.confidence_downgrade_threshold:
+            for p in patterns:
+                applicable_types = p.get("applicable_content_types") or []
+                if not applicable_types or content_type in applicable_types:
+                    if p.get("confidence") != "LOW":
+                        tasks.append(deps.storage_service.update_pattern_failures(p["id"]))
+        else:
+            for p in patterns:
+                if p.get("consecutive_failures", 0) > 0:
+                    applicable_types = p.get("applicable_content_types") or []
+                    if not applicable_types or content_type in applicable_types:
+                        tasks.append(deps.storage_service.update_pattern_failures(p["id"], reset=True))
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    except Exception:
+        logger.debug("Pattern failure tracking failed (non-critical)")
+
+
 async def run_full_review(
     content: str,
     deps: BrainDeps,
     model: "Model | None",
     content_type: str | None = None,
+    mode: str | None = None,
+    record_history: bool = True,
 ) -> ReviewResult:
-    """Run dimension reviews in parallel and aggregate into a ReviewResult.
+    """Score the enabled dimensions and aggregate into a ReviewResult.
 
     If the content type has custom review_dimensions, only enabled dimensions
-    are scored and weights are applied to the overall score.
+    are scored and weights are applied to the overall score. Voice, positioning,
+    benchmarks and graph context are loaded once, concurrently, and shared by
+    every dimension run instead of each run fetching them through tools.
+
+    Dimensions are scored by one review_agent call each ("parallel") or all
+    in one batched_review_agent call ("batched"); see resolve_review_mode().
+    record_history=False skips review history and pattern failure tracking
+    (benchmarks and other dry runs).
     """
     # Determine which dimensions to use and their weights
     dim_configs: list[ReviewDimensionConfig] = list(DEFAULT_REVIEW_DIMENSIONS)
+    type_config = None
 
     if content_type:
         registry = deps.get_content_type_registry()
@@ -200,26 +464,13 @@ async def run_full_review(
         if type_config and type_config.review_dimensions:
             dim_configs = [d for d in type_config.review_dimensions if d.enabled]
 
-    # Build prompts only for enabled dimensions
+    # Score only dimensions that exist
     dim_details = {d["name"]: d for d in REVIEW_DIMENSIONS}
-    prompts = []
-    active_configs: list[ReviewDimensionConfig] = []
-    for dc in dim_configs:
-        detail = dim_details.get(dc.name)
-        if not detail:
-            continue
-        prompt = (
-            f"Review the following content for the **{detail['name']}** dimension.\n"
-            f"Focus: {detail['focus']}\n"
-            f"Checks: {detail['checks']}\n\n"
-            f"Content to review:\n{content}"
-        )
-        if content_type:
-            prompt += f"\nContent type: {content_type}"
-        prompts.append(prompt)
-        active_configs.append(dc)
+    active_configs = [dc for dc in dim_configs if dc.name in dim_details]
+    review_mode = resolve_review_mode(content, deps, type_config, mode)
+    score_dimensions = _score_batched if review_mode == "batched" else _score_parallel
 
-    # Timeout-protected parallel reviews
+    # Timeout-protected reviews
     from pydantic_ai.usage import UsageLimits
     limits = UsageLimits(request_limit=deps.config.pipeline_request_limit)
     timeout_seconds = (
@@ -228,29 +479,15 @@ async def run_full_review(
     )
     try:
         async with asyncio.timeout(timeout_seconds):
-            results = await asyncio.gather(
-                *[
-                    review_agent.run(prompt, deps=deps, model=model, usage_limits=limits)
-                    for prompt in prompts
-                ],
-                return_exceptions=True,
+            review_deps = await with_context_pack(
+                deps, "review", content[:500], content_type=content_type or "",
+            )
+            scores = await score_dimensions(
+                content, content_type, active_configs, review_deps, model, limits,
             )
     except TimeoutError:
         logger.warning("run_full_review timed out after %ds", timeout_seconds)
-        results = []
-
-    scores: list[DimensionScore] = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.warning("Dimension %s failed: %s", active_configs[i].name, result)
-            scores.append(DimensionScore(
-                dimension=active_configs[i].name,
-                score=0,
-                status="issue",
-                issues=[f"Review failed: {result}"],
-            ))
-        else:
-            scores.append(result.output)
+        scores = []
 
     # Compute weighted overall score
     valid_scores = [
@@ -292,44 +529,9 @@ async def run_full_review(
     else:
         summary = f"Content scores {overall_score}/10 overall and needs targeted revisions. Review the issues below before publishing."
 
-    # Record review history (non-blocking)
-    try:
-        await deps.storage_service.add_review_history({
-            "content_type": content_type or "",
-            "overall_score": overall_score,
-            "verdict": verdict,
-            "dimension_scores": [
-                {"dimension": s.dimension, "score": s.score, "status": s.status}
-                for s in scores
-            ],
-            "dimension_details": {s.dimension: s.score for s in scores if s.score is not None},
-            "top_strengths": top_strengths,
-            "critical_issues": critical_issues,
-            "content_preview": content[:200] if content else "",
-        })
-    except Exception:
-        logger.debug("Failed to record review history")
-
-    # Track pattern failures for confidence downgrade
-    try:
-        patterns = await deps.storage_service.get_patterns()
-        tasks = []
-        if overall_score < deps.config.confidence_downgrade_threshold:
-            for p in patterns:
-                applicable_types = p.get("applicable_content_types") or []
-                if not applicable_types or content_type in applicable_types:
-                    if p.get("confidence") != "LOW":
-                        tasks.append(deps.storage_service.update_pattern_failures(p["id"]))
-        else:
-            for p in patterns:
-                if p.get("consecutive_failures", 0) > 0:
-                    applicable_types = p.get("applicable_content_types") or []
-                    if not applicable_types or content_type in applicable_types:
-                        tasks.append(deps.storage_service.update_pattern_failures(p["id"], reset=True))
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-    except Exception:
-        logger.debug("Pattern failure tracking failed (non-critical)")
+    if record_history:
+        await _record_review(content, deps, content_type, overall_score, verdict, scores,
+                             top_strengths, critical_issues)
 
     return ReviewResult(
         scores=scores,
@@ -339,4 +541,5 @@ async def run_full_review(
         top_strengths=top_strengths,
         critical_issues=critical_issues,
         next_steps=next_steps,
+        review_mode=review_mode,
     )
@@ -6,6 +6,7 @@ second brain system architecture with mandatory source attribution.
 
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, format_pattern_registry, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import SpecialistAnswer
@@ -77,6 +78,7 @@ async def validate_specialist(ctx: RunContext[BrainDeps], output: SpecialistAnsw
 
 
 @specialist_agent.tool
+@run_memoized
 async def search_codebase_knowledge(ctx: RunContext[BrainDeps], query: str) -> str:
     """Search the brain's knowledge base for technical information."""
     try:
@@ -96,6 +98,7 @@ async def search_codebase_knowledge(ctx: RunContext[BrainDeps], query: str) -> s
 
 
 @specialist_agent.tool
+@run_memoized
 async def search_patterns_for_answer(ctx: RunContext[BrainDeps], topic: str) -> str:
     """Search patterns registry for technical patterns."""
     try:
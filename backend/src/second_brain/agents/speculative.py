@@ -0,0 +1,103 @@
+"""Speculative memory retrieval while a chat request is being routed.
+
+Recall and ask, by far the most common chat routes, both open with a
+memory search for the message. Instead of waiting for routing to finish,
+/api/chat starts that search up front:
+
+- if the request is routed to recall/recall_deep/ask, the prefetched
+  memories are injected into the agent's prompt;
+- for any other route the search is cancelled (or its result dropped).
+
+Speculations whose result was never used count as waste:
+speculative_recall_stats(), served on GET /api/health/runtime.
+"""
+
+import asyncio
+import logging
+import threading
+
+from second_brain.agents.utils import format_memories, format_relations, is_conversational
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_ROUTES = frozenset({"recall", "recall_deep", "ask"})
+
+_lock = threading.Lock()
+_stats = {"started": 0, "used": 0, "wasted": 0, "failed": 0}
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+class SpeculativeRecall:
+    """One in-flight memory search started before the route is known."""
+
+    def __init__(self, deps, message: str):
+        self.message = message
+        self._task: asyncio.Task = asyncio.ensure_future(deps.memory_service.search(
+            message, limit=deps.config.memory_search_limit,
+        ))
+        self._settled = False
+        _count("started")
+
+    def discard(self) -> None:
+        """The route does not need memory: cancel the search, count it as waste."""
+        if self._settled:
+            return
+        self._settled = True
+        self._task.cancel()
+        _count("wasted")
+
+    async def inject(self, timeout: float | None = None) -> str:
+        """The message with the prefetched memories prepended (the bare message on failure)."""
+        if self._settled:
+            return self.message
+        self._settled = True
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self._task
+            memories = format_memories(list(result.memories))
+            relations = format_relations(list(result.relations))
+        except Exception as e:
+            self._task.cancel()
+            _count("failed")
+            logger.debug("Speculative recall failed: %s", type(e).__name__)
+            return self.message
+        _count("used")
+        if not memories and not relations:
+            return self.message
+        context = "\n".join(part for part in (memories, relations) if part)
+        return (
+            "Prefetched memory search results for this request (search further if needed):\n"
+            f"{context}\n\n"
+            f"Request: {self.message}"
+        )
+
+
+def start_speculative_recall(deps, message: str) -> SpeculativeRecall | None:
+    """Start a memory search for `message` if enabled and the message is not small talk."""
+    if not deps.config.speculative_recall_enabled or is_conversational(message):
+        return None
+    try:
+        return SpeculativeRecall(deps, message)
+    except Exception as e:
+        logger.debug("Speculative recall not started: %s", type(e).__name__)
+        return None
+
+
+def speculative_recall_stats() -> dict:
+    """Started/used/wasted/failed speculations and the share that was wasted."""
+    with _lock:
+        stats = dict(_stats)
+    settled = stats["used"] + stats["wasted"] + stats["failed"]
+    stats["waste_ratio"] = round(stats["wasted"] / settled, 3) if settled else 0.0
+    return stats
+
+
+def reset_speculative_recall_stats() -> None:
+    """Zero all counters (tests)."""
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
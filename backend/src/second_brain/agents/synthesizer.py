@@ -6,6 +6,7 @@ actions with priority, effort estimates, dependencies, and ownership.
 
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import SynthesizerResult
@@ -95,6 +96,7 @@ async def validate_synthesis(
 
 
 @synthesizer_agent.tool
+@run_memoized
 async def load_past_reviews(ctx: RunContext[BrainDeps], content_type: str = "") -> str:
     """Load past review history for context on recurring issues."""
     try:
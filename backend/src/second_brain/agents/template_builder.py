@@ -6,6 +6,7 @@ fill-in-the-blank template with [PLACEHOLDER] markers.
 
 import logging
 from pydantic_ai import Agent, ModelRetry, RunContext
+from second_brain.agents.tool_memo import run_memoized
 from second_brain.agents.utils import all_tools_failed, format_pattern_registry, tool_error
 from second_brain.deps import BrainDeps
 from second_brain.schemas import DeconstructedTemplate
@@ -93,6 +94,7 @@ async def validate_template(
 
 
 @template_builder_agent.tool
+@run_memoized
 async def search_existing_patterns(ctx: RunContext[BrainDeps], topic: str = "") -> str:
     """Search for existing patterns that might already cover this template."""
     try:
@@ -105,6 +107,7 @@ async def search_existing_patterns(ctx: RunContext[BrainDeps], topic: str = "")
 
 
 @template_builder_agent.tool
+@run_memoized
 async def search_examples(ctx: RunContext[BrainDeps], content_type: str = "") -> str:
     """Search examples to identify recurring structures."""
     try:
@@ -122,6 +125,7 @@ async def search_examples(ctx: RunContext[BrainDeps], content_type: str = "") ->
 
 
 @template_builder_agent.tool
+@run_memoized
 async def search_template_bank(ctx: RunContext[BrainDeps], content_type: str = "") -> str:
     """Search the template bank for existing templates of this content type."""
     try:
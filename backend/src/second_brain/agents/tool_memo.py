@@ -0,0 +1,109 @@
+"""Run-scoped memoization of read-only agent tools.
+
+When an output validator raises ModelRetry (recall, review, create,
+chief_of_staff...), the model usually re-issues the tool calls it already
+made: the same `search_semantic_memory` query, another `load_voice_reference`.
+Read-only tools are decorated so a repeat within one agent run returns the
+earlier result instead of hitting Mem0, Voyage and Supabase again:
+
+    @recall_agent.tool
+    @run_memoized
+    async def search_semantic_memory(ctx: RunContext[BrainDeps], query: str) -> str:
+        ...
+
+Results are keyed by tool function and normalized arguments, and live for
+one run (one RunUsage, so sub-agents run with `usage=ctx.usage` share it).
+Side-effecting tools opt out by not being decorated. BACKEND_ERROR results
+are never reused, and any brain write (services.write_generation) makes
+earlier results miss, so a run that stores a pattern sees it on its next
+search. Disable with TOOL_MEMO_ENABLED=false; counters: tool_memo_stats(),
+served on GET /api/health/runtime.
+"""
+
+import functools
+import inspect
+import json
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic_ai import RunContext
+
+from second_brain.agents.utils import TOOL_ERROR_PREFIX
+from second_brain.services.write_generation import write_generation
+
+ToolFunc = TypeVar("ToolFunc", bound=Callable[..., Awaitable[Any]])
+
+_lock = threading.Lock()
+# id(run usage) -> {(tool, args, write generation): result}; entries are
+# dropped when the run's RunUsage is garbage collected
+_memos: dict[int, dict[tuple, Any]] = {}
+_stats = {"hits": 0, "misses": 0, "uncached_errors": 0}
+
+
+def _run_memo(ctx: RunContext) -> dict[tuple, Any]:
+    key = id(ctx.usage)
+    with _lock:
+        memo = _memos.get(key)
+        if memo is None:
+            memo = _memos[key] = {}
+            weakref.finalize(ctx.usage, _forget_run, key)
+        return memo
+
+
+def _forget_run(key: int) -> None:
+    with _lock:
+        _memos.pop(key, None)
+
+
+def run_memoized(func: ToolFunc) -> ToolFunc:
+    """Reuse the result of an identical earlier call to `func` within the same agent run.
+
+    For `@agent.tool` functions taking RunContext first; apply below the
+    agent decorator. Only for tools without side effects.
+    """
+    signature = inspect.signature(func)
+    tool_id = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    async def wrapper(ctx: RunContext, *args, **kwargs):
+        if not ctx.deps.config.tool_memo_enabled:
+            return await func(ctx, *args, **kwargs)
+        bound = signature.bind(ctx, *args, **kwargs)
+        bound.apply_defaults()
+        call_args = dict(list(bound.arguments.items())[1:])
+        key = (tool_id, json.dumps(call_args, sort_keys=True, default=str), write_generation())
+        memo = _run_memo(ctx)
+        if key in memo:
+            with _lock:
+                _stats["hits"] += 1
+            return memo[key]
+
+        result = await func(ctx, *args, **kwargs)
+        with _lock:
+            _stats["misses"] += 1
+            if isinstance(result, str) and result.startswith(TOOL_ERROR_PREFIX):
+                # Transient backend failures get a fresh attempt on retry
+                _stats["uncached_errors"] += 1
+            else:
+                memo[key] = result
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def tool_memo_stats() -> dict:
+    with _lock:
+        stats = dict(_stats)
+        stats["active_runs"] = len(_memos)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def clear_tool_memo_stats() -> None:
+    """Reset counters (tests)."""
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
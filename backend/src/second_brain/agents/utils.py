@@ -750,108 +750,234 @@ async def run_agent_with_retry(
     return last_result
 
 
+def parse_pipeline_steps(spec: str) -> tuple[list[str], dict[str, list[str]]]:
+    """Parse a comma-separated step list with optional dependency annotations.
+
+    "recall,create,review" is a linear chain (no dependencies returned).
+    "recall,ask,create<recall+ask,review<create,clarity<create" runs
+    recall and ask in parallel, then create, then review and clarity in
+    parallel. Once any step is annotated, unannotated steps have no
+    dependencies.
+    """
+    steps: list[str] = []
+    dependencies: dict[str, list[str]] = {}
+    for item in spec.split(","):
+        name, annotated, needs = item.partition("<")
+        name = name.strip()
+        if not name:
+            continue
+        steps.append(name)
+        if annotated:
+            dependencies[name] = [d.strip() for d in needs.split("+") if d.strip()]
+    return steps, dependencies
+
+
+def _step_ids(steps: list[str]) -> list[str]:
+    """Unique id per step: the name, suffixed _2, _3... for repeated names."""
+    seen: dict[str, int] = {}
+    ids = []
+    for name in steps:
+        seen[name] = seen.get(name, 0) + 1
+        ids.append(name if seen[name] == 1 else f"{name}_{seen[name]}")
+    return ids
+
+
+def _pipeline_graph(ids: list[str], dependencies: dict[str, list[str]] | None) -> dict[str, list[str]]:
+    """Step id -> ids it waits for. Linear chain without (or with cyclic) dependencies."""
+    linear = {sid: ids[i - 1:i] for i, sid in enumerate(ids)}
+    if not dependencies:
+        return linear
+    graph = {}
+    for sid in ids:
+        wanted = dependencies.get(sid, [])
+        unknown = [d for d in wanted if d not in ids or d == sid]
+        if unknown:
+            logger.warning("Pipeline step '%s' ignores unknown dependencies: %s", sid, ", ".join(unknown))
+        graph[sid] = [d for d in dict.fromkeys(wanted) if d in ids and d != sid]
+
+    # Kahn's algorithm: every step must become ready
+    remaining = {sid: len(needs) for sid, needs in graph.items()}
+    ready = [sid for sid, n in remaining.items() if n == 0]
+    resolved = 0
+    while ready:
+        sid = ready.pop()
+        resolved += 1
+        for other, needs in graph.items():
+            if sid in needs:
+                remaining[other] -= 1
+                if remaining[other] == 0:
+                    ready.append(other)
+    if resolved < len(ids):
+        logger.warning("Pipeline dependencies contain a cycle, running steps in order")
+        return linear
+    return graph
+
+
+def _step_summary(step_name: str, output: Any) -> str:
+    """The part of a step's output that downstream steps need as context."""
+    if step_name == "review":
+        return (
+            f"Score {output.overall_score}/10 — {output.verdict}\n"
+            f"Strengths: {', '.join(output.top_strengths[:3])}\n"
+            f"Issues: {', '.join(output.critical_issues[:3])}"
+        )
+    if hasattr(output, "summary") and output.summary:
+        return output.summary
+    if hasattr(output, "draft") and output.draft:
+        return output.draft
+    if hasattr(output, "answer") and output.answer:
+        return output.answer
+    return str(output)
+
+
 async def run_pipeline(
     steps: list[str],
     initial_prompt: str,
     deps: "BrainDeps",
     model: "Model | None" = None,
     content_type: str | None = None,
+    on_step: Callable[[dict[str, Any]], None] | None = None,
+    dependencies: dict[str, list[str]] | None = None,
 ) -> dict[str, Any]:
-    """Run a multi-agent pipeline, chaining results between agents.
+    """Run a multi-agent pipeline as a dependency graph.
 
-    Each step's output is formatted and prepended to the next step's prompt.
-    Special handling for 'review' step (uses run_full_review).
+    Without `dependencies` the steps form a chain, each one seeing the
+    previous step's output. With them, every step waits only for the steps
+    it names, and steps whose dependencies are met run concurrently. A step
+    receives the structured outputs of its dependencies: their summaries in
+    its prompt, and review steps review the upstream draft. Failed and
+    skipped steps don't block their dependents.
 
     Args:
-        steps: Ordered list of AgentRoute names (e.g., ["recall", "create", "review"])
+        steps: AgentRoute names (e.g., ["recall", "create", "review"]).
+            Repeated names get ids "review_2", "review_3"...
         initial_prompt: The user's original request
         deps: BrainDeps instance
         model: Optional model override
         content_type: Content type for create/review steps
+        on_step: Called with {"step", "index", "total", "status"} as each step
+            starts and ends; status is start, done, error or skipped. Done and
+            error events carry "seconds".
+        dependencies: Step id -> step ids whose output it needs. Unknown ids
+            are ignored; a cycle falls back to running the steps in order.
 
     Returns:
-        Dict mapping step name to its output, plus "final" key with last step's output.
+        Dict mapping step id to its output, "final" with the last step's
+        output, and "timings" with {"steps": {id: seconds}, "total": seconds}.
     """
     from pydantic_ai.usage import UsageLimits
 
     from second_brain.agents.registry import get_agent_registry
     registry = get_agent_registry()
     limits = UsageLimits(request_limit=deps.config.pipeline_request_limit)
-    results = {}
-    current_context = initial_prompt
-
-    for i, step_name in enumerate(steps):
-        if step_name not in registry:
-            logger.warning("Pipeline step '%s' not in registry, skipping", step_name)
-            continue
-
+    ids = _step_ids(steps)
+    names = dict(zip(ids, steps))
+    index = {sid: i for i, sid in enumerate(ids)}
+    graph = _pipeline_graph(ids, dependencies)
+    results: dict[str, Any] = {}
+    outputs: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+
+    def report(sid: str, status: str, **extra: Any) -> None:
+        if on_step is not None:
+            on_step({"step": sid, "index": index[sid], "total": len(ids), "status": status, **extra})
+
+    async def run_step(sid: str) -> None:
+        step_name = names[sid]
         agent, description = registry[step_name]
-        logger.info("Pipeline step %d/%d: %s (%s)", i + 1, len(steps), step_name, description)
-
+        logger.info("Pipeline step %d/%d: %s (%s)", index[sid] + 1, len(ids), sid, description)
+        report(sid, "start")
+        upstream = [outputs[d] for d in graph[sid] if d in outputs]
+        context = "\n\n".join(
+            [initial_prompt]
+            + [f"[Context from {d}]: {_step_summary(names[d], outputs[d])}" for d in graph[sid] if d in outputs]
+        )
         step_timeout = deps.config.api_timeout_seconds
         if step_name == "review":
             step_timeout *= deps.config.mcp_review_timeout_multiplier
+        start = _time.monotonic()
         try:
             async with asyncio.timeout(step_timeout):
                 # Per-step model resolution
                 from second_brain.models import get_agent_model
                 step_model = get_agent_model(step_name, deps.config)
 
-                # Special handling for review — uses run_full_review()
+                # Special handling for review — uses run_full_review() on the upstream draft
                 if step_name == "review":
                     from second_brain.agents.review import run_full_review
-                    # Use previous step's output as content to review
-                    content_to_review = current_context
-                    if "create" in results:
-                        content_to_review = str(results["create"])
-                    review_result = await run_full_review(
+                    content_to_review = next(
+                        (o.draft for o in reversed(upstream)
+                         if isinstance(getattr(o, "draft", None), str) and o.draft),
+                        context,
+                    )
+                    output = await run_full_review(
                         content=content_to_review,
                         deps=deps,
                         model=step_model,
                         content_type=content_type,
                     )
-                    results[step_name] = review_result
-                    current_context = (
-                        f"{current_context}\n\n"
-                        f"[Review result]: Score {review_result.overall_score}/10 — "
-                        f"{review_result.verdict}\n"
-                        f"Strengths: {', '.join(review_result.top_strengths[:3])}\n"
-                        f"Issues: {', '.join(review_result.critical_issues[:3])}"
+                else:
+                    # Content agents get voice/examples/patterns up front instead of via tools
+                    from second_brain.agents.context_pack import with_context_pack
+                    step_deps = await with_context_pack(
+                        deps, step_name, initial_prompt,
+                        content_type=content_type if step_name == "create" else None,
                     )
-                    continue
-
-                # Standard agent execution
-                kwargs = {"deps": deps, "usage_limits": limits}
-                if step_model is not None:
-                    kwargs["model"] = step_model
-
-                result = await agent.run(current_context, **kwargs)
-                results[step_name] = result.output
-
-                # Build context for next step
-                output_str = str(result.output)
-                if hasattr(result.output, "summary") and result.output.summary:
-                    output_str = result.output.summary
-                elif hasattr(result.output, "draft") and result.output.draft:
-                    output_str = result.output.draft
-                elif hasattr(result.output, "answer") and result.output.answer:
-                    output_str = result.output.answer
-
-                current_context = (
-                    f"{initial_prompt}\n\n"
-                    f"[Context from {step_name}]: {output_str}"
-                )
-
+                    kwargs = {"deps": step_deps, "usage_limits": limits}
+                    if step_model is not None:
+                        kwargs["model"] = step_model
+                    result = await agent.run(context, **kwargs)
+                    output = result.output
         except TimeoutError:
-            logger.error("Pipeline step '%s' timed out after %ss", step_name, step_timeout)
-            results[step_name] = {"error": f"Step timed out after {step_timeout}s"}
+            logger.error("Pipeline step '%s' timed out after %ss", sid, step_timeout)
+            results[sid] = {"error": f"Step timed out after {step_timeout}s"}
         except Exception as e:
-            logger.error("Pipeline step '%s' failed: %s", step_name, type(e).__name__)
-            logger.debug("Pipeline step '%s' error detail: %s", step_name, e)
-            results[step_name] = {"error": f"Step failed: {type(e).__name__}"}
-            # Continue pipeline — don't block remaining steps
+            logger.error("Pipeline step '%s' failed: %s", sid, type(e).__name__)
+            logger.debug("Pipeline step '%s' error detail: %s", sid, e)
+            results[sid] = {"error": f"Step failed: {type(e).__name__}"}
+        else:
+            results[sid] = outputs[sid] = output
+        timings[sid] = round(_time.monotonic() - start, 3)
+        if sid in outputs:
+            report(sid, "done", seconds=timings[sid])
+        else:
+            # Continue pipeline — dependents run without this step's output
+            report(sid, "error", error=results[sid]["error"], seconds=timings[sid])
+
+    pending = list(ids)
+    finished: set[str] = set()
+    running: dict[asyncio.Task, str] = {}
+    started = _time.monotonic()
+
+    def schedule() -> None:
+        progressed = True
+        while progressed:
+            progressed = False
+            for sid in list(pending):
+                if not all(d in finished for d in graph[sid]):
+                    continue
+                pending.remove(sid)
+                if names[sid] not in registry:
+                    logger.warning("Pipeline step '%s' not in registry, skipping", names[sid])
+                    report(sid, "skipped")
+                    finished.add(sid)
+                    progressed = True
+                else:
+                    running[asyncio.create_task(run_step(sid))] = sid
 
-    results["final"] = results.get(steps[-1], None) if steps else None
+    try:
+        schedule()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                finished.add(running.pop(task))
+            schedule()
+    finally:
+        for task in running:
+            task.cancel()
+
+    results["final"] = results.get(ids[-1], None) if ids else None
+    results["timings"] = {"steps": timings, "total": round(_time.monotonic() - started, 3)}
     return results
 
 
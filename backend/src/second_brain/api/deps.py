@@ -32,6 +32,34 @@ def get_model(request: Request) -> "Model":
     return model
 
 
+def resolve_agent_model(request: Request, agent_name: str) -> "Model":
+    """The model for `agent_name`: its AGENT_MODEL_OVERRIDES entry, else the app model.
+
+    Override models come from the shared registry in second_brain.models, so
+    they are built once per process, not per request. Either way the model
+    is wrapped in the LLM output cache when it is enabled for the agent.
+    """
+    config = request.app.state.deps.config
+    if agent_name in config.agent_model_overrides:
+        from second_brain.models import get_agent_model
+        try:
+            return get_agent_model(agent_name, config)
+        except Exception as e:
+            logger.warning("Model override for %s failed: %s", agent_name, type(e).__name__)
+            logger.debug("Model override error detail: %s", e)
+    from second_brain.services.llm_cache import with_llm_cache
+    return with_llm_cache(get_model(request), agent_name, config)
+
+
+def agent_model(agent_name: str):
+    """Dependency factory: the model for `agent_name`, honoring per-agent overrides."""
+
+    def dependency(request: Request) -> "Model":
+        return resolve_agent_model(request, agent_name)
+
+    return dependency
+
+
 _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
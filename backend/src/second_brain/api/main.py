@@ -9,6 +9,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from second_brain.config import BrainConfig
 from second_brain.deps import create_deps
 from second_brain.models import get_model as get_model_fn
+from second_brain.services.community_maintenance import start_community_maintenance
+from second_brain.services.executors import shutdown_executors
+from second_brain.services.warmup import start_warmup
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,8 @@ async def lifespan(app: FastAPI):
     config = app.state.config  # Set by create_app before lifespan runs
     logger.info("Initializing Second Brain deps for API...")
     app.state.init_error = None
+    app.state.warmup = None
+    app.state.community_maintainer = None
     try:
         deps = create_deps()
         app.state.deps = deps
@@ -39,8 +44,20 @@ async def lifespan(app: FastAPI):
         logger.error("LLM model init failed (agents will be unavailable): %s", e)
         app.state.model = None
         app.state.init_error = f"LLM model: {e}"
+    if deps.config.warmup_enabled:
+        app.state.warmup = start_warmup(deps)
+    if deps.graphiti_service:
+        app.state.community_maintainer = start_community_maintenance(
+            deps.graphiti_service, deps.config,
+        )
     yield
     logger.info("Second Brain API shutting down")
+    warmup = app.state.warmup
+    if warmup is not None and warmup.task is not None:
+        warmup.task.cancel()
+    if app.state.community_maintainer is not None:
+        app.state.community_maintainer.stop()
+    shutdown_executors()
 
 
 def create_app() -> FastAPI:
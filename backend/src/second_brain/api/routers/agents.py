@@ -2,16 +2,18 @@
 
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 if TYPE_CHECKING:
     from pydantic_ai.models import Model
 
 from second_brain.deps import BrainDeps
-from second_brain.api.deps import get_deps, get_model
+from second_brain.api.deps import agent_model, get_deps, resolve_agent_model
 from second_brain.api.schemas import (
     AskRequest,
     ChatRequest,
@@ -31,14 +33,22 @@ from second_brain.api.schemas import (
     TemplateRequest,
 )
 from second_brain.agents.recall import recall_agent
+from second_brain.agents.answer_cache import lookup_answer, store_answer
 from second_brain.agents.ask import ask_agent
 from second_brain.agents.learn import learn_agent
 from second_brain.agents.create import create_agent
 from second_brain.agents.review import run_full_review
+from second_brain.api.streaming import SSE_HEADERS, AgentStream, PipelineStream, sse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Agents"])
 
+_CONVERSATIONAL_ANSWER = (
+    "Hey! I'm your Second Brain assistant. "
+    "Ask me anything — I can search your memory, help with content, "
+    "review your work, or answer questions using your accumulated knowledge."
+)
+
 
 async def _run_agent(
     name: str,
@@ -49,32 +59,70 @@ async def _run_agent(
 
     Returns the result on success. Raises HTTPException on timeout or failure.
     """
+    async with _agent_stage(name, timeout):
+        return await coro()
+
+
+def _agent_error(name: str, e: Exception) -> HTTPException:
+    """Map an agent failure to the HTTP error the endpoint answers with."""
+    error_name = type(e).__name__
+    if error_name == "UnexpectedModelBehavior":
+        logger.warning("%s agent exhausted retries: %s", name, e)
+        return HTTPException(
+            503,
+            detail={
+                "error": f"{name} service degraded",
+                "message": "Backend memory services may be temporarily unavailable.",
+                "suggestion": "Try again in a few minutes, or use quick_recall for direct search.",
+                "retry_after": 30,
+            },
+        )
+    logger.error("%s agent failed: %s", name, e, exc_info=True)
+    return HTTPException(502, detail=f"{name} failed: {error_name}: {e}")
+
+
+@asynccontextmanager
+async def _agent_stage(name: str, timeout: float) -> AsyncIterator[None]:
+    """Timeout and error handling of _run_agent for a block that may stream."""
     try:
         async with asyncio.timeout(timeout):
-            return await coro()
+            yield
     except TimeoutError:
         raise HTTPException(504, detail=f"{name} timed out after {timeout}s")
     except HTTPException:
         raise
     except Exception as e:
-        error_name = type(e).__name__
-        if error_name == "UnexpectedModelBehavior":
-            logger.warning("%s agent exhausted retries: %s", name, e)
-            raise HTTPException(
-                503,
-                detail={
-                    "error": f"{name} service degraded",
-                    "message": "Backend memory services may be temporarily unavailable.",
-                    "suggestion": "Try again in a few minutes, or use quick_recall for direct search.",
-                    "retry_after": 30,
-                },
-            )
-        logger.error("%s agent failed: %s", name, e, exc_info=True)
-        raise HTTPException(502, detail=f"{name} failed: {error_name}: {e}")
+        raise _agent_error(name, e)
+
+
+def _event_stream(name: str, events: AsyncIterator[str]) -> StreamingResponse:
+    """Serve `events` as server-sent events; failures become a final `error` event."""
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for event in events:
+                yield event
+        except HTTPException as e:
+            yield sse("error", {"status_code": e.status_code, "detail": e.detail})
+        except Exception as e:
+            error = _agent_error(name, e)
+            yield sse("error", {"status_code": error.status_code, "detail": error.detail})
+
+    return StreamingResponse(body(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+async def _stream_agent_result(
+    name: str, agent: Any, prompt: str, deps: BrainDeps, model: "Model | None",
+) -> AsyncIterator[str]:
+    """Token deltas of one agent run, then its output as the `result` event."""
+    stream = AgentStream(agent, prompt, deps, model)
+    async with _agent_stage(name, deps.config.api_timeout_seconds):
+        async for event in stream.events():
+            yield event
+    yield sse("result", stream.output.model_dump())
 
 
 @router.post("/recall")
-async def recall(body: RecallRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def recall(body: RecallRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("recall"))) -> dict[str, Any]:
     """Search memory for relevant context, patterns, and past experiences."""
     result = await _run_agent(
         "Recall",
@@ -85,31 +133,61 @@ async def recall(body: RecallRequest, deps: BrainDeps = Depends(get_deps), model
 
 
 @router.post("/ask")
-async def ask(body: AskRequest, deps: BrainDeps = Depends(get_deps), model: "Model | None" = Depends(get_model)) -> dict[str, Any]:
+async def ask(body: AskRequest, deps: BrainDeps = Depends(get_deps), model: "Model | None" = Depends(agent_model("ask"))) -> dict[str, Any]:
     """Ask the Second Brain a question."""
     # Short-circuit for greetings and small talk
-    from second_brain.agents.utils import is_conversational
-    if is_conversational(body.question):
-        from second_brain.schemas import AskResult
-        return AskResult(
-            answer=(
-                "Hey! I'm your Second Brain assistant. "
-                "Ask me anything — I can search your memory, help with content, "
-                "review your work, or answer questions using your accumulated knowledge."
-            ),
-            is_conversational=True,
-            confidence="HIGH",
-        ).model_dump()
+    greeting = _conversational_ask(body.question)
+    if greeting is not None:
+        return greeting
+    lookup = await lookup_answer(deps, body.question)
+    if lookup and lookup.answer:
+        return {**lookup.answer.model_dump(), **lookup.response_fields()}
     result = await _run_agent(
         "Ask",
         lambda: ask_agent.run(body.question, deps=deps, model=model),
         deps.config.api_timeout_seconds,
     )
+    store_answer(deps, lookup, result.output)
     return result.output.model_dump()
 
 
+@router.post("/ask/stream")
+async def ask_stream(body: AskRequest, deps: BrainDeps = Depends(get_deps), model: "Model | None" = Depends(agent_model("ask"))) -> StreamingResponse:
+    """Ask the Second Brain a question, streaming the answer as server-sent events."""
+    async def events() -> AsyncIterator[str]:
+        greeting = _conversational_ask(body.question)
+        if greeting is not None:
+            yield sse("result", greeting)
+            return
+        lookup = await lookup_answer(deps, body.question)
+        if lookup and lookup.answer:
+            yield sse("result", {**lookup.answer.model_dump(), **lookup.response_fields()})
+            return
+        stream = AgentStream(ask_agent, body.question, deps, model)
+        async with _agent_stage("Ask", deps.config.api_timeout_seconds):
+            async for event in stream.events():
+                yield event
+        store_answer(deps, lookup, stream.output)
+        yield sse("result", stream.output.model_dump())
+
+    return _event_stream("Ask", events())
+
+
+def _conversational_ask(question: str) -> dict[str, Any] | None:
+    """The canned /ask answer for greetings and small talk, else None."""
+    from second_brain.agents.utils import is_conversational
+    if not is_conversational(question):
+        return None
+    from second_brain.schemas import AskResult
+    return AskResult(
+        answer=_CONVERSATIONAL_ANSWER,
+        is_conversational=True,
+        confidence="HIGH",
+    ).model_dump()
+
+
 @router.post("/learn")
-async def learn(body: LearnRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def learn(body: LearnRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("learn"))) -> dict[str, Any]:
     """Extract patterns and learnings from content."""
     prompt = f"Extract learnings from this work session (category: {body.category}):\n\n{body.content}"
     result = await _run_agent(
@@ -121,8 +199,33 @@ async def learn(body: LearnRequest, deps: BrainDeps = Depends(get_deps), model:
 
 
 @router.post("/create")
-async def create_content(body: CreateContentRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def create_content(body: CreateContentRequest, request: Request, deps: BrainDeps = Depends(get_deps)) -> dict[str, Any]:
     """Draft content in your voice using brain knowledge."""
+    name, agent, prompt, deps = await _create_call(body, deps)
+    model = resolve_agent_model(request, "linkedin_writer" if body.content_type == "linkedin" else "create")
+    result = await _run_agent(
+        name,
+        lambda: agent.run(prompt, deps=deps, model=model),
+        deps.config.api_timeout_seconds,
+    )
+    return result.output.model_dump()
+
+
+@router.post("/create/stream")
+async def create_content_stream(body: CreateContentRequest, request: Request, deps: BrainDeps = Depends(get_deps)) -> StreamingResponse:
+    """Draft content in your voice, streaming the draft as server-sent events."""
+    name, agent, prompt, deps = await _create_call(body, deps)
+    model = resolve_agent_model(request, "linkedin_writer" if body.content_type == "linkedin" else "create")
+    return _event_stream(name, _stream_agent_result(name, agent, prompt, deps, model))
+
+
+async def _create_call(body: CreateContentRequest, deps: BrainDeps) -> tuple[str, Any, str, BrainDeps]:
+    """Agent name, agent, prompt and run deps (with context pack) for a /create request.
+
+    Raises HTTPException on bad input.
+    """
+    from second_brain.agents.context_pack import with_context_pack
+
     # Validate user_id against allowed list
     effective_uid = body.user_id.strip().lower() if body.user_id and body.user_id.strip() else None
     if effective_uid:
@@ -136,36 +239,11 @@ async def create_content(body: CreateContentRequest, deps: BrainDeps = Depends(g
         available = await registry.slugs()
         raise HTTPException(400, detail=f"Unknown content type '{body.content_type}'. Available: {', '.join(available)}")
 
-    # Pre-load voice guide (scoped to user_id if provided)
-    voice_sections = []
-    try:
-        voice_content = await deps.storage_service.get_memory_content(
-            "style-voice", override_user_id=effective_uid,
-        )
-        if voice_content:
-            for item in voice_content:
-                title = item.get("title", "Untitled")
-                text = item.get("content", "")[:deps.config.content_preview_limit]
-                voice_sections.append(f"### {title}\n{text}")
-    except Exception:
-        logger.debug("Failed to pre-load voice guide")
-
-    # Pre-load examples (scoped to user_id if provided)
-    example_sections = []
-    try:
-        examples = await deps.storage_service.get_examples(
-            content_type=body.content_type, override_user_id=effective_uid,
-        )
-        if examples:
-            limit = deps.config.experience_limit
-            for ex in examples[:limit]:
-                title = ex.get("title", "Untitled")
-                text = ex.get("content", "")[:deps.config.content_preview_limit]
-                example_sections.append(f"### {title}\n{text}")
-    except Exception:
-        logger.debug("Failed to pre-load examples")
-
-    timeout = deps.config.api_timeout_seconds
+    # Voice guide, examples, patterns, etc. fetched in parallel (scoped to user_id if provided)
+    agent_name = "linkedin_writer" if body.content_type == "linkedin" else "create"
+    deps = await with_context_pack(
+        deps, agent_name, body.prompt, effective_uid, content_type=body.content_type,
+    )
 
     # Route LinkedIn content to dedicated LinkedIn Writer agent
     if body.content_type == "linkedin":
@@ -174,22 +252,12 @@ async def create_content(body: CreateContentRequest, deps: BrainDeps = Depends(g
         writer_prompt = f"Write a LinkedIn post about: {body.prompt}"
         if effective_uid:
             writer_prompt += f"\nVoice profile: {effective_uid}"
-        if voice_sections:
-            writer_prompt += "\n\n## Your Voice & Tone Guide\n" + "\n\n".join(voice_sections)
-        if example_sections:
-            writer_prompt += "\n\n## Reference Examples (linkedin)\n" + "\n\n".join(example_sections)
         if body.structure_hint:
             writer_prompt += (
                 "\n\n## Structure Template (MANDATORY)\n"
                 f"{body.structure_hint}"
             )
-
-        result = await _run_agent(
-            "LinkedIn Writer",
-            lambda: linkedin_writer_agent.run(writer_prompt, deps=deps, model=model),
-            timeout,
-        )
-        return result.output.model_dump()
+        return "LinkedIn Writer", linkedin_writer_agent, writer_prompt, deps
 
     # Build enhanced prompt (mirrors mcp_server.py create_content)
     enhanced_parts = [
@@ -213,33 +281,32 @@ async def create_content(body: CreateContentRequest, deps: BrainDeps = Depends(g
         )
     if effective_uid:
         enhanced_parts.append(f"\nVoice profile: {effective_uid}")
-    if voice_sections:
-        enhanced_parts.append("\n## Your Voice & Tone Guide\n" + "\n\n".join(voice_sections))
-    else:
-        enhanced_parts.append(
-            "\nNo voice guide stored yet. Write in a clear, direct, conversational tone. "
-            "Avoid corporate speak and AI-sounding phrases."
-        )
-    if example_sections:
-        enhanced_parts.append(
-            f"\n## Reference Examples ({body.content_type})\nStudy these examples of your past "
-            f"{type_config.name} content — match the style, structure, and voice:\n"
-            + "\n\n".join(example_sections)
-        )
     enhanced_parts.append(f"\n## Request\n{body.prompt}")
-    enhanced = "\n".join(enhanced_parts)
+    return "Create", create_agent, "\n".join(enhanced_parts), deps
 
+
+@router.post("/linkedin/comment")
+async def linkedin_comment_endpoint(body: LinkedInCommentRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("linkedin_engagement"))) -> dict[str, Any]:
+    """Write an authentic comment on a LinkedIn post using brain context."""
+    agent, prompt = _linkedin_comment_call(body, deps)
     result = await _run_agent(
-        "Create",
-        lambda: create_agent.run(enhanced, deps=deps, model=model),
+        "LinkedIn Engagement",
+        lambda: agent.run(prompt, deps=deps, model=model),
         deps.config.api_timeout_seconds,
     )
     return result.output.model_dump()
 
 
-@router.post("/linkedin/comment")
-async def linkedin_comment_endpoint(body: LinkedInCommentRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
-    """Write an authentic comment on a LinkedIn post using brain context."""
+@router.post("/linkedin/comment/stream")
+async def linkedin_comment_stream(body: LinkedInCommentRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("linkedin_engagement"))) -> StreamingResponse:
+    """Write a LinkedIn comment, streaming it as server-sent events."""
+    agent, prompt = _linkedin_comment_call(body, deps)
+    name = "LinkedIn Engagement"
+    return _event_stream(name, _stream_agent_result(name, agent, prompt, deps, model))
+
+
+def _linkedin_comment_call(body: LinkedInCommentRequest, deps: BrainDeps) -> tuple[Any, str]:
+    """Engagement agent and prompt for a LinkedIn comment. Raises HTTPException on bad input."""
     effective_uid = body.user_id.strip().lower() if body.user_id and body.user_id.strip() else None
     if effective_uid:
         allowed = deps.config.allowed_user_ids_list
@@ -254,18 +321,31 @@ async def linkedin_comment_endpoint(body: LinkedInCommentRequest, deps: BrainDep
         prompt += f"\n\nAdditional context: {body.context}"
     if effective_uid:
         prompt += f"\nVoice profile: {effective_uid}"
+    return linkedin_engagement_agent, prompt
 
+
+@router.post("/linkedin/reply")
+async def linkedin_reply_endpoint(body: LinkedInReplyRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("linkedin_engagement"))) -> dict[str, Any]:
+    """Write an authentic reply to a comment on your LinkedIn post."""
+    agent, prompt = _linkedin_reply_call(body, deps)
     result = await _run_agent(
         "LinkedIn Engagement",
-        lambda: linkedin_engagement_agent.run(prompt, deps=deps, model=model),
+        lambda: agent.run(prompt, deps=deps, model=model),
         deps.config.api_timeout_seconds,
     )
     return result.output.model_dump()
 
 
-@router.post("/linkedin/reply")
-async def linkedin_reply_endpoint(body: LinkedInReplyRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
-    """Write an authentic reply to a comment on your LinkedIn post."""
+@router.post("/linkedin/reply/stream")
+async def linkedin_reply_stream(body: LinkedInReplyRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("linkedin_engagement"))) -> StreamingResponse:
+    """Write a LinkedIn reply, streaming it as server-sent events."""
+    agent, prompt = _linkedin_reply_call(body, deps)
+    name = "LinkedIn Engagement"
+    return _event_stream(name, _stream_agent_result(name, agent, prompt, deps, model))
+
+
+def _linkedin_reply_call(body: LinkedInReplyRequest, deps: BrainDeps) -> tuple[Any, str]:
+    """Engagement agent and prompt for a LinkedIn reply. Raises HTTPException on bad input."""
     effective_uid = body.user_id.strip().lower() if body.user_id and body.user_id.strip() else None
     if effective_uid:
         allowed = deps.config.allowed_user_ids_list
@@ -284,17 +364,11 @@ async def linkedin_reply_endpoint(body: LinkedInReplyRequest, deps: BrainDeps =
         prompt += f"\n\nThread context: {body.context}"
     if effective_uid:
         prompt += f"\nVoice profile: {effective_uid}"
-
-    result = await _run_agent(
-        "LinkedIn Engagement",
-        lambda: linkedin_engagement_agent.run(prompt, deps=deps, model=model),
-        deps.config.api_timeout_seconds,
-    )
-    return result.output.model_dump()
+    return linkedin_engagement_agent, prompt
 
 
 @router.post("/review")
-async def review_content(body: ReviewContentRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def review_content(body: ReviewContentRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("review"))) -> dict[str, Any]:
     """Review content quality with adaptive dimension scoring."""
     timeout = deps.config.api_timeout_seconds * deps.config.mcp_review_timeout_multiplier
     result = await _run_agent(
@@ -307,7 +381,7 @@ async def review_content(body: ReviewContentRequest, deps: BrainDeps = Depends(g
 
 
 @router.post("/coaching")
-async def coaching_session(body: CoachingRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def coaching_session(body: CoachingRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("coach"))) -> dict[str, Any]:
     """Get daily accountability coaching."""
     from second_brain.agents.coach import coach_agent
     prompt = f"Session type: {body.session_type}\n\n{body.request}"
@@ -320,7 +394,7 @@ async def coaching_session(body: CoachingRequest, deps: BrainDeps = Depends(get_
 
 
 @router.post("/prioritize")
-async def prioritize_tasks(body: PrioritizeRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def prioritize_tasks(body: PrioritizeRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("pmo"))) -> dict[str, Any]:
     """Score and prioritize tasks using PMO methodology."""
     from second_brain.agents.pmo import pmo_agent
     result = await _run_agent(
@@ -332,19 +406,21 @@ async def prioritize_tasks(body: PrioritizeRequest, deps: BrainDeps = Depends(ge
 
 
 @router.post("/email")
-async def compose_email(body: EmailRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def compose_email(body: EmailRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("email"))) -> dict[str, Any]:
     """Compose emails with brand voice."""
+    from second_brain.agents.context_pack import with_context_pack
     from second_brain.agents.email_agent import email_agent
+    run_deps = await with_context_pack(deps, "email", body.request)
     result = await _run_agent(
         "Email",
-        lambda: email_agent.run(body.request, deps=deps, model=model),
+        lambda: email_agent.run(body.request, deps=run_deps, model=model),
         deps.config.api_timeout_seconds,
     )
     return result.output.model_dump()
 
 
 @router.post("/specialist")
-async def ask_specialist(body: SpecialistRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def ask_specialist(body: SpecialistRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("specialist"))) -> dict[str, Any]:
     """Ask a specialist question about Claude Code or Pydantic AI."""
     from second_brain.agents.specialist import specialist_agent
     result = await _run_agent(
@@ -356,36 +432,63 @@ async def ask_specialist(body: SpecialistRequest, deps: BrainDeps = Depends(get_
 
 
 @router.post("/pipeline")
-async def run_pipeline(body: PipelineRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def run_pipeline(body: PipelineRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("chief_of_staff"))) -> dict[str, Any]:
     """Run a multi-agent pipeline."""
     from second_brain.agents.utils import run_pipeline as _run_pipeline
 
-    if not body.steps:
-        from second_brain.agents.chief_of_staff import chief_of_staff
-        routing = await _run_agent(
-            "Pipeline routing",
-            lambda: chief_of_staff.run(body.request, deps=deps, model=model),
-            deps.config.api_timeout_seconds,
-        )
-        routing_output = routing.output
-        if routing_output.target_agent == "pipeline":
-            step_list = list(routing_output.pipeline_steps)
-        else:
-            step_list = [routing_output.target_agent]
-    else:
-        step_list = [s.strip() for s in body.steps.split(",") if s.strip()]
-
+    step_list, dependencies = await _pipeline_steps(body, deps, model)
     results = await _run_agent(
         "Pipeline",
-        lambda: _run_pipeline(steps=step_list, initial_prompt=body.request, deps=deps, model=model),
+        lambda: _run_pipeline(
+            steps=step_list, initial_prompt=body.request, deps=deps, model=model,
+            dependencies=dependencies,
+        ),
         deps.config.api_timeout_seconds * 2,
     )
+    return {"result": _pipeline_output(results), "timings": results.get("timings")}
+
+
+@router.post("/pipeline/stream")
+async def run_pipeline_stream(body: PipelineRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("chief_of_staff"))) -> StreamingResponse:
+    """Run a multi-agent pipeline, reporting each step as a server-sent event."""
+    async def events() -> AsyncIterator[str]:
+        step_list, dependencies = await _pipeline_steps(body, deps, model)
+        stream = PipelineStream(step_list, body.request, deps, model, dependencies)
+        async with _agent_stage("Pipeline", deps.config.api_timeout_seconds * 2):
+            async for event in stream.events():
+                yield event
+        yield sse("result", {
+            "result": _pipeline_output(stream.results), "timings": stream.results.get("timings"),
+        })
+
+    return _event_stream("Pipeline", events())
+
+
+async def _pipeline_steps(
+    body: PipelineRequest, deps: BrainDeps, model: "Model | None",
+) -> tuple[list[str], dict[str, list[str]]]:
+    """Steps and dependencies from the request, or the ones the router picks."""
+    if body.steps:
+        from second_brain.agents.utils import parse_pipeline_steps
+        return parse_pipeline_steps(body.steps)
+    from second_brain.agents.chief_of_staff import route_request
+    routing_output, _router = await _run_agent(
+        "Pipeline routing",
+        lambda: route_request(body.request, deps, model),
+        deps.config.api_timeout_seconds,
+    )
+    if routing_output.target_agent == "pipeline":
+        return list(routing_output.pipeline_steps), dict(routing_output.pipeline_dependencies)
+    return [routing_output.target_agent], {}
+
+
+def _pipeline_output(results: dict[str, Any]) -> str:
     final = results.get("final")
-    return {"result": str(final) if final else "Pipeline completed with no output."}
+    return str(final) if final else "Pipeline completed with no output."
 
 
 @router.post("/clarity")
-async def analyze_clarity(body: ClarityRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def analyze_clarity(body: ClarityRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("clarity"))) -> dict[str, Any]:
     """Analyze content for clarity and readability."""
     from second_brain.agents.clarity import clarity_agent
     result = await _run_agent(
@@ -397,7 +500,7 @@ async def analyze_clarity(body: ClarityRequest, deps: BrainDeps = Depends(get_de
 
 
 @router.post("/synthesize")
-async def synthesize_feedback(body: SynthesizeRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def synthesize_feedback(body: SynthesizeRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("synthesizer"))) -> dict[str, Any]:
     """Consolidate review findings into actionable themes."""
     from second_brain.agents.synthesizer import synthesizer_agent
     result = await _run_agent(
@@ -409,7 +512,7 @@ async def synthesize_feedback(body: SynthesizeRequest, deps: BrainDeps = Depends
 
 
 @router.post("/templates")
-async def find_templates(body: TemplateRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(get_model)) -> dict[str, Any]:
+async def find_templates(body: TemplateRequest, deps: BrainDeps = Depends(get_deps), model: "Model" = Depends(agent_model("template_builder"))) -> dict[str, Any]:
     """Analyze a deliverable for reusable template opportunities."""
     from second_brain.agents.template_builder import template_builder_agent
     result = await _run_agent(
@@ -421,72 +524,44 @@ async def find_templates(body: TemplateRequest, deps: BrainDeps = Depends(get_de
 
 
 @router.post("/chat")
-async def unified_chat(body: ChatRequest, deps: BrainDeps = Depends(get_deps), model: "Model | None" = Depends(get_model)) -> dict[str, Any]:
+async def unified_chat(body: ChatRequest, request: Request, deps: BrainDeps = Depends(get_deps), model: "Model | None" = Depends(agent_model("chief_of_staff"))) -> dict[str, Any]:
     """Unified chat — Chief of Staff routes to the optimal agent automatically."""
-    from second_brain.agents.chief_of_staff import chief_of_staff
     from second_brain.agents.utils import run_pipeline as _run_pipeline
 
-    # Step 1: Run Chief of Staff routing
-    routing = await _run_agent(
-        "Chat routing",
-        lambda: chief_of_staff.run(body.message, deps=deps, model=model),
-        deps.config.api_timeout_seconds,
-    )
-    decision = routing.output
+    decision, routing_info, prompt = await _route_chat(body.message, deps, model)
     target = decision.target_agent
-    routing_info = {
-        "agent": target,
-        "reasoning": decision.reasoning,
-        "confidence": decision.confidence,
-        "complexity": decision.query_complexity,
-    }
 
     # Step 2: Handle conversational short-circuit
     if target == "conversational":
-        return {
-            "agent": "conversational",
-            "routing": routing_info,
-            "output": {
-                "answer": (
-                    "Hey! I'm your Second Brain assistant. "
-                    "Ask me anything — I can search your memory, help with content, "
-                    "review your work, or answer questions using your accumulated knowledge."
-                ),
-                "is_conversational": True,
-                "confidence": "HIGH",
-            },
-        }
+        return _conversational_chat(routing_info)
 
     # Step 3: Handle pipeline routing
     if target == "pipeline":
         step_list = list(decision.pipeline_steps)
         results = await _run_agent(
             "Pipeline",
-            lambda: _run_pipeline(steps=step_list, initial_prompt=body.message, deps=deps, model=model),
+            lambda: _run_pipeline(
+                steps=step_list, initial_prompt=body.message, deps=deps, model=model,
+                dependencies=dict(decision.pipeline_dependencies),
+            ),
             deps.config.api_timeout_seconds * 2,
         )
-        final = results.get("final")
         return {
             "agent": "pipeline",
             "routing": routing_info,
-            "output": {"result": str(final) if final else "Pipeline completed with no output."},
+            "output": {"result": _pipeline_output(results), "timings": results.get("timings")},
         }
 
-    # Step 4: Handle single-agent routing
-    from second_brain.agents.registry import get_agent_registry
-    registry = get_agent_registry()
-
-    if target not in registry:
-        raise HTTPException(400, detail=f"Unknown agent route: {target}")
-
-    agent_instance, _desc = registry[target]
+    # Step 4: Handle single-agent routing, on the target's own model if overridden
+    agent_instance = _chat_agent(target)
+    target_model = resolve_agent_model(request, target)
 
     # Special handling for review (uses run_full_review)
     if target == "review":
         timeout = deps.config.api_timeout_seconds * deps.config.mcp_review_timeout_multiplier
         result = await _run_agent(
             "Review",
-            lambda: run_full_review(body.message, deps, model),
+            lambda: run_full_review(body.message, deps, target_model),
             timeout,
         )
         return {
@@ -495,10 +570,12 @@ async def unified_chat(body: ChatRequest, deps: BrainDeps = Depends(get_deps), m
             "output": result.model_dump(),
         }
 
-    # Standard agent execution
+    # Standard agent execution (content agents get their context pack up front)
+    from second_brain.agents.context_pack import with_context_pack
+    run_deps = await with_context_pack(deps, target, body.message)
     result = await _run_agent(
         target.title(),
-        lambda: agent_instance.run(body.message, deps=deps, model=model),
+        lambda: agent_instance.run(prompt, deps=run_deps, model=target_model),
         deps.config.api_timeout_seconds,
     )
     return {
@@ -506,3 +583,104 @@ async def unified_chat(body: ChatRequest, deps: BrainDeps = Depends(get_deps), m
         "routing": routing_info,
         "output": result.output.model_dump(),
     }
+
+
+@router.post("/chat/stream")
+async def unified_chat_stream(body: ChatRequest, request: Request, deps: BrainDeps = Depends(get_deps), model: "Model | None" = Depends(agent_model("chief_of_staff"))) -> StreamingResponse:
+    """Unified chat as server-sent events: routing, then deltas or pipeline steps, then the /chat result."""
+    async def events() -> AsyncIterator[str]:
+        decision, routing_info, prompt = await _route_chat(body.message, deps, model)
+        target = decision.target_agent
+        yield sse("routing", routing_info)
+
+        if target == "conversational":
+            yield sse("result", _conversational_chat(routing_info))
+            return
+
+        if target == "pipeline":
+            stream = PipelineStream(
+                list(decision.pipeline_steps), body.message, deps, model,
+                dict(decision.pipeline_dependencies),
+            )
+            async with _agent_stage("Pipeline", deps.config.api_timeout_seconds * 2):
+                async for event in stream.events():
+                    yield event
+            output = {"result": _pipeline_output(stream.results), "timings": stream.results.get("timings")}
+        elif target == "review":
+            timeout = deps.config.api_timeout_seconds * deps.config.mcp_review_timeout_multiplier
+            async with _agent_stage("Review", timeout):
+                review = await run_full_review(body.message, deps, resolve_agent_model(request, "review"))
+            output = review.model_dump()
+        else:
+            from second_brain.agents.context_pack import with_context_pack
+            run_deps = await with_context_pack(deps, target, body.message)
+            agent_stream = AgentStream(_chat_agent(target), prompt, run_deps, resolve_agent_model(request, target))
+            async with _agent_stage(target.title(), deps.config.api_timeout_seconds):
+                async for event in agent_stream.events():
+                    yield event
+            output = agent_stream.output.model_dump()
+        yield sse("result", {"agent": target, "routing": routing_info, "output": output})
+
+    return _event_stream("Chat", events())
+
+
+async def _route_chat(
+    message: str, deps: BrainDeps, model: "Model | None",
+) -> tuple[Any, dict[str, Any], str]:
+    """Route a chat message: (decision, routing info, prompt for the target agent)."""
+    from second_brain.agents.chief_of_staff import route_request
+    from second_brain.agents.speculative import SPECULATIVE_ROUTES, start_speculative_recall
+
+    # Memory search most routes start with, overlapped with routing
+    speculation = start_speculative_recall(deps, message)
+
+    # Step 1: Route — deterministic fast path, Chief of Staff LLM when uncertain
+    try:
+        decision, router = await _run_agent(
+            "Chat routing",
+            lambda: route_request(message, deps, model),
+            deps.config.api_timeout_seconds,
+        )
+    except BaseException:
+        if speculation is not None:
+            speculation.discard()
+        raise
+    target = decision.target_agent
+    prompt = message
+    if speculation is not None:
+        if target in SPECULATIVE_ROUTES:
+            prompt = await speculation.inject(deps.config.service_timeout_seconds)
+        else:
+            speculation.discard()
+    routing_info = {
+        "agent": target,
+        "reasoning": decision.reasoning,
+        "confidence": decision.confidence,
+        "complexity": decision.query_complexity,
+        "router": router,
+    }
+    return decision, routing_info, prompt
+
+
+def _conversational_chat(routing_info: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "agent": "conversational",
+        "routing": routing_info,
+        "output": {
+            "answer": _CONVERSATIONAL_ANSWER,
+            "is_conversational": True,
+            "confidence": "HIGH",
+        },
+    }
+
+
+def _chat_agent(target: str) -> Any:
+    """The registered agent for a chat route. Raises HTTPException for unknown routes."""
+    from second_brain.agents.registry import get_agent_registry
+    registry = get_agent_registry()
+
+    if target not in registry:
+        raise HTTPException(400, detail=f"Unknown agent route: {target}")
+
+    agent_instance, _desc = registry[target]
+    return agent_instance
@@ -2,7 +2,7 @@
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from second_brain.deps import BrainDeps
 from second_brain.api.deps import get_deps
@@ -31,12 +31,23 @@ async def graph_search(body: GraphSearchRequest, deps: BrainDeps = Depends(get_d
 
 
 @router.get("/episodes")
-async def graph_episodes(group_id: str | None = None, deps: BrainDeps = Depends(get_deps)):
-    """List graph episodes."""
+async def graph_episodes(
+    group_id: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    deps: BrainDeps = Depends(get_deps),
+):
+    """List graph episodes, newest first. Pass `next_cursor` back as `cursor` for the next page."""
     if not deps.graphiti_service:
         raise HTTPException(404, detail="Knowledge graph not enabled")
-    episodes = await deps.graphiti_service.get_episodes(group_id=group_id)
-    return {"episodes": episodes, "count": len(episodes)}
+    try:
+        page = await deps.graphiti_service.get_episodes_page(
+            group_id=group_id, limit=limit, cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
+    episodes = page["episodes"]
+    return {"episodes": episodes, "count": len(episodes), "next_cursor": page["next_cursor"]}
 
 
 @router.get("/episode-count")
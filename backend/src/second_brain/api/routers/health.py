@@ -6,6 +6,7 @@ import logging
 import time
 
 from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse
 
 from second_brain.deps import BrainDeps
 from second_brain.api.deps import get_deps
@@ -24,21 +25,68 @@ async def liveness():
 
 @router.get("/ready")
 async def readiness(request: Request):
-    """Readiness probe — can the app serve agent requests?"""
+    """Readiness probe — can the app serve agent requests?
+
+    Not ready (503) until deps exist and background warm-up has finished.
+    Per-service warm-up status is reported under "services"; a service that
+    failed to warm does not block readiness (it retries lazily on use).
+    """
     deps = getattr(request.app.state, "deps", None)
     model = getattr(request.app.state, "model", None)
     init_error = getattr(request.app.state, "init_error", None)
+    warmup = getattr(request.app.state, "warmup", None)
     if deps is None:
         return Response(
             content=f'{{"status":"not_ready","reason":"deps not initialized","error":{json.dumps(init_error)}}}',
             media_type="application/json",
             status_code=503,
         )
-    return {
+    result = {
         "status": "ready",
         "deps": "ok",
         "model": "ok" if model is not None else "unavailable",
     }
+    if warmup is not None:
+        result["services"] = warmup.snapshot()
+        if not warmup.done:
+            result["status"] = "warming"
+            return JSONResponse(result, status_code=503)
+    return result
+
+
+@router.get("/runtime")
+async def runtime_metrics(request: Request):
+    """Runtime metrics — executors, retry budgets, connections, models, LLM/answer caches, tool memo, graph ingest/cache/communities. No I/O."""
+    from second_brain.agents.answer_cache import answer_cache_stats
+    from second_brain.agents.fast_router import fast_router_stats
+    from second_brain.agents.speculative import speculative_recall_stats
+    from second_brain.agents.tool_memo import tool_memo_stats
+    from second_brain.models import model_registry_stats
+    from second_brain.services.executors import executor_stats
+    from second_brain.services.keepalive import connection_stats
+    from second_brain.services.llm_cache import llm_cache_stats
+    from second_brain.services.retry import retry_budget_stats
+
+    result = {
+        "executors": executor_stats(),
+        "retry_budgets": retry_budget_stats(),
+        "connections": connection_stats(),
+        "router": fast_router_stats(),
+        "speculative_recall": speculative_recall_stats(),
+        "models": model_registry_stats(),
+        "llm_cache": llm_cache_stats(),
+        "answer_cache": answer_cache_stats(),
+        "tool_memo": tool_memo_stats(),
+    }
+    deps = getattr(request.app.state, "deps", None)
+    graphiti = getattr(deps, "graphiti_service", None) if deps else None
+    if graphiti is not None:
+        result["graphiti_ingest"] = graphiti.ingest_stats()
+        result["graph_cache"] = graphiti.cache_stats()
+    maintainer = getattr(request.app.state, "community_maintainer", None)
+    if maintainer is not None:
+        result["community_maintenance"] = maintainer.snapshot()
+    return result
 
 
 @router.get("/metrics")
@@ -93,11 +93,10 @@ async def multimodal_search(body: MultimodalSearchRequest, deps: BrainDeps = Dep
     if body.image_url.strip():
         url = body.image_url.strip()
         if url.startswith("data:"):
-            from PIL import Image as PILImage
-            from io import BytesIO
-            import base64 as b64
-            b64_data = url.split(",", 1)[1] if "," in url else url
-            input_items.append(PILImage.open(BytesIO(b64.b64decode(b64_data))))
+            from second_brain.services.executors import MEDIA, run_blocking
+            from second_brain.services.voyage import load_data_uri_image
+
+            input_items.append(await run_blocking(MEDIA, load_data_uri_image, url))
         else:
             input_items.append(url)
 
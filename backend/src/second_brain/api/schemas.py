@@ -72,7 +72,15 @@ class LinkedInReplyRequest(BaseModel):
 
 class PipelineRequest(BaseModel):
     request: str = Field(..., min_length=1, max_length=10000)
-    steps: str = Field(default="")
+    steps: str = Field(
+        default="",
+        description=(
+            "Comma-separated agents, run in order (e.g. 'recall,create,review'). "
+            "'step<a+b' makes a step wait for a and b only, and unannotated steps "
+            "start immediately (e.g. 'create,review<create,clarity<create'). "
+            "Empty = auto-route."
+        ),
+    )
 
 
 class ChatRequest(BaseModel):
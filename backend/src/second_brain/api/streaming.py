@@ -0,0 +1,155 @@
+"""Server-sent event streams for agent endpoints.
+
+The plain agent endpoints await `agent.run(...)` and answer only when the
+whole structured output is ready, so clients see nothing for 10-30 s on
+create/LinkedIn/pipeline calls. The `/stream` variants answer immediately
+with `text/event-stream` and emit:
+
+- `routing`  — chat only: which agent was picked and why;
+- `step`     — pipeline only: `{"step", "index", "total", "status"}` as
+  each step starts and finishes (`done`, `error`, `skipped`);
+- `delta`    — `{"field", "text"}`: new characters of the output's main
+  text field (draft, answer, response) as the model writes them;
+- `reset`    — the streamed text failed output validation and the model
+  is answering the retry prompt; clients should drop what they rendered;
+- `result`   — the same JSON the non-streaming endpoint returns;
+- `error`    — `{"status_code", "detail"}` with the status the
+  non-streaming endpoint would have answered with.
+
+The run is driven node by node with pydantic-ai's `agent.iter` and each
+model request is streamed. Output validators are not run on partial
+outputs: they raise ModelRetry on incomplete drafts. Each finished response
+goes through the agent's own retry loop, so a rejected output is answered
+with a retry prompt in the same run (same message history), not a new run.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_core import from_json
+
+if TYPE_CHECKING:
+    from pydantic_ai.models import Model
+
+logger = logging.getLogger(__name__)
+
+# Output fields streamed as text deltas, first match wins
+TEXT_FIELDS = ("draft", "answer", "response", "result")
+
+# Seconds to group model chunks by before re-parsing the partial output
+STREAM_DEBOUNCE_SECONDS = 0.05
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse(event: str, data: Any) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def partial_output(response: ModelResponse) -> dict[str, Any] | None:
+    """The output tool's arguments parsed so far, or None before it starts."""
+    for part in response.parts:
+        if not isinstance(part, ToolCallPart) or not part.tool_name.startswith("final_result"):
+            continue
+        if isinstance(part.args, dict):
+            return part.args
+        try:
+            parsed = from_json(part.args or "{}", allow_partial="trailing-strings")
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+    return None
+
+
+class TextDeltas:
+    """Turns successive partial outputs into `delta` events for one text field."""
+
+    def __init__(self):
+        self.field: str | None = None
+        self.sent = ""
+
+    def events(self, partial: dict[str, Any] | None) -> list[str]:
+        if not partial:
+            return []
+        if self.field is None:
+            self.field = next(
+                (f for f in TEXT_FIELDS if isinstance(partial.get(f), str)), None,
+            )
+            if self.field is None:
+                return []
+        text = partial.get(self.field)
+        if not isinstance(text, str) or len(text) <= len(self.sent) or not text.startswith(self.sent):
+            return []
+        delta, self.sent = text[len(self.sent):], text
+        return [sse("delta", {"field": self.field, "text": delta})]
+
+
+class AgentStream:
+    """One agent run with token streaming; `output` holds the validated result."""
+
+    def __init__(self, agent: "Agent", prompt: str, deps: Any, model: "Model | None"):
+        self.agent = agent
+        self.prompt = prompt
+        self.deps = deps
+        self.model = model
+        self.output: Any = None
+
+    async def events(self) -> AsyncIterator[str]:
+        """`delta` (and `reset`) events until the run finishes. Errors propagate."""
+        deltas = TextDeltas()
+        async with self.agent.iter(self.prompt, deps=self.deps, model=self.model) as run:
+            async for node in run:
+                if not Agent.is_model_request_node(node):
+                    continue
+                if deltas.sent:
+                    # The last streamed output was rejected and this request answers the retry
+                    logger.debug("Streamed output rejected, streaming the retry")
+                    yield sse("reset", {})
+                deltas = TextDeltas()
+                async with node.stream(run.ctx) as request:
+                    async for response in request.stream_responses(debounce_by=STREAM_DEBOUNCE_SECONDS):
+                        for event in deltas.events(partial_output(response)):
+                            yield event
+        self.output = run.result.output
+
+
+class PipelineStream:
+    """One run_pipeline() call; `results` holds its return value."""
+
+    def __init__(
+        self,
+        steps: list[str],
+        prompt: str,
+        deps: Any,
+        model: "Model | None",
+        dependencies: dict[str, list[str]] | None = None,
+    ):
+        self.steps = steps
+        self.prompt = prompt
+        self.deps = deps
+        self.model = model
+        self.dependencies = dependencies
+        self.results: dict[str, Any] = {}
+
+    async def events(self) -> AsyncIterator[str]:
+        """A `step` event as each pipeline step starts and finishes."""
+        from second_brain.agents.utils import run_pipeline
+
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        task = asyncio.ensure_future(run_pipeline(
+            steps=self.steps, initial_prompt=self.prompt, deps=self.deps, model=self.model,
+            on_step=queue.put_nowait, dependencies=self.dependencies,
+        ))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (step := await queue.get()) is not None:
+                yield sse("step", step)
+            self.results = await task
+        finally:
+            task.cancel()
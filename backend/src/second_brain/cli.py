@@ -174,6 +174,7 @@ def learn(content: str, category: str):
 def create(prompt: str, content_type: str):
     """Draft content in your voice using brain knowledge."""
     prompt = _validate_input(prompt, label="prompt")
+    from second_brain.agents.context_pack import with_context_pack
     from second_brain.agents.create import create_agent
 
     deps = create_deps()
@@ -251,7 +252,11 @@ def create(prompt: str, content_type: str):
 
         enhanced = "\n".join(enhanced_parts)
 
-        result = await create_agent.run(enhanced, deps=deps, model=model)
+        # Voice and examples are already in the prompt; the pack brings the rest
+        run_deps = await with_context_pack(
+            deps, "create", prompt, content_type=content_type, exclude=("voice", "examples"),
+        )
+        result = await create_agent.run(enhanced, deps=run_deps, model=model)
         output = result.output
 
         click.echo(f"\n# Draft ({output.content_type})\n")
@@ -927,17 +932,16 @@ def patterns():
 def route(request: str, execute: bool):
     """Route a request through the Chief of Staff orchestrator."""
     request = _validate_input(request, label="request")
-    from second_brain.agents.chief_of_staff import chief_of_staff
+    from second_brain.agents.chief_of_staff import route_request
 
     deps = create_deps()
     model = get_agent_model("chief_of_staff", deps.config)
 
     async def run():
         # Step 1: Get routing decision
-        result = await chief_of_staff.run(request, deps=deps, model=model)
-        routing = result.output
+        routing, router = await route_request(request, deps, model)
 
-        click.echo(f"\nRoute: {routing.target_agent}")
+        click.echo(f"\nRoute: {routing.target_agent} (router: {router})")
         click.echo(f"Reasoning: {routing.reasoning}")
         if routing.pipeline_steps:
             click.echo(f"Pipeline: {' -> '.join(routing.pipeline_steps)}")
@@ -955,10 +959,14 @@ def route(request: str, execute: bool):
                 initial_prompt=request,
                 deps=deps,
                 model=model,
+                dependencies=routing.pipeline_dependencies,
             )
             final = results.get("final")
             if final:
                 click.echo(f"\nPipeline result:\n{final}")
+            timings = results["timings"]
+            per_step = ", ".join(f"{step} {seconds:.1f}s" for step, seconds in timings["steps"].items())
+            click.echo(f"Timings: {per_step} (total {timings['total']:.1f}s)")
         else:
             from second_brain.agents.registry import get_agent_registry
             registry = get_agent_registry()
@@ -1088,13 +1096,15 @@ def prioritize(tasks: str):
 def email(request: str):
     """Compose or manage emails."""
     request = _validate_input(request, label="request")
+    from second_brain.agents.context_pack import with_context_pack
     from second_brain.agents.email_agent import email_agent
 
     deps = create_deps()
     model = get_agent_model("email", deps.config)
 
     async def run():
-        result = await email_agent.run(request, deps=deps, model=model)
+        run_deps = await with_context_pack(deps, "email", request)
+        result = await email_agent.run(request, deps=run_deps, model=model)
         out = result.output
         if out.subject:
             click.echo(f"\nSubject: {out.subject}")
@@ -1135,20 +1145,35 @@ def seed_templates_cmd(user_id: str):
 
 
 @cli.command("ingest-linkedin")
-@click.argument("csv_path")
+@click.argument("csv_path", type=click.Path(exists=True, dir_okay=False))
 @click.option("--user-id", default="uttam", help="User ID for data ownership")
-@click.option("--dry-run", is_flag=True, help="Parse only, don't write to DB")
+@click.option("--dry-run", is_flag=True, help="Parse and estimate throughput, don't write to DB")
 @click.option("--min-length", default=100, help="Min post length to include")
 def ingest_linkedin_cmd(csv_path: str, user_id: str, dry_run: bool, min_length: int):
     """Ingest LinkedIn CSV posts into the examples table."""
-    from scripts.ingest_linkedin_csv import ingest_posts
-
-    asyncio.run(ingest_posts(
-        csv_path=csv_path,
-        user_id=user_id,
-        dry_run=dry_run,
-        min_length=min_length,
-    ))
+    from second_brain.ingest import ingest_linkedin_csv
+
+    async def run():
+        result = await ingest_linkedin_csv(
+            csv_path, dry_run=dry_run, min_length=min_length,
+        )
+        if dry_run:
+            click.echo(
+                f"DRY RUN -- {result.records} posts: {result.embed_calls} embed batches, "
+                f"{result.upsert_calls} bulk upserts, {result.memory_calls} Mem0 writes"
+            )
+            click.echo(
+                f"Estimated ~{result.estimated_seconds:.0f}s "
+                f"(serial baseline ~{result.serial_estimated_seconds:.0f}s)"
+            )
+        else:
+            click.echo(
+                f"Ingested {result.ingested}/{result.records} posts, "
+                f"{result.memory_stored} in Mem0, {result.errors} errors, "
+                f"{result.duplicates} duplicates ({result.records_per_second} rec/s)"
+            )
+
+    asyncio.run(run())
 
 
 @cli.command()
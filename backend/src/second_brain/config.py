@@ -9,7 +9,7 @@ logger = logging.getLogger(__name__)
 _KNOWN_AGENT_NAMES = frozenset({
     "recall", "ask", "learn", "create", "review", "chief_of_staff",
     "coach", "pmo", "email", "specialist", "clarity", "synthesizer",
-    "template_builder",
+    "template_builder", "linkedin_writer", "linkedin_engagement", "hook_writer",
 })
 
 
@@ -109,6 +109,25 @@ class BrainConfig(BaseSettings):
         le=200,
         description="Batch size for embedding generation during migration. Range: 1-200.",
     )
+    voyage_batch_max_tokens: int = Field(
+        default=100_000,
+        ge=1_000,
+        le=1_000_000,
+        description="Estimated token budget per Voyage embed request. Keep below the "
+        "model's per-request token limit (e.g., 320K for voyage-3.5).",
+    )
+    voyage_batch_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Voyage embed requests in flight at once during batch embedding. Range: 1-16.",
+    )
+    voyage_batch_retries: int = Field(
+        default=1,
+        ge=0,
+        le=5,
+        description="Extra rounds for retrying only the failed requests of a batch embed. Range: 0-5.",
+    )
     multimodal_max_file_size_mb: int = Field(
         default=20,
         ge=1,
@@ -197,6 +216,45 @@ class BrainConfig(BaseSettings):
         default=None,
         description="Override LLM model for Graphiti entity extraction. If None, uses primary_model (Anthropic) or ollama_model. Set to an Ollama Cloud model like 'deepseek-v3.1:671b-cloud' for better extraction.",
     )
+    graphiti_ingest_concurrency: int = Field(
+        default=3, ge=1, le=16,
+        description="Initial concurrent episode extractions for batch/chunked Graphiti ingest. "
+        "Adapts (AIMD) between 1 and graphiti_ingest_max_concurrency. Range: 1-16.",
+    )
+    graphiti_ingest_max_concurrency: int = Field(
+        default=8, ge=1, le=32,
+        description="Upper bound for adaptive Graphiti ingest concurrency. "
+        "Halved on LLM rate limits (429). Range: 1-32.",
+    )
+    graphiti_traverse_fanout: int = Field(
+        default=25, ge=1, le=500,
+        description="Max outgoing relationships followed per entity per hop in "
+        "traverse_neighbors. Bounds expansion around hub entities. Range: 1-500.",
+    )
+    graphiti_community_refresh_seconds: int = Field(
+        default=1800, ge=0, le=86400,
+        description="Interval of the background job that incrementally updates "
+        "communities of groups with new episodes. 0 disables. Range: 0-86400.",
+    )
+    graphiti_community_drift_threshold: float = Field(
+        default=0.25, ge=0.0, le=10.0,
+        description="Relative membership change since a community's summary was "
+        "written that triggers re-summarizing it. Range: 0.0-10.0.",
+    )
+    graph_cache_ttl_seconds: int = Field(
+        default=300, ge=0, le=86400,
+        description="TTL for cached graph search results, per group_id. Entries are also "
+        "dropped when the group's graph changes. 0 disables the cache. Range: 0-86400.",
+    )
+    graph_cache_max_entries: int = Field(
+        default=512, ge=1, le=100000,
+        description="Max cached graph query results across all groups (LRU). Range: 1-100000.",
+    )
+    graphiti_episode_count_reconcile_seconds: int = Field(
+        default=300, ge=0, le=86400,
+        description="Episode counts are kept incrementally on add/remove and re-counted "
+        "from the graph at most this often. 0 = count on every call. Range: 0-86400.",
+    )
 
     # Supabase
     supabase_url: str = Field(..., description="Supabase project URL")
@@ -337,6 +395,98 @@ class BrainConfig(BaseSettings):
         le=30,
         description="Queries with more words than this are classified as 'complex'. Range: 3-30.",
     )
+    fast_router_enabled: bool = Field(
+        default=True,
+        description="Route greetings and unambiguous requests with deterministic rules; "
+        "only uncertain requests run the Chief of Staff LLM router.",
+    )
+    speculative_recall_enabled: bool = Field(
+        default=True,
+        description="Start the chat message's memory search while routing runs; "
+        "injected into recall/ask, cancelled for other routes.",
+    )
+    context_pack_enabled: bool = Field(
+        default=True,
+        description="Prefetch voice, examples, templates, patterns and audience in parallel "
+        "before create/LinkedIn/hook/email runs instead of one tool round trip each.",
+    )
+    context_pack_token_budget: int = Field(
+        default=6000,
+        ge=500,
+        le=50000,
+        description="Estimated token budget for a context pack; lower-priority sections "
+        "are trimmed or dropped past it. Range: 500-50000.",
+    )
+    review_mode: str = Field(
+        default="parallel",
+        description="Default review scoring mode: parallel (one LLM call per dimension), "
+        "batched (all dimensions in one call) or auto (batched up to "
+        "review_batched_max_words). Content types can override it.",
+    )
+    review_batched_max_words: int = Field(
+        default=600,
+        ge=0,
+        le=10000,
+        description="In auto review mode, drafts up to this many words are scored in one "
+        "batched call; longer drafts get per-dimension calls. Range: 0-10000.",
+    )
+    llm_cache_enabled: bool = Field(
+        default=False,
+        description="Replay stored model responses for repeated identical requests of the "
+        "agents in llm_cache_agents (local SQLite file, see llm_cache_path).",
+    )
+    llm_cache_agents: str = Field(
+        default="clarity,review,synthesizer,template_builder",
+        description="Comma-separated agents whose model responses are cached. "
+        "Only list agents that should answer identical input identically.",
+    )
+    llm_cache_path: Path | None = Field(
+        default=None,
+        description="SQLite file for the LLM output cache. "
+        "Default: ~/.cache/second-brain/llm_cache.sqlite3",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=60,
+        le=2592000,
+        description="How long a cached model response is replayed. Range: 60-2592000.",
+    )
+    llm_cache_max_mb: int = Field(
+        default=100,
+        ge=1,
+        le=10240,
+        description="Size cap of the LLM output cache; least recently used entries "
+        "are evicted past it. Range: 1-10240.",
+    )
+    answer_cache_enabled: bool = Field(
+        default=False,
+        description="Answer ask questions from recent answers to semantically similar "
+        "questions. Any brain write invalidates the cache.",
+    )
+    answer_cache_similarity: float = Field(
+        default=0.95,
+        ge=0.5,
+        le=1.0,
+        description="Min cosine similarity between question embeddings for a cached "
+        "answer to be reused. Range: 0.5-1.0.",
+    )
+    answer_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=60,
+        le=86400,
+        description="Max age of a cached ask answer. Range: 60-86400.",
+    )
+    answer_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        le=10000,
+        description="Max cached ask answers (oldest dropped first). Range: 1-10000.",
+    )
+    tool_memo_enabled: bool = Field(
+        default=True,
+        description="Reuse read-only agent tool results for identical calls within one "
+        "agent run, so ModelRetry re-asks don't repeat Mem0/Voyage/Supabase calls.",
+    )
 
     # Service-level timeouts (used in sub-plan 02)
     service_timeout_seconds: int = Field(
@@ -345,11 +495,62 @@ class BrainConfig(BaseSettings):
         "Must be less than api_timeout_seconds.",
     )
 
+    # Dedicated thread pools per backend (services/executors.py)
+    mem0_max_workers: int = Field(
+        default=8, ge=1, le=64,
+        description="Worker threads for blocking Mem0 SDK calls. Range: 1-64.",
+    )
+    supabase_max_workers: int = Field(
+        default=16, ge=1, le=64,
+        description="Worker threads for blocking supabase-py calls. Range: 1-64.",
+    )
+    voyage_max_workers: int = Field(
+        default=8, ge=1, le=64,
+        description="Worker threads for blocking Voyage AI SDK calls. Range: 1-64.",
+    )
+    executor_default_max_workers: int = Field(
+        default=4, ge=1, le=64,
+        description="Worker threads for every other backend executor "
+        "(OpenAI embeddings, image decoding). Range: 1-64.",
+    )
+
+    # Startup warm-up (services/warmup.py)
+    warmup_enabled: bool = Field(
+        default=True,
+        description="Initialize all backends concurrently in the background at startup "
+        "so the first request does not pay connection/index setup.",
+    )
+    warmup_prewarm_caches: bool = Field(
+        default=True,
+        description="Also load the pattern registry and voice guide during warm-up.",
+    )
+    warmup_timeout_seconds: int = Field(
+        default=60, ge=5, le=600,
+        description="Per-service warm-up time limit. Range: 5-600.",
+    )
+    keepalive_interval_seconds: int = Field(
+        default=60, ge=0, le=230,
+        description=(
+            "Ping Mem0/Graphiti after this many idle seconds so pooled connections "
+            "stay warm; failed pings rebuild the client in the background. "
+            "0 disables. Range: 0-230."
+        ),
+    )
+
     # Batch operation settings
     batch_upsert_chunk_size: int = Field(
         default=500, ge=1, le=1000,
         description="Maximum rows per batch upsert to Supabase.",
     )
+    ingest_batch_size: int = Field(
+        default=128, ge=1, le=128,
+        description="Records embedded and upserted together during bulk ingest. "
+        "Capped at 128 (Voyage per-request limit).",
+    )
+    ingest_memory_concurrency: int = Field(
+        default=4, ge=1, le=32,
+        description="Maximum concurrent Mem0 writes during bulk ingest. Range: 1-32.",
+    )
 
     # API timeouts
     api_timeout_seconds: int = Field(
@@ -496,6 +697,15 @@ class BrainConfig(BaseSettings):
             )
         return self
 
+    @model_validator(mode="after")
+    def _validate_review_mode(self) -> "BrainConfig":
+        if self.review_mode not in ("parallel", "batched", "auto"):
+            raise ValueError(
+                f"review_mode must be 'parallel', 'batched', or 'auto' — got: "
+                f"{self.review_mode!r}"
+            )
+        return self
+
     @model_validator(mode="after")
     def _validate_subscription_config(self) -> "BrainConfig":
         if self.use_subscription:
@@ -614,6 +824,11 @@ class BrainConfig(BaseSettings):
             )
         return self
 
+    @property
+    def llm_cache_agents_list(self) -> list[str]:
+        """Parse LLM_CACHE_AGENTS into a list of agent names."""
+        return [a.strip() for a in self.llm_cache_agents.split(",") if a.strip()]
+
     @property
     def fallback_chain_list(self) -> list[str]:
         """Parse MODEL_FALLBACK_CHAIN into a list of provider names."""
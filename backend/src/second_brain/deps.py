@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from second_brain.config import BrainConfig
 
 if TYPE_CHECKING:
+    from second_brain.agents.context_pack import ContextPack
     from second_brain.services.abstract import (
         AnalyticsServiceBase,
         CalendarServiceBase,
@@ -36,6 +37,8 @@ class BrainDeps:
     calendar_service: "CalendarServiceBase | None" = None
     analytics_service: "AnalyticsServiceBase | None" = None
     task_service: "TaskManagementServiceBase | None" = None
+    # Per-run, set on a copy by agents.context_pack.with_context_pack()
+    context_pack: "ContextPack | None" = None
 
     def get_content_type_registry(self) -> "ContentTypeRegistry":
         """Get or create the content type registry."""
@@ -51,12 +54,15 @@ def create_deps(config: BrainConfig | None = None) -> BrainDeps:
     Args:
         config: Optional config override. Defaults to loading from .env.
     """
+    from second_brain.services.executors import configure_executors
     from second_brain.services.memory import MemoryService
     from second_brain.services.storage import StorageService
 
     if config is None:
         config = BrainConfig()
 
+    configure_executors(config)
+
     graphiti = None
     # New path: graphiti_enabled flag (independent of Mem0 graph)
     if config.graphiti_enabled:
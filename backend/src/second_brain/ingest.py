@@ -0,0 +1,414 @@
+"""Streaming bulk ingest of exported content into examples + Mem0.
+
+Readers yield records lazily (CSV, JSONL, markdown directories) so large
+exports never sit in memory at once. IngestEngine consumes them in chunks:
+one document-embedding batch, one Supabase bulk upsert and a bounded set of
+concurrent Mem0 writes per chunk, instead of three round trips per record.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import math
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from second_brain.deps import BrainDeps
+
+logger = logging.getLogger(__name__)
+
+# Embedding input cap (chars) — matches migrate.py
+_EMBED_MAX_CHARS = 8000
+# Mem0 content cap (chars) — long posts are truncated before extraction
+_MEMORY_MAX_CHARS = 4000
+
+# Rough per-call latencies used by dry-run throughput estimates (seconds)
+_EST_EMBED_BATCH_SECONDS = 1.5
+_EST_UPSERT_SECONDS = 0.5
+_EST_MEMORY_ADD_SECONDS = 1.0
+
+
+@dataclass
+class IngestRecord:
+    """A single item to ingest as an example (and optionally a Mem0 memory)."""
+
+    content: str
+    source_file: str
+    content_type: str
+    title: str = ""
+    tags: list[str] = field(default_factory=list)
+    memory_text: str | None = None  # None = skip the Mem0 write
+    memory_metadata: dict = field(default_factory=dict)
+
+    def to_example(self, embedding: list[float]) -> dict:
+        """Build an examples-table row for this record."""
+        return {
+            "content_type": self.content_type,
+            "title": self.title,
+            "content": self.content,
+            "source_file": self.source_file,
+            "tags": self.tags,
+            "embedding": embedding,
+        }
+
+
+@dataclass
+class IngestStats:
+    """Outcome of an ingest run."""
+
+    records: int = 0
+    ingested: int = 0
+    memory_stored: int = 0
+    errors: int = 0
+    duplicates: int = 0  # repeated (content_type, source_file) within a chunk
+    elapsed_seconds: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return round(self.records / self.elapsed_seconds, 2)
+
+
+@dataclass
+class IngestEstimate:
+    """Dry-run throughput estimate: backend round trips and expected duration."""
+
+    records: int
+    embed_calls: int
+    upsert_calls: int
+    memory_calls: int
+    estimated_seconds: float
+    serial_estimated_seconds: float
+
+    @classmethod
+    def for_records(
+        cls,
+        records: int,
+        memory_calls: int,
+        batch_size: int,
+        memory_concurrency: int,
+    ) -> "IngestEstimate":
+        """Estimate the cost of ingesting `records` items.
+
+        `serial_estimated_seconds` is the one-record-at-a-time baseline
+        (embed + upsert + Mem0 add per record) for comparison.
+        """
+        batches = math.ceil(records / batch_size) if records else 0
+        memory_waves = math.ceil(memory_calls / memory_concurrency) if memory_calls else 0
+        estimated = (
+            batches * (_EST_EMBED_BATCH_SECONDS + _EST_UPSERT_SECONDS)
+            + memory_waves * _EST_MEMORY_ADD_SECONDS
+        )
+        serial = (
+            records * (_EST_EMBED_BATCH_SECONDS + _EST_UPSERT_SECONDS)
+            + memory_calls * _EST_MEMORY_ADD_SECONDS
+        )
+        return cls(
+            records=records,
+            embed_calls=batches,
+            upsert_calls=batches,
+            memory_calls=memory_calls,
+            estimated_seconds=round(estimated, 1),
+            serial_estimated_seconds=round(serial, 1),
+        )
+
+
+# --- Readers ---
+
+
+def read_csv(path: str | Path, skip_header: bool = True) -> Iterator[list[str]]:
+    """Yield CSV rows one at a time.
+
+    Args:
+        path: CSV file path.
+        skip_header: Skip (and log) the first row.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        if skip_header:
+            header = next(reader, None)
+            logger.info("CSV headers: %s", header)
+        yield from reader
+
+
+def read_jsonl(path: str | Path) -> Iterator[dict]:
+    """Yield JSON objects from a JSONL file, skipping blank or malformed lines."""
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed JSONL line %d in %s", line_no, path)
+                continue
+            if isinstance(obj, dict):
+                yield obj
+
+
+def read_markdown_dir(
+    path: str | Path, content_type: str, min_length: int = 0,
+) -> Iterator[IngestRecord]:
+    """Yield one record per markdown file under `path` (README/INDEX skipped)."""
+    root = Path(path)
+    for md_file in sorted(root.rglob("*.md")):
+        if md_file.name in ("README.md", "INDEX.md"):
+            continue
+        content = md_file.read_text(encoding="utf-8").strip()
+        if len(content) < max(min_length, 1):
+            continue
+        title = md_file.stem.replace("-", " ").title()
+        yield IngestRecord(
+            content=content,
+            source_file=str(md_file),
+            content_type=content_type,
+            title=title,
+            tags=[content_type],
+            memory_text=f"{title}:\n\n{content[:_MEMORY_MAX_CHARS]}",
+            memory_metadata={"category": f"{content_type}_example", "source": str(md_file)},
+        )
+
+
+# --- Record mappers ---
+
+
+def linkedin_records(
+    rows: Iterable[list[str]], min_length: int = 100,
+) -> Iterator[IngestRecord]:
+    """Map LinkedIn export rows (_, post, account, url) to records.
+
+    Rows that are too short, or missing a post, account or URL, are skipped
+    (the URL is the example's upsert key).
+    """
+    for row in rows:
+        if len(row) < 4:
+            continue
+        full_post = row[1].strip()
+        account = row[2].strip()
+        post_url = row[3].strip()
+        if not full_post or not account or not post_url or len(full_post) < min_length:
+            continue
+
+        # Hook = first line, or the opening of the post
+        first_line = full_post.split("\n")[0].strip()
+        hook = first_line[:150] if first_line else full_post[:150]
+
+        yield IngestRecord(
+            content=full_post,
+            source_file=post_url,
+            content_type="linkedin",
+            title=f"{account} -- {hook[:80]}",
+            tags=[account, "linkedin"],
+            memory_text=(
+                f"LinkedIn post by {account}:\n\n{full_post[:_MEMORY_MAX_CHARS]}"
+            ),
+            memory_metadata={
+                "category": "linkedin_example",
+                "source": account,
+                "post_url": post_url,
+                "hook": hook,
+            },
+        )
+
+
+def jsonl_records(
+    objects: Iterable[dict], content_type: str, min_length: int = 0,
+) -> Iterator[IngestRecord]:
+    """Map JSONL objects with content/title/source_file(or url)/tags keys to records."""
+    for obj in objects:
+        content = str(obj.get("content") or "").strip()
+        source = str(obj.get("source_file") or obj.get("url") or "").strip()
+        if not content or not source or len(content) < min_length:
+            continue
+        title = str(obj.get("title") or content.split("\n")[0][:80])
+        tags = obj.get("tags") or [content_type]
+        yield IngestRecord(
+            content=content,
+            source_file=source,
+            content_type=obj.get("content_type") or content_type,
+            title=title,
+            tags=list(tags),
+            memory_text=f"{title}:\n\n{content[:_MEMORY_MAX_CHARS]}",
+            memory_metadata={"category": f"{content_type}_example", "source": source},
+        )
+
+
+def chunked(records: Iterable[IngestRecord], size: int) -> Iterator[list[IngestRecord]]:
+    """Yield lists of up to `size` records without materializing the stream."""
+    it = iter(records)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def dedupe_chunk(chunk: list[IngestRecord]) -> list[IngestRecord]:
+    """Keep the last record per (content_type, source_file).
+
+    One bulk upsert can't touch the same conflict key twice — Postgres
+    rejects the whole statement.
+    """
+    latest: dict[tuple[str, str], IngestRecord] = {}
+    for record in chunk:
+        key = (record.content_type, record.source_file)
+        latest.pop(key, None)
+        latest[key] = record
+    return list(latest.values())
+
+
+def estimate_ingest(
+    records: Iterable[IngestRecord], batch_size: int, memory_concurrency: int,
+) -> IngestEstimate:
+    """Count records (streaming) and estimate ingest throughput."""
+    total = 0
+    memory_calls = 0
+    for record in records:
+        total += 1
+        if record.memory_text:
+            memory_calls += 1
+    return IngestEstimate.for_records(
+        total, memory_calls, min(batch_size, 128), memory_concurrency,
+    )
+
+
+# --- Engine ---
+
+
+class IngestEngine:
+    """Chunked ingest: batch embeddings, bulk upserts, bounded Mem0 writes."""
+
+    def __init__(
+        self,
+        deps: "BrainDeps",
+        batch_size: int | None = None,
+        memory_concurrency: int | None = None,
+    ):
+        self.deps = deps
+        self.batch_size = min(batch_size or deps.config.ingest_batch_size, 128)
+        self.memory_concurrency = (
+            memory_concurrency or deps.config.ingest_memory_concurrency
+        )
+
+    async def run(self, records: Iterable[IngestRecord]) -> IngestStats:
+        """Ingest records chunk by chunk. Never raises on per-record failures."""
+        if not self.deps.embedding_service:
+            raise ValueError("Embedding service not available. Cannot ingest without embeddings.")
+
+        stats = IngestStats()
+        semaphore = asyncio.Semaphore(self.memory_concurrency)
+        start = time.monotonic()
+        for chunk in chunked(records, self.batch_size):
+            stats.records += len(chunk)
+            unique = dedupe_chunk(chunk)
+            stats.duplicates += len(chunk) - len(unique)
+            chunk = unique
+            # Mem0 extraction doesn't need the embeddings — overlap both arms
+            await asyncio.gather(
+                self._embed_and_upsert(chunk, stats),
+                self._store_memories(chunk, stats, semaphore),
+            )
+            logger.info(
+                "Progress: %d records, %d ingested, %d in Mem0, %d errors",
+                stats.records, stats.ingested, stats.memory_stored, stats.errors,
+            )
+        stats.elapsed_seconds = round(time.monotonic() - start, 2)
+        return stats
+
+    async def _embed_and_upsert(self, chunk: list[IngestRecord], stats: IngestStats) -> None:
+        texts = [r.content[:_EMBED_MAX_CHARS] for r in chunk]
+        try:
+            embeddings = await self.deps.embedding_service.embed_batch(
+                texts, input_type="document",
+            )
+        except Exception as e:
+            logger.warning("Batch embedding failed: %s", type(e).__name__)
+            logger.debug("Batch embedding error detail: %s", e)
+            embeddings = []
+
+        if len(embeddings) != len(chunk):
+            # Timed-out or short batch — positions can't be trusted
+            logger.warning(
+                "Embedding batch returned %d/%d vectors; skipping chunk",
+                len(embeddings), len(chunk),
+            )
+            stats.errors += len(chunk)
+            return
+
+        examples = []
+        for record, embedding in zip(chunk, embeddings):
+            if not embedding:
+                stats.errors += 1
+                continue
+            examples.append(record.to_example(embedding))
+        if not examples:
+            return
+
+        result = await self.deps.storage_service.bulk_upsert_examples(examples)
+        stats.ingested += result.get("inserted", 0)
+        stats.errors += result.get("errors", 0)
+
+    async def _store_memories(
+        self, chunk: list[IngestRecord], stats: IngestStats, semaphore: asyncio.Semaphore,
+    ) -> None:
+        async def _add(record: IngestRecord) -> bool:
+            async with semaphore:
+                try:
+                    await self.deps.memory_service.add(
+                        record.memory_text, metadata=record.memory_metadata,
+                    )
+                    return True
+                except Exception as e:
+                    logger.warning("Mem0 store failed for %s: %s", record.source_file, type(e).__name__)
+                    logger.debug("Mem0 error detail: %s", e)
+                    return False
+
+        results = await asyncio.gather(*(_add(r) for r in chunk if r.memory_text))
+        stats.memory_stored += sum(results)
+
+
+async def ingest_linkedin_csv(
+    csv_path: str | Path,
+    deps: "BrainDeps | None" = None,
+    dry_run: bool = False,
+    min_length: int = 100,
+) -> IngestStats | IngestEstimate:
+    """Stream a LinkedIn CSV export into examples + Mem0.
+
+    Dry runs only parse the file and need no backend connections.
+    Returns an IngestEstimate on dry runs, IngestStats otherwise.
+    """
+    records = linkedin_records(read_csv(csv_path), min_length=min_length)
+    if dry_run:
+        if deps is not None:
+            config = deps.config
+        else:
+            from second_brain.config import BrainConfig
+            config = BrainConfig()
+        estimate = estimate_ingest(
+            records, config.ingest_batch_size, config.ingest_memory_concurrency,
+        )
+        logger.info(
+            "DRY RUN -- %d posts: %d embed + %d upsert + %d Mem0 calls, ~%.0fs "
+            "(serial baseline ~%.0fs)",
+            estimate.records, estimate.embed_calls, estimate.upsert_calls,
+            estimate.memory_calls, estimate.estimated_seconds,
+            estimate.serial_estimated_seconds,
+        )
+        return estimate
+
+    if deps is None:
+        from second_brain.deps import create_deps
+        deps = create_deps()
+    stats = await IngestEngine(deps).run(records)
+    logger.info(
+        "Done -- %d/%d posts ingested, %d stored in Mem0, %d errors (%.1f rec/s).",
+        stats.ingested, stats.records, stats.memory_stored, stats.errors,
+        stats.records_per_second,
+    )
+    return stats
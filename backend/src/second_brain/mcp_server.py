@@ -6,6 +6,7 @@ Run: python -m second_brain.mcp_server
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 from fastmcp import FastMCP
@@ -18,10 +19,17 @@ if TYPE_CHECKING:
 from second_brain.deps import BrainDeps, create_deps
 from second_brain.models import get_model
 from second_brain.agents.recall import recall_agent
+from second_brain.agents.answer_cache import lookup_answer, store_answer
 from second_brain.agents.ask import ask_agent
 from second_brain.agents.learn import learn_agent
 from second_brain.agents.create import create_agent
+from second_brain.agents.context_pack import with_context_pack
 from second_brain.agents.review import run_full_review
+from second_brain.services.community_maintenance import (
+    CommunityMaintainer,
+    start_community_maintenance,
+)
+from second_brain.services.warmup import WarmupState, start_warmup
 
 logger = logging.getLogger(__name__)
 
@@ -76,8 +84,25 @@ def _validate_url_scheme(url: str, label: str = "URL") -> str:
     return url
 
 
+@asynccontextmanager
+async def _server_lifespan(_server):
+    """Warm up eagerly-initialized deps and start background graph maintenance."""
+    global _warmup, _community_maintainer
+    if _deps is not None and _deps.config.warmup_enabled:
+        _warmup = start_warmup(_deps)
+    if _deps is not None and _deps.graphiti_service:
+        _community_maintainer = start_community_maintenance(_deps.graphiti_service, _deps.config)
+    try:
+        yield {}
+    finally:
+        if _warmup is not None and _warmup.task is not None:
+            _warmup.task.cancel()
+        if _community_maintainer is not None:
+            _community_maintainer.stop()
+
+
 # Initialize server
-server = FastMCP("Second Brain")
+server = FastMCP("Second Brain", lifespan=_server_lifespan)
 
 
 @server.custom_route("/health", methods=["GET"])
@@ -94,23 +119,28 @@ async def health_check(request: Request) -> JSONResponse:
              "error": "Initialization failed. Check server logs."},
             status_code=503,
         )
-    return JSONResponse({
+    result = {
         "status": "healthy",
         "service": "second-brain",
         "initialized": _deps is not None,
-    })
+    }
+    if _warmup is not None:
+        result["warmed_up"] = _warmup.done
+        result["services"] = _warmup.snapshot()
+    return JSONResponse(result)
 
 
 # Lazy-init deps (created on first tool call) with circuit breaker
 _deps: BrainDeps | None = None
 _model = None
-_agent_models: dict = {}  # Per-agent model cache
 _deps_failed: bool = False
 _deps_error: str = ""
+_warmup: WarmupState | None = None
+_community_maintainer: CommunityMaintainer | None = None
 
 
 def _get_deps() -> BrainDeps:
-    global _deps, _model, _deps_failed, _deps_error, _agent_models
+    global _deps, _model, _deps_failed, _deps_error
     if _deps_failed:
         raise RuntimeError(
             f"Second Brain initialization failed: {_deps_error}. "
@@ -120,7 +150,6 @@ def _get_deps() -> BrainDeps:
         try:
             _deps = create_deps()
             _model = get_model(_deps.config)
-            _agent_models = {}
         except Exception as e:
             _deps_failed = True
             _deps_error = str(e)
@@ -138,13 +167,12 @@ def init_deps() -> None:
 
     See also: service_mcp.py:init_deps() for the same pattern.
     """
-    global _deps, _model, _deps_failed, _deps_error, _agent_models
+    global _deps, _model, _deps_failed, _deps_error
     if _deps is not None:
         return  # Already initialized
     try:
         _deps = create_deps()
         _model = get_model(_deps.config)
-        _agent_models = {}
         logger.info("Dependencies initialized successfully")
     except Exception as e:
         _deps_failed = True
@@ -180,18 +208,16 @@ async def _setup_mem0_project() -> None:
 def _get_model(agent_name: str | None = None) -> "Model | None":
     """Get model for a specific agent, or the global default.
 
-    Caches per-agent models to avoid rebuilding on every tool call.
+    Models come from the process-wide registry in second_brain.models, so
+    agents that resolve to the same model share one instance and client.
     """
     _get_deps()  # ensure initialized
 
     if agent_name is None:
         return _model
 
-    if agent_name not in _agent_models:
-        from second_brain.models import get_agent_model
-        _agent_models[agent_name] = get_agent_model(agent_name, _deps.config)
-
-    return _agent_models[agent_name]
+    from second_brain.models import get_agent_model
+    return get_agent_model(agent_name, _deps.config)
 
 
 @server.tool()
@@ -491,19 +517,24 @@ async def ask(question: str) -> str:
             "review your work, or answer questions using your accumulated knowledge."
         )
     deps = _get_deps()
-    model = _get_model("ask")
-    timeout = deps.config.api_timeout_seconds
-    try:
-        async with asyncio.timeout(timeout):
-            result = await ask_agent.run(
-                question,
-                deps=deps,
-                model=model,
-            )
-    except TimeoutError:
-        logger.warning("MCP ask timed out after %ds", timeout)
-        return f"Ask timed out after {timeout}s. Try a simpler question."
-    output = result.output
+    lookup = await lookup_answer(deps, question)
+    if lookup and lookup.answer:
+        output = lookup.answer
+    else:
+        model = _get_model("ask")
+        timeout = deps.config.api_timeout_seconds
+        try:
+            async with asyncio.timeout(timeout):
+                result = await ask_agent.run(
+                    question,
+                    deps=deps,
+                    model=model,
+                )
+        except TimeoutError:
+            logger.warning("MCP ask timed out after %ds", timeout)
+            return f"Ask timed out after {timeout}s. Try a simpler question."
+        output = result.output
+        store_answer(deps, lookup, output)
 
     # Format as readable text for Claude Code
     parts = [output.answer]
@@ -517,6 +548,8 @@ async def ask(question: str) -> str:
             parts.append(f"- {rel.source} --[{rel.relationship}]--> {rel.target}")
     if output.next_action:
         parts.append(f"\nSuggested next: {output.next_action}")
+    if lookup and lookup.answer:
+        parts.append(f"\n(Cached answer, {lookup.age_seconds:.0f}s old)")
     return "\n".join(parts)
 
 
@@ -634,12 +667,10 @@ async def learn_image(image_url: str, context: str = "", category: str = "visual
     if deps.embedding_service:
         try:
             if image_url.startswith("data:"):
-                from PIL import Image as PILImage
-                from io import BytesIO
-                import base64 as b64
+                from second_brain.services.executors import MEDIA, run_blocking
+                from second_brain.services.voyage import load_data_uri_image
 
-                b64_data = image_url.split(",", 1)[1] if "," in image_url else image_url
-                img = PILImage.open(BytesIO(b64.b64decode(b64_data)))
+                img = await run_blocking(MEDIA, load_data_uri_image, image_url)
             else:
                 img = image_url  # Voyage multimodal accepts URL strings
 
@@ -867,12 +898,10 @@ async def multimodal_vector_search(
     if image_url.strip():
         url = image_url.strip()
         if url.startswith("data:"):
-            from PIL import Image as PILImage
-            from io import BytesIO
-            import base64 as b64
+            from second_brain.services.executors import MEDIA, run_blocking
+            from second_brain.services.voyage import load_data_uri_image
 
-            b64_data = url.split(",", 1)[1] if "," in url else url
-            input_items.append(PILImage.open(BytesIO(b64.b64decode(b64_data))))
+            input_items.append(await run_blocking(MEDIA, load_data_uri_image, url))
         else:
             input_items.append(url)
 
@@ -976,8 +1005,9 @@ async def create_content(
             )
         try:
             async with asyncio.timeout(timeout):
+                run_deps = await with_context_pack(deps, "linkedin_writer", prompt, effective_uid)
                 result = await linkedin_writer_agent.run(
-                    writer_prompt, deps=deps, model=model,
+                    writer_prompt, deps=run_deps, model=model,
                 )
         except TimeoutError:
             logger.warning("MCP create_content linkedin_writer timed out after %ds", timeout)
@@ -1001,7 +1031,7 @@ async def create_content(
             parts.append(f"\n⚠️ **Degraded**: {out.error}")
         return "\n".join(parts)
 
-    # Build prompt — agent's own tools fetch voice guide and examples
+    # Build prompt — voice guide and examples come from the context pack (tools as fallback)
     agent_prompt = f"Create {type_config.name} ({content_type}) content"
     if type_config.length_guidance:
         agent_prompt += f" ({type_config.length_guidance})"
@@ -1020,7 +1050,10 @@ async def create_content(
 
     try:
         async with asyncio.timeout(timeout):
-            result = await create_agent.run(agent_prompt, deps=deps, model=model)
+            run_deps = await with_context_pack(
+                deps, "create", prompt, effective_uid, content_type=content_type,
+            )
+            result = await create_agent.run(agent_prompt, deps=run_deps, model=model)
     except TimeoutError:
         logger.warning("MCP create_content timed out after %ds", timeout)
         return f"Create timed out after {timeout}s. Try a simpler prompt."
@@ -1511,6 +1544,51 @@ async def graph_communities(query: str = "", limit: int = 5) -> str:
         return f"Community search failed: {type(e).__name__}"
 
 
+@server.tool()
+async def graph_episodes(limit: int = 20, cursor: str = "") -> str:
+    """List episodes ingested into the knowledge graph, newest first.
+
+    When to use: To review what content has reached the graph. Large graphs
+    are returned a page at a time — pass the returned cursor to continue.
+
+    Returns: Episode previews with IDs and sources, plus a cursor for the next page.
+
+    Args:
+        limit: Episodes per page (default: 20, max: 100)
+        cursor: Cursor from the previous page (default: first page)
+    """
+    deps = _get_deps()
+    if not deps.graphiti_service:
+        return "Episode listing unavailable — Graphiti not configured."
+    limit = max(1, min(limit, 100))
+    try:
+        async with asyncio.timeout(deps.config.api_timeout_seconds):
+            page = await deps.graphiti_service.get_episodes_page(
+                group_id=deps.config.brain_user_id or None,
+                limit=limit,
+                cursor=cursor or None,
+            )
+    except ValueError as e:
+        return str(e)
+    except TimeoutError:
+        logger.warning("MCP graph_episodes timed out")
+        return "Episode listing timed out."
+    except Exception as e:
+        logger.warning("graph_episodes failed: %s", type(e).__name__)
+        return f"Episode listing failed: {type(e).__name__}"
+    episodes = page["episodes"]
+    if not episodes:
+        return "No episodes found."
+    formatted = [f"## Graph Episodes ({len(episodes)})"]
+    for ep in episodes:
+        preview = ep.get("content", "")[:120].replace("\n", " ")
+        created = (ep.get("created_at") or "")[:10]
+        formatted.append(f"- `{ep.get('id', '?')}` [{ep.get('source', 'unknown')}] {created} {preview}")
+    if page["next_cursor"]:
+        formatted.append(f"\nMore episodes available — cursor: {page['next_cursor']}")
+    return "\n".join(formatted)
+
+
 @server.tool()
 async def graph_advanced_search(
     query: str,
@@ -2590,7 +2668,8 @@ async def compose_email(request: str) -> str:
     timeout = deps.config.api_timeout_seconds
     try:
         async with asyncio.timeout(timeout):
-            result = await email_agent.run(request, deps=deps, model=model)
+            run_deps = await with_context_pack(deps, "email", request)
+            result = await email_agent.run(request, deps=run_deps, model=model)
     except TimeoutError:
         logger.warning("MCP compose_email timed out after %ds", timeout)
         return f"Email composition timed out after {timeout}s."
@@ -2633,19 +2712,22 @@ async def ask_claude_specialist(question: str) -> str:
 
 @server.tool()
 async def run_brain_pipeline(request: str, steps: str = "") -> str:
-    """Run a multi-agent pipeline — chains multiple agents in sequence where
-    each agent's output feeds into the next. Auto-routes via Chief of Staff
-    if no steps specified.
+    """Run a multi-agent pipeline — chains multiple agents where each
+    agent's output feeds into the steps that depend on it. Independent steps
+    run in parallel. Auto-routes via Chief of Staff if no steps specified.
 
     When to use: For multi-step workflows like content creation pipelines
     (recall->create->review) or learn-from-content flows (review->learn).
     For single-agent tasks, call the specific tool directly.
 
-    Returns: Final pipeline output (from the last agent in the chain).
+    Returns: Final pipeline output (from the last listed agent), followed by
+    per-step timings.
 
     Args:
         request: The request to process through the pipeline.
-        steps: Comma-separated agent names (e.g., "recall,create,review").
+        steps: Comma-separated agent names run in order (e.g., "recall,create,review").
+               "step<a+b" makes a step wait only for a and b; unannotated steps
+               then start immediately (e.g., "create,review<create,clarity<create").
                Empty = auto-route via Chief of Staff.
     """
     try:
@@ -2654,21 +2736,22 @@ async def run_brain_pipeline(request: str, steps: str = "") -> str:
         return str(e)
     deps = _get_deps()
     model = _get_model("chief_of_staff")
-    from second_brain.agents.utils import run_pipeline
+    from second_brain.agents.utils import parse_pipeline_steps, run_pipeline
 
+    dependencies: dict[str, list[str]] = {}
     if not steps:
-        # Auto-route via Chief of Staff
-        from second_brain.agents.chief_of_staff import chief_of_staff
+        # Auto-route: deterministic fast path, Chief of Staff when uncertain
+        from second_brain.agents.chief_of_staff import route_request
         timeout = deps.config.api_timeout_seconds
         try:
             async with asyncio.timeout(timeout):
-                routing = await chief_of_staff.run(request, deps=deps, model=model)
+                routing_output, _router = await route_request(request, deps, model)
         except TimeoutError:
             logger.warning("MCP run_brain_pipeline routing timed out after %ds", timeout)
             return f"Pipeline routing timed out after {timeout}s."
-        routing_output = routing.output
         if routing_output.target_agent == "pipeline":
             step_list = list(routing_output.pipeline_steps)
+            dependencies = dict(routing_output.pipeline_dependencies)
         else:
             step_list = [routing_output.target_agent]
         # Short-circuit conversational routing — no pipeline needed
@@ -2679,7 +2762,7 @@ async def run_brain_pipeline(request: str, steps: str = "") -> str:
                 "review your work, or answer questions using your accumulated knowledge."
             )
     else:
-        step_list = [s.strip() for s in steps.split(",") if s.strip()]
+        step_list, dependencies = parse_pipeline_steps(steps)
 
     pipeline_timeout = deps.config.api_timeout_seconds * max(len(step_list), 1) * deps.config.mcp_review_timeout_multiplier
     try:
@@ -2689,12 +2772,18 @@ async def run_brain_pipeline(request: str, steps: str = "") -> str:
                 initial_prompt=request,
                 deps=deps,
                 model=model,
+                dependencies=dependencies,
             )
     except TimeoutError:
         logger.warning("MCP run_brain_pipeline execution timed out after %ds (%d steps)", pipeline_timeout, len(step_list))
         return f"Pipeline timed out after {pipeline_timeout}s ({len(step_list)} steps). Try fewer steps or a simpler request."
     final = results.get("final")
-    return str(final) if final else "Pipeline completed with no output."
+    output = str(final) if final else "Pipeline completed with no output."
+    timings = results.get("timings")
+    if isinstance(timings, dict) and timings.get("steps"):
+        per_step = ", ".join(f"{step} {seconds:.1f}s" for step, seconds in timings["steps"].items())
+        output += f"\n\nStep timings: {per_step} (total {timings['total']:.1f}s)"
+    return output
 
 
 @server.tool()
@@ -3027,7 +3116,8 @@ async def write_linkedin_hooks(
     timeout = deps.config.api_timeout_seconds
     try:
         async with asyncio.timeout(timeout):
-            result = await hook_writer_agent.run(prompt, deps=deps, model=model)
+            run_deps = await with_context_pack(deps, "hook_writer", topic, effective_uid)
+            result = await hook_writer_agent.run(prompt, deps=run_deps, model=model)
     except TimeoutError:
         logger.warning("MCP write_linkedin_hooks timed out after %ds", timeout)
         return f"Hook writing timed out after {timeout}s."
@@ -2,9 +2,17 @@
 
 Uses the provider registry pattern: config.model_provider selects the primary
 provider, config.model_fallback_chain lists fallback providers tried in order.
+
+Built models live in a process-wide registry keyed by (provider, model name,
+credentials hash), so every agent, request and pipeline step that resolves
+to the same model shares one instance -- and with it the provider's HTTP
+client and its pooled connections -- instead of re-validating the config
+and opening fresh TCP/TLS connections on every call.
 """
 
+import hashlib
 import logging
+import threading
 
 from pydantic_ai.models import Model
 
@@ -12,6 +20,63 @@ from second_brain.config import BrainConfig
 
 logger = logging.getLogger(__name__)
 
+_registry: dict[tuple[str, str, str], Model] = {}
+_registry_lock = threading.Lock()
+_registry_stats = {"hits": 0, "misses": 0}
+
+
+def _credentials_hash(provider: object) -> str:
+    """Fingerprint of a provider's settings (API keys, URLs, flags, default model).
+
+    Only scalar attributes are hashed, so secrets never end up in registry keys.
+    """
+    settings = sorted(
+        (name, value) for name, value in vars(provider).items()
+        if value is None or isinstance(value, (str, int, float, bool))
+    )
+    return hashlib.sha256(repr(settings).encode()).hexdigest()[:16]
+
+
+def _registry_model(provider_name: str, model_name: str, config: BrainConfig) -> Model:
+    """Return the registered model for this provider/model/credentials, building it once.
+
+    Raises whatever the provider raises (unknown provider, missing credentials,
+    build failure); failures are not cached.
+    """
+    from second_brain.providers import get_provider_class
+
+    provider = get_provider_class(provider_name).from_config(config)
+    key = (provider_name, model_name, _credentials_hash(provider))
+    with _registry_lock:
+        model = _registry.get(key)
+        _registry_stats["hits" if model is not None else "misses"] += 1
+    if model is not None:
+        return model
+
+    provider.validate_config()
+    model = provider.build_model(model_name)
+    with _registry_lock:
+        # A concurrent caller may have built the same model meanwhile -- keep the first
+        return _registry.setdefault(key, model)
+
+
+def model_registry_stats() -> dict:
+    """Registered models and registry hits/misses since startup."""
+    with _registry_lock:
+        stats = dict(_registry_stats)
+        stats["models"] = len(_registry)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def clear_model_registry() -> None:
+    """Drop all registered models and counters (tests, credential rotation)."""
+    with _registry_lock:
+        _registry.clear()
+        for key in _registry_stats:
+            _registry_stats[key] = 0
+
 
 def get_model(config: BrainConfig) -> Model:
     """Get the best available LLM model using provider registry + fallback chain.
@@ -19,18 +84,13 @@ def get_model(config: BrainConfig) -> Model:
     Tries the primary provider first, then each fallback in order.
     Raises RuntimeError if all providers fail with diagnostic details.
     """
-    from second_brain.providers import get_provider_class
-
     # Build list of providers to try: primary + fallbacks
     providers_to_try = [config.model_provider] + config.fallback_chain_list
     errors: list[tuple[str, str]] = []
 
     for provider_name in providers_to_try:
         try:
-            provider_cls = get_provider_class(provider_name)
-            provider = provider_cls.from_config(config)
-            provider.validate_config()
-            model = provider.build_model(config.model_name or "")
+            model = _registry_model(provider_name, config.model_name or "", config)
             if providers_to_try.index(provider_name) > 0:
                 logger.info(
                     "Primary provider unavailable, using fallback: %s",
@@ -57,12 +117,21 @@ def get_agent_model(agent_name: str, config: BrainConfig) -> Model:
     Checks config.agent_model_overrides for an agent-specific model string.
     If found, parses 'provider:model' syntax or uses global provider with
     the override as model name. Falls back to get_model(config) if no override.
+    With LLM_CACHE_ENABLED, agents in LLM_CACHE_AGENTS get the model wrapped
+    in the response cache (see second_brain.services.llm_cache).
     """
+    from second_brain.services.llm_cache import with_llm_cache
+
+    return with_llm_cache(_agent_override_model(agent_name, config), agent_name, config)
+
+
+def _agent_override_model(agent_name: str, config: BrainConfig) -> Model:
+    """The agent's AGENT_MODEL_OVERRIDES model, or get_model(config)."""
     override = config.agent_model_overrides.get(agent_name)
     if not override:
         return get_model(config)
 
-    from second_brain.providers import get_provider_class, PROVIDER_REGISTRY
+    from second_brain.providers import PROVIDER_REGISTRY
 
     # Parse provider:model syntax
     provider_name = config.model_provider
@@ -75,11 +144,8 @@ def get_agent_model(agent_name: str, config: BrainConfig) -> Model:
             model_name = rest
 
     try:
-        provider_cls = get_provider_class(provider_name)
-        provider = provider_cls.from_config(config)
-        provider.validate_config()
-        model = provider.build_model(model_name)
-        logger.info(
+        model = _registry_model(provider_name, model_name, config)
+        logger.debug(
             "Agent %r using model override: %s (provider: %s)",
             agent_name, model_name, provider_name,
         )
@@ -0,0 +1,217 @@
+"""Compare parallel and batched review scoring on a fixed corpus.
+
+run_full_review() can score dimensions with one LLM call each ("parallel")
+or all of them in one call ("batched"). Before switching a content type or
+REVIEW_MODE to batched, run both modes over the same drafts and check that
+the scores agree closely enough for the call savings:
+
+    python scripts/benchmark_review_modes.py [--corpus drafts.json]
+
+Both runs use record_history=False, so benchmarks leave review history and
+pattern confidence untouched.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic_ai.models.wrapper import WrapperModel
+
+from second_brain.agents.review import REVIEW_MODES, run_full_review
+from second_brain.deps import BrainDeps
+
+if TYPE_CHECKING:
+    from pydantic_ai.models import Model
+
+logger = logging.getLogger(__name__)
+
+# Fixed drafts of varied type and quality, so score deltas are comparable run to run
+BENCHMARK_CORPUS: list[dict[str, str]] = [
+    {
+        "content_type": "linkedin",
+        "content": (
+            "I almost shut down my startup in 2022.\n\n"
+            "Burn was $80k a month. Runway: 4 months. Two enterprise deals stuck in legal.\n\n"
+            "So we did the unglamorous thing: called every churned customer and asked why.\n\n"
+            "11 of 14 said the same thing — onboarding took too long.\n\n"
+            "We cut setup from 3 weeks to 2 days. Net revenue retention went from 84% to 121%.\n\n"
+            "Your churned customers know exactly what's wrong. Have you asked them?"
+        ),
+    },
+    {
+        "content_type": "linkedin",
+        "content": (
+            "Excited to announce that we are leveraging synergies to deliver best-in-class "
+            "solutions for our valued stakeholders. Innovation is in our DNA. "
+            "#innovation #leadership #growth #synergy #business #success #motivation"
+        ),
+    },
+    {
+        "content_type": "email",
+        "content": (
+            "Subject: Follow-up on Tuesday's pilot review\n\n"
+            "Hi Dana,\n\n"
+            "Thanks for walking us through the pilot results on Tuesday. The 30% drop in "
+            "ticket handling time is a strong signal, and I've attached the breakdown by team "
+            "you asked for.\n\n"
+            "Could we get 20 minutes next week to agree the rollout scope for Q3? "
+            "Thursday or Friday afternoon both work on my side.\n\n"
+            "Best,\nSam"
+        ),
+    },
+    {
+        "content_type": "landing-page",
+        "content": (
+            "Stop losing deals to slow follow-up.\n\n"
+            "Our AI assistant drafts personalised follow-ups from your call notes in seconds, "
+            "in your voice. Teams using it reply 4x faster and close 18% more pipeline.\n\n"
+            "- Connects to your CRM in 5 minutes\n"
+            "- Learns your tone from past emails\n"
+            "- You approve every message before it sends\n\n"
+            "Start a 14-day free trial. No credit card required."
+        ),
+    },
+]
+
+
+class _CountingModel(WrapperModel):
+    """Counts model requests made through it."""
+
+    def __init__(self, wrapped: "Model"):
+        super().__init__(wrapped)
+        self.requests = 0
+
+    async def request(self, *args, **kwargs):
+        self.requests += 1
+        return await super().request(*args, **kwargs)
+
+
+@dataclass
+class ModeRun:
+    """One draft reviewed in one mode."""
+
+    mode: str
+    scores: dict[str, int]
+    overall_score: float
+    verdict: str
+    llm_calls: int
+    seconds: float
+
+
+@dataclass
+class SampleComparison:
+    """Both modes on the same draft."""
+
+    content_type: str
+    preview: str
+    runs: dict[str, ModeRun] = field(default_factory=dict)
+
+    def score_deltas(self) -> dict[str, int]:
+        """Batched minus parallel score per dimension scored by both."""
+        parallel, batched = self.runs["parallel"].scores, self.runs["batched"].scores
+        return {dim: batched[dim] - parallel[dim] for dim in parallel if dim in batched}
+
+
+def load_corpus(path: str | Path) -> list[dict[str, str]]:
+    """A JSON list of {"content", "content_type"} drafts."""
+    items = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [
+        {"content": item["content"], "content_type": item.get("content_type", "")}
+        for item in items if item.get("content")
+    ]
+
+
+async def compare_review_modes(
+    deps: BrainDeps,
+    model: "Model",
+    corpus: list[dict[str, str]] = BENCHMARK_CORPUS,
+) -> list[SampleComparison]:
+    """Review every draft in both modes, one after the other so timings are not shared."""
+    comparisons = []
+    for item in corpus:
+        comparison = SampleComparison(
+            content_type=item.get("content_type", ""),
+            preview=item["content"][:60],
+        )
+        for mode in REVIEW_MODES:
+            counting = _CountingModel(model)
+            start = time.monotonic()
+            result = await run_full_review(
+                item["content"], deps, counting, item.get("content_type") or None,
+                mode=mode, record_history=False,
+            )
+            comparison.runs[mode] = ModeRun(
+                mode=mode,
+                scores={s.dimension: s.score for s in result.scores},
+                overall_score=result.overall_score,
+                verdict=result.verdict,
+                llm_calls=counting.requests,
+                seconds=round(time.monotonic() - start, 2),
+            )
+        comparisons.append(comparison)
+    return comparisons
+
+
+def summarize(comparisons: list[SampleComparison]) -> dict:
+    """Agreement and cost of batched relative to parallel across the corpus."""
+    if not comparisons:
+        return {"samples": 0}
+    per_dimension: dict[str, list[int]] = {}
+    for c in comparisons:
+        for dim, delta in c.score_deltas().items():
+            per_dimension.setdefault(dim, []).append(delta)
+    overall_deltas = [
+        c.runs["batched"].overall_score - c.runs["parallel"].overall_score for c in comparisons
+    ]
+    totals = {
+        mode: {
+            "llm_calls": sum(c.runs[mode].llm_calls for c in comparisons),
+            "seconds": round(sum(c.runs[mode].seconds for c in comparisons), 2),
+        }
+        for mode in REVIEW_MODES
+    }
+    batched_calls = totals["batched"]["llm_calls"]
+    return {
+        "samples": len(comparisons),
+        "mean_abs_delta_by_dimension": {
+            dim: round(sum(abs(d) for d in deltas) / len(deltas), 2)
+            for dim, deltas in per_dimension.items()
+        },
+        "mean_overall_delta": round(sum(overall_deltas) / len(overall_deltas), 2),
+        "max_abs_overall_delta": round(max(abs(d) for d in overall_deltas), 2),
+        "verdict_agreement": round(
+            sum(c.runs["batched"].verdict == c.runs["parallel"].verdict for c in comparisons)
+            / len(comparisons), 2,
+        ),
+        "totals": totals,
+        "call_reduction": (
+            round(totals["parallel"]["llm_calls"] / batched_calls, 1) if batched_calls else None
+        ),
+    }
+
+
+def format_report(comparisons: list[SampleComparison], summary: dict) -> str:
+    """Plain-text report: one line per draft, then the corpus summary."""
+    lines = ["# Review mode benchmark: parallel vs batched", ""]
+    for c in comparisons:
+        p, b = c.runs["parallel"], c.runs["batched"]
+        lines.append(
+            f"- [{c.content_type or 'general'}] {c.preview!r}: "
+            f"{p.overall_score} ({p.verdict}, {p.llm_calls} calls, {p.seconds}s) vs "
+            f"{b.overall_score} ({b.verdict}, {b.llm_calls} calls, {b.seconds}s)"
+        )
+    if summary.get("samples"):
+        lines += ["", "## Summary"]
+        for dim, delta in summary["mean_abs_delta_by_dimension"].items():
+            lines.append(f"  {dim:20s} mean |delta| {delta}")
+        lines.append(f"  Overall mean delta: {summary['mean_overall_delta']:+} "
+                     f"(max |delta| {summary['max_abs_overall_delta']})")
+        lines.append(f"  Verdict agreement: {summary['verdict_agreement']:.0%}")
+        for mode, total in summary["totals"].items():
+            lines.append(f"  {mode:9s} {total['llm_calls']} LLM calls, {total['seconds']}s")
+        if summary["call_reduction"]:
+            lines.append(f"  Batched uses {summary['call_reduction']}x fewer LLM calls")
+    return "\n".join(lines)
@@ -255,6 +255,11 @@ class ContentTypeConfig(BaseModel):
         description="Frontend UI metadata. Keys: icon (str), color (str), category (str), "
         "input_placeholder (str), show_framework_selector (bool).",
     )
+    review_mode: str = Field(
+        default="",
+        description="How run_full_review scores this type: 'parallel' (one LLM call per "
+        "dimension), 'batched' (all dimensions in one call) or 'auto'. Empty = REVIEW_MODE config.",
+    )
 
 
 class CreateResult(BaseModel):
@@ -316,6 +321,17 @@ class DimensionScore(BaseModel):
     )
 
 
+class BatchedReviewOutput(BaseModel):
+    """All review dimensions scored in a single LLM call (batched review mode)."""
+
+    scores: list[DimensionScore] = Field(description="One score per requested dimension")
+    error: str = Field(
+        default="",
+        description="Error message when review backends are degraded or unavailable. "
+        "When set, minimal scoring is expected and should not trigger retries.",
+    )
+
+
 class ReviewResult(BaseModel):
     """Aggregate scorecard from a full 6-dimension review."""
 
@@ -326,6 +342,7 @@ class ReviewResult(BaseModel):
     top_strengths: list[str] = Field(default_factory=list, description="Top 3 strengths across all dimensions")
     critical_issues: list[str] = Field(default_factory=list, description="Must-fix issues across all dimensions")
     next_steps: list[str] = Field(default_factory=list, description="Recommended next actions")
+    review_mode: str = Field(default="", description="Scoring mode used: parallel or batched")
 
 
 class GrowthEvent(BaseModel):
@@ -981,6 +998,14 @@ class RoutingDecision(BaseModel):
         default_factory=list,
         description="If pipeline mode, ordered list of agents to chain. Empty for single agent.",
     )
+    pipeline_dependencies: dict[str, list[AgentRoute]] = Field(
+        default_factory=dict,
+        description=(
+            "Optional, pipeline mode only: step -> steps whose output it needs. "
+            "Empty = run pipeline_steps in order. When set, steps without an entry "
+            "start immediately and independent steps run in parallel."
+        ),
+    )
     confidence: ConfidenceLevel = Field(default="MEDIUM", description="Routing confidence")
     query_complexity: QueryComplexity = Field(
         default="medium",
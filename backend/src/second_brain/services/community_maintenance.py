@@ -0,0 +1,134 @@
+"""Scheduled incremental community maintenance for the Graphiti graph.
+
+GraphitiService.build_communities() rebuilds every community of a group
+from scratch, which gets slower as the graph grows. Instead a background
+job periodically runs GraphitiService.update_communities() for the groups
+that received episodes since the last run: new entities join existing
+communities and only drifted communities are re-summarized, so
+graph_communities keeps serving fresh summaries without a full rebuild.
+
+Progress of the current and last run: CommunityMaintainer.snapshot(),
+served on GET /api/health/runtime.
+"""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from second_brain.services.graphiti import GraphitiService
+
+logger = logging.getLogger(__name__)
+
+IDLE = "idle"
+RUNNING = "running"
+
+
+class CommunityMaintainer:
+    """Runs update_communities() for stale groups every `interval` seconds."""
+
+    def __init__(
+        self,
+        graphiti: "GraphitiService",
+        interval: float,
+        drift_threshold: float = 0.25,
+    ):
+        self.graphiti = graphiti
+        self.interval = interval
+        self.drift_threshold = drift_threshold
+        self.task: asyncio.Task | None = None
+        self.runs = 0
+        self.status = IDLE
+        self.group: str | None = None
+        self.phase: str | None = None
+        self.done = 0
+        self.total = 0
+        self.last_run: dict | None = None
+
+    def _progress(self, phase: str, done: int = 0, total: int = 0) -> None:
+        self.phase, self.done, self.total = phase, done, total
+
+    async def run_once(self, groups: list[str | None] | None = None) -> dict:
+        """Maintain `groups` (default: those with new episodes). Never raises."""
+        if groups is None:
+            groups = self.graphiti.take_stale_community_groups()
+        start = time.monotonic()
+        reports: dict[str, dict] = {}
+        self.status = RUNNING
+        try:
+            for group in groups:
+                self.group = group
+                self._progress("starting")
+                try:
+                    report = await self.graphiti.update_communities(
+                        group, drift_threshold=self.drift_threshold, progress=self._progress,
+                    )
+                except Exception as e:
+                    logger.warning("Community maintenance failed: %s", type(e).__name__)
+                    logger.debug("Community maintenance error detail: %s", e)
+                    report = {"error": type(e).__name__}
+                if "error" in report:
+                    # Retry on the next run
+                    self.graphiti.mark_communities_stale(group)
+                reports[group or ""] = report
+        finally:
+            self.status = IDLE
+            self.group = self.phase = None
+            self.done = self.total = 0
+        self.runs += 1
+        self.last_run = {
+            "finished_at": time.time(),
+            "seconds": round(time.monotonic() - start, 3),
+            "groups": reports,
+        }
+        if reports:
+            logger.info(
+                "Community maintenance: %d group(s) in %.1fs", len(reports), self.last_run["seconds"],
+            )
+        return self.last_run
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_once()
+
+    def start(self) -> None:
+        """Schedule the periodic job on the running loop."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._loop(), name="community-maintenance")
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def snapshot(self) -> dict:
+        current = None
+        if self.status == RUNNING:
+            current = {
+                "group": self.group,
+                "phase": self.phase,
+                "done": self.done,
+                "total": self.total,
+            }
+        return {
+            "status": self.status,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "current": current,
+            "last_run": self.last_run,
+        }
+
+
+def start_community_maintenance(graphiti: "GraphitiService", config) -> CommunityMaintainer | None:
+    """Start the periodic job if enabled in config; None when disabled."""
+    if config.graphiti_community_refresh_seconds <= 0:
+        return None
+    maintainer = CommunityMaintainer(
+        graphiti,
+        config.graphiti_community_refresh_seconds,
+        drift_threshold=config.graphiti_community_drift_threshold,
+    )
+    maintainer.start()
+    return maintainer
@@ -0,0 +1,91 @@
+"""Request deadlines that reach the socket.
+
+`asyncio.timeout` alone only abandons the awaiting coroutine — a blocking SDK
+call already running on a worker thread keeps its HTTP request open until the
+server answers. `deadline()` records the absolute deadline in a context
+variable; backend executors copy it into the worker thread, where:
+
+- jobs that waited past their deadline are dropped before they start
+  (see services.executors), and
+- httpx clients with `install_deadline_timeouts()` clamp each request's
+  connect/read/write/pool timeouts to the time remaining.
+
+So an expired call releases its worker and socket within one timeout instead
+of running to completion in the background.
+"""
+
+import asyncio
+import contextvars
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "second_brain_deadline", default=None,
+)
+
+_TIMEOUT_KEYS = ("connect", "read", "write", "pool")
+
+
+@asynccontextmanager
+async def deadline(seconds: float) -> AsyncIterator[None]:
+    """`asyncio.timeout` that also propagates its deadline to blocking I/O.
+
+    Nested deadlines keep the earliest one. Raises TimeoutError on expiry.
+    """
+    expires = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = _deadline.set(expires)
+    try:
+        async with asyncio.timeout(max(0.0, expires - time.monotonic())):
+            yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time(default: float | None = None) -> float | None:
+    """Seconds left before the current deadline (may be <= 0), else `default`."""
+    expires = _deadline.get()
+    if expires is None:
+        return default
+    return expires - time.monotonic()
+
+
+def deadline_expired() -> bool:
+    remaining = remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+def _clamp_request_timeout(request: httpx.Request) -> None:
+    """httpx request hook: bound every timeout phase by the remaining deadline."""
+    remaining = remaining_time()
+    if remaining is None:
+        return
+    if remaining <= 0:
+        raise TimeoutError("Deadline expired before request was sent")
+    current = request.extensions.get("timeout") or {}
+    request.extensions["timeout"] = {
+        key: remaining if current.get(key) is None else min(current[key], remaining)
+        for key in _TIMEOUT_KEYS
+    }
+
+
+def install_deadline_timeouts(client, default_timeout: float | None = None) -> None:
+    """Make a sync httpx.Client honour deadline() on every request.
+
+    Optionally replaces the client's default timeout (SDK defaults such as
+    Mem0's 300s are far longer than any service call is allowed to take).
+    Non-httpx objects (e.g. test doubles) are left untouched.
+    """
+    if not isinstance(client, httpx.Client):
+        return
+    if default_timeout is not None:
+        client.timeout = httpx.Timeout(default_timeout)
+    hooks = client.event_hooks
+    if _clamp_request_timeout not in hooks["request"]:
+        hooks["request"] = [*hooks["request"], _clamp_request_timeout]
+        client.event_hooks = hooks
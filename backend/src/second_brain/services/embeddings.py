@@ -1,9 +1,10 @@
 """Embedding generation service — Voyage AI primary, OpenAI fallback."""
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from second_brain.services.deadlines import deadline, remaining_time
+
 if TYPE_CHECKING:
     from second_brain.config import BrainConfig
 
@@ -41,7 +42,8 @@ class EmbeddingService:
         """Lazy-init OpenAI client (fallback only)."""
         if self._openai_client is None:
             from openai import OpenAI
-            self._openai_client = OpenAI(api_key=self.config.openai_api_key)
+            # Retries are handled by services.retry; the SDK's own would sleep in a worker
+            self._openai_client = OpenAI(api_key=self.config.openai_api_key, max_retries=0)
         return self._openai_client
 
     async def embed(self, text: str) -> list[float]:
@@ -49,18 +51,19 @@ class EmbeddingService:
         if self._voyage:
             return await self._voyage.embed(text)
 
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import OPENAI_RETRY_CONFIG, async_retry
         client = self._get_openai_client()
 
         def _call():
             response = client.embeddings.create(
                 input=text, model=self._model, dimensions=self._dimensions,
+                timeout=remaining_time(self._timeout),
             )
             return response.data[0].embedding
 
         try:
-            async with asyncio.timeout(self._timeout):
-                return await async_retry(_call)
+            async with deadline(self._timeout):
+                return await async_retry(_call, config=OPENAI_RETRY_CONFIG)
         except TimeoutError:
             logger.warning("EmbeddingService.embed (OpenAI) timed out after %ds", self._timeout)
             return []
@@ -75,28 +78,41 @@ class EmbeddingService:
             return await self._voyage.embed_query(text)
         return await self.embed(text)
 
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for a batch of texts."""
+    async def embed_batch(
+        self, texts: list[str], input_type: str = "document"
+    ) -> list[list[float] | None]:
+        """Generate embeddings for a batch of texts.
+
+        Args:
+            texts: Texts to embed.
+            input_type: "document" for storage, "query" for search.
+                Only honoured by Voyage; OpenAI has no input types.
+
+        Returns:
+            Voyage: one entry per text, None where the request failed.
+            OpenAI: all embeddings, or [] on timeout.
+        """
         if self._voyage:
-            return await self._voyage.embed_batch(texts)
+            return await self._voyage.embed_batch(texts, input_type=input_type)
 
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import OPENAI_RETRY_CONFIG, async_retry
         client = self._get_openai_client()
         batch_size = self.config.embedding_batch_size
         all_embeddings: list[list[float]] = []
 
         try:
-            async with asyncio.timeout(self._timeout):
+            async with deadline(self._timeout):
                 for i in range(0, len(texts), batch_size):
                     batch = texts[i:i + batch_size]
 
                     def _call(b=batch):
                         response = client.embeddings.create(
                             input=b, model=self._model, dimensions=self._dimensions,
+                            timeout=remaining_time(self._timeout),
                         )
                         return [item.embedding for item in response.data]
 
-                    embeddings = await async_retry(_call)
+                    embeddings = await async_retry(_call, config=OPENAI_RETRY_CONFIG)
                     all_embeddings.extend(embeddings)
         except TimeoutError:
             logger.warning("EmbeddingService.embed_batch (OpenAI) timed out after %ds", self._timeout)
@@ -0,0 +1,190 @@
+"""Adaptive-concurrency scheduler for Graphiti episode ingestion.
+
+Each Graphiti episode costs an LLM entity-extraction round trip, so ingesting
+a long transcript one chunk at a time is latency-bound, while a fixed high
+fan-out trips provider rate limits. The scheduler runs episodes concurrently
+under an AIMD (additive-increase / multiplicative-decrease) limit:
+
+- every fast success raises the limit by 1/limit (about +1 per full window),
+- a rate-limit error (HTTP 429) halves it,
+- timeouts and other errors hold it steady.
+
+Jobs are admitted in submission order and results are returned in input
+order, so callers can rely on positional results.
+
+Episodes of one group must not resolve entities concurrently: graphiti-core
+dedupes an episode's entities against the graph as it is when the episode
+is read, so two add_episode() calls in one group create duplicate entities
+and edges. run_batches() therefore gives each group a lane whose batches run
+one after another, while the episodes inside a batch are extracted
+concurrently (add_episode_bulk dedupes across the batch). A batch holds one
+limiter slot per episode, so the AIMD limit bounds extraction fan-out.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+_I = TypeVar("_I")
+_T = TypeVar("_T")
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for provider 429s, whichever SDK raised them."""
+    if "RateLimit" in type(exc).__name__:
+        return True
+    status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+    return status == 429
+
+
+class AIMDLimiter:
+    """Concurrency limit that grows on fast successes and halves on 429s."""
+
+    def __init__(
+        self,
+        initial: int = 3,
+        minimum: int = 1,
+        maximum: int = 8,
+        latency_target: float = 15.0,
+    ):
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.latency_target = latency_target
+        self._limit = float(min(max(initial, minimum), self.maximum))
+        self._in_flight = 0
+        # Created on first use so it binds to the loop that actually runs jobs
+        self._cond: asyncio.Condition | None = None
+        self._cond_loop: asyncio.AbstractEventLoop | None = None
+        self.successes = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+        return self._cond
+
+    async def acquire(self, slots: int = 1) -> int:
+        """Wait for a free slot, then take up to `slots`; returns how many were taken."""
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < self.limit)
+            taken = min(slots, self.limit - self._in_flight)
+            self._in_flight += taken
+            return taken
+
+    async def release(
+        self, latency: float, error: BaseException | None = None, slots: int = 1,
+    ) -> None:
+        """Return `slots` and adjust the limit from the call's outcome."""
+        cond = self._condition()
+        async with cond:
+            self._in_flight -= slots
+            if error is None:
+                self.successes += 1
+                if latency <= self.latency_target:
+                    self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            elif is_rate_limit_error(error):
+                self.rate_limited += 1
+                self._limit = max(float(self.minimum), self._limit / 2)
+                logger.info("Episode ingest rate limited — concurrency now %d", self.limit)
+            else:
+                self.errors += 1
+            cond.notify_all()
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "successes": self.successes,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+        }
+
+
+class EpisodeScheduler:
+    """Runs episode jobs under a shared AIMDLimiter."""
+
+    def __init__(self, limiter: AIMDLimiter):
+        self.limiter = limiter
+
+    async def run_one(self, job: Callable[[], Awaitable[_T]]) -> _T:
+        """Run one job in a limiter slot. Exceptions propagate after release."""
+        await self.limiter.acquire()
+        return await self._run_holding(job, 1)
+
+    async def _run_holding(self, job: Callable[[], Awaitable[_T]], slots: int) -> _T:
+        start = time.monotonic()
+        error: BaseException | None = None
+        try:
+            return await job()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            await self.limiter.release(time.monotonic() - start, error, slots)
+
+    async def run(
+        self, jobs: Sequence[Callable[[], Awaitable[_T]]],
+    ) -> list[_T | BaseException]:
+        """Run jobs concurrently, admitted in order; results in input order.
+
+        A failed job's slot holds its exception instead of a result.
+        """
+        tasks = []
+        for job in jobs:
+            tasks.append(asyncio.ensure_future(self.run_one(job)))
+            # Let the task reach acquire() so admission follows input order
+            await asyncio.sleep(0)
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_batches(
+        self,
+        items: Sequence[_I],
+        job: Callable[[list[_I]], Awaitable[Sequence[_T]]],
+        lanes: Sequence[Hashable],
+    ) -> list[_T | BaseException]:
+        """Run `items` through `job` in batches; results in input order.
+
+        Lanes run concurrently. Each works through its items in input order,
+        one batch at a time, and a batch takes as many items as there are
+        free limiter slots (at least one). `job` returns one result per
+        item; when it raises, every item of the batch holds the exception.
+        """
+        by_lane: dict[Hashable, list[int]] = {}
+        for i, key in enumerate(lanes):
+            by_lane.setdefault(key, []).append(i)
+        results: list = [None] * len(items)
+
+        async def _lane(indices: list[int]) -> None:
+            while indices:
+                taken = await self.limiter.acquire(len(indices))
+                batch, indices = indices[:taken], indices[taken:]
+                try:
+                    out = await self._run_holding(lambda: job([items[i] for i in batch]), taken)
+                except Exception as e:
+                    out = [e] * len(batch)
+                for i, result in zip(batch, out):
+                    results[i] = result
+
+        tasks = []
+        for indices in by_lane.values():
+            tasks.append(asyncio.ensure_future(_lane(indices)))
+            # Let the task reach acquire() so admission follows input order
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return results
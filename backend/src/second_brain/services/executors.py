@@ -0,0 +1,232 @@
+"""Dedicated bounded thread pools per backend.
+
+Blocking SDK calls (mem0, supabase-py, voyageai, OpenAI, PIL decoding) used to
+share asyncio's default executor, so a slow backend could occupy every worker
+and stall unrelated calls. Each backend now gets its own named
+ThreadPoolExecutor with a configurable worker cap. Saturation is visible via
+executor_stats(): queue depth, active workers, and time spent waiting for a
+worker.
+
+Cancellation: when the awaiting coroutine is cancelled (usually a timeout),
+a job that has not started yet is withdrawn from the queue; one that is
+already running cannot be interrupted and is counted in `abandoned_in_flight`
+until its thread returns. Jobs whose deadline() passed while queued are
+dropped with TimeoutError instead of being started.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from second_brain.services.deadlines import deadline_expired
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Backend names — match RetryConfig.backend so retries run on the same pool
+MEM0 = "mem0"
+SUPABASE = "supabase"
+VOYAGE = "voyage"
+OPENAI = "openai"
+MEDIA = "media"  # CPU-bound decoding (PIL) kept off the I/O pools
+LLM_CACHE = "llm_cache"  # local SQLite reads/writes of the LLM output cache
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class _Job:
+    submitted_at: float
+    started: bool = False
+    finished: bool = False
+    withdrawn: bool = False
+    abandoned: bool = False
+
+
+class BackendExecutor:
+    """Bounded thread pool for one backend, with saturation counters."""
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"brain-{name}",
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.peak_queued = 0
+        self.expired = 0
+        self.withdrawn = 0
+        self.abandoned_in_flight = 0
+        self.abandoned_total = 0
+        self._wait_total = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _start(self, job: "_Job") -> bool:
+        """Move a job from queued to active. False if it was withdrawn."""
+        wait = time.monotonic() - job.submitted_at
+        with self._lock:
+            if job.withdrawn:
+                return False
+            job.started = True
+            self.queued -= 1
+            self.active += 1
+            self._wait_total += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+            return True
+
+    def _finish(self, job: "_Job", ok: bool) -> None:
+        with self._lock:
+            job.finished = True
+            self.active -= 1
+            if job.abandoned:
+                self.abandoned_in_flight -= 1
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def _cancelled(self, job: "_Job") -> None:
+        """The caller stopped waiting: withdraw a queued job, or mark a running one."""
+        with self._lock:
+            if not job.started:
+                job.withdrawn = True
+                self.queued -= 1
+                self.withdrawn += 1
+            elif not job.finished:
+                job.abandoned = True
+                self.abandoned_in_flight += 1
+                self.abandoned_total += 1
+
+    async def run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking callable on this backend's pool.
+
+        Context variables (including the current deadline()) propagate to the
+        worker, as with asyncio.to_thread.
+        """
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        job = _Job(time.monotonic())
+
+        def _tracked():
+            if not self._start(job):
+                return None
+            ok = False
+            try:
+                if ctx.run(deadline_expired):
+                    with self._lock:
+                        self.expired += 1
+                    raise TimeoutError(f"{self.name} call expired while queued")
+                result = call()
+                ok = True
+                return result
+            finally:
+                self._finish(job, ok)
+
+        with self._lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._pool, _tracked)
+        except RuntimeError:
+            # Pool shut down before the job was accepted
+            with self._lock:
+                self.queued -= 1
+            raise
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self._cancelled(job)
+            raise
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            started = self.completed + self.failed + self.active
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self.queued,
+                "active_workers": self.active,
+                "completed": self.completed,
+                "failed": self.failed,
+                "peak_queue_depth": self.peak_queued,
+                "expired": self.expired,
+                "withdrawn": self.withdrawn,
+                "abandoned_in_flight": self.abandoned_in_flight,
+                "abandoned_total": self.abandoned_total,
+                "avg_wait_ms": round(self._wait_total / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            }
+
+    def shutdown(self, wait: bool = False, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_executors: dict[str, BackendExecutor] = {}
+_max_workers: dict[str, int] = {}
+_executors_lock = threading.Lock()
+
+
+def configure_executors(config) -> None:
+    """Set per-backend worker caps from BrainConfig.
+
+    Executors already running with a different cap are replaced; jobs already
+    submitted to the old pool still run to completion.
+    """
+    caps = {
+        MEM0: config.mem0_max_workers,
+        SUPABASE: config.supabase_max_workers,
+        VOYAGE: config.voyage_max_workers,
+    }
+    default = config.executor_default_max_workers
+    with _executors_lock:
+        _max_workers.clear()
+        _max_workers.update(caps)
+        _max_workers["default"] = default
+        for name, executor in list(_executors.items()):
+            if executor.max_workers != _max_workers.get(name, default):
+                executor.shutdown(wait=False)
+                del _executors[name]
+
+
+def get_executor(backend: str) -> BackendExecutor:
+    """Return the process-wide executor for a backend (created on first use)."""
+    with _executors_lock:
+        executor = _executors.get(backend)
+        if executor is None:
+            workers = _max_workers.get(backend, _max_workers.get("default", DEFAULT_MAX_WORKERS))
+            executor = _executors[backend] = BackendExecutor(backend, workers)
+        return executor
+
+
+async def run_blocking(backend: str, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a blocking call on the named backend's executor."""
+    return await get_executor(backend).run(func, *args, **kwargs)
+
+
+def executor_stats() -> dict[str, dict]:
+    """Snapshot of every backend executor, for metrics surfaces."""
+    with _executors_lock:
+        executors = sorted(_executors.items())
+    return {name: e.snapshot() for name, e in executors}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down and drop all backend executors (app shutdown, tests)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+        _max_workers.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,109 @@
+"""Per-group cache for Graphiti query results.
+
+Graph searches hit Neo4j/FalkorDB (and search also runs the cross-encoder
+reranker) on every call, yet recall and voice loading repeat the same
+queries between writes. Results are cached per group_id and the whole
+group is dropped whenever that group's graph changes:
+
+- a write to group G invalidates G and the unscoped (group_id=None) bucket,
+  since unscoped queries span every group;
+- a write whose group is unknown (e.g. remove_episode by uuid) invalidates
+  everything.
+
+Each bucket carries a generation counter, so a query that was already in
+flight when its group was invalidated does not store its stale result.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any
+
+_UNSCOPED = ""
+
+
+class GraphQueryCache:
+    """TTL + LRU cache of graph query results, bucketed by group_id."""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._buckets: dict[str, OrderedDict[str, tuple[float, Any]]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0  # bumped by invalidate(None)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _bucket_key(group_id: str | None) -> str:
+        return group_id or _UNSCOPED
+
+    def generation(self, group_id: str | None) -> tuple[int, int]:
+        """Current generation of a group; pass it back to put()."""
+        return self._epoch, self._generations.get(self._bucket_key(group_id), 0)
+
+    def get(self, group_id: str | None, key: str) -> tuple[bool, Any]:
+        """(True, value) on a fresh hit, else (False, None)."""
+        bucket = self._buckets.get(self._bucket_key(group_id))
+        entry = bucket.get(key) if bucket else None
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del bucket[key]
+                self._size -= 1
+            self.misses += 1
+            return False, None
+        bucket.move_to_end(key)
+        self.hits += 1
+        # Callers may annotate results in place; never hand out the cached object
+        return True, copy.deepcopy(entry[1])
+
+    def put(
+        self, group_id: str | None, key: str, value: Any, generation: tuple[int, int],
+    ) -> None:
+        """Store a result computed at `generation`; dropped if the group changed since."""
+        if self.generation(group_id) != generation:
+            return
+        name = self._bucket_key(group_id)
+        bucket = self._buckets.setdefault(name, OrderedDict())
+        if key not in bucket:
+            self._size += 1
+        bucket[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        bucket.move_to_end(key)
+        while self._size > self.max_entries:
+            self._evict_one()
+
+    def _evict_one(self) -> None:
+        # Evict from the largest bucket so one busy group cannot starve the rest
+        name = max(self._buckets, key=lambda n: len(self._buckets[n]))
+        self._buckets[name].popitem(last=False)
+        self._size -= 1
+        self.evictions += 1
+
+    def invalidate(self, group_id: str | None = None) -> None:
+        """Drop results that a write to `group_id` may have changed (None = all)."""
+        self.invalidations += 1
+        if group_id is None:
+            self._buckets.clear()
+            self._size = 0
+            self._epoch += 1
+            return
+        for name in (self._bucket_key(group_id), _UNSCOPED):
+            bucket = self._buckets.pop(name, None)
+            if bucket:
+                self._size -= len(bucket)
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._size,
+            "groups": len(self._buckets),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
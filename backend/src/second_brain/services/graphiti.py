@@ -1,25 +1,161 @@
 """Graph memory via Graphiti (Neo4j/FalkorDB backend)."""
 
 import asyncio
+import base64
+import functools
+import hashlib
+import inspect
+import json
 import logging
-from datetime import datetime, timezone
+import re
+import time
+import uuid as uuid_lib
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
 from second_brain.config import BrainConfig
+from second_brain.services.episode_scheduler import AIMDLimiter, EpisodeScheduler
+from second_brain.services.graph_cache import GraphQueryCache
+from second_brain.services.retry import GRAPHITI_RETRY_CONFIG, create_retry_decorator, retry_call
+from second_brain.services.write_generation import bump_write_generation
 
 logger = logging.getLogger(__name__)
 
-# Retry config for Graphiti network calls — transient errors only
-_GRAPHITI_RETRY = retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
-    retry=retry_if_exception_type((ConnectionError, OSError)),
-    reraise=True,
+# Retry for Graphiti network calls — transient errors only
+_GRAPHITI_RETRY = create_retry_decorator(GRAPHITI_RETRY_CONFIG)
+
+
+# Entity node labels across graphiti-core versions
+_ENTITY_LABELS = ("Entity", "EntityNode")
+_ENTITY_FULLTEXT_INDEX = "brain_entity_text"
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+# Errors meaning the full-text index (or procedure) is absent, as opposed to
+# a query the index could not parse
+_MISSING_INDEX = re.compile(
+    r"no such (fulltext )?(schema )?index|no procedure|unknown index|index .*(not found|does not exist)",
+    re.IGNORECASE,
 )
 
 
+def fulltext_query(text: str, backend: str = "neo4j") -> str:
+    """Full-text query for free text: each term matches exactly (scored) or as a prefix.
+
+    Neo4j takes Lucene syntax. Terms are lowercased (the index analyzer
+    lowercases anyway) so words like AND/OR/NOT are never read as operators.
+    FalkorDB takes RediSearch syntax, which has its own operators: there
+    terms are reduced to word characters and OR-ed with `|`.
+    """
+    if backend == "falkordb":
+        terms = re.findall(r"\w+", text.lower())
+        # RediSearch rejects prefixes shorter than two characters
+        return "|".join(f"{t}|{t}*" if len(t) > 1 else t for t in terms)
+    terms = [_LUCENE_SPECIAL.sub(r"\\\1", t) for t in text.lower().split()]
+    return " OR ".join(f"{t} OR {t}*" for t in terms if t)
+
+
+def _has_results(value: Any) -> bool:
+    # Failures return empty values; never cache those
+    if isinstance(value, dict):
+        return any(value.values())
+    return bool(value)
+
+
+def _graph_cached(op: str):
+    """Serve a read query from the service's GraphQueryCache, keyed by its arguments.
+
+    The group bucket comes from the `group_id` argument (unscoped if absent).
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = self._query_cache
+            if cache is None:
+                return await func(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "self"}
+            group_id = params.get("group_id")
+            key = f"{op}:{sorted(params.items())!r}"
+            hit, value = cache.get(group_id, key)
+            if hit:
+                return value
+            generation = cache.generation(group_id)
+            value = await func(self, *args, **kwargs)
+            if _has_results(value):
+                cache.put(group_id, key, value, generation)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def encode_episode_cursor(created_at: Any, uuid: str) -> str:
+    """Opaque keyset cursor for get_episodes_page: (created_at, uuid) of the last row."""
+    raw = json.dumps([str(created_at) if created_at is not None else None, uuid])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_episode_cursor(cursor: str) -> tuple[str | None, str]:
+    """Inverse of encode_episode_cursor. Raises ValueError for malformed cursors."""
+    try:
+        created_at, uuid = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError("Invalid episode cursor") from e
+    if not isinstance(uuid, str) or not (created_at is None or isinstance(created_at, str)):
+        raise ValueError("Invalid episode cursor")
+    return created_at, uuid
+
+
+def episode_content_key(content: str, group_id: str | None = None) -> str:
+    """Stable content address for an episode: sha256 over group_id + content.
+
+    Unlike hash(), identical across processes, so re-ingesting the same
+    content into the same group can be detected and skipped.
+    """
+    digest = hashlib.sha256()
+    digest.update((group_id or "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _entity_record(r: Any) -> dict:
+    return {
+        "uuid": str(r["uuid"]) if r["uuid"] else "",
+        "name": str(r["name"]) if r["name"] else "",
+        "summary": str(r["summary"]) if r["summary"] else "",
+        "labels": r["labels"] if r["labels"] else [],
+        "created_at": str(r["created_at"]) if r["created_at"] else None,
+    }
+
+
+def _metadata_reference_time(metadata: dict | None) -> datetime | None:
+    """Parse metadata['reference_time'] (ISO 8601), or None if absent/invalid."""
+    if metadata and metadata.get("reference_time"):
+        try:
+            return datetime.fromisoformat(metadata["reference_time"])
+        except (ValueError, TypeError):
+            pass  # Fall back to caller's default
+    return None
+
+
+def _raw_episode(kwargs: dict) -> Any:
+    """add_episode() kwargs as a graphiti-core RawEpisode for add_episode_bulk()."""
+    from graphiti_core.utils.bulk_utils import RawEpisode
+
+    return RawEpisode(
+        name=kwargs["name"],
+        content=kwargs["episode_body"],
+        source_description=kwargs["source_description"],
+        source=kwargs["source"],
+        reference_time=kwargs["reference_time"],
+    )
+
+
 class GraphitiService:
     """Knowledge graph service via Graphiti + Neo4j."""
 
@@ -30,14 +166,70 @@ class GraphitiService:
         self._init_failed = False
         self._backend: str | None = None
         self._timeout: int = getattr(config, "service_timeout_seconds", 15)
+        self._scheduler: EpisodeScheduler | None = None
+        self._entity_fulltext = True  # cleared if the full-text index is unusable
+        self._query_cache: GraphQueryCache | None = None
+        if config.graph_cache_ttl_seconds > 0:
+            self._query_cache = GraphQueryCache(
+                config.graph_cache_ttl_seconds, config.graph_cache_max_entries,
+            )
+        # group_id ("" = all groups) -> (count, monotonic time of last full count)
+        self._episode_counts: dict[str, tuple[int, float]] = {}
+        self._count_reconcile = config.graphiti_episode_count_reconcile_seconds
+        self._init_lock = asyncio.Lock()
+        # Groups with new episodes since the last community maintenance run
+        self._community_stale: set[str | None] = set()
 
     async def _ensure_init(self) -> None:
-        """Lazy async initialization with Neo4j primary → FalkorDB fallback."""
+        """Lazy async initialization with Neo4j primary → FalkorDB fallback.
+
+        Concurrent callers (e.g. a request arriving during background
+        warm-up) wait for the one initialization in progress.
+        """
         if self._initialized:
             return
         if self._client is None and self._init_failed:
             return
+        async with self._init_lock:
+            if self._initialized or (self._client is None and self._init_failed):
+                return
+            await self._initialize()
+
+    async def warm_up(self) -> bool:
+        """Connect and build indexes ahead of the first request. True if available."""
+        await self._ensure_init()
+        return self._initialized
 
+    async def ping(self) -> None:
+        """Trivial driver round trip that keeps pooled connections alive. Raises on failure."""
+        await self._ensure_init()
+        driver = getattr(self._client, "driver", None)
+        if not self._initialized or driver is None:
+            raise ConnectionError("Graphiti unavailable")
+        async with asyncio.timeout(self._timeout):
+            await driver.execute_query("RETURN 1")
+
+    async def reconnect(self) -> None:
+        """Re-open the backend connection in place after failed keep-alive pings.
+
+        The query cache, episode counts and ingest scheduler carry over.
+        Raises ConnectionError when no backend answers; the service then stays
+        unavailable until the next attempt.
+        """
+        async with self._init_lock:
+            old, self._client = self._client, None
+            self._initialized = False
+            self._init_failed = False
+            if old is not None:
+                try:
+                    await old.close()
+                except Exception as e:
+                    logger.debug("Graphiti close before reconnect failed: %s", e)
+            await self._initialize()
+            if not self._initialized:
+                raise ConnectionError("Graphiti unavailable")
+
+    async def _initialize(self) -> None:
         from graphiti_core import Graphiti
 
         llm_client, embedder, cross_encoder = self._build_providers()
@@ -56,6 +248,7 @@ class GraphitiService:
                 await self._client.build_indices_and_constraints()
                 self._initialized = True
                 self._backend = "neo4j"
+                await self._ensure_brain_indices()
                 logger.info("Graphiti initialized with Neo4j")
                 return
             except Exception as e:
@@ -76,6 +269,7 @@ class GraphitiService:
                 await self._client.build_indices_and_constraints()
                 self._initialized = True
                 self._backend = "falkordb"
+                await self._ensure_brain_indices()
                 logger.info("Graphiti initialized with FalkorDB (fallback)")
                 return
             except Exception as e:
@@ -87,6 +281,100 @@ class GraphitiService:
         logger.error("Graphiti initialization failed — no backend available")
         self._init_failed = True
 
+    async def _ensure_brain_indices(self) -> None:
+        """Create second-brain's own indexes on top of graphiti's (best effort).
+
+        - content_key uniqueness for episode dedup
+        - full-text index over entity name + summary for search_entities
+        """
+        driver = getattr(self._client, "driver", None)
+        if driver is None:
+            return
+        if self._backend == "falkordb":
+            statements = [
+                "CREATE INDEX FOR (e:EpisodicNode) ON (e.content_key)",
+                *(
+                    f"CALL db.idx.fulltext.createNodeIndex('{label}', 'name', 'summary')"
+                    for label in _ENTITY_LABELS
+                ),
+            ]
+        else:
+            statements = [
+                "CREATE CONSTRAINT episode_content_key IF NOT EXISTS "
+                "FOR (e:EpisodicNode) REQUIRE e.content_key IS UNIQUE",
+                f"CREATE FULLTEXT INDEX {_ENTITY_FULLTEXT_INDEX} IF NOT EXISTS "
+                f"FOR (e:{'|'.join(_ENTITY_LABELS)}) ON EACH [e.name, e.summary]",
+            ]
+        for statement in statements:
+            try:
+                async with asyncio.timeout(self._timeout):
+                    await driver.execute_query(statement)
+            except Exception as e:
+                # FalkorDB errors if the index already exists
+                logger.debug("Graphiti index statement skipped (%s): %s", statement[:40], e)
+
+    async def _existing_content_keys(self, keys: list[str]) -> set[str]:
+        """Return which content keys already have an episode (one batched lookup).
+
+        On any failure returns an empty set — ingesting a duplicate is
+        cheaper than losing new content.
+        """
+        driver = getattr(self._client, "driver", None)
+        if driver is None or not keys:
+            return set()
+        try:
+            async with asyncio.timeout(self._timeout):
+                records, _, _ = await driver.execute_query(
+                    "MATCH (e:EpisodicNode) WHERE e.content_key IN $keys "
+                    "RETURN e.content_key AS key",
+                    keys=keys,
+                )
+            return {r["key"] for r in records}
+        except Exception as e:
+            logger.warning("Graphiti content_key lookup failed: %s", type(e).__name__)
+            logger.debug("Graphiti content_key lookup error detail: %s", e)
+            return set()
+
+    async def _tag_content_key(self, result: Any, key: str) -> None:
+        """Store the content key on the episode node graphiti just created."""
+        episode_uuid = getattr(getattr(result, "episode", None), "uuid", None)
+        driver = getattr(self._client, "driver", None)
+        if not isinstance(episode_uuid, str) or driver is None:
+            return
+        try:
+            async with asyncio.timeout(self._timeout):
+                await driver.execute_query(
+                    "MATCH (e:EpisodicNode {uuid: $uuid}) SET e.content_key = $key",
+                    uuid=episode_uuid, key=key,
+                )
+        except Exception as e:
+            logger.debug("Graphiti content_key tag failed for %s: %s", episode_uuid, e)
+
+    async def _tag_bulk_content_keys(self, episodes: list[dict], keys: list[str]) -> None:
+        """Store content keys on the episodes add_episode_bulk() just created.
+
+        add_episode_bulk() does not return the new episodes on every
+        graphiti-core version, so they are matched by name and content.
+        """
+        driver = getattr(self._client, "driver", None)
+        if driver is None:
+            return
+        rows = [
+            {"name": ep["name"], "content": ep["episode_body"], "key": key}
+            for ep, key in zip(episodes, keys)
+        ]
+        try:
+            async with asyncio.timeout(self._timeout):
+                await driver.execute_query(
+                    "UNWIND $rows AS row "
+                    "MATCH (e:EpisodicNode {name: row.name}) "
+                    "WHERE e.content = row.content AND e.content_key IS NULL "
+                    "SET e.content_key = row.key",
+                    rows=rows,
+                )
+        except Exception as e:
+            logger.debug("Graphiti content_key tag failed for %d bulk episodes: %s", len(rows), e)
+
     def _build_providers(self) -> tuple[Any, Any, Any]:
         """Build LLM, embedder, and cross-encoder providers."""
         from graphiti_core.llm_client.config import LLMConfig
@@ -165,6 +453,50 @@ class GraphitiService:
 
         return llm_client, embedder, cross_encoder
 
+    def _episode_kwargs(
+        self,
+        content: str,
+        metadata: dict | None = None,
+        group_id: str | None = None,
+        reference_time: datetime | None = None,
+    ) -> dict:
+        """Build graphiti add_episode() kwargs from content + brain metadata."""
+        from graphiti_core.nodes import EpisodeType
+
+        # Build descriptive episode name (stable across processes)
+        ep_hash = episode_content_key(content, group_id)[:12]
+        if metadata:
+            source_name = metadata.get("source", metadata.get("category", "brain"))
+            ep_name = f"{source_name}_{ep_hash}"
+        else:
+            ep_name = f"episode_{ep_hash}"
+
+        # Use metadata for richer source description
+        source_desc = "second-brain"
+        if metadata:
+            parts = []
+            if metadata.get("source"):
+                parts.append(metadata["source"])
+            if metadata.get("category"):
+                parts.append(f"category:{metadata['category']}")
+            if metadata.get("client"):
+                parts.append(f"client:{metadata['client']}")
+            source_desc = " | ".join(parts) if parts else "second-brain"
+
+        # Explicit reference_time wins, then metadata (e.g., transcript dates), then now
+        ref_time = reference_time or _metadata_reference_time(metadata) or datetime.now(timezone.utc)
+
+        kwargs = {
+            "name": ep_name,
+            "episode_body": content,
+            "source": EpisodeType.text,
+            "source_description": source_desc,
+            "reference_time": ref_time,
+        }
+        if group_id:
+            kwargs["group_id"] = group_id
+        return kwargs
+
     @_GRAPHITI_RETRY
     async def add_episode(
         self,
@@ -179,48 +511,17 @@ class GraphitiService:
             return
 
         try:
-            from graphiti_core.edges import EpisodeType
-
-            # Build descriptive episode name
-            ep_hash = f"{hash(content) & 0xFFFFFFFF:08x}"
-            if metadata:
-                source_name = metadata.get("source", metadata.get("category", "brain"))
-                ep_name = f"{source_name}_{ep_hash}"
-            else:
-                ep_name = f"episode_{ep_hash}"
-
-            # Use metadata for richer source description
-            source_desc = "second-brain"
-            if metadata:
-                parts = []
-                if metadata.get("source"):
-                    parts.append(metadata["source"])
-                if metadata.get("category"):
-                    parts.append(f"category:{metadata['category']}")
-                if metadata.get("client"):
-                    parts.append(f"client:{metadata['client']}")
-                source_desc = " | ".join(parts) if parts else "second-brain"
-
-            # Support explicit reference_time from metadata (e.g., transcript dates)
-            ref_time = datetime.now(timezone.utc)
-            if metadata and metadata.get("reference_time"):
-                try:
-                    ref_time = datetime.fromisoformat(metadata["reference_time"])
-                except (ValueError, TypeError):
-                    pass  # Fall back to now
-
-            kwargs = {
-                "name": ep_name,
-                "episode_body": content,
-                "source": EpisodeType.text,
-                "source_description": source_desc,
-                "reference_time": ref_time,
-            }
-            if group_id:
-                kwargs["group_id"] = group_id
-
+            key = episode_content_key(content, group_id)
+            if await self._existing_content_keys([key]):
+                logger.debug("Graphiti episode %s already ingested, skipping", key[:12])
+                return
+            kwargs = self._episode_kwargs(content, metadata, group_id)
             async with asyncio.timeout(self._timeout * 2):
-                await self._client.add_episode(**kwargs)
+                result = await self._client.add_episode(**kwargs)
+            self.invalidate_cache(group_id)
+            self._adjust_episode_count(group_id, 1)
+            self._community_stale.add(group_id)
+            await self._tag_content_key(result, key)
         except TimeoutError:
             logger.warning("Graphiti add_episode timed out after %ds", self._timeout * 2)
         except (ConnectionError, OSError):
@@ -229,10 +530,124 @@ class GraphitiService:
             logger.warning("Graphiti add_episode failed: %s", type(e).__name__)
             logger.debug("Graphiti add_episode error detail: %s", e)
 
+    @property
+    def episode_scheduler(self) -> EpisodeScheduler:
+        """Adaptive-concurrency scheduler shared by all bulk episode ingestion."""
+        if self._scheduler is None:
+            self._scheduler = EpisodeScheduler(AIMDLimiter(
+                initial=self.config.graphiti_ingest_concurrency,
+                maximum=self.config.graphiti_ingest_max_concurrency,
+                latency_target=self._timeout,
+            ))
+        return self._scheduler
+
+    def ingest_stats(self) -> dict | None:
+        """Adaptive ingest concurrency snapshot, or None before first bulk ingest."""
+        return self._scheduler.limiter.snapshot() if self._scheduler else None
+
+    def cache_stats(self) -> dict | None:
+        """Graph query cache hit-rate snapshot, or None when the cache is disabled."""
+        return self._query_cache.stats() if self._query_cache else None
+
+    def invalidate_cache(self, group_id: str | None = None) -> None:
+        """Drop cached query results a write to `group_id` may have changed (None = all)."""
+        bump_write_generation()
+        if self._query_cache is not None:
+            self._query_cache.invalidate(group_id)
+
+    def _adjust_episode_count(self, group_id: str | None, delta: int) -> None:
+        """Apply an add/remove to the known counts of `group_id` and of all groups."""
+        for name in {group_id or "", ""}:
+            if name in self._episode_counts:
+                count, counted_at = self._episode_counts[name]
+                self._episode_counts[name] = (max(0, count + delta), counted_at)
+
+    async def _ingest_episodes(self, episodes: list[dict]) -> list[bool | None]:
+        """Run prepared add_episode() kwargs through the shared scheduler.
+
+        Each group is a lane of batches (EpisodeScheduler.run_batches): the
+        episodes of a batch go to graphiti-core's add_episode_bulk(), which
+        extracts them concurrently and dedupes entities across the batch;
+        the next batch of the group starts once the previous one is saved,
+        so it resolves against those entities. Different groups ingest
+        concurrently. A batch of one uses add_episode(), which also
+        invalidates contradicted edges. Episodes whose content key is
+        already in the graph (or repeated earlier in `episodes`) are skipped
+        without an LLM call and reported as None. Unlike add_episode(),
+        failures (including LLM 429s) reach the scheduler so it can adapt;
+        each is logged and reported as False.
+        """
+        timeout = self._timeout * 2
+        keys = [episode_content_key(ep["episode_body"], ep.get("group_id")) for ep in episodes]
+        existing = await self._existing_content_keys(list(dict.fromkeys(keys)))
+        seen: set[str] = set()
+        todo: list[int] = []
+        for i, key in enumerate(keys):
+            if key not in existing and key not in seen:
+                todo.append(i)
+            seen.add(key)
+        if len(todo) < len(episodes):
+            logger.info(
+                "Graphiti skipping %d/%d already-ingested episodes",
+                len(episodes) - len(todo), len(episodes),
+            )
+
+        async def _add(batch: list[int]) -> list[bool]:
+            if len(batch) == 1:
+                kwargs = episodes[batch[0]]
+                async with asyncio.timeout(timeout):
+                    result = await retry_call(
+                        lambda: self._client.add_episode(**kwargs), GRAPHITI_RETRY_CONFIG,
+                    )
+                await self._tag_content_key(result, keys[batch[0]])
+                return [True]
+            # Not retried: add_episode_bulk() saves the episodes before extracting
+            group = episodes[batch[0]].get("group_id")
+            async with asyncio.timeout(timeout * len(batch)):
+                await self._client.add_episode_bulk(
+                    [_raw_episode(episodes[i]) for i in batch],
+                    **({"group_id": group} if group else {}),
+                )
+            await self._tag_bulk_content_keys([episodes[i] for i in batch], [keys[i] for i in batch])
+            return [True] * len(batch)
+
+        results = await self.episode_scheduler.run_batches(
+            todo, _add, lanes=[episodes[i].get("group_id") for i in todo],
+        )
+        ok: list[bool | None] = [None] * len(episodes)
+        for i, result in zip(todo, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, TimeoutError):
+                    logger.warning(
+                        "Graphiti episode %d/%d timed out after %ds", i + 1, len(episodes), timeout,
+                    )
+                else:
+                    logger.warning(
+                        "Graphiti episode %d/%d failed: %s", i + 1, len(episodes), type(result).__name__,
+                    )
+                    logger.debug("Graphiti episode error detail: %s", result)
+                ok[i] = False
+            else:
+                ok[i] = True
+        for i in todo:
+            if ok[i]:
+                self._adjust_episode_count(episodes[i].get("group_id"), 1)
+        for group_id in {episodes[i].get("group_id") for i in todo if ok[i]}:
+            self.invalidate_cache(group_id)
+            self._community_stale.add(group_id)
+        return ok
+
     async def add_episodes_batch(
         self, episodes: list[dict],
     ) -> int:
-        """Add multiple episodes. Each dict must have 'content' and optionally 'metadata'.
+        """Add multiple episodes. Each dict must have 'content' and optionally
+        'metadata' and 'group_id'.
+
+        Episodes run on the shared adaptive scheduler: extraction is
+        concurrent, and entity resolution runs batch by batch within a group
+        (see _ingest_episodes). Episodes without an explicit reference_time
+        get strictly increasing timestamps in input order, so the graph's
+        temporal order matches the input.
 
         Returns the count of successfully added episodes.
         """
@@ -241,22 +656,15 @@ class GraphitiService:
             logger.debug("Graphiti not available, skipping batch add")
             return 0
 
-        sem = asyncio.Semaphore(3)  # Limit concurrent LLM/DB calls
-
-        async def _add_one(ep: dict) -> bool:
-            async with sem:
-                try:
-                    await self.add_episode(
-                        content=ep["content"],
-                        metadata=ep.get("metadata"),
-                    )
-                    return True
-                except Exception as e:
-                    logger.debug("Batch episode failed: %s", e)
-                    return False
-
-        results = await asyncio.gather(*[_add_one(ep) for ep in episodes])
-        return sum(1 for r in results if r)
+        base = datetime.now(timezone.utc)
+        prepared = []
+        for i, ep in enumerate(episodes):
+            metadata = ep.get("metadata")
+            ref_time = _metadata_reference_time(metadata) or base + timedelta(milliseconds=i)
+            prepared.append(self._episode_kwargs(
+                ep["content"], metadata, ep.get("group_id"), reference_time=ref_time,
+            ))
+        return sum(1 for ok in await self._ingest_episodes(prepared) if ok)
 
     async def add_episodes_chunked(
         self,
@@ -270,6 +678,10 @@ class GraphitiService:
 
         Each chunk is prefixed with a context summary derived from the full content.
         This produces richer entity/relationship extraction than a single large episode.
+        Chunks are extracted concurrently on the shared adaptive scheduler, in
+        add_episode_bulk() batches that resolve entities one after another
+        (see _ingest_episodes); chunk i is stamped reference_time + i ms so
+        the graph keeps document order.
 
         Returns the count of successfully added episodes.
         """
@@ -301,7 +713,8 @@ class GraphitiService:
             chunks.append(content[start:end])
             start = end - chunk_overlap
 
-        added = 0
+        base = _metadata_reference_time(metadata) or datetime.now(timezone.utc)
+        prepared = []
         for i, chunk in enumerate(chunks):
             chunk_meta = dict(metadata) if metadata else {}
             chunk_meta["chunk_index"] = i
@@ -309,20 +722,16 @@ class GraphitiService:
 
             # Prefix with context for better entity extraction
             episode_content = context_line + chunk if i > 0 else chunk
+            prepared.append(self._episode_kwargs(
+                episode_content, chunk_meta, group_id,
+                reference_time=base + timedelta(milliseconds=i),
+            ))
 
-            try:
-                await self.add_episode(
-                    content=episode_content,
-                    metadata=chunk_meta,
-                    group_id=group_id,
-                )
-                added += 1
-            except Exception as e:
-                logger.debug("Chunked episode %d/%d failed: %s", i + 1, len(chunks), e)
-
+        added = sum(1 for ok in await self._ingest_episodes(prepared) if ok)
         logger.info("Added %d/%d chunked episodes", added, len(chunks))
         return added
 
+    @_graph_cached("search")
     @_GRAPHITI_RETRY
     async def search(
         self, query: str, limit: int = 10, group_id: str | None = None
@@ -374,8 +783,30 @@ class GraphitiService:
                 logger.warning("Graphiti search_entities: no driver available")
                 return []
 
-            # Try Entity label first (graphiti-core standard), fall back to EntityNode
-            for label in ("Entity", "EntityNode"):
+            text_query = fulltext_query(query, self._backend or "neo4j")
+            if text_query and self._entity_fulltext:
+                try:
+                    return await self._search_entities_fulltext(driver, text_query, limit, group_id)
+                except (ConnectionError, OSError, TimeoutError):
+                    raise
+                except Exception as e:
+                    if _MISSING_INDEX.search(str(e)):
+                        self._entity_fulltext = False
+                        logger.warning(
+                            "Graphiti entity full-text index unavailable (%s) — using scan",
+                            type(e).__name__,
+                        )
+                    else:
+                        # A query the index could not parse: scan for this call only
+                        logger.warning(
+                            "Graphiti entity full-text query failed (%s) — using scan",
+                            type(e).__name__,
+                        )
+                    logger.debug("Graphiti full-text error detail: %s", e)
+
+            # Fallback: substring scan. Try Entity label first (graphiti-core standard),
+            # then EntityNode
+            for label in _ENTITY_LABELS:
                 try:
                     if group_id:
                         cypher = (
@@ -402,16 +833,7 @@ class GraphitiService:
                     async with asyncio.timeout(self._timeout):
                         records, _, _ = await driver.execute_query(cypher, **params)
                     if records:
-                        return [
-                            {
-                                "uuid": str(r["uuid"]) if r["uuid"] else "",
-                                "name": str(r["name"]) if r["name"] else "",
-                                "summary": str(r["summary"]) if r["summary"] else "",
-                                "labels": r["labels"] if r["labels"] else [],
-                                "created_at": str(r["created_at"]) if r["created_at"] else None,
-                            }
-                            for r in records
-                        ]
+                        return [_entity_record(r) for r in records]
                 except Exception:
                     continue  # Try next label
             return []
@@ -425,6 +847,36 @@ class GraphitiService:
             logger.debug("Graphiti search_entities error detail: %s", e)
             return []
 
+    async def _search_entities_fulltext(
+        self, driver: Any, text_query: str, limit: int, group_id: str | None,
+    ) -> list[dict]:
+        """One relevance-ranked full-text query across both entity labels."""
+        where = "WHERE e.group_id = $gid " if group_id else ""
+        returns = (
+            "RETURN e.uuid AS uuid, e.name AS name, e.summary AS summary, "
+            "e.labels AS labels, e.created_at AS created_at, score "
+        )
+        if self._backend == "falkordb":
+            # FalkorDB full-text indexes are per label
+            cypher = " UNION ALL ".join(
+                f"CALL db.idx.fulltext.queryNodes('{label}', $q) YIELD node AS e, score "
+                + where + returns + "ORDER BY score DESC LIMIT $lim"
+                for label in _ENTITY_LABELS
+            )
+        else:
+            cypher = (
+                "CALL db.index.fulltext.queryNodes($index, $q) YIELD node AS e, score "
+                + where + returns + "ORDER BY score DESC LIMIT $lim"
+            )
+        params: dict = {"index": _ENTITY_FULLTEXT_INDEX, "q": text_query, "lim": limit}
+        if group_id:
+            params["gid"] = group_id
+        async with asyncio.timeout(self._timeout):
+            records, _, _ = await driver.execute_query(cypher, **params)
+        ranked = sorted(records, key=lambda r: r.get("score") or 0, reverse=True)[:limit]
+        return [_entity_record(r) for r in ranked]
+
+    @_graph_cached("entity_context")
     @_GRAPHITI_RETRY
     async def get_entity_context(
         self, entity_uuid: str, limit: int = 20
@@ -500,61 +952,24 @@ class GraphitiService:
     async def traverse_neighbors(
         self, entity_uuid: str, max_hops: int = 2, limit: int = 20
     ) -> list[dict]:
-        """BFS traversal from a starting entity, up to max_hops away.
+        """BFS traversal from a starting entity, up to max_hops away (max 5).
+
+        Expands one hop per query: the frontier is matched by uuid on an
+        indexed entity label, each node contributes at most
+        `graphiti_traverse_fanout` outgoing edges, and nodes already visited
+        are never expanded again. Stops as soon as `limit` edges are found.
 
-        Returns list of relationship dicts showing the path from origin.
+        Returns list of relationship dicts (source, relationship, target, hop).
         """
         await self._ensure_init()
         if not self._initialized:
             return []
         try:
-            # Try graphiti-core's search_ with bfs_origin if available
-            if hasattr(self._client, "search_"):
-                try:
-                    from graphiti_core.search.search_config import SearchConfig
-                    config = SearchConfig(
-                        bfs_origin_node_uuids=[entity_uuid],
-                        limit=limit,
-                    )
-                    async with asyncio.timeout(self._timeout * 2):
-                        raw = await self._client.search_("", search_config=config)
-                    edges = getattr(raw, "edges", [])
-                    return [
-                        {
-                            "source": getattr(e, "source_node_name", "?"),
-                            "relationship": getattr(e, "fact", "?"),
-                            "target": getattr(e, "target_node_name", "?"),
-                        }
-                        for e in edges[:limit]
-                    ]
-                except (ImportError, AttributeError, TypeError):
-                    pass  # Fall through to Cypher fallback
-
-            # Cypher fallback: variable-length path
             driver = getattr(self._client, "driver", None)
             if driver is None:
                 return []
-            cypher = (
-                "MATCH (start {uuid: $uuid})-[r*1.." + str(min(max_hops, 5)) + "]->(end) "
-                "WITH start, end, r "
-                "UNWIND r AS rel "
-                "WITH startNode(rel) AS s, rel, endNode(rel) AS t "
-                "RETURN DISTINCT s.name AS source, type(rel) AS relationship, "
-                "t.name AS target, rel.fact AS fact "
-                "LIMIT $lim"
-            )
             async with asyncio.timeout(self._timeout * 2):
-                records, _, _ = await driver.execute_query(
-                    cypher, uuid=entity_uuid, lim=limit
-                )
-            return [
-                {
-                    "source": str(r["source"]) if r["source"] else "?",
-                    "relationship": str(r.get("fact") or r.get("relationship", "?")),
-                    "target": str(r["target"]) if r["target"] else "?",
-                }
-                for r in records
-            ]
+                return await self._bfs(driver, entity_uuid, min(max_hops, 5), limit)
         except (ConnectionError, OSError):
             raise
         except TimeoutError:
@@ -565,6 +980,61 @@ class GraphitiService:
             logger.debug("Graphiti traverse_neighbors error detail: %s", e)
             return []
 
+    async def _bfs(
+        self, driver: Any, origin: str, max_hops: int, limit: int,
+    ) -> list[dict]:
+        fanout = self.config.graphiti_traverse_fanout
+        frontier = [origin]
+        visited = {origin}
+        seen_edges: set[tuple] = set()
+        results: list[dict] = []
+        # Anchor label is resolved on the first hop (graphiti-core versions differ)
+        labels = list(_ENTITY_LABELS)
+        for hop in range(1, max_hops + 1):
+            if not frontier or len(results) >= limit:
+                break
+            records: list = []
+            for label in labels:
+                cypher = (
+                    "UNWIND $uuids AS uid "
+                    f"MATCH (s:{label} {{uuid: uid}})-[r]->(t:{label}) "
+                    "WITH s, collect({rel: r, t: t})[..$fanout] AS edges "
+                    "UNWIND edges AS e "
+                    "RETURN s.uuid AS source_uuid, s.name AS source, "
+                    "type(e.rel) AS relationship, e.rel.fact AS fact, "
+                    "e.t.uuid AS target_uuid, e.t.name AS target "
+                    "LIMIT $lim"
+                )
+                records, _, _ = await driver.execute_query(
+                    cypher, uuids=frontier, fanout=fanout, lim=fanout * len(frontier),
+                )
+                if records:
+                    labels = [label]
+                    break
+            next_frontier: list[str] = []
+            for r in records:
+                source_uuid = r.get("source_uuid")
+                target_uuid = r.get("target_uuid")
+                relationship = str(r.get("fact") or r.get("relationship") or "?")
+                key = (source_uuid, relationship, target_uuid)
+                if key in seen_edges:
+                    continue
+                seen_edges.add(key)
+                results.append({
+                    "source": str(r["source"]) if r.get("source") else "?",
+                    "relationship": relationship,
+                    "target": str(r["target"]) if r.get("target") else "?",
+                    "hop": hop,
+                })
+                if len(results) >= limit:
+                    break
+                if target_uuid and target_uuid not in visited:
+                    visited.add(target_uuid)
+                    next_frontier.append(target_uuid)
+            frontier = next_frontier
+        return results
+
+    @_graph_cached("communities")
     @_GRAPHITI_RETRY
     async def search_communities(
         self, query: str, limit: int = 5, group_id: str | None = None
@@ -624,6 +1094,7 @@ class GraphitiService:
                 kwargs["group_ids"] = [group_id]
             async with asyncio.timeout(self._timeout * 3):
                 await self._client.build_communities_(**kwargs)
+            self.invalidate_cache(group_id)
             # After building, search for all communities to return them
             return await self.search_communities("", group_id=group_id)
         except (ConnectionError, OSError):
@@ -638,6 +1109,179 @@ class GraphitiService:
             logger.debug("Graphiti build_communities error detail: %s", e)
             return []
 
+    def mark_communities_stale(self, group_id: str | None) -> None:
+        """Queue a group for the next update_communities() run."""
+        self._community_stale.add(group_id)
+
+    def take_stale_community_groups(self) -> list[str | None]:
+        """Groups with new episodes since the last call (None = unscoped). Clears the set."""
+        groups = list(self._community_stale)
+        self._community_stale.clear()
+        return groups
+
+    async def update_communities(
+        self,
+        group_id: str | None = None,
+        drift_threshold: float = 0.25,
+        batch_size: int = 500,
+        max_recompute: int = 20,
+        progress: Callable[..., None] | None = None,
+    ) -> dict:
+        """Incrementally maintain communities after new episodes.
+
+        Instead of rebuilding every community (build_communities), new
+        entities join the community most common among their neighbours, and
+        only communities whose membership changed by more than
+        `drift_threshold` since their summary was written are re-summarized.
+        A group without communities gets one full build.
+
+        `progress(phase, done=, total=)` is called as the run advances.
+        Returns counts: mode, assigned, drifted, recomputed.
+        """
+        report = {"mode": "incremental", "assigned": 0, "drifted": 0, "recomputed": 0}
+        step = progress or (lambda phase, done=0, total=0: None)
+        await self._ensure_init()
+        driver = getattr(self._client, "driver", None)
+        if not self._initialized or driver is None:
+            report["mode"] = "unavailable"
+            return report
+        params = {"gid": group_id}
+        try:
+            async with asyncio.timeout(self._timeout):
+                records, _, _ = await driver.execute_query(
+                    "MATCH (c:Community) WHERE $gid IS NULL OR c.group_id = $gid "
+                    "RETURN count(c) AS cnt",
+                    **params,
+                )
+            if not records or not records[0]["cnt"]:
+                step("full_build")
+                report["mode"] = "full"
+                report["communities"] = len(await self.build_communities(group_id))
+                return report
+
+            # Communities built before maintenance existed get their current size as baseline
+            async with asyncio.timeout(self._timeout):
+                await driver.execute_query(
+                    "MATCH (c:Community) WHERE ($gid IS NULL OR c.group_id = $gid) "
+                    "AND c.brain_summary_size IS NULL "
+                    "OPTIONAL MATCH (c)-[:HAS_MEMBER]->(n) "
+                    "WITH c, count(n) AS size SET c.brain_summary_size = size",
+                    **params,
+                )
+
+            step("assigning")
+            report["assigned"] = await self._assign_new_entities(driver, group_id, batch_size)
+
+            step("detecting_drift")
+            async with asyncio.timeout(self._timeout):
+                records, _, _ = await driver.execute_query(
+                    "MATCH (c:Community)-[:HAS_MEMBER]->(n) "
+                    "WHERE $gid IS NULL OR c.group_id = $gid "
+                    "WITH c, count(n) AS size "
+                    "WHERE abs(size - c.brain_summary_size) > $threshold * c.brain_summary_size "
+                    "RETURN c.uuid AS uuid ORDER BY size DESC LIMIT $lim",
+                    threshold=drift_threshold, lim=max_recompute, **params,
+                )
+            drifted = [str(r["uuid"]) for r in records]
+            report["drifted"] = len(drifted)
+            for i, community_uuid in enumerate(drifted):
+                step("recomputing", done=i, total=len(drifted))
+                if await self._resummarize_community(driver, community_uuid):
+                    report["recomputed"] += 1
+            step("recomputing", done=len(drifted), total=len(drifted))
+        except (ConnectionError, OSError):
+            raise
+        except TimeoutError:
+            logger.warning("Graphiti update_communities timed out after %ds", self._timeout)
+            report["error"] = "TimeoutError"
+        except Exception as e:
+            logger.warning("Graphiti update_communities failed: %s", type(e).__name__)
+            logger.debug("Graphiti update_communities error detail: %s", e)
+            report["error"] = type(e).__name__
+        if report["assigned"] or report["recomputed"]:
+            self.invalidate_cache(group_id)
+        return report
+
+    async def _assign_new_entities(self, driver, group_id: str | None, batch_size: int) -> int:
+        """Attach community-less entities to their neighbours' most common community.
+
+        Entities with no neighbour in any community are left for the next full build.
+        Assignments can cascade (a new member makes its neighbours eligible),
+        so batches repeat until one comes back short.
+        """
+        assigned = 0
+        for label in _ENTITY_LABELS:
+            while True:
+                async with asyncio.timeout(self._timeout):
+                    records, _, _ = await driver.execute_query(
+                        f"MATCH (n:{label})-[:RELATES_TO]-(:{label})<-[:HAS_MEMBER]-(c:Community) "
+                        "WHERE ($gid IS NULL OR n.group_id = $gid) "
+                        "AND NOT (n)<-[:HAS_MEMBER]-(:Community) "
+                        "WITH n, c, count(*) AS votes ORDER BY votes DESC, c.uuid "
+                        "WITH n, collect(c.uuid)[0] AS community "
+                        "RETURN n.uuid AS entity, community LIMIT $lim",
+                        gid=group_id, lim=batch_size,
+                    )
+                if not records:
+                    break
+                rows = [
+                    {
+                        "entity": str(r["entity"]),
+                        "community": str(r["community"]),
+                        "edge": str(uuid_lib.uuid4()),
+                    }
+                    for r in records
+                ]
+                async with asyncio.timeout(self._timeout):
+                    await driver.execute_query(
+                        "UNWIND $rows AS row "
+                        f"MATCH (c:Community {{uuid: row.community}}), (n:{label} {{uuid: row.entity}}) "
+                        "MERGE (c)-[r:HAS_MEMBER]->(n) "
+                        "ON CREATE SET r.uuid = row.edge, r.group_id = c.group_id, r.created_at = $now",
+                        rows=rows, now=datetime.now(timezone.utc),
+                    )
+                assigned += len(rows)
+                if len(rows) < batch_size:
+                    break
+        return assigned
+
+    async def _resummarize_community(self, driver, community_uuid: str) -> bool:
+        """Regenerate one community's name, summary and embedding from its current members."""
+        try:
+            from graphiti_core.nodes import EntityNode
+            from graphiti_core.utils.maintenance.community_operations import build_community
+        except ImportError:
+            logger.debug("graphiti-core community operations unavailable")
+            return False
+        async with asyncio.timeout(self._timeout):
+            records, _, _ = await driver.execute_query(
+                "MATCH (c:Community {uuid: $uuid})-[:HAS_MEMBER]->(n) RETURN n.uuid AS uuid",
+                uuid=community_uuid,
+            )
+        member_uuids = [str(r["uuid"]) for r in records]
+        if not member_uuids:
+            return False
+        try:
+            # Members are summarized pairwise by the LLM: same budget as build_communities
+            async with asyncio.timeout(self._timeout * 3):
+                members = await EntityNode.get_by_uuids(driver, member_uuids)
+                community, _ = await build_community(self._client.llm_client, members)
+                community.uuid = community_uuid
+                await community.generate_name_embedding(self._client.embedder)
+                await community.save(driver)
+                await driver.execute_query(
+                    "MATCH (c:Community {uuid: $uuid}) SET c.brain_summary_size = $size",
+                    uuid=community_uuid, size=len(member_uuids),
+                )
+        except (ConnectionError, OSError):
+            raise
+        except Exception as e:
+            logger.warning("Graphiti community re-summary failed: %s", type(e).__name__)
+            logger.debug("Graphiti community re-summary error detail: %s", e)
+            return False
+        return True
+
+    @_graph_cached("advanced_search")
     @_GRAPHITI_RETRY
     async def advanced_search(
         self,
@@ -735,11 +1379,21 @@ class GraphitiService:
                 return False
             async with asyncio.timeout(self._timeout):
                 records, _, _ = await driver.execute_query(
-                    "MATCH (e:EpisodicNode {uuid: $uuid}) DETACH DELETE e RETURN count(e) AS deleted",
+                    "MATCH (e:EpisodicNode {uuid: $uuid}) "
+                    "WITH e, e.group_id AS gid DETACH DELETE e "
+                    "RETURN gid, count(*) AS deleted",
                     uuid=episode_uuid,
                 )
             deleted = records[0]["deleted"] if records else 0
             if deleted > 0:
+                gid = records[0].get("gid")
+                if gid:
+                    self.invalidate_cache(gid)
+                    self._adjust_episode_count(gid, -deleted)
+                else:
+                    # Group unknown — drop everything
+                    self.invalidate_cache()
+                    self._episode_counts.clear()
                 logger.debug("Removed episode %s", episode_uuid)
             return deleted > 0
         except TimeoutError:
@@ -752,36 +1406,64 @@ class GraphitiService:
             logger.debug("Graphiti error detail: %s", e)
             return False
 
-    @_GRAPHITI_RETRY
     async def get_episodes(self, group_id: str | None = None) -> list[dict]:
-        """Retrieve all episodes, optionally filtered by group_id, via Cypher query."""
+        """Retrieve the newest 1000 episodes, optionally filtered by group_id.
+
+        Prefer get_episodes_page() for anything user-facing.
+        """
+        page = await self.get_episodes_page(group_id=group_id, limit=1000)
+        return page["episodes"]
+
+    @_GRAPHITI_RETRY
+    async def get_episodes_page(
+        self, group_id: str | None = None, limit: int = 50, cursor: str | None = None,
+    ) -> dict:
+        """One page of episodes, newest first, with keyset pagination.
+
+        Ordered by (created_at, uuid) descending; `cursor` is the `next_cursor`
+        of the previous page. Raises ValueError for a malformed cursor.
+
+        Returns:
+            {"episodes": [...], "next_cursor": str | None} — next_cursor is
+            None on the last page.
+        """
+        empty: dict = {"episodes": [], "next_cursor": None}
+        after = decode_episode_cursor(cursor) if cursor else None
         await self._ensure_init()
         if not self._initialized:
-            return []
+            return empty
         try:
             driver = getattr(self._client, "driver", None)
             if driver is None:
                 logger.warning("Graphiti get_episodes: no driver available")
-                return []
+                return empty
+            conditions = []
+            params: dict = {"lim": limit + 1}
             if group_id:
-                query = (
-                    "MATCH (e:EpisodicNode {group_id: $gid}) "
-                    "RETURN e.uuid AS id, e.content AS content, "
-                    "e.source AS source, e.created_at AS created_at "
-                    "ORDER BY e.created_at DESC LIMIT 1000"
+                conditions.append("e.group_id = $gid")
+                params["gid"] = group_id
+            if after:
+                # Neo4j stores created_at as DATETIME, FalkorDB as ISO strings
+                ts = "$ts" if self._backend == "falkordb" else "datetime($ts)"
+                conditions.append(
+                    f"(e.created_at < {ts} OR (e.created_at = {ts} AND e.uuid < $uid))"
                 )
-                params = {"gid": group_id}
-            else:
-                query = (
-                    "MATCH (e:EpisodicNode) "
-                    "RETURN e.uuid AS id, e.content AS content, "
-                    "e.source AS source, e.created_at AS created_at "
-                    "ORDER BY e.created_at DESC LIMIT 1000"
-                )
-                params = {}
+                params["ts"], params["uid"] = after
+            where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+            query = (
+                f"MATCH (e:EpisodicNode) {where}"
+                "RETURN e.uuid AS id, e.content AS content, "
+                "e.source AS source, e.created_at AS created_at "
+                "ORDER BY e.created_at DESC, e.uuid DESC LIMIT $lim"
+            )
             async with asyncio.timeout(self._timeout):
                 records, _, _ = await driver.execute_query(query, **params)
-            return [
+            next_cursor = None
+            if len(records) > limit:
+                records = records[:limit]
+                last = records[-1]
+                next_cursor = encode_episode_cursor(last["created_at"], str(last["id"]))
+            episodes = [
                 {
                     "id": str(r["id"]) if r["id"] else "",
                     "content": str(r["content"]) if r["content"] else "",
@@ -790,15 +1472,16 @@ class GraphitiService:
                 }
                 for r in records
             ]
+            return {"episodes": episodes, "next_cursor": next_cursor}
         except TimeoutError:
             logger.warning("Graphiti get_episodes timed out after %ds", self._timeout)
-            return []
+            return empty
         except (ConnectionError, OSError):
             raise  # Let retry decorator handle
         except Exception as e:
             logger.warning("Graphiti get_episodes failed: %s", type(e).__name__)
             logger.debug("Graphiti error detail: %s", e)
-            return []
+            return empty
 
     @_GRAPHITI_RETRY
     async def get_episode_by_id(self, episode_uuid: str) -> dict | None:
@@ -840,10 +1523,17 @@ class GraphitiService:
 
     @_GRAPHITI_RETRY
     async def get_episode_count(self, group_id: str | None = None) -> int:
-        """Count episodes for a group using efficient COUNT query."""
+        """Count episodes for a group.
+
+        Served from the incrementally maintained count when it was reconciled
+        with a COUNT query less than `graphiti_episode_count_reconcile_seconds` ago.
+        """
         await self._ensure_init()
         if not self._initialized:
             return 0
+        known = self._episode_counts.get(group_id or "")
+        if known and time.monotonic() - known[1] < self._count_reconcile:
+            return known[0]
         try:
             driver = getattr(self._client, "driver", None)
             if driver is None:
@@ -857,7 +1547,9 @@ class GraphitiService:
                 params = {}
             async with asyncio.timeout(self._timeout):
                 records, _, _ = await driver.execute_query(query, **params)
-            return records[0]["cnt"] if records else 0
+            count = records[0]["cnt"] if records else 0
+            self._episode_counts[group_id or ""] = (count, time.monotonic())
+            return count
         except (ConnectionError, OSError):
             raise  # Let retry handle
         except TimeoutError:
@@ -888,6 +1580,9 @@ class GraphitiService:
                     gid=group_id,
                 )
             deleted = records[0]["deleted"] if records else 0
+            self.invalidate_cache(group_id)
+            self._adjust_episode_count(group_id, -deleted)
+            self._episode_counts[group_id] = (0, time.monotonic())
             logger.debug("Deleted %d episodes for group %s", deleted, group_id)
             return deleted
         except TimeoutError:
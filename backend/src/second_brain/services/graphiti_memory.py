@@ -7,12 +7,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
 from typing import TYPE_CHECKING
 
 from second_brain.services.abstract import MemoryServiceBase
+from second_brain.services.keepalive import KeepAlive, track_connection
 from second_brain.services.retry import _GRAPHITI_ADAPTER_RETRY
 from second_brain.services.search_result import SearchResult
+from second_brain.services.write_generation import bumps_write_generation
 
 if TYPE_CHECKING:
     from second_brain.config import BrainConfig
@@ -49,9 +50,11 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
         self._config = config
         self.user_id: str = config.brain_user_id
         self._timeout: int = config.service_timeout_seconds
-        self._last_activity: float = time.monotonic()
-        self._idle_threshold: int = 240  # 4 minutes (< 5 min typical timeout)
         self._graphiti: "GraphitiService" = self._init_graphiti()
+        self._keepalive = KeepAlive(
+            "graphiti", self._ping, self._reconnect,
+            interval=config.keepalive_interval_seconds,
+        )
 
     def _effective_user_id(self, override: str | None = None) -> str:
         """Return override if provided, else self.user_id (from config)."""
@@ -63,14 +66,20 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
         logger.info("GraphitiService client initialized")
         return GraphitiService(self._config)
 
-    def _check_idle_reconnect(self) -> None:
-        """Re-instantiate GraphitiService if idle for too long."""
-        elapsed = time.monotonic() - self._last_activity
-        if elapsed > self._idle_threshold:
-            logger.debug("Graphiti idle for %.0fs, re-instantiating client", elapsed)
-            self._graphiti = self._init_graphiti()
-        self._last_activity = time.monotonic()
+    async def _ping(self) -> None:
+        """Keep-alive round trip on the pooled driver (raises on failure)."""
+        await self._graphiti.ping()
+
+    async def _reconnect(self) -> None:
+        """Reconnect GraphitiService off the request path after failed keep-alive pings.
+
+        Reconnects in place, so its query cache, episode counts and ingest
+        scheduler survive; raises while the backend is still unreachable.
+        """
+        await self._graphiti.reconnect()
 
+    @track_connection
+    @bumps_write_generation
     async def add(
         self,
         content: str,
@@ -78,7 +87,6 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
         enable_graph: bool | None = None,
     ) -> dict:
         """Add content as a Graphiti episode. Returns status dict."""
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _add():
@@ -97,6 +105,7 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.add error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def add_with_metadata(
         self,
         content: str,
@@ -106,6 +115,7 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
         """Add content with metadata. Delegates to add()."""
         return await self.add(content, metadata=metadata)
 
+    @bumps_write_generation
     async def add_multimodal(
         self,
         content_blocks: list[dict],
@@ -134,6 +144,7 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
         combined_text = "\n".join(text_parts)
         return await self.add(combined_text, metadata=metadata)
 
+    @track_connection
     async def search(
         self,
         query: str,
@@ -147,7 +158,6 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
 
         Populates BOTH memories (for reranking/formatting) and relations (for graph display).
         """
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _search():
@@ -169,6 +179,7 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.search error detail: %s", e)
             return SearchResult()
 
+    @track_connection
     async def search_with_filters(
         self,
         query: str,
@@ -186,7 +197,6 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
         - {"AND": [{"key": "val"}, ...]} → extracts values, prepends to query
         - {"key": {"in": [...]}} → joins list values, prepends to query
         """
-        self._check_idle_reconnect()
         augmented_query = query
         if metadata_filters:
             parts: list[str] = []
@@ -229,12 +239,12 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.search_with_filters error detail: %s", e)
             return SearchResult(search_filters=metadata_filters or {})
 
+    @track_connection
     async def search_by_category(
         self, category: str, query: str = "", limit: int = 10,
         override_user_id: str | None = None,
     ) -> SearchResult:
         """Search by category by prepending category to query string."""
-        self._check_idle_reconnect()
         try:
             combined = f"{category} {query}"
 
@@ -258,9 +268,9 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.search_by_category error detail: %s", e)
             return SearchResult()
 
+    @track_connection
     async def get_all(self) -> list[dict]:
         """Retrieve all episodes for the current user's group."""
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _get():
@@ -287,9 +297,9 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.get_all error detail: %s", e)
             return []
 
+    @track_connection
     async def get_memory_count(self) -> int:
         """Count episodes for the current user's group."""
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _count():
@@ -305,6 +315,7 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.get_memory_count error detail: %s", e)
             return 0
 
+    @bumps_write_generation
     async def update_memory(
         self, memory_id: str, content: str | None = None, metadata: dict | None = None
     ) -> None:
@@ -320,9 +331,10 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.warning("GraphitiMemoryAdapter.update_memory failed: %s", type(e).__name__)
             logger.debug("GraphitiMemoryAdapter.update_memory error detail: %s", e)
 
+    @track_connection
+    @bumps_write_generation
     async def delete(self, memory_id: str) -> None:
         """Delete a memory (episode) by its UUID."""
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _delete():
@@ -338,9 +350,9 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.warning("GraphitiMemoryAdapter.delete failed: %s", type(e).__name__)
             logger.debug("GraphitiMemoryAdapter.delete error detail: %s", e)
 
+    @track_connection
     async def get_by_id(self, memory_id: str) -> dict | None:
         """Retrieve a specific episode by UUID."""
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _get():
@@ -366,9 +378,10 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
             logger.debug("GraphitiMemoryAdapter.get_by_id error detail: %s", e)
             return None
 
+    @track_connection
+    @bumps_write_generation
     async def delete_all(self) -> int:
         """Delete all episodes for the current user's group."""
-        self._check_idle_reconnect()
         try:
             @_GRAPHITI_ADAPTER_RETRY
             async def _delete_all():
@@ -416,6 +429,7 @@ class GraphitiMemoryAdapter(MemoryServiceBase):
 
     async def close(self) -> None:
         """Close underlying Graphiti client if possible."""
+        self._keepalive.stop()
         try:
             if hasattr(self._graphiti, "close"):
                 await self._graphiti.close()
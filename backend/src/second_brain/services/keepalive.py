@@ -0,0 +1,231 @@
+"""Keep-alive for long-lived backend clients.
+
+Mem0's API and hosted graph databases drop connections that sit idle for
+about five minutes. The memory services used to work around that by
+rebuilding their client on the request path after 4 idle minutes, so the
+first request after a pause paid for a new session and TLS handshake.
+Instead each service keeps one pooled client for its lifetime plus a
+`KeepAlive`:
+
+- a background task pings the backend whenever it has been idle for
+  `interval` seconds, so pooled connections never go stale;
+- after `max_failures` consecutive failed pings the client is rebuilt in
+  the background, never on a request; while the backend stays down,
+  further attempts back off exponentially (up to `max_backoff` seconds)
+  until a ping succeeds again;
+- `track_connection` records each request as warm or cold (the first
+  request after more than `cold_after` idle seconds) with its latency.
+
+Per-backend counters: connection_stats(), served on GET /api/health/runtime.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Idle time after which a request is counted as cold: pooled connections are
+# expired by then (below the ~5 min server-side idle timeout).
+COLD_AFTER_SECONDS = 240.0
+
+
+class ConnectionStats:
+    """Request latency (warm vs cold), ping and reconnect counters for one backend."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.warm_requests = 0
+        self.cold_requests = 0
+        self._warm_latency_total = 0.0
+        self._cold_latency_total = 0.0
+        self._cold_latency_max = 0.0
+        self.pings = 0
+        self.ping_failures = 0
+        self.reconnects = 0
+        self.reconnect_failures = 0
+        self._reconnect_times: deque[float] = deque(maxlen=100)
+
+    def record_request(self, latency: float, cold: bool) -> None:
+        with self._lock:
+            if cold:
+                self.cold_requests += 1
+                self._cold_latency_total += latency
+                self._cold_latency_max = max(self._cold_latency_max, latency)
+            else:
+                self.warm_requests += 1
+                self._warm_latency_total += latency
+
+    def record_ping(self, ok: bool) -> None:
+        with self._lock:
+            self.pings += 1
+            if not ok:
+                self.ping_failures += 1
+
+    def record_reconnect(self, ok: bool = True) -> None:
+        with self._lock:
+            if not ok:
+                self.reconnect_failures += 1
+                return
+            self.reconnects += 1
+            self._reconnect_times.append(time.monotonic())
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            hour_ago = time.monotonic() - 3600
+            return {
+                "warm_requests": self.warm_requests,
+                "cold_requests": self.cold_requests,
+                "avg_warm_latency_ms": round(
+                    self._warm_latency_total / self.warm_requests * 1000, 1,
+                ) if self.warm_requests else 0.0,
+                "avg_cold_latency_ms": round(
+                    self._cold_latency_total / self.cold_requests * 1000, 1,
+                ) if self.cold_requests else 0.0,
+                "max_cold_latency_ms": round(self._cold_latency_max * 1000, 1),
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+                "reconnects": self.reconnects,
+                "reconnect_failures": self.reconnect_failures,
+                "reconnects_last_hour": sum(1 for t in self._reconnect_times if t >= hour_ago),
+            }
+
+
+_stats: dict[str, ConnectionStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_connection_stats(name: str) -> ConnectionStats:
+    with _stats_lock:
+        if name not in _stats:
+            _stats[name] = ConnectionStats(name)
+        return _stats[name]
+
+
+def connection_stats() -> dict[str, dict]:
+    """Snapshot of every backend's connection counters."""
+    with _stats_lock:
+        stats = list(_stats.values())
+    return {s.name: s.snapshot() for s in stats}
+
+
+def reset_connection_stats() -> None:
+    """Drop all counters (tests)."""
+    with _stats_lock:
+        _stats.clear()
+
+
+class KeepAlive:
+    """Background idle pinger and cold-request detector for one client."""
+
+    def __init__(
+        self,
+        name: str,
+        ping: Callable[[], Awaitable[object]],
+        reconnect: Callable[[], Awaitable[object]],
+        interval: float,
+        cold_after: float = COLD_AFTER_SECONDS,
+        max_failures: int = 2,
+        max_backoff: float = 3600.0,
+    ):
+        self.name = name
+        self.stats = get_connection_stats(name)
+        self.interval = interval
+        self.cold_after = cold_after
+        self.max_failures = max_failures
+        self.max_backoff = max_backoff
+        # Reconnect attempts since the last successful ping
+        self._attempts = 0
+        self._ping = ping
+        self._reconnect = reconnect
+        self._last_activity = time.monotonic()
+        self._task: asyncio.Task | None = None
+
+    def touch(self) -> bool:
+        """Record activity; True if the connection had been idle long enough to be cold.
+
+        Also starts the background pinger on first use inside an event loop.
+        """
+        now = time.monotonic()
+        cold = now - self._last_activity > self.cold_after
+        self._last_activity = now
+        self._ensure_started()
+        return cold
+
+    def _ensure_started(self) -> None:
+        if self.interval <= 0 or (self._task is not None and not self._task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run(), name=f"keepalive-{self.name}")
+
+    async def _run(self) -> None:
+        failures = 0
+        while True:
+            idle = time.monotonic() - self._last_activity
+            if idle < self.interval:
+                await asyncio.sleep(self.interval - idle)
+                continue
+            try:
+                await self._ping()
+            except Exception as e:
+                self.stats.record_ping(False)
+                failures += 1
+                logger.warning("%s keep-alive ping failed: %s", self.name, type(e).__name__)
+                logger.debug("%s keep-alive error detail: %s", self.name, e)
+                if failures >= self.max_failures:
+                    failures = 0
+                    await self._rebuild()
+                await asyncio.sleep(self.retry_delay)
+                continue
+            self.stats.record_ping(True)
+            failures = 0
+            self._attempts = 0
+            self._last_activity = time.monotonic()
+
+    @property
+    def retry_delay(self) -> float:
+        """Wait before the next ping: doubles with each reconnect since the last good ping."""
+        return min(self.interval * 2 ** self._attempts, max(self.max_backoff, self.interval))
+
+    async def _rebuild(self) -> None:
+        self._attempts += 1
+        try:
+            await self._reconnect()
+        except Exception as e:
+            self.stats.record_reconnect(ok=False)
+            logger.warning(
+                "%s background reconnect failed: %s — next attempt in %.0fs",
+                self.name, type(e).__name__, self.retry_delay * self.max_failures,
+            )
+            logger.debug("%s reconnect error detail: %s", self.name, e)
+            return
+        self.stats.record_reconnect()
+        logger.info("%s client rebuilt after failed keep-alive pings", self.name)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+def track_connection(method):
+    """Record a service method call as a warm or cold request on `self._keepalive`."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        keepalive: KeepAlive = self._keepalive
+        cold = keepalive.touch()
+        start = time.monotonic()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            keepalive.stats.record_request(time.monotonic() - start, cold)
+
+    return wrapper
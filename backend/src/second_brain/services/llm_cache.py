@@ -0,0 +1,276 @@
+"""Opt-in cache of model responses for agents that answer identical input identically.
+
+clarity, review (dimension and batched runs), synthesizer and template_builder
+are re-invoked on the same input all the time: the frontend resubmits,
+pipelines re-review unchanged drafts, MCP clients retry after timeouts.
+With LLM_CACHE_ENABLED their models are wrapped in CachedModel, which
+stores each model response in a local SQLite file and replays it for the
+same request.
+
+A request is keyed by agent name, model, the instructions and message
+history of the run (prompt, tool calls and tool results, timestamps and
+call ids left out), and the tool/output schemas. Brain context reaches
+the model only through instructions (context packs) and tool results, so
+when the context an agent saw changes, so does the key; a tool-using run
+replays the tool-call turn but re-runs the tools themselves.
+
+Entries expire after LLM_CACHE_TTL_SECONDS; past LLM_CACHE_MAX_MB the
+least recently used entries are evicted. Cache failures never fail a run:
+they are logged and the model is called as usual.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.usage import RequestUsage
+
+from second_brain.services.executors import LLM_CACHE, run_blocking
+
+if TYPE_CHECKING:
+    from pydantic_ai.models import Model, ModelRequestParameters
+    from pydantic_ai.settings import ModelSettings
+
+    from second_brain.config import BrainConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "second-brain" / "llm_cache.sqlite3"
+
+# Bump when the key or stored format changes so old entries stop matching
+_KEY_VERSION = 1
+
+# Part fields that differ between otherwise identical requests
+_VOLATILE_FIELDS = frozenset({"timestamp", "tool_call_id", "id", "provider_name", "provider_details"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    agent TEXT NOT NULL,
+    response BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def _part_fingerprint(part: Any) -> dict:
+    fields = dataclasses.asdict(part) if dataclasses.is_dataclass(part) else {"repr": repr(part)}
+    return {k: v for k, v in fields.items() if k not in _VOLATILE_FIELDS}
+
+
+def cache_key(
+    agent_name: str,
+    model: "Model",
+    messages: list[ModelMessage],
+    model_settings: "ModelSettings | None",
+    model_request_parameters: "ModelRequestParameters",
+) -> str:
+    """Content hash of one model request."""
+    payload = {
+        "v": _KEY_VERSION,
+        "agent": agent_name,
+        "model": f"{model.system}:{model.model_name}",
+        "messages": [
+            {
+                "kind": m.kind,
+                "instructions": getattr(m, "instructions", None),
+                "parts": [_part_fingerprint(p) for p in m.parts],
+            }
+            for m in messages
+        ],
+        "params": dataclasses.asdict(model_request_parameters),
+        "settings": model_settings,
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class LLMOutputCache:
+    """SQLite store of serialized model responses with TTL and size-based LRU eviction."""
+
+    def __init__(self, path: Path, ttl: float, max_bytes: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> bytes | None:
+        """The stored response, or None when absent or expired."""
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT response, expires_at FROM llm_cache WHERE key = ?", (key,),
+            ).fetchone()
+            if row is None or row[1] < now:
+                if row is not None:
+                    db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    db.commit()
+                self.misses += 1
+                return None
+            db.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, agent_name: str, response: bytes) -> None:
+        """Store a response, then evict expired and least recently used entries past max_bytes."""
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, agent_name, response, len(response), now + self.ttl, now),
+            )
+            self.writes += 1
+            self.evictions += db.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,)).rowcount
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+            while total > self.max_bytes:
+                row = db.execute(
+                    "SELECT key, size FROM llm_cache ORDER BY last_used ASC LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                db.execute("DELETE FROM llm_cache WHERE key = ?", (row[0],))
+                total -= row[1]
+                self.evictions += 1
+            db.commit()
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db().execute("DELETE FROM llm_cache")
+            self._db().commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = (0, 0)
+            if self._conn is not None:
+                entries, size = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+                ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+class CachedModel(WrapperModel):
+    """Replays stored responses for requests an agent has already made.
+
+    Streaming requests pass straight through uncached.
+    """
+
+    def __init__(self, wrapped: "Model", agent_name: str, cache: LLMOutputCache):
+        super().__init__(wrapped)
+        self.agent_name = agent_name
+        self.cache = cache
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: "ModelSettings | None",
+        model_request_parameters: "ModelRequestParameters",
+    ) -> ModelResponse:
+        key = cache_key(self.agent_name, self.wrapped, messages, model_settings, model_request_parameters)
+        try:
+            stored = await run_blocking(LLM_CACHE, self.cache.get, key)
+        except Exception as e:
+            self.cache.record_error()
+            logger.warning("LLM cache read failed: %s", type(e).__name__)
+            logger.debug("LLM cache error detail: %s", e)
+            stored = None
+        if stored is not None:
+            response = ModelMessagesTypeAdapter.validate_json(stored)[0]
+            # Replayed responses cost no tokens
+            return dataclasses.replace(response, usage=RequestUsage())
+
+        response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+        try:
+            data = ModelMessagesTypeAdapter.dump_json([response])
+            await run_blocking(LLM_CACHE, self.cache.put, key, self.agent_name, data)
+        except Exception as e:
+            self.cache.record_error()
+            logger.warning("LLM cache write failed: %s", type(e).__name__)
+            logger.debug("LLM cache error detail: %s", e)
+        return response
+
+
+_caches: dict[Path, LLMOutputCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(config: "BrainConfig") -> LLMOutputCache:
+    """The process-wide cache for config.llm_cache_path."""
+    path = Path(config.llm_cache_path or DEFAULT_CACHE_PATH).expanduser()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = LLMOutputCache(
+                path, config.llm_cache_ttl_seconds, config.llm_cache_max_mb * 1024 * 1024,
+            )
+        return cache
+
+
+def with_llm_cache(model: "Model", agent_name: str, config: "BrainConfig") -> "Model":
+    """`model` wrapped in CachedModel when the LLM cache is enabled for `agent_name`."""
+    if not config.llm_cache_enabled or agent_name not in config.llm_cache_agents_list:
+        return model
+    if isinstance(model, CachedModel):
+        return model
+    return CachedModel(model, agent_name, get_llm_cache(config))
+
+
+def llm_cache_stats() -> dict[str, dict]:
+    """Counters of every open cache, keyed by file path."""
+    with _caches_lock:
+        caches = list(_caches.items())
+    return {str(path): cache.stats() for path, cache in caches}
+
+
+def close_llm_caches() -> None:
+    """Close and forget all caches (tests, shutdown)."""
+    with _caches_lock:
+        caches = list(_caches.values())
+        _caches.clear()
+    for cache in caches:
+        with cache._lock:
+            if cache._conn is not None:
+                cache._conn.close()
+                cache._conn = None
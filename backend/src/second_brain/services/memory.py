@@ -1,13 +1,17 @@
 """Semantic memory via Mem0 Cloud."""
 
-import asyncio
 import logging
-import time
+
+import httpx
 
 from second_brain.config import BrainConfig
-from second_brain.services.retry import _MEM0_RETRY
+from second_brain.services.deadlines import deadline, install_deadline_timeouts
+from second_brain.services.executors import MEM0, run_blocking
+from second_brain.services.keepalive import COLD_AFTER_SECONDS, KeepAlive, track_connection
+from second_brain.services.retry import MEM0_RETRY_CONFIG, async_retry
 from second_brain.services.abstract import MemoryServiceBase
 from second_brain.services.search_result import SearchResult
+from second_brain.services.write_generation import bumps_write_generation
 
 logger = logging.getLogger(__name__)
 
@@ -134,9 +138,11 @@ class MemoryService(MemoryServiceBase):
         self.user_id = config.brain_user_id
         self.enable_graph = config.graph_provider == "mem0"
         self._timeout = config.service_timeout_seconds
-        self._last_activity: float = time.monotonic()
-        self._idle_threshold: int = 240  # 4 minutes (< 5 min Mem0 timeout)
         self._client = self._init_client()
+        self._keepalive = KeepAlive(
+            "mem0", self._ping, self._reconnect,
+            interval=config.keepalive_interval_seconds,
+        )
 
     def _init_client(self):
         """Initialize Mem0 cloud client. Requires mem0_api_key."""
@@ -147,14 +153,22 @@ class MemoryService(MemoryServiceBase):
             )
         from mem0 import MemoryClient
 
-        client = MemoryClient(api_key=self.config.mem0_api_key)
+        # One pooled session for the service's lifetime; idle connections are
+        # expired client-side before Mem0's ~5 min server timeout drops them.
+        # (httpx's default expiry is 5s, so every pause used to reconnect.)
+        http_client = httpx.Client(limits=httpx.Limits(keepalive_expiry=COLD_AFTER_SECONDS))
+        client = MemoryClient(api_key=self.config.mem0_api_key, client=http_client)
+        # Mem0's httpx client defaults to a 300s timeout; bound it by the
+        # service timeout and let deadline() clamp each request further.
+        install_deadline_timeouts(getattr(client, "client", None), self._timeout)
         logger.info("Mem0 cloud client initialized")
         return client
 
+    @track_connection
+    @bumps_write_generation
     async def add(self, content: str, metadata: dict | None = None,
                   enable_graph: bool | None = None) -> dict:
         """Add a memory. Content is auto-extracted into facts by Mem0."""
-        self._check_idle_reconnect()
         messages = [{"role": "user", "content": content}]
         kwargs: dict = {
             "user_id": self.user_id,
@@ -164,18 +178,19 @@ class MemoryService(MemoryServiceBase):
         if use_graph:
             kwargs["enable_graph"] = True
         try:
-            @_MEM0_RETRY
             def _add():
                 return self._client.add(messages, **kwargs)
 
-            async with asyncio.timeout(self._timeout):
-                result = await asyncio.to_thread(_add)
+            async with deadline(self._timeout):
+                result = await async_retry(_add, config=MEM0_RETRY_CONFIG)
             return result
         except Exception as e:
             logger.warning("Mem0 add failed: %s", type(e).__name__)
             logger.debug("Mem0 add error detail: %s", e)
             return {}
 
+    @track_connection
+    @bumps_write_generation
     async def add_with_metadata(
         self,
         content: str,
@@ -192,7 +207,6 @@ class MemoryService(MemoryServiceBase):
             metadata: Required metadata dict (category, etc.). Must be <2KB.
             enable_graph: Override graph setting. None = use config default.
         """
-        self._check_idle_reconnect()
         messages = [{"role": "user", "content": content}]
         kwargs: dict = {
             "user_id": self.user_id,
@@ -202,18 +216,19 @@ class MemoryService(MemoryServiceBase):
         if use_graph:
             kwargs["enable_graph"] = True
         try:
-            @_MEM0_RETRY
             def _add():
                 return self._client.add(messages, **kwargs)
 
-            async with asyncio.timeout(self._timeout):
-                result = await asyncio.to_thread(_add)
+            async with deadline(self._timeout):
+                result = await async_retry(_add, config=MEM0_RETRY_CONFIG)
             return result
         except Exception as e:
             logger.warning("Mem0 add_with_metadata failed: %s", type(e).__name__)
             logger.debug("Mem0 add_with_metadata error detail: %s", e)
             return {}
 
+    @track_connection
+    @bumps_write_generation
     async def add_multimodal(
         self,
         content_blocks: list[dict],
@@ -237,7 +252,6 @@ class MemoryService(MemoryServiceBase):
         Returns:
             Result dict from Mem0 (may be empty on failure).
         """
-        self._check_idle_reconnect()
         messages = []
         for block in content_blocks:
             block_type = block.get("type", "")
@@ -262,12 +276,11 @@ class MemoryService(MemoryServiceBase):
             kwargs["enable_graph"] = True
 
         try:
-            @_MEM0_RETRY
             def _add():
                 return self._client.add(messages, **kwargs)
 
-            async with asyncio.timeout(self._timeout):
-                result = await asyncio.to_thread(_add)
+            async with deadline(self._timeout):
+                result = await async_retry(_add, config=MEM0_RETRY_CONFIG)
             return result
         except Exception as e:
             logger.warning("Mem0 add_multimodal failed: %s", type(e).__name__)
@@ -278,13 +291,20 @@ class MemoryService(MemoryServiceBase):
         """Return override if provided, else self.user_id (from config)."""
         return override if override else self.user_id
 
-    def _check_idle_reconnect(self) -> None:
-        """Re-instantiate client if idle for too long (Mem0 timeout workaround)."""
-        elapsed = time.monotonic() - self._last_activity
-        if elapsed > self._idle_threshold:
-            logger.debug("Mem0 idle for %.0fs, re-instantiating client", elapsed)
-            self._client = self._init_client()
-        self._last_activity = time.monotonic()
+    async def _ping(self) -> None:
+        """Keep-alive round trip on the pooled session (raises on failure)."""
+        def _get():
+            self._client.client.get("/v1/ping/").raise_for_status()
+
+        async with deadline(self._timeout):
+            await run_blocking(MEM0, _get)
+
+    async def _reconnect(self) -> None:
+        """Rebuild the client off the request path after failed keep-alive pings."""
+        old = getattr(self._client, "client", None)
+        self._client = await run_blocking(MEM0, self._init_client)
+        if isinstance(old, httpx.Client):
+            await run_blocking(MEM0, old.close)
 
     async def enable_project_graph(self) -> None:
         """Enable graph memory at Mem0 Cloud project level."""
@@ -292,7 +312,7 @@ class MemoryService(MemoryServiceBase):
             logger.warning("Graph provider is not 'mem0' — skipping project graph enablement")
             return
         try:
-            await asyncio.to_thread(lambda: self._client.project.update(enable_graph=True))
+            await run_blocking(MEM0, lambda: self._client.project.update(enable_graph=True))
             logger.info("Enabled graph memory at Mem0 project level")
         except Exception as e:
             logger.error("Failed to enable project-level graph: %s", e)
@@ -315,8 +335,8 @@ class MemoryService(MemoryServiceBase):
         """
         criteria = criteria or DEFAULT_RETRIEVAL_CRITERIA
         try:
-            await asyncio.to_thread(
-                lambda: self._client.project.update(retrieval_criteria=criteria)
+            await run_blocking(
+                MEM0, lambda: self._client.project.update(retrieval_criteria=criteria)
             )
             logger.info(
                 "Configured Mem0 Criteria Retrieval with %d criteria: %s",
@@ -346,8 +366,8 @@ class MemoryService(MemoryServiceBase):
         """
         instructions = instructions or DEFAULT_CUSTOM_INSTRUCTIONS
         try:
-            await asyncio.to_thread(
-                lambda: self._client.project.update(custom_instructions=instructions)
+            await run_blocking(
+                MEM0, lambda: self._client.project.update(custom_instructions=instructions)
             )
             # Log first 100 chars as preview
             preview = instructions[:100].replace('\n', ' ') + "..."
@@ -357,13 +377,13 @@ class MemoryService(MemoryServiceBase):
             logger.error("Failed to setup Custom Instructions: %s", e)
             return False
 
+    @track_connection
     async def search(self, query: str, limit: int | None = None,
                      enable_graph: bool | None = None,
                      override_user_id: str | None = None,
                      filter_memories: bool | None = None,
                      use_criteria: bool | None = None) -> SearchResult:
         """Semantic search across memories."""
-        self._check_idle_reconnect()
         limit = limit if limit is not None else self.config.memory_search_limit
         uid = self._effective_user_id(override_user_id)
         kwargs: dict = {
@@ -386,12 +406,11 @@ class MemoryService(MemoryServiceBase):
         try:
             logger.debug("Mem0 search kwargs: %s", {k: v for k, v in kwargs.items() if k != "filters"})
 
-            @_MEM0_RETRY
             def _search():
                 return self._client.search(query, version="v2", **kwargs)
 
-            async with asyncio.timeout(self._timeout):
-                results = await asyncio.to_thread(_search)
+            async with deadline(self._timeout):
+                results = await async_retry(_search, config=MEM0_RETRY_CONFIG)
         except Exception as e:
             logger.warning("Mem0 search failed: %s — kwargs keys: %s", type(e).__name__, list(kwargs.keys()))
             logger.debug("Mem0 search error detail: %s", e)
@@ -404,6 +423,7 @@ class MemoryService(MemoryServiceBase):
         memories = results[:limit] if isinstance(results, list) else []
         return SearchResult(memories=memories, relations=[])
 
+    @track_connection
     async def search_with_filters(
         self,
         query: str,
@@ -427,7 +447,6 @@ class MemoryService(MemoryServiceBase):
             enable_graph: Override graph setting. None = use config default.
             override_user_id: Override user_id for scoping to a different user.
         """
-        self._check_idle_reconnect()
         # Validate filter structure early
         validate_metadata_filter(metadata_filters)
         limit = limit if limit is not None else self.config.memory_search_limit
@@ -467,22 +486,20 @@ class MemoryService(MemoryServiceBase):
         try:
             logger.debug("Mem0 search_with_filters kwargs: %s", {k: v for k, v in kwargs.items() if k != "filters"})
 
-            @_MEM0_RETRY
             def _search():
                 return self._client.search(query, version="v2", **kwargs)
 
-            @_MEM0_RETRY
             def _search_no_filters():
                 kw = {k: v for k, v in kwargs.items() if k != "filters"}
                 return self._client.search(query, version="v2", **kw)
 
             try:
-                async with asyncio.timeout(self._timeout):
-                    results = await asyncio.to_thread(_search)
+                async with deadline(self._timeout):
+                    results = await async_retry(_search, config=MEM0_RETRY_CONFIG)
             except TypeError:
                 logger.warning("Mem0 client doesn't support filters, falling back to unfiltered search")
-                async with asyncio.timeout(self._timeout):
-                    results = await asyncio.to_thread(_search_no_filters)
+                async with deadline(self._timeout):
+                    results = await async_retry(_search_no_filters, config=MEM0_RETRY_CONFIG)
         except Exception as e:
             logger.warning("Mem0 search_with_filters failed: %s — kwargs keys: %s", type(e).__name__, list(kwargs.keys()))
             logger.debug("Mem0 search_with_filters error detail: %s", e)
@@ -504,6 +521,8 @@ class MemoryService(MemoryServiceBase):
             search_filters=metadata_filters or {},
         )
 
+    @track_connection
+    @bumps_write_generation
     async def update_memory(
         self,
         memory_id: str,
@@ -517,7 +536,6 @@ class MemoryService(MemoryServiceBase):
             content: New content text (None = keep existing).
             metadata: New metadata dict (None = keep existing).
         """
-        self._check_idle_reconnect()
         try:
             kwargs: dict = {}
             if content is not None:
@@ -525,29 +543,27 @@ class MemoryService(MemoryServiceBase):
             if metadata is not None:
                 kwargs["metadata"] = metadata
             if kwargs:
-                @_MEM0_RETRY
                 def _update():
                     return self._client.update(memory_id=memory_id, **kwargs)
 
-                async with asyncio.timeout(self._timeout):
-                    await asyncio.to_thread(_update)
+                async with deadline(self._timeout):
+                    await async_retry(_update, config=MEM0_RETRY_CONFIG)
         except Exception as e:
             logger.warning("Mem0 update_memory failed: %s", type(e).__name__)
             logger.debug("Mem0 update_memory error detail: %s", e)
 
+    @track_connection
     async def get_all(self) -> list[dict]:
         """Get all memories for the user."""
-        self._check_idle_reconnect()
         try:
             kwargs: dict = {"user_id": self.user_id}
             logger.debug("Mem0 get_all kwargs: %s", {k: v for k, v in kwargs.items() if k != "filters"})
 
-            @_MEM0_RETRY
             def _get_all():
                 return self._client.get_all(**kwargs)
 
-            async with asyncio.timeout(self._timeout):
-                results = await asyncio.to_thread(_get_all)
+            async with deadline(self._timeout):
+                results = await async_retry(_get_all, config=MEM0_RETRY_CONFIG)
 
             if isinstance(results, dict):
                 return results.get("results", [])
@@ -567,16 +583,16 @@ class MemoryService(MemoryServiceBase):
             logger.debug("Mem0 get_memory_count error detail: %s", e)
             return 0
 
+    @track_connection
+    @bumps_write_generation
     async def delete(self, memory_id: str) -> None:
         """Delete a specific memory."""
-        self._check_idle_reconnect()
         try:
-            @_MEM0_RETRY
             def _delete():
                 return self._client.delete(memory_id)
 
-            async with asyncio.timeout(self._timeout):
-                await asyncio.to_thread(_delete)
+            async with deadline(self._timeout):
+                await async_retry(_delete, config=MEM0_RETRY_CONFIG)
         except Exception as e:
             logger.warning("Mem0 delete failed: %s", type(e).__name__)
             logger.debug("Mem0 delete error detail: %s", e)
@@ -601,6 +617,7 @@ class MemoryService(MemoryServiceBase):
             logger.debug("Mem0 error detail: %s", e)
             return None
 
+    @bumps_write_generation
     async def delete_all(self) -> int:
         """Delete all memories. Use with caution — irreversible.
 
@@ -647,9 +664,10 @@ class MemoryService(MemoryServiceBase):
 
     async def close(self) -> None:
         """Release Mem0 client resources."""
+        self._keepalive.stop()
         try:
             if hasattr(self._client, "close"):
-                await asyncio.to_thread(self._client.close)
+                await run_blocking(MEM0, self._client.close)
         except Exception as e:
             logger.warning("Mem0 close failed: %s", type(e).__name__)
             logger.debug("Mem0 close error detail: %s", e)
@@ -1,22 +1,27 @@
-"""Retry utility with exponential backoff for transient failures."""
+"""Async-native retry with exponential backoff and per-backend retry budgets.
+
+Backoff sleeps happen on the event loop (asyncio.sleep), never inside a
+worker thread, so a brownout can't park threads in time.sleep. Every retry
+also draws from a process-wide token-bucket budget for its backend: failed
+attempts drain the bucket, successes refill it slowly, and once the bucket
+falls below half capacity retries stop until the backend recovers. This caps
+retry traffic at roughly `token_ratio` of successful traffic and prevents
+retry storms.
+"""
 
 import asyncio
+import functools
 import logging
-from collections.abc import Callable
+import random
+import threading
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any
-
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-    wait_random_exponential,
-)
+from typing import Any, TypeVar
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class RetryConfig:
@@ -28,6 +33,10 @@ class RetryConfig:
     retry_on: tuple[type[Exception], ...] = field(
         default_factory=lambda: (ConnectionError, TimeoutError, OSError)
     )
+    # Backoff = multiplier * 2^(attempt-1), clamped to [min_wait, max_wait]
+    multiplier: float = 1.0
+    # Retry budget shared by every call to the same backend
+    backend: str = "default"
 
 
 DEFAULT_RETRY = RetryConfig()
@@ -47,37 +56,10 @@ MEM0_RETRY_CONFIG = Mem0RetryConfig(
     max_wait=10.0,
     retry_on=(ConnectionError, TimeoutError, OSError),
     use_jitter=True,
+    backend="mem0",
 )
 
 
-def create_retry_decorator(config: RetryConfig | None = None):
-    """Create a tenacity retry decorator from config.
-
-    Args:
-        config: Retry configuration. Defaults to DEFAULT_RETRY.
-
-    Returns:
-        A tenacity retry decorator with before_sleep_log for observability.
-    """
-    cfg = config or DEFAULT_RETRY
-    wait_strategy = (
-        wait_random_exponential(multiplier=1, max=cfg.max_wait)
-        if getattr(cfg, "use_jitter", False)
-        else wait_exponential(multiplier=1, min=cfg.min_wait, max=cfg.max_wait)
-    )
-    return retry(
-        stop=stop_after_attempt(cfg.max_attempts),
-        wait=wait_strategy,
-        retry=retry_if_exception_type(cfg.retry_on),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
-
-
-# Mem0-specific retry decorator with jitter and observable logging
-_MEM0_RETRY = create_retry_decorator(MEM0_RETRY_CONFIG)
-
-
 @dataclass
 class GraphitiAdapterRetryConfig(RetryConfig):
     """Retry config for GraphitiMemoryAdapter (matches Mem0 pattern).
@@ -95,24 +77,180 @@ GRAPHITI_ADAPTER_RETRY_CONFIG = GraphitiAdapterRetryConfig(
     max_wait=4.0,
     retry_on=(ConnectionError, TimeoutError, OSError),
     use_jitter=False,
+    backend="graphiti",
 )
 
+# GraphitiService network calls — connection errors only (timeouts handled inline)
+GRAPHITI_RETRY_CONFIG = RetryConfig(
+    max_attempts=3,
+    min_wait=0.5,
+    max_wait=4.0,
+    retry_on=(ConnectionError, OSError),
+    multiplier=0.5,
+    backend="graphiti",
+)
+
+VOYAGE_RETRY_CONFIG = RetryConfig(backend="voyage")
+OPENAI_RETRY_CONFIG = RetryConfig(backend="openai")
+
+
+# --- Retry budgets ---
+
+# gRPC-style retry throttling: start full, -1 per failed attempt,
+# +token_ratio per success, retries allowed only above half capacity.
+_BUDGET_MAX_TOKENS = 10.0
+_BUDGET_TOKEN_RATIO = 0.1
+
+
+class RetryBudget:
+    """Token-bucket retry budget for one backend. Thread-safe."""
+
+    def __init__(
+        self,
+        max_tokens: float = _BUDGET_MAX_TOKENS,
+        token_ratio: float = _BUDGET_TOKEN_RATIO,
+    ):
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self.retries_allowed = 0
+        self.retries_throttled = 0
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def allow_retry(self) -> bool:
+        """True if the backend is healthy enough to spend a retry."""
+        with self._lock:
+            if self._tokens > self.max_tokens / 2:
+                self.retries_allowed += 1
+                return True
+            self.retries_throttled += 1
+            return False
+
+    def snapshot(self) -> dict:
+        return {
+            "tokens": round(self._tokens, 2),
+            "max_tokens": self.max_tokens,
+            "retries_allowed": self.retries_allowed,
+            "retries_throttled": self.retries_throttled,
+        }
+
+
+_budgets: dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(backend: str) -> RetryBudget:
+    """Return the process-wide retry budget for a backend (created on first use)."""
+    with _budgets_lock:
+        budget = _budgets.get(backend)
+        if budget is None:
+            budget = _budgets[backend] = RetryBudget()
+        return budget
+
+
+def retry_budget_stats() -> dict[str, dict]:
+    """Snapshot of every backend's retry budget, for metrics surfaces."""
+    with _budgets_lock:
+        return {name: b.snapshot() for name, b in sorted(_budgets.items())}
+
+
+def reset_retry_budgets() -> None:
+    """Drop all retry budgets (tests, or after a config reload)."""
+    with _budgets_lock:
+        _budgets.clear()
+
+
+# --- Retry loop ---
+
+
+def _backoff_seconds(cfg: RetryConfig, attempt: int) -> float:
+    exp = cfg.multiplier * 2 ** (attempt - 1)
+    if getattr(cfg, "use_jitter", False):
+        return random.uniform(0, min(cfg.max_wait, exp))
+    return max(cfg.min_wait, min(cfg.max_wait, exp))
+
+
+async def retry_call(
+    call: Callable[[], Awaitable[_T]], config: RetryConfig | None = None,
+) -> _T:
+    """Await `call()` with retries on transient failures.
+
+    Sleeps between attempts on the event loop and stops early when the
+    backend's retry budget is exhausted. The last error is re-raised.
+    """
+    cfg = config or DEFAULT_RETRY
+    budget = get_retry_budget(cfg.backend)
+    attempt = 1
+    while True:
+        try:
+            result = await call()
+        except cfg.retry_on as e:
+            budget.record_failure()
+            if attempt >= cfg.max_attempts:
+                raise
+            if not budget.allow_retry():
+                logger.warning(
+                    "Retry budget exhausted for %s — not retrying %s",
+                    cfg.backend, type(e).__name__,
+                )
+                raise
+            wait = _backoff_seconds(cfg, attempt)
+            logger.warning(
+                "Retrying %s call in %.2fs after %s (attempt %d/%d)",
+                cfg.backend, wait, type(e).__name__, attempt, cfg.max_attempts,
+            )
+            await asyncio.sleep(wait)
+            attempt += 1
+        else:
+            budget.record_success()
+            return result
+
+
+def create_retry_decorator(config: RetryConfig | None = None):
+    """Create an async retry decorator from config.
+
+    Args:
+        config: Retry configuration. Defaults to DEFAULT_RETRY.
+
+    Returns:
+        A decorator for coroutine functions that retries via retry_call().
+    """
+    cfg = config or DEFAULT_RETRY
+
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            return await retry_call(lambda: func(*args, **kwargs), cfg)
+        return wrapper
+
+    return decorator
+
+
 # GraphitiMemoryAdapter retry decorator (for async method wrapping)
 _GRAPHITI_ADAPTER_RETRY = create_retry_decorator(GRAPHITI_ADAPTER_RETRY_CONFIG)
 
 
 async def async_retry(func: Callable[..., Any], *args: Any, config: RetryConfig | None = None, **kwargs: Any) -> Any:
-    """Run a sync function in a thread with retry on transient failures."""
-    cfg = config or DEFAULT_RETRY
+    """Run a sync function on its backend's executor with retry on transient failures.
 
-    @retry(
-        stop=stop_after_attempt(cfg.max_attempts),
-        wait=wait_exponential(multiplier=1, min=cfg.min_wait, max=cfg.max_wait),
-        retry=retry_if_exception_type(cfg.retry_on),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
-    def _call():
-        return func(*args, **kwargs)
+    Each attempt is a separate job on the executor named by `config.backend`
+    (see services.executors); backoff happens on the event loop, so a waiting
+    retry never holds a worker.
+    """
+    from second_brain.services.executors import get_executor
 
-    return await asyncio.to_thread(_call)
+    cfg = config or DEFAULT_RETRY
+    executor = get_executor(cfg.backend)
+    return await retry_call(lambda: executor.run(func, *args, **kwargs), cfg)
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from datetime import date, datetime, timedelta, timezone
 from typing import TypeVar
 
@@ -12,6 +12,9 @@ from supabase import create_client, Client
 _T = TypeVar("_T")
 
 from second_brain.config import BrainConfig
+from second_brain.services.deadlines import deadline, install_deadline_timeouts
+from second_brain.services.executors import SUPABASE, run_blocking
+from second_brain.services.write_generation import bumps_write_generation
 from second_brain.schemas import (
     ContentTypeConfig, DEFAULT_CONTENT_TYPES, ReviewDimensionConfig,
 )
@@ -38,6 +41,7 @@ def content_type_from_row(row: dict) -> ContentTypeConfig:
         length_guidance=row.get("length_guidance", ""),
         validation_rules=row.get("validation_rules") or {},
         ui_config=row.get("ui_config") or {},
+        review_mode=row.get("review_mode") or "",
     )
 
 
@@ -52,10 +56,17 @@ class StorageService:
             config.supabase_url,
             config.supabase_key,
         )
+        install_deadline_timeouts(
+            getattr(self._client.postgrest, "session", None), self._timeout,
+        )
+
+    def _run(self, func: Callable[..., _T], *args) -> Awaitable[_T]:
+        """Run a blocking supabase-py call on the dedicated Supabase executor."""
+        return run_blocking(SUPABASE, func, *args)
 
     async def _with_timeout(self, coro: Awaitable[_T]) -> _T:
         """Wrap an awaitable with the configured service timeout."""
-        async with asyncio.timeout(self._timeout):
+        async with deadline(self._timeout):
             return await coro
 
     # --- Patterns ---
@@ -71,7 +82,7 @@ class StorageService:
             if confidence:
                 query = query.eq("confidence", confidence)
             query = query.order("date_updated", desc=True)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_patterns failed: %s", type(e).__name__)
@@ -91,17 +102,19 @@ class StorageService:
             or content_type_slug in (p.get("applicable_content_types") or [])
         ]
 
+    @bumps_write_generation
     async def upsert_pattern(self, pattern: dict) -> dict:
         try:
             data = {**pattern, "user_id": self.user_id}
             query = self._client.table("patterns").upsert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase upsert_pattern failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def bulk_upsert_patterns(
         self, patterns: list[dict], chunk_size: int | None = None
     ) -> dict:
@@ -115,7 +128,7 @@ class StorageService:
                 p.setdefault("user_id", self.user_id)
             try:
                 result = await self._with_timeout(
-                    asyncio.to_thread(
+                    self._run(
                         self._client.table("patterns").upsert(chunk).execute
                     )
                 )
@@ -129,12 +142,13 @@ class StorageService:
                 errors += len(chunk)
         return {"inserted": inserted, "errors": errors}
 
+    @bumps_write_generation
     async def insert_pattern(self, pattern: dict) -> dict:
         """Insert a new pattern. Raises on duplicate name (DB UNIQUE constraint)."""
         try:
             data = {**pattern, "user_id": self.user_id}
             query = self._client.table("patterns").insert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase insert_pattern failed: %s", type(e).__name__)
@@ -151,7 +165,7 @@ class StorageService:
                 .ilike("name", name)
                 .limit(1)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else None
         except Exception as e:
             logger.warning("Supabase get_pattern_by_name failed: %s", type(e).__name__)
@@ -168,7 +182,7 @@ class StorageService:
             Pattern row or None if not found.
         """
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("patterns")
                 .select("*")
                 .eq("user_id", self.user_id)
@@ -181,12 +195,13 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return None
 
+    @bumps_write_generation
     async def reinforce_pattern(
         self, pattern_id: str, new_evidence: list[str] | None = None
     ) -> dict:
         """Atomically reinforce a pattern via DB RPC function."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.rpc(
                     "reinforce_pattern",
                     {
@@ -212,6 +227,7 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             raise ValueError("Failed to reinforce pattern") from e
 
+    @bumps_write_generation
     async def delete_pattern(self, pattern_id: str) -> bool:
         """Delete a pattern by ID."""
         try:
@@ -221,7 +237,7 @@ class StorageService:
                 .eq("id", pattern_id)
                 .eq("user_id", self.user_id)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return len(result.data) > 0
         except Exception as e:
             logger.warning("Supabase delete_pattern failed: %s", type(e).__name__)
@@ -230,11 +246,12 @@ class StorageService:
 
     # --- Experiences ---
 
+    @bumps_write_generation
     async def add_experience(self, experience: dict) -> dict:
         try:
             data = {**experience, "user_id": self.user_id}
             query = self._client.table("experiences").insert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase add_experience failed: %s", type(e).__name__)
@@ -250,13 +267,14 @@ class StorageService:
             if category:
                 query = query.eq("category", category)
             query = query.order("created_at", desc=True).limit(limit)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_experiences failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return []
 
+    @bumps_write_generation
     async def delete_experience(self, experience_id: str) -> bool:
         """Delete an experience by ID."""
         try:
@@ -266,7 +284,7 @@ class StorageService:
                 .eq("id", experience_id)
                 .eq("user_id", self.user_id)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return len(result.data) > 0
         except Exception as e:
             logger.warning("Supabase delete_experience failed: %s", type(e).__name__)
@@ -283,7 +301,7 @@ class StorageService:
             Experience row or None if not found.
         """
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("experiences")
                 .select("*")
                 .eq("user_id", self.user_id)
@@ -302,7 +320,7 @@ class StorageService:
         try:
             data = {**snapshot, "user_id": self.user_id}
             query = self._client.table("brain_health").insert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase add_health_snapshot failed: %s", type(e).__name__)
@@ -318,7 +336,7 @@ class StorageService:
                 .order("date", desc=True)
                 .limit(limit)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_health_history failed: %s", type(e).__name__)
@@ -332,7 +350,7 @@ class StorageService:
         try:
             data = {**event, "user_id": self.user_id}
             query = self._client.table("growth_log").insert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase add_growth_event failed: %s", type(e).__name__)
@@ -352,7 +370,7 @@ class StorageService:
             if event_type:
                 query = query.eq("event_type", event_type)
             query = query.gte("event_date", cutoff).order("event_date", desc=True)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_growth_events failed: %s", type(e).__name__)
@@ -370,7 +388,7 @@ class StorageService:
             query = self._client.table("growth_log").select("event_type")
             query = query.eq("user_id", self.user_id)
             query = query.gte("event_date", cutoff)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             counts: dict[str, int] = {}
             for e in result.data or []:
                 t = e.get("event_type", "unknown")
@@ -383,12 +401,13 @@ class StorageService:
 
     # --- Review History ---
 
+    @bumps_write_generation
     async def add_review_history(self, entry: dict) -> dict:
         """Record a review result for quality trending."""
         try:
             data = {**entry, "user_id": self.user_id}
             query = self._client.table("review_history").insert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase add_review_history failed: %s", type(e).__name__)
@@ -407,7 +426,7 @@ class StorageService:
             if content_type:
                 query = query.eq("content_type", content_type)
             query = query.order("review_date", desc=True).limit(limit)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_review_history failed: %s", type(e).__name__)
@@ -421,7 +440,7 @@ class StorageService:
         try:
             data = {**transition, "user_id": self.user_id}
             query = self._client.table("confidence_history").insert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase add_confidence_transition failed: %s", type(e).__name__)
@@ -440,7 +459,7 @@ class StorageService:
             if pattern_name:
                 query = query.eq("pattern_name", pattern_name)
             query = query.order("transition_date", desc=True).limit(limit)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_confidence_history failed: %s", type(e).__name__)
@@ -460,24 +479,26 @@ class StorageService:
             query = query.eq("category", category)
             if subcategory:
                 query = query.eq("subcategory", subcategory)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_memory_content failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return []
 
+    @bumps_write_generation
     async def upsert_memory_content(self, content: dict) -> dict:
         try:
             data = {**content, "user_id": self.user_id}
             query = self._client.table("memory_content").upsert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase upsert_memory_content failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def bulk_upsert_memory_content(
         self, items: list[dict], chunk_size: int | None = None
     ) -> dict:
@@ -491,7 +512,7 @@ class StorageService:
                 item.setdefault("user_id", self.user_id)
             try:
                 result = await self._with_timeout(
-                    asyncio.to_thread(
+                    self._run(
                         self._client.table("memory_content").upsert(chunk).execute
                     )
                 )
@@ -505,6 +526,7 @@ class StorageService:
                 errors += len(chunk)
         return {"inserted": inserted, "errors": errors}
 
+    @bumps_write_generation
     async def delete_memory_content(
         self, category: str, subcategory: str = "general"
     ) -> bool:
@@ -518,7 +540,7 @@ class StorageService:
             True if found and deleted, False otherwise.
         """
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("memory_content")
                 .delete()
                 .eq("category", category)
@@ -547,26 +569,28 @@ class StorageService:
             if content_type:
                 query = query.eq("content_type", content_type)
             query = query.order("created_at", desc=True)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_examples failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return []
 
+    @bumps_write_generation
     async def upsert_example(self, example: dict) -> dict:
         try:
             data = {**example, "user_id": self.user_id}
             query = self._client.table("examples").upsert(
                 data, on_conflict="content_type,source_file"
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase upsert_example failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def bulk_upsert_examples(
         self, examples: list[dict], chunk_size: int | None = None
     ) -> dict:
@@ -580,7 +604,7 @@ class StorageService:
                 item.setdefault("user_id", self.user_id)
             try:
                 result = await self._with_timeout(
-                    asyncio.to_thread(
+                    self._run(
                         self._client.table("examples").upsert(
                             chunk, on_conflict="content_type,source_file"
                         ).execute
@@ -596,6 +620,7 @@ class StorageService:
                 errors += len(chunk)
         return {"inserted": inserted, "errors": errors}
 
+    @bumps_write_generation
     async def delete_example(self, example_id: str) -> bool:
         """Delete an example by ID."""
         try:
@@ -605,7 +630,7 @@ class StorageService:
                 .eq("id", example_id)
                 .eq("user_id", self.user_id)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return len(result.data) > 0
         except Exception as e:
             logger.warning("Supabase delete_example failed: %s", type(e).__name__)
@@ -632,7 +657,7 @@ class StorageService:
                 query = query.eq("content_type", content_type)
             if tags:
                 query = query.contains("tags", tags)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data or []
         except Exception as e:
             logger.warning("Supabase get_templates failed: %s", type(e).__name__)
@@ -642,7 +667,7 @@ class StorageService:
     async def get_template(self, template_id: str) -> dict | None:
         """Get a single template by ID."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("templates")
                 .select("*")
                 .eq("user_id", self.user_id)
@@ -656,22 +681,24 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return None
 
+    @bumps_write_generation
     async def upsert_template(self, template: dict) -> dict:
         """Create or update a template."""
         try:
             data = {**template, "user_id": self.user_id}
             query = self._client.table("templates").upsert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase upsert_template failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def delete_template(self, template_id: str) -> bool:
         """Soft-delete a template by setting is_active=False."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("templates")
                 .update({"is_active": False})
                 .eq("id", template_id)
@@ -695,24 +722,26 @@ class StorageService:
             if category:
                 query = query.eq("category", category)
             query = query.order("created_at", desc=True)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_knowledge failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return []
 
+    @bumps_write_generation
     async def upsert_knowledge(self, knowledge: dict) -> dict:
         try:
             data = {**knowledge, "user_id": self.user_id}
             query = self._client.table("knowledge_repo").upsert(data)
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase upsert_knowledge failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def bulk_upsert_knowledge(
         self, items: list[dict], chunk_size: int | None = None
     ) -> dict:
@@ -726,7 +755,7 @@ class StorageService:
                 item.setdefault("user_id", self.user_id)
             try:
                 result = await self._with_timeout(
-                    asyncio.to_thread(
+                    self._run(
                         self._client.table("knowledge_repo").upsert(chunk).execute
                     )
                 )
@@ -740,6 +769,7 @@ class StorageService:
                 errors += len(chunk)
         return {"inserted": inserted, "errors": errors}
 
+    @bumps_write_generation
     async def delete_knowledge(self, knowledge_id: str) -> bool:
         """Delete a knowledge entry by ID."""
         try:
@@ -749,7 +779,7 @@ class StorageService:
                 .eq("id", knowledge_id)
                 .eq("user_id", self.user_id)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return len(result.data) > 0
         except Exception as e:
             logger.warning("Supabase delete_knowledge failed: %s", type(e).__name__)
@@ -766,7 +796,7 @@ class StorageService:
                 .select("*")
                 .order("name")
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data
         except Exception as e:
             logger.warning("Supabase get_content_types failed: %s", type(e).__name__)
@@ -782,13 +812,14 @@ class StorageService:
                 .eq("slug", slug)
                 .limit(1)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else None
         except Exception as e:
             logger.warning("Supabase get_content_type_by_slug failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return None
 
+    @bumps_write_generation
     async def upsert_content_type(self, content_type: dict) -> dict:
         """Create or update a content type. Uses slug as the conflict key."""
         try:
@@ -796,13 +827,14 @@ class StorageService:
                 self._client.table("content_types")
                 .upsert(content_type, on_conflict="slug")
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return result.data[0] if result.data else {}
         except Exception as e:
             logger.warning("Supabase upsert_content_type failed: %s", type(e).__name__)
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def delete_content_type(self, slug: str) -> bool:
         """Delete a custom content type by slug. Built-in types cannot be deleted."""
         try:
@@ -812,7 +844,7 @@ class StorageService:
                 .eq("slug", slug)
                 .eq("is_builtin", False)
             )
-            result = await asyncio.to_thread(query.execute)
+            result = await self._run(query.execute)
             return len(result.data) > 0
         except Exception as e:
             logger.warning("Supabase delete_content_type failed: %s", type(e).__name__)
@@ -846,7 +878,7 @@ class StorageService:
 
         try:
             result = await self._with_timeout(
-                asyncio.to_thread(
+                self._run(
                     self._client.rpc(
                         "vector_search",
                         {
@@ -905,7 +937,7 @@ class StorageService:
 
         try:
             result = await self._with_timeout(
-                asyncio.to_thread(
+                self._run(
                     self._client.rpc(
                         "hybrid_search",
                         {
@@ -1001,11 +1033,12 @@ class StorageService:
 
     # --- Project Lifecycle ---
 
+    @bumps_write_generation
     async def create_project(self, project: dict) -> dict:
         """Create a new project with lifecycle tracking."""
         try:
             data = {**project, "user_id": self.user_id}
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("projects").insert(data).execute
             )
             return result.data[0] if result.data else {}
@@ -1017,7 +1050,7 @@ class StorageService:
     async def get_project(self, project_id: str) -> dict | None:
         """Get a project by ID with its artifacts."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("projects")
                 .select("*, project_artifacts(*)")
                 .eq("user_id", self.user_id)
@@ -1041,7 +1074,7 @@ class StorageService:
                 query = query.eq("lifecycle_stage", lifecycle_stage)
             if category:
                 query = query.eq("category", category)
-            result = await asyncio.to_thread(
+            result = await self._run(
                 query.order("updated_at", desc=True).limit(limit).execute
             )
             return result.data if result.data else []
@@ -1050,6 +1083,7 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return []
 
+    @bumps_write_generation
     async def update_project_stage(self, project_id: str, stage: str, **kwargs) -> dict:
         """Update project lifecycle stage and optional fields."""
         try:
@@ -1060,7 +1094,7 @@ class StorageService:
             update_data.update(kwargs)
             if stage == "complete":
                 update_data["completed_at"] = datetime.now(timezone.utc).isoformat()
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("projects")
                 .update(update_data)
                 .eq("id", project_id)
@@ -1073,6 +1107,7 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return {}
 
+    @bumps_write_generation
     async def update_project(self, project_id: str, fields: dict) -> dict | None:
         """Update arbitrary project fields by ID.
 
@@ -1084,7 +1119,7 @@ class StorageService:
             Updated project row or None if not found.
         """
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("projects")
                 .update(fields)
                 .eq("id", project_id)
@@ -1097,6 +1132,7 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return None
 
+    @bumps_write_generation
     async def delete_project(self, project_id: str) -> bool:
         """Delete a project by ID. Associated artifacts are cascade-deleted by the DB.
 
@@ -1107,7 +1143,7 @@ class StorageService:
             True if project was found and deleted, False otherwise.
         """
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("projects")
                 .delete()
                 .eq("id", project_id)
@@ -1120,10 +1156,11 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return False
 
+    @bumps_write_generation
     async def add_project_artifact(self, artifact: dict) -> dict:
         """Add or update an artifact for a project (upsert by project_id + artifact_type)."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("project_artifacts")
                 .upsert(artifact, on_conflict="project_id,artifact_type")
                 .execute
@@ -1137,7 +1174,7 @@ class StorageService:
     async def get_project_artifacts(self, project_id: str) -> list[dict]:
         """Get all artifacts for a project."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("project_artifacts")
                 .select("*")
                 .eq("project_id", project_id)
@@ -1150,6 +1187,7 @@ class StorageService:
             logger.debug("Supabase error detail: %s", e)
             return []
 
+    @bumps_write_generation
     async def delete_project_artifact(self, artifact_id: str) -> bool:
         """Delete a single project artifact by ID.
 
@@ -1164,7 +1202,7 @@ class StorageService:
         """
         try:
             # Fetch artifact to get project_id
-            artifact = await asyncio.to_thread(
+            artifact = await self._run(
                 self._client.table("project_artifacts")
                 .select("id, project_id")
                 .eq("id", artifact_id)
@@ -1174,7 +1212,7 @@ class StorageService:
                 return False
             project_id = artifact.data[0]["project_id"]
             # Verify project ownership
-            project = await asyncio.to_thread(
+            project = await self._run(
                 self._client.table("projects")
                 .select("id")
                 .eq("id", project_id)
@@ -1184,7 +1222,7 @@ class StorageService:
             if not project.data:
                 return False
             # Now safe to delete
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("project_artifacts")
                 .delete()
                 .eq("id", artifact_id)
@@ -1198,13 +1236,14 @@ class StorageService:
 
     # --- Pattern Registry & Downgrade ---
 
+    @bumps_write_generation
     async def update_pattern_failures(self, pattern_id: str, reset: bool = False) -> dict:
         """Increment or reset consecutive_failures on a pattern."""
         try:
             if reset:
                 update_data = {"consecutive_failures": 0}
             else:
-                current = await asyncio.to_thread(
+                current = await self._run(
                     self._client.table("patterns")
                     .select("consecutive_failures")
                     .eq("id", pattern_id)
@@ -1212,7 +1251,7 @@ class StorageService:
                 )
                 current_val = current.data[0].get("consecutive_failures", 0) if current.data else 0
                 update_data = {"consecutive_failures": current_val + 1}
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("patterns")
                 .update(update_data)
                 .eq("id", pattern_id)
@@ -1227,7 +1266,7 @@ class StorageService:
     async def get_pattern_registry(self) -> list[dict]:
         """Get all patterns formatted for registry view."""
         try:
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("patterns")
                 .select("name, topic, confidence, use_count, date_added, date_updated, "
                         "consecutive_failures, applicable_content_types")
@@ -1245,7 +1284,7 @@ class StorageService:
     async def downgrade_pattern_confidence(self, pattern_id: str) -> dict:
         """Downgrade a pattern's confidence level (HIGH->MEDIUM, MEDIUM->LOW)."""
         try:
-            current = await asyncio.to_thread(
+            current = await self._run(
                 self._client.table("patterns")
                 .select("name, confidence, consecutive_failures")
                 .eq("id", pattern_id)
@@ -1258,7 +1297,7 @@ class StorageService:
             new_conf = "MEDIUM" if conf == "HIGH" else "LOW" if conf == "MEDIUM" else "LOW"
             if new_conf == conf:
                 return pattern  # Already at LOW, can't downgrade further
-            result = await asyncio.to_thread(
+            result = await self._run(
                 self._client.table("patterns")
                 .update({"confidence": new_conf, "consecutive_failures": 0})
                 .eq("id", pattern_id)
@@ -1276,7 +1315,7 @@ class StorageService:
         """Get quality metrics trending data for the specified period."""
         try:
             result = await self._with_timeout(
-                asyncio.to_thread(
+                self._run(
                     self._client.table("review_history")
                     .select("*")
                     .gte("review_date", (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat())
@@ -1355,19 +1394,19 @@ class StorageService:
                           "values-beliefs", "personal"}
         try:
             result, pattern_result, example_result = await asyncio.gather(
-                asyncio.to_thread(
+                self._run(
                     self._client.table("memory_content")
                     .select("category, subcategory")
                     .eq("user_id", self.user_id)
                     .execute
                 ),
-                asyncio.to_thread(
+                self._run(
                     self._client.table("patterns")
                     .select("id", count="exact")
                     .eq("user_id", self.user_id)
                     .execute
                 ),
-                asyncio.to_thread(
+                self._run(
                     self._client.table("examples")
                     .select("id", count="exact")
                     .eq("user_id", self.user_id)
@@ -4,11 +4,63 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from second_brain.services.deadlines import deadline
+
 if TYPE_CHECKING:
     from second_brain.config import BrainConfig
 
 logger = logging.getLogger(__name__)
 
+# Rough chars-per-token ratio for Voyage tokenizers (English prose)
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for batching — no tokenizer round trip."""
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def token_batches(
+    texts: list[str], max_items: int, max_tokens: int,
+) -> list[list[int]]:
+    """Group input indices into batches bounded by item count and estimated tokens.
+
+    An input that alone exceeds `max_tokens` gets a batch of its own
+    (Voyage truncates oversized inputs rather than rejecting them).
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (
+            len(current) >= max_items or current_tokens + tokens > max_tokens
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def load_data_uri_image(uri: str):
+    """Decode a base64 image (data URI or bare base64) into a loaded PIL image.
+
+    CPU-bound — run it on the media executor, not the event loop.
+    Raises ImportError if Pillow is not installed.
+    """
+    import base64
+    from io import BytesIO
+
+    from PIL import Image
+
+    b64_data = uri.split(",", 1)[1] if "," in uri else uri
+    img = Image.open(BytesIO(base64.b64decode(b64_data)))
+    img.load()
+    return img
+
 
 class VoyageService:
     """Voyage AI embeddings + reranking via voyageai Python SDK.
@@ -34,12 +86,19 @@ class VoyageService:
                     "Set it in .env or pass via config."
                 )
             import voyageai
-            self._client = voyageai.Client(api_key=self.config.voyage_api_key)
+            self._client = voyageai.Client(
+                api_key=self.config.voyage_api_key, timeout=self._timeout,
+            )
         return self._client
 
+    async def warm_up(self) -> None:
+        """Import the SDK and build the client off the event loop, before first use."""
+        from second_brain.services.executors import VOYAGE, run_blocking
+        await run_blocking(VOYAGE, self._get_client)
+
     async def embed(self, text: str) -> list[float]:
         """Generate embedding for a single text string."""
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import VOYAGE_RETRY_CONFIG, async_retry
         client = self._get_client()
 
         def _call():
@@ -51,15 +110,15 @@ class VoyageService:
             return result.embeddings[0]
 
         try:
-            async with asyncio.timeout(self._timeout):
-                return await async_retry(_call)
+            async with deadline(self._timeout):
+                return await async_retry(_call, config=VOYAGE_RETRY_CONFIG)
         except TimeoutError:
             logger.warning("VoyageService.embed timed out after %ds", self._timeout)
             return []
 
     async def embed_query(self, text: str) -> list[float]:
         """Generate embedding for a search query (uses input_type='query')."""
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import VOYAGE_RETRY_CONFIG, async_retry
         client = self._get_client()
 
         def _call():
@@ -71,45 +130,94 @@ class VoyageService:
             return result.embeddings[0]
 
         try:
-            async with asyncio.timeout(self._timeout):
-                return await async_retry(_call)
+            async with deadline(self._timeout):
+                return await async_retry(_call, config=VOYAGE_RETRY_CONFIG)
         except TimeoutError:
             logger.warning("VoyageService.embed_query timed out after %ds", self._timeout)
             return []
 
     async def embed_batch(
         self, texts: list[str], input_type: str = "document"
-    ) -> list[list[float]]:
+    ) -> list[list[float] | None]:
         """Generate embeddings for a batch of texts.
 
-        Respects Voyage batch limit of 128 items per request.
+        Inputs are packed into requests bounded by both the Voyage 128-item
+        limit and `voyage_batch_max_tokens` (estimated), dispatched up to
+        `voyage_batch_concurrency` at a time, each under its own timeout.
+        Failed requests are retried (`voyage_batch_retries` rounds) without
+        re-sending the ones that succeeded.
+
+        Returns:
+            One entry per input, in input order. Items whose request still
+            failed after retries are None.
         """
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import VOYAGE_RETRY_CONFIG, async_retry
         client = self._get_client()
-        batch_size = min(self.config.embedding_batch_size, 128)
-        all_embeddings: list[list[float]] = []
-
-        try:
-            async with asyncio.timeout(self._timeout):
-                for i in range(0, len(texts), batch_size):
-                    batch = texts[i:i + batch_size]
-
-                    def _call(b=batch):
-                        inputs = [[t] for t in b]
-                        result = client.multimodal_embed(
-                            inputs,
-                            model=self._embed_model,
-                            input_type=input_type,
-                        )
-                        return result.embeddings
-
-                    embeddings = await async_retry(_call)
-                    all_embeddings.extend(embeddings)
-        except TimeoutError:
-            logger.warning("VoyageService.embed_batch timed out after %ds", self._timeout)
-            return []
-
-        return all_embeddings
+        results: list[list[float] | None] = [None] * len(texts)
+        if not texts:
+            return results
+
+        batches = token_batches(
+            texts,
+            max_items=min(self.config.embedding_batch_size, 128),
+            max_tokens=self.config.voyage_batch_max_tokens,
+        )
+        semaphore = asyncio.Semaphore(self.config.voyage_batch_concurrency)
+
+        async def _run(indices: list[int]) -> bool:
+            def _call():
+                result = client.multimodal_embed(
+                    [[texts[i]] for i in indices],
+                    model=self._embed_model,
+                    input_type=input_type,
+                )
+                return result.embeddings
+
+            async with semaphore:
+                try:
+                    async with deadline(self._timeout):
+                        embeddings = await async_retry(_call, config=VOYAGE_RETRY_CONFIG)
+                except TimeoutError:
+                    logger.warning(
+                        "VoyageService.embed_batch request of %d items timed out after %ds",
+                        len(indices), self._timeout,
+                    )
+                    return False
+                except Exception as e:
+                    logger.warning(
+                        "VoyageService.embed_batch request of %d items failed: %s",
+                        len(indices), type(e).__name__,
+                    )
+                    logger.debug("Voyage embed_batch error detail: %s", e)
+                    return False
+            if len(embeddings) != len(indices):
+                logger.warning(
+                    "VoyageService.embed_batch got %d embeddings for %d inputs",
+                    len(embeddings), len(indices),
+                )
+                return False
+            for i, emb in zip(indices, embeddings):
+                results[i] = emb
+            return True
+
+        pending = batches
+        for attempt in range(self.config.voyage_batch_retries + 1):
+            if attempt:
+                logger.info(
+                    "VoyageService.embed_batch retrying %d failed request(s)", len(pending),
+                )
+            outcomes = await asyncio.gather(*(_run(b) for b in pending))
+            pending = [b for b, ok in zip(pending, outcomes) if not ok]
+            if not pending:
+                break
+
+        if pending:
+            failed = sum(len(b) for b in pending)
+            logger.warning(
+                "VoyageService.embed_batch: %d/%d inputs failed after retries",
+                failed, len(texts),
+            )
+        return results
 
     async def multimodal_embed(
         self,
@@ -128,7 +236,7 @@ class VoyageService:
         Returns:
             List of embedding vectors (one per input sequence).
         """
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import VOYAGE_RETRY_CONFIG, async_retry
         client = self._get_client()
 
         def _call():
@@ -140,8 +248,8 @@ class VoyageService:
             return result.embeddings
 
         try:
-            async with asyncio.timeout(self._timeout):
-                return await async_retry(_call)
+            async with deadline(self._timeout):
+                return await async_retry(_call, config=VOYAGE_RETRY_CONFIG)
         except TimeoutError:
             logger.warning("VoyageService.multimodal_embed timed out after %ds", self._timeout)
             return []
@@ -166,7 +274,7 @@ class VoyageService:
         if not documents:
             return []
 
-        from second_brain.services.retry import async_retry
+        from second_brain.services.retry import VOYAGE_RETRY_CONFIG, async_retry
         client = self._get_client()
         k = top_k or self.config.voyage_rerank_top_k
 
@@ -187,8 +295,8 @@ class VoyageService:
             ]
 
         try:
-            async with asyncio.timeout(self._timeout):
-                return await async_retry(_call)
+            async with deadline(self._timeout):
+                return await async_retry(_call, config=VOYAGE_RETRY_CONFIG)
         except TimeoutError:
             logger.warning("VoyageService.rerank timed out after %ds", self._timeout)
             return []
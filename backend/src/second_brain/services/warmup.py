@@ -0,0 +1,128 @@
+"""Background warm-up of backend services.
+
+Services connect lazily, so without warm-up the first request pays for
+Graphiti index builds, SDK imports, TLS handshakes and cache fills. At
+startup `start_warmup()` runs every backend's warm-up step concurrently in
+a background task and records per-service readiness:
+
+    pending -> warming -> ready | failed
+
+Services that are not configured are reported as "disabled". Failures are
+logged and leave the service to initialize lazily on first use, as before.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from second_brain.deps import BrainDeps
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+DISABLED = "disabled"
+
+
+class WarmupState:
+    """Per-service readiness, updated by the warm-up task."""
+
+    def __init__(self) -> None:
+        self.services: dict[str, dict] = {}
+        self.task: asyncio.Task | None = None
+
+    def set(self, name: str, status: str, **extra) -> None:
+        self.services[name] = {"status": status, **extra}
+
+    @property
+    def done(self) -> bool:
+        if self.task is not None and not self.task.done():
+            return False
+        return all(s["status"] not in (PENDING, WARMING) for s in self.services.values())
+
+    def snapshot(self) -> dict:
+        return {name: dict(info) for name, info in self.services.items()}
+
+
+def _warmup_steps(
+    deps: "BrainDeps", prewarm_caches: bool,
+) -> dict[str, Callable[[], Awaitable[object]] | None]:
+    """Warm-up coroutine per service; None marks a service that is not configured."""
+    storage = deps.storage_service
+
+    async def _storage():
+        # First query opens the Supabase connection pool; content types are cached
+        await deps.get_content_type_registry().get_all()
+
+    async def _caches():
+        await asyncio.gather(
+            storage.get_pattern_registry(),
+            storage.get_memory_content("style-voice"),
+        )
+
+    async def _graphiti():
+        if not await deps.graphiti_service.warm_up():
+            raise RuntimeError("Graphiti unavailable")
+
+    return {
+        "memory": deps.memory_service.get_memory_count,
+        "storage": _storage,
+        "caches": _caches if prewarm_caches else None,
+        "graphiti": _graphiti if deps.graphiti_service else None,
+        "voyage": deps.voyage_service.warm_up if deps.voyage_service else None,
+    }
+
+
+async def _warm_one(
+    state: WarmupState, name: str, step: Callable[[], Awaitable[object]], timeout: float,
+) -> None:
+    state.set(name, WARMING)
+    start = time.monotonic()
+    try:
+        async with asyncio.timeout(timeout):
+            await step()
+    except TimeoutError:
+        state.set(name, FAILED, seconds=round(time.monotonic() - start, 3), error="TimeoutError")
+        logger.warning("Warm-up of %s timed out after %ds", name, timeout)
+    except Exception as e:
+        state.set(name, FAILED, seconds=round(time.monotonic() - start, 3), error=type(e).__name__)
+        logger.warning("Warm-up of %s failed: %s", name, type(e).__name__)
+        logger.debug("Warm-up %s error detail: %s", name, e)
+    else:
+        state.set(name, READY, seconds=round(time.monotonic() - start, 3))
+
+
+async def warm_up(
+    deps: "BrainDeps",
+    state: WarmupState | None = None,
+    prewarm_caches: bool = True,
+    timeout: float = 60,
+) -> WarmupState:
+    """Warm every configured service concurrently. Never raises."""
+    state = state or WarmupState()
+    steps = _warmup_steps(deps, prewarm_caches)
+    for name, step in steps.items():
+        state.set(name, PENDING if step else DISABLED)
+    start = time.monotonic()
+    await asyncio.gather(*(
+        _warm_one(state, name, step, timeout) for name, step in steps.items() if step
+    ))
+    logger.info("Service warm-up finished in %.1fs", time.monotonic() - start)
+    return state
+
+
+def start_warmup(deps: "BrainDeps") -> WarmupState:
+    """Schedule warm_up() in the background on the running loop."""
+    config = deps.config
+    state = WarmupState()
+    state.task = asyncio.create_task(warm_up(
+        deps, state,
+        prewarm_caches=config.warmup_prewarm_caches,
+        timeout=config.warmup_timeout_seconds,
+    ))
+    return state
@@ -0,0 +1,46 @@
+"""Process-wide brain write generation.
+
+Every write that can change what agents read — memories, patterns,
+experiences, memory content, examples, templates, knowledge, content
+types, projects and their artifacts, review history, graph episodes —
+bumps one counter. Caches of answers derived from brain content
+(agents.answer_cache, agents.tool_memo) remember the generation they were
+computed at and treat anything older as stale. Health snapshots, growth
+events and confidence transitions do not bump: only health reporting
+reads them.
+
+The counter is per process: a write through the MCP server does not bump
+the API's generation, so such caches also keep a TTL.
+"""
+
+import functools
+import threading
+
+_lock = threading.Lock()
+_generation = 0
+
+
+def write_generation() -> int:
+    """The current generation; changes after every brain write."""
+    return _generation
+
+
+def bump_write_generation() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+
+
+def bumps_write_generation(func):
+    """Bump the write generation once the wrapped async write returns or fails.
+
+    Failed writes bump too: a partial write may still have landed.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            bump_write_generation()
+
+    return wrapper
@@ -0,0 +1,4 @@
+-- 024: Add review_mode column to content_types table
+-- '' = REVIEW_MODE config, 'parallel' = one LLM call per dimension,
+-- 'batched' = all dimensions in one call, 'auto' = batched for short drafts
+ALTER TABLE content_types ADD COLUMN IF NOT EXISTS review_mode TEXT DEFAULT '';
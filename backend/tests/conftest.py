@@ -22,6 +22,22 @@ def single_user_default(monkeypatch):
     if "ALLOWED_USER_IDS" not in os.environ:
         monkeypatch.setenv("ALLOWED_USER_IDS", "testuser")
 
+@pytest.fixture(autouse=True)
+def fresh_retry_budgets():
+    """Give every test full retry budgets (they are process-wide by design)."""
+    from second_brain.services.retry import reset_retry_budgets
+    reset_retry_budgets()
+    yield
+    reset_retry_budgets()
+
+@pytest.fixture(autouse=True)
+def fresh_model_registry():
+    """Build models from scratch in every test (the registry is process-wide by design)."""
+    from second_brain.models import clear_model_registry
+    clear_model_registry()
+    yield
+    clear_model_registry()
+
 # ---------------------------------------------------------------------------
 # FastMCP 2.x compatibility: @server.tool() returns FunctionTool objects that
 # are not directly callable. Patch __call__ to delegate to the wrapped .fn so
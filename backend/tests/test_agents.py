@@ -931,6 +931,107 @@ class TestReviewAgent:
         from second_brain.agents.review import run_full_review
         assert callable(run_full_review)
 
+    async def test_run_full_review_shares_one_context_load(self, mock_deps):
+        """One brain-context load per review; each dimension is a single tool-free model call."""
+        from pydantic_ai.messages import ModelResponse, ToolCallPart
+        from pydantic_ai.models.function import FunctionModel
+
+        from second_brain.agents.review import run_full_review
+
+        storage = mock_deps.storage_service
+        storage.get_memory_content = AsyncMock(return_value=[{"title": "Voice", "content": "Plain and direct."}])
+        storage.get_examples = AsyncMock(return_value=[{"title": "Best post", "content": "Benchmark."}])
+        storage.add_review_history = AsyncMock()
+        calls = []
+
+        def model(messages, info):
+            calls.append(messages[-1].instructions)
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {
+                "dimension": "x", "score": 8, "status": "pass", "strengths": ["clear"],
+            })])
+
+        result = await run_full_review("Some content to review", mock_deps, FunctionModel(model), "linkedin")
+
+        assert len(result.scores) == len(calls) == 6
+        assert all("## BRAIN CONTEXT PACK" in c and "Plain and direct." in c for c in calls)
+        # voice + company/personal/customers, once for the whole review
+        assert storage.get_memory_content.await_count == 4
+        storage.get_examples.assert_awaited_once_with(content_type="linkedin", override_user_id=None)
+        mock_deps.memory_service.search.assert_awaited_once()
+
+    async def test_run_full_review_batched_is_one_call(self, mock_deps):
+        from pydantic_ai.messages import ModelResponse, ToolCallPart
+        from pydantic_ai.models.function import FunctionModel
+
+        from second_brain.agents.review import run_full_review
+        from second_brain.schemas import REVIEW_DIMENSIONS
+
+        mock_deps.storage_service.add_review_history = AsyncMock()
+        prompts = []
+
+        def model(messages, info):
+            prompts.append(messages[-1].parts[-1].content)
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"scores": [
+                {"dimension": d["name"].upper(), "score": 8, "status": "pass", "strengths": ["clear"]}
+                for d in REVIEW_DIMENSIONS
+            ]})])
+
+        result = await run_full_review("Short post", mock_deps, FunctionModel(model), mode="batched")
+
+        assert len(prompts) == 1
+        assert all(f"**{d['name']}**" in prompts[0] for d in REVIEW_DIMENSIONS)
+        assert [s.dimension for s in result.scores] == [d["name"] for d in REVIEW_DIMENSIONS]
+        assert result.overall_score == 8.0
+        assert result.review_mode == "batched"
+
+    async def test_run_full_review_batched_scores_skipped_dimensions_separately(self, mock_deps):
+        from pydantic_ai.messages import ModelResponse, ToolCallPart
+        from pydantic_ai.models.function import FunctionModel
+
+        from unittest.mock import patch
+
+        from second_brain.agents.review import run_full_review
+        from second_brain.schemas import ReviewDimensionConfig
+
+        mock_deps.storage_service.add_review_history = AsyncMock()
+        calls = []
+
+        def model(messages, info):
+            calls.append(info.output_tools[0].name)
+            if "Review the following content for the" in messages[-1].parts[-1].content:
+                args = {"dimension": "Quality", "score": 4, "status": "issue", "issues": ["typos"]}
+            else:
+                args = {"scores": [
+                    {"dimension": "Messaging", "score": 9, "status": "pass", "strengths": ["sharp"]},
+                ]}
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, args)])
+
+        type_config = MagicMock(review_mode="", review_dimensions=[
+            ReviewDimensionConfig(name="Messaging"), ReviewDimensionConfig(name="Quality"),
+        ])
+        with patch.object(mock_deps.get_content_type_registry(), "get", AsyncMock(return_value=type_config)):
+            result = await run_full_review(
+                "Short post", mock_deps, FunctionModel(model), "linkedin", mode="batched",
+            )
+
+        assert len(calls) == 2
+        assert [(s.dimension, s.score) for s in result.scores] == [("Messaging", 9), ("Quality", 4)]
+
+    def test_resolve_review_mode(self, mock_deps):
+        from second_brain.agents.review import resolve_review_mode
+
+        short, long = "word " * 50, "word " * 5000
+        assert resolve_review_mode(short, mock_deps) == "parallel"
+        assert resolve_review_mode(short, mock_deps, mode="batched") == "batched"
+
+        type_config = MagicMock(review_mode="batched")
+        assert resolve_review_mode(long, mock_deps, type_config) == "batched"
+        assert resolve_review_mode(long, mock_deps, type_config, mode="parallel") == "parallel"
+
+        mock_deps.config.review_mode = "auto"
+        assert resolve_review_mode(short, mock_deps) == "batched"
+        assert resolve_review_mode(long, mock_deps) == "parallel"
+
 
 class TestGrowthEventRecording:
     """Test that learn agent tools record growth events."""
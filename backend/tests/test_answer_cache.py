@@ -0,0 +1,142 @@
+"""Tests for the semantic ask answer cache and the brain write generation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from second_brain.agents.answer_cache import (
+    answer_cache_stats,
+    clear_answer_cache,
+    lookup_answer,
+    store_answer,
+)
+from second_brain.schemas import AskResult
+from second_brain.services.write_generation import (
+    bump_write_generation,
+    bumps_write_generation,
+    write_generation,
+)
+
+VECTORS = {
+    "What is our pricing strategy?": [1.0, 0.0, 0.0],
+    "what's our pricing strategy": [0.99, 0.05, 0.0],
+    "Who are our customers?": [0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_answer_cache()
+    yield
+    clear_answer_cache()
+
+
+@pytest.fixture
+def cache_deps(mock_deps):
+    mock_deps.config.answer_cache_enabled = True
+    mock_deps.embedding_service.embed_query = AsyncMock(side_effect=lambda q: VECTORS[q])
+    return mock_deps
+
+
+async def _remember(deps, question: str, answer: str) -> None:
+    lookup = await lookup_answer(deps, question)
+    store_answer(deps, lookup, AskResult(answer=answer))
+
+
+class TestAnswerCache:
+    async def test_similar_question_hits(self, cache_deps):
+        await _remember(cache_deps, "What is our pricing strategy?", "Value-based.")
+
+        lookup = await lookup_answer(cache_deps, "what's our pricing strategy")
+
+        assert lookup.answer.answer == "Value-based."
+        assert lookup.similarity > 0.95
+        assert lookup.response_fields()["cached"] is True
+        assert answer_cache_stats()["hits"] == 1
+
+    async def test_different_question_misses(self, cache_deps):
+        await _remember(cache_deps, "What is our pricing strategy?", "Value-based.")
+
+        lookup = await lookup_answer(cache_deps, "Who are our customers?")
+
+        assert lookup.answer is None
+        assert lookup.response_fields() == {}
+
+    async def test_brain_write_invalidates(self, cache_deps):
+        await _remember(cache_deps, "What is our pricing strategy?", "Value-based.")
+        bump_write_generation()
+
+        lookup = await lookup_answer(cache_deps, "What is our pricing strategy?")
+
+        assert lookup.answer is None
+        assert answer_cache_stats()["invalidations"] == 1
+
+    async def test_answer_computed_across_a_write_is_not_stored(self, cache_deps):
+        lookup = await lookup_answer(cache_deps, "What is our pricing strategy?")
+        bump_write_generation()
+        store_answer(cache_deps, lookup, AskResult(answer="Stale"))
+
+        assert answer_cache_stats()["entries"] == 0
+
+    async def test_errors_are_not_stored(self, cache_deps):
+        lookup = await lookup_answer(cache_deps, "What is our pricing strategy?")
+        store_answer(cache_deps, lookup, AskResult(answer="", error="Memory unavailable"))
+
+        assert answer_cache_stats()["entries"] == 0
+
+    async def test_max_entries_drops_oldest(self, cache_deps):
+        cache_deps.config.answer_cache_max_entries = 1
+        await _remember(cache_deps, "What is our pricing strategy?", "Value-based.")
+        await _remember(cache_deps, "Who are our customers?", "Founders.")
+
+        assert (await lookup_answer(cache_deps, "What is our pricing strategy?")).answer is None
+        assert (await lookup_answer(cache_deps, "Who are our customers?")).answer.answer == "Founders."
+
+    async def test_disabled(self, mock_deps):
+        assert await lookup_answer(mock_deps, "What is our pricing strategy?") is None
+        mock_deps.embedding_service.embed_query.assert_not_called()
+
+    async def test_embedding_failure_skips_cache(self, cache_deps):
+        cache_deps.embedding_service.embed_query = AsyncMock(side_effect=RuntimeError("down"))
+        assert await lookup_answer(cache_deps, "What is our pricing strategy?") is None
+        assert answer_cache_stats()["errors"] == 1
+
+
+class TestWriteGeneration:
+    async def test_decorated_write_bumps(self):
+        @bumps_write_generation
+        async def write():
+            return "ok"
+
+        before = write_generation()
+        assert await write() == "ok"
+        assert write_generation() == before + 1
+
+    async def test_failed_write_bumps(self):
+        @bumps_write_generation
+        async def write():
+            raise ConnectionError("down")
+
+        before = write_generation()
+        with pytest.raises(ConnectionError):
+            await write()
+        assert write_generation() == before + 1
+
+    async def test_storage_writes_bump(self, brain_config):
+        from second_brain.services.storage import StorageService
+
+        storage = StorageService.__new__(StorageService)
+        storage.user_id = "ryan"
+        storage._client = MagicMock()
+        storage._run = AsyncMock(return_value=MagicMock(data=[{"id": "p1"}]))
+
+        before = write_generation()
+        await storage.upsert_pattern({"name": "Hook First"})
+        assert write_generation() == before + 1
+
+        before = write_generation()
+        await storage.upsert_content_type({"slug": "memo"})
+        await storage.create_project({"name": "Launch"})
+        await storage.update_project("p1", {"name": "Relaunch"})
+        await storage.add_project_artifact({"project_id": "p1", "artifact_type": "plan"})
+        assert write_generation() == before + 4
@@ -35,20 +35,14 @@ def mock_brain_config(tmp_path):
 def app(mock_brain_config):
     """Create test app with mocked deps."""
     application = create_app()
-    mock_deps = MagicMock(spec=BrainDeps)
-    mock_deps.config = mock_brain_config
-    mock_deps.memory_service = AsyncMock()
-    mock_deps.storage_service = AsyncMock()
-    mock_deps.embedding_service = AsyncMock()
-    mock_deps.voyage_service = AsyncMock()
-    mock_deps.graphiti_service = None
-    mock_deps.content_type_registry = MagicMock()
-    mock_deps.email_service = None
-    mock_deps.calendar_service = None
-    mock_deps.analytics_service = None
-    mock_deps.task_service = None
-    # get_content_type_registry returns the registry mock
-    mock_deps.get_content_type_registry.return_value = mock_deps.content_type_registry
+    mock_deps = BrainDeps(
+        config=mock_brain_config,
+        memory_service=AsyncMock(),
+        storage_service=AsyncMock(),
+        embedding_service=AsyncMock(),
+        voyage_service=AsyncMock(),
+        content_type_registry=MagicMock(),
+    )
     application.state.deps = mock_deps
     application.state.model = MagicMock()
     return application
@@ -94,6 +88,26 @@ class TestAskEndpoint:
         assert response.status_code == 200
         assert "answer" in response.json()
 
+    @patch("second_brain.api.routers.agents.ask_agent")
+    def test_repeated_question_served_from_answer_cache(self, mock_agent, app, client):
+        from second_brain.agents.answer_cache import clear_answer_cache
+        from second_brain.schemas import AskResult
+
+        clear_answer_cache()
+        app.state.deps.config.answer_cache_enabled = True
+        app.state.deps.embedding_service.embed_query = AsyncMock(return_value=[0.6, 0.8])
+        mock_agent.run = AsyncMock(return_value=MagicMock(output=AskResult(answer="Value-based pricing.")))
+
+        first = client.post("/api/ask", json={"question": "What is our pricing strategy?"}).json()
+        second = client.post("/api/ask", json={"question": "what's our pricing strategy"}).json()
+        clear_answer_cache()
+
+        assert mock_agent.run.await_count == 1
+        assert "cached" not in first
+        assert second["answer"] == "Value-based pricing."
+        assert second["cached"] is True
+        assert second["cache_age_seconds"] >= 0
+
 
 class TestAskConversationalShortCircuit:
     def test_greeting_returns_conversational_response(self, client):
@@ -273,7 +287,7 @@ class TestMemoryEndpoints:
         mock_type.length_guidance = "50-300 words"
         mock_type.ui_config = {"icon": "linkedin", "color": "#0077b5", "category": "social"}
         mock_registry.get_all = AsyncMock(return_value={"linkedin": mock_type})
-        app.state.deps.get_content_type_registry.return_value = mock_registry
+        app.state.deps.content_type_registry = mock_registry
         response = client.get("/api/content-types")
         assert response.status_code == 200
         data = response.json()
@@ -287,7 +301,7 @@ class TestMemoryEndpoints:
     def test_list_content_types_empty(self, client, app):
         mock_registry = MagicMock()
         mock_registry.get_all = AsyncMock(return_value={})
-        app.state.deps.get_content_type_registry.return_value = mock_registry
+        app.state.deps.content_type_registry = mock_registry
         response = client.get("/api/content-types")
         assert response.status_code == 200
         assert response.json()["count"] == 0
@@ -519,6 +533,27 @@ class TestGraphEndpoints:
         response = client.get("/api/graph/episodes")
         assert response.status_code == 404
 
+    def test_graph_episodes_paginated(self, client, app):
+        mock_graphiti = AsyncMock()
+        mock_graphiti.get_episodes_page = AsyncMock(return_value={
+            "episodes": [{"id": "ep-1", "content": "x"}], "next_cursor": "abc",
+        })
+        app.state.deps.graphiti_service = mock_graphiti
+        response = client.get("/api/graph/episodes", params={"limit": 1, "cursor": "prev"})
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "abc"
+        assert response.json()["count"] == 1
+        mock_graphiti.get_episodes_page.assert_awaited_once_with(
+            group_id=None, limit=1, cursor="prev",
+        )
+
+    def test_graph_episodes_invalid_cursor(self, client, app):
+        mock_graphiti = AsyncMock()
+        mock_graphiti.get_episodes_page = AsyncMock(side_effect=ValueError("Invalid episode cursor"))
+        app.state.deps.graphiti_service = mock_graphiti
+        response = client.get("/api/graph/episodes", params={"cursor": "garbage"})
+        assert response.status_code == 400
+
     def test_graph_episode_count_disabled(self, client, app):
         response = client.get("/api/graph/episode-count")
         assert response.status_code == 404
@@ -561,6 +596,71 @@ class TestDepsNotInitialized:
         assert "not initialized" in response.json()["detail"]
 
 
+class TestAgentModelOverrides:
+    """Endpoints run each agent on its AGENT_MODEL_OVERRIDES model when one is set."""
+
+    @patch("second_brain.api.routers.agents.recall_agent")
+    def test_override_model_used(self, mock_agent, app, client):
+        app.state.deps.config.agent_model_overrides = {"recall": "mistral:7b"}
+        override = MagicMock()
+        mock_result = MagicMock()
+        mock_result.output.model_dump.return_value = {"query": "test"}
+        mock_agent.run = AsyncMock(return_value=mock_result)
+
+        with patch("second_brain.models.get_agent_model", return_value=override) as mock_get:
+            response = client.post("/api/recall", json={"query": "test"})
+
+        assert response.status_code == 200
+        mock_get.assert_called_once_with("recall", app.state.deps.config)
+        assert mock_agent.run.call_args.kwargs["model"] is override
+
+    @patch("second_brain.api.routers.agents.recall_agent")
+    def test_no_override_uses_app_model(self, mock_agent, app, client):
+        mock_result = MagicMock()
+        mock_result.output.model_dump.return_value = {"query": "test"}
+        mock_agent.run = AsyncMock(return_value=mock_result)
+
+        with patch("second_brain.models.get_agent_model") as mock_get:
+            response = client.post("/api/recall", json={"query": "test"})
+
+        assert response.status_code == 200
+        mock_get.assert_not_called()
+        assert mock_agent.run.call_args.kwargs["model"] is app.state.model
+
+    def test_failed_override_falls_back_to_app_model(self, app):
+        from second_brain.api.deps import resolve_agent_model
+
+        app.state.deps.config.agent_model_overrides = {"create": "mistral:7b"}
+        request = MagicMock()
+        request.app = app
+        with patch("second_brain.models.get_agent_model", side_effect=RuntimeError("No LLM available")):
+            assert resolve_agent_model(request, "create") is app.state.model
+
+    @patch("second_brain.agents.registry.get_agent_registry")
+    @patch("second_brain.agents.chief_of_staff.route_request")
+    def test_chat_runs_target_on_its_override(self, mock_route, mock_registry, app, client):
+        from second_brain.schemas import RoutingDecision
+
+        app.state.deps.config.agent_model_overrides = {"coach": "mistral:7b"}
+        app.state.deps.config.speculative_recall_enabled = False
+        mock_route.return_value = (RoutingDecision(target_agent="coach", reasoning="plan"), "fast")
+        coach = MagicMock()
+        coach_result = MagicMock()
+        coach_result.output.model_dump.return_value = {"plan": "x"}
+        coach.run = AsyncMock(return_value=coach_result)
+        mock_registry.return_value = {"coach": (coach, "Coach")}
+        override = MagicMock()
+
+        with patch("second_brain.models.get_agent_model", return_value=override):
+            response = client.post("/api/chat", json={"message": "plan my day"})
+
+        assert response.status_code == 200
+        assert mock_route.call_args.args[2] is app.state.model
+        assert coach.run.call_args.kwargs["model"] is override
+        runtime = client.get("/api/health/runtime").json()
+        assert {"hits", "misses", "models", "hit_ratio"} <= set(runtime["models"])
+
+
 class TestModelNotInitialized:
     """Test that agent endpoints return 503 when model is None."""
 
@@ -662,6 +762,38 @@ class TestHealthProbes:
         assert response.status_code == 200
         assert response.json()["status"] == "ready"
 
+    def test_runtime_metrics_reports_executors_and_budgets(self, client):
+        from second_brain.services.executors import get_executor
+        from second_brain.services.keepalive import get_connection_stats
+        from second_brain.services.retry import get_retry_budget
+
+        get_executor("supabase")
+        get_retry_budget("mem0")
+        get_connection_stats("mem0")
+        response = client.get("/api/health/runtime")
+        assert response.status_code == 200
+        data = response.json()
+        assert {"queue_depth", "active_workers", "avg_wait_ms"} <= set(data["executors"]["supabase"])
+        assert data["retry_budgets"]["mem0"]["tokens"] == 10.0
+        assert {"cold_requests", "avg_cold_latency_ms", "reconnects_last_hour"} <= set(
+            data["connections"]["mem0"]
+        )
+        assert {"fast", "fallthrough", "fast_ratio", "routes"} <= set(data["router"])
+        assert "waste_ratio" in data["speculative_recall"]
+        assert {"hits", "misses", "hit_rate"} <= set(data["tool_memo"])
+        assert "graphiti_ingest" not in data
+
+    def test_runtime_metrics_includes_graphiti_ingest(self, app, client):
+        app.state.deps.graphiti_service = MagicMock()
+        app.state.deps.graphiti_service.ingest_stats.return_value = {"limit": 3, "in_flight": 0}
+        app.state.deps.graphiti_service.cache_stats.return_value = {"hits": 4, "hit_rate": 0.8}
+        app.state.community_maintainer = MagicMock()
+        app.state.community_maintainer.snapshot.return_value = {"status": "idle", "runs": 2}
+        response = client.get("/api/health/runtime")
+        assert response.json()["graphiti_ingest"]["limit"] == 3
+        assert response.json()["graph_cache"]["hit_rate"] == 0.8
+        assert response.json()["community_maintenance"]["runs"] == 2
+
     def test_readiness_model_unavailable(self):
         application = create_app()
         mock_deps = MagicMock(spec=BrainDeps)
@@ -750,12 +882,70 @@ class TestChatEndpoint:
 
             mock_pipeline.return_value = {"final": "Generated content here"}
 
-            response = client.post("/api/chat", json={"message": "Write a LinkedIn post about AI"})
+            response = client.post(
+                "/api/chat", json={"message": "Research AI trends, then write a LinkedIn post"},
+            )
             assert response.status_code == 200
             data = response.json()
             assert data["agent"] == "pipeline"
+            assert data["routing"]["router"] == "llm"
             assert "result" in data["output"]
 
+    def test_chat_fast_path_skips_chief_of_staff(self, client):
+        """Unambiguous requests are routed by rules without the routing LLM run."""
+        with patch("second_brain.agents.chief_of_staff.chief_of_staff") as mock_cos, \
+             patch("second_brain.agents.registry.get_agent_registry") as mock_registry:
+            mock_cos.run = AsyncMock()
+            mock_agent = MagicMock()
+            mock_agent_result = MagicMock()
+            mock_agent_result.output.model_dump = MagicMock(return_value={"summary": "ok"})
+            mock_agent.run = AsyncMock(return_value=mock_agent_result)
+            mock_registry.return_value = {"recall": (mock_agent, "Search memory")}
+
+            response = client.post("/api/chat", json={"message": "Recall my pricing notes"})
+            assert response.status_code == 200
+            data = response.json()
+            assert data["agent"] == "recall"
+            assert data["routing"]["router"] == "fast"
+            mock_cos.run.assert_not_called()
+
+    def test_chat_injects_speculative_recall(self, app, client):
+        """Memory prefetched during routing is handed to the recall agent."""
+        from second_brain.services.search_result import SearchResult
+        app.state.deps.memory_service.search = AsyncMock(return_value=SearchResult(
+            memories=[{"memory": "Pricing is value-based", "score": 0.9}],
+        ))
+        with patch("second_brain.agents.registry.get_agent_registry") as mock_registry:
+            mock_agent = MagicMock()
+            mock_agent_result = MagicMock()
+            mock_agent_result.output.model_dump = MagicMock(return_value={"summary": "ok"})
+            mock_agent.run = AsyncMock(return_value=mock_agent_result)
+            mock_registry.return_value = {"recall": (mock_agent, "Search memory")}
+
+            response = client.post("/api/chat", json={"message": "Recall my pricing notes"})
+            assert response.status_code == 200
+            prompt = mock_agent.run.call_args.args[0]
+            assert "Pricing is value-based" in prompt
+            assert prompt.endswith("Request: Recall my pricing notes")
+
+    def test_chat_discards_speculation_for_other_routes(self, app, client):
+        """Routes that do not start with a memory search get the bare message."""
+        from second_brain.agents.speculative import speculative_recall_stats
+        from second_brain.services.search_result import SearchResult
+        app.state.deps.memory_service.search = AsyncMock(return_value=SearchResult())
+        wasted = speculative_recall_stats()["wasted"]
+        with patch("second_brain.agents.registry.get_agent_registry") as mock_registry:
+            mock_agent = MagicMock()
+            mock_agent_result = MagicMock()
+            mock_agent_result.output.model_dump = MagicMock(return_value={"draft": "..."})
+            mock_agent.run = AsyncMock(return_value=mock_agent_result)
+            mock_registry.return_value = {"create": (mock_agent, "Create content")}
+
+            response = client.post("/api/chat", json={"message": "Write a launch email for the beta"})
+            assert response.status_code == 200
+            assert mock_agent.run.call_args.args[0] == "Write a launch email for the beta"
+            assert speculative_recall_stats()["wasted"] == wasted + 1
+
     def test_chat_empty_message_rejected(self, client):
         """Empty message should be rejected by validation."""
         response = client.post("/api/chat", json={"message": ""})
@@ -779,3 +969,127 @@ class TestChatEndpoint:
             assert response.status_code == 400
             assert "Unknown agent route" in response.json()["detail"]
 
+
+
+class TestStreamingEndpoints:
+    """Tests for the server-sent event variants of the agent endpoints."""
+
+    @staticmethod
+    def _events(response):
+        from tests.test_streaming import parse_events
+        return parse_events(response.text)
+
+    @staticmethod
+    def _writer(app):
+        """A real agent over a streaming FunctionModel, used as the app's model."""
+        from pydantic import BaseModel
+        from pydantic_ai import Agent
+        from tests.test_streaming import streaming_model
+
+        class Engagement(BaseModel):
+            response: str
+            tone: str = "warm"
+
+        app.state.model = streaming_model('{"response": "Great point about focus", "tone": "warm"}')
+        return Agent(output_type=Engagement)
+
+    def test_linkedin_comment_stream(self, client, app):
+        agent = self._writer(app)
+        with patch("second_brain.agents.linkedin_engagement.linkedin_engagement_agent", agent):
+            response = client.post("/api/linkedin/comment/stream", json={"post_content": "Focus wins."})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._events(response)
+        deltas = [data for name, data in events if name == "delta"]
+        assert deltas and {d["field"] for d in deltas} == {"response"}
+        assert "".join(d["text"] for d in deltas) == "Great point about focus"
+        assert events[-1] == ("result", {"response": "Great point about focus", "tone": "warm"})
+
+    def test_create_stream_rejects_unknown_type_before_streaming(self, client, app):
+        registry = app.state.deps.content_type_registry
+        registry.get = AsyncMock(return_value=None)
+        registry.slugs = AsyncMock(return_value=["linkedin"])
+
+        response = client.post("/api/create/stream", json={"prompt": "x", "content_type": "nope"})
+        assert response.status_code == 400
+
+    def test_ask_stream_greeting(self, client):
+        response = client.post("/api/ask/stream", json={"question": "hello"})
+        events = self._events(response)
+        assert len(events) == 1
+        assert events[0][0] == "result"
+        assert events[0][1]["is_conversational"] is True
+
+    @patch("second_brain.api.routers.agents.ask_agent")
+    def test_agent_failure_becomes_error_event(self, mock_agent, client):
+        mock_agent.iter.side_effect = RuntimeError("model down")
+        response = client.post("/api/ask/stream", json={"question": "What did I decide about pricing?"})
+
+        assert response.status_code == 200
+        events = self._events(response)
+        assert events[-1][0] == "error"
+        assert events[-1][1]["status_code"] == 502
+
+    def test_pipeline_stream_reports_steps(self, client):
+        async def fake_pipeline(steps, initial_prompt, deps, model=None, on_step=None, **kwargs):
+            for i, step in enumerate(steps):
+                on_step({"step": step, "index": i, "total": len(steps), "status": "start"})
+                on_step({"step": step, "index": i, "total": len(steps), "status": "done"})
+            return {"final": "Final post", "timings": {"steps": {"recall": 0.1, "create": 0.2}, "total": 0.3}}
+
+        with patch("second_brain.agents.utils.run_pipeline", fake_pipeline):
+            response = client.post(
+                "/api/pipeline/stream", json={"request": "Research then write", "steps": "recall,create"},
+            )
+
+        events = self._events(response)
+        steps = [(d["step"], d["status"]) for name, d in events if name == "step"]
+        assert steps == [("recall", "start"), ("recall", "done"), ("create", "start"), ("create", "done")]
+        assert events[-1] == ("result", {
+            "result": "Final post",
+            "timings": {"steps": {"recall": 0.1, "create": 0.2}, "total": 0.3},
+        })
+
+    def test_chat_stream_routes_then_streams(self, client, app):
+        agent = self._writer(app)
+        with patch("second_brain.agents.registry.get_agent_registry",
+                   return_value={"linkedin_engagement": (agent, "Engagement")}):
+            response = client.post(
+                "/api/chat/stream", json={"message": "Reply to this LinkedIn comment: love it"},
+            )
+
+        events = self._events(response)
+        assert events[0][0] == "routing"
+        assert events[0][1]["agent"] == "linkedin_engagement"
+        assert events[0][1]["router"] == "fast"
+        assert any(name == "delta" for name, _ in events)
+        name, result = events[-1]
+        assert name == "result"
+        assert result["agent"] == "linkedin_engagement"
+        assert result["output"]["response"] == "Great point about focus"
+
+    def test_chat_stream_conversational(self, client):
+        response = client.post("/api/chat/stream", json={"message": "Hello!"})
+        events = self._events(response)
+        assert [name for name, _ in events] == ["routing", "result"]
+        assert events[1][1]["agent"] == "conversational"
+
+
+class TestPipelineEndpoint:
+    def test_dependency_annotations_and_timings(self, client):
+        timings = {"steps": {"create": 4.0, "review": 2.0, "clarity": 1.5}, "total": 6.1}
+        with patch(
+            "second_brain.agents.utils.run_pipeline",
+            AsyncMock(return_value={"final": "Post", "timings": timings}),
+        ) as mock_pipeline:
+            response = client.post("/api/pipeline", json={
+                "request": "Write and check a post",
+                "steps": "create,review<create,clarity<create",
+            })
+
+        assert response.status_code == 200
+        assert response.json() == {"result": "Post", "timings": timings}
+        kwargs = mock_pipeline.call_args.kwargs
+        assert kwargs["steps"] == ["create", "review", "clarity"]
+        assert kwargs["dependencies"] == {"review": ["create"], "clarity": ["create"]}
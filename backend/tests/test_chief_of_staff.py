@@ -7,7 +7,7 @@ from pydantic_ai import ModelRetry
 
 from second_brain.agents.chief_of_staff import chief_of_staff
 from second_brain.agents.registry import get_agent_registry
-from second_brain.agents.utils import run_pipeline
+from second_brain.agents.utils import _pipeline_graph, parse_pipeline_steps, run_pipeline
 from second_brain.schemas import RoutingDecision
 from second_brain.config import BrainConfig
 from second_brain.deps import BrainDeps
@@ -117,6 +117,41 @@ class TestConversationalRoute:
         )
 
 
+class TestRouteRequest:
+    def _deps(self, **overrides):
+        config = _make_config()
+        for key, value in overrides.items():
+            setattr(config, key, value)
+        return BrainDeps(config=config, memory_service=MagicMock(), storage_service=MagicMock())
+
+    async def test_fast_path_skips_llm(self):
+        from second_brain.agents.chief_of_staff import route_request
+        with patch("second_brain.agents.chief_of_staff.chief_of_staff") as mock_cos:
+            mock_cos.run = AsyncMock()
+            decision, router = await route_request("Recall my pricing notes", self._deps())
+        assert router == "fast"
+        assert decision.target_agent == "recall"
+        mock_cos.run.assert_not_called()
+
+    async def test_uncertain_falls_through_to_llm(self):
+        from second_brain.agents.chief_of_staff import route_request
+        llm_decision = RoutingDecision(target_agent="ask", reasoning="Needs brain context")
+        with patch("second_brain.agents.chief_of_staff.chief_of_staff") as mock_cos:
+            mock_cos.run = AsyncMock(return_value=MagicMock(output=llm_decision))
+            decision, router = await route_request("How should I price enterprise deals?", self._deps())
+        assert router == "llm"
+        assert decision is llm_decision
+
+    async def test_disabled_always_uses_llm(self):
+        from second_brain.agents.chief_of_staff import route_request
+        llm_decision = RoutingDecision(target_agent="conversational", reasoning="Greeting")
+        with patch("second_brain.agents.chief_of_staff.chief_of_staff") as mock_cos:
+            mock_cos.run = AsyncMock(return_value=MagicMock(output=llm_decision))
+            _, router = await route_request("hello", self._deps(fast_router_enabled=False))
+        assert router == "llm"
+        mock_cos.run.assert_awaited_once()
+
+
 class TestAgentRegistry:
     def test_registry_has_core_agents(self):
         registry = get_agent_registry()
@@ -222,6 +257,170 @@ class TestPipeline:
         # Should not crash; recall key should be in results with error info or missing
         assert "final" in results
 
+    @pytest.mark.asyncio
+    async def test_pipeline_reports_step_events(self):
+        """on_step sees start/done, error and skipped steps in order."""
+        config = _make_config()
+        deps = BrainDeps(
+            config=config,
+            memory_service=MagicMock(),
+            storage_service=MagicMock(),
+        )
+        events = []
+        learn_result = MagicMock()
+        learn_result.output = MagicMock(summary="Learned", draft=None, answer=None)
+        with patch("second_brain.agents.recall.recall_agent") as mock_recall, \
+             patch("second_brain.agents.learn.learn_agent") as mock_learn, \
+             patch("second_brain.models.get_agent_model", return_value=None):
+            mock_recall.run = AsyncMock(side_effect=RuntimeError("test error"))
+            mock_learn.run = AsyncMock(return_value=learn_result)
+            await run_pipeline(
+                steps=["nonexistent_agent", "recall", "learn"],
+                initial_prompt="test",
+                deps=deps,
+                on_step=events.append,
+            )
+        assert [(e["step"], e["status"]) for e in events] == [
+            ("nonexistent_agent", "skipped"),
+            ("recall", "start"),
+            ("recall", "error"),
+            ("learn", "start"),
+            ("learn", "done"),
+        ]
+        assert events[2]["error"] == "Step failed: RuntimeError"
+        assert all(e["total"] == 3 for e in events)
+
+
+class TestPipelineGraph:
+    def test_parse_linear(self):
+        assert parse_pipeline_steps("recall, create ,review,") == (["recall", "create", "review"], {})
+
+    def test_parse_annotated(self):
+        steps, dependencies = parse_pipeline_steps("recall,ask,create<recall+ask,review<create")
+        assert steps == ["recall", "ask", "create", "review"]
+        assert dependencies == {"create": ["recall", "ask"], "review": ["create"]}
+
+    def test_default_is_linear_chain(self):
+        assert _pipeline_graph(["a", "b", "c"], None) == {"a": [], "b": ["a"], "c": ["b"]}
+
+    def test_unknown_dependencies_ignored(self):
+        graph = _pipeline_graph(["a", "b"], {"b": ["a", "zzz", "b"]})
+        assert graph == {"a": [], "b": ["a"]}
+
+    def test_cycle_falls_back_to_linear(self):
+        graph = _pipeline_graph(["a", "b"], {"a": ["b"], "b": ["a"]})
+        assert graph == {"a": [], "b": ["a"]}
+
+
+def _timed_agent(log: list, name: str, output, delay: float = 0.05):
+    """Agent mock that records start/end and the prompt it was given."""
+    import asyncio
+
+    async def run(prompt, **kwargs):
+        log.append(("start", name, prompt))
+        await asyncio.sleep(delay)
+        log.append(("end", name, prompt))
+        result = MagicMock()
+        result.output = output
+        return result
+
+    agent = MagicMock()
+    agent.run = run
+    return agent
+
+
+class TestPipelineDag:
+    def _deps(self):
+        return BrainDeps(
+            config=_make_config(),
+            memory_service=MagicMock(),
+            storage_service=MagicMock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        log = []
+        registry = {
+            "recall": (_timed_agent(log, "recall", MagicMock(summary="memories")), "Recall"),
+            "ask": (_timed_agent(log, "ask", MagicMock(summary="facts")), "Ask"),
+            "create": (_timed_agent(log, "create", MagicMock(summary="post")), "Create"),
+        }
+        with patch("second_brain.agents.registry.get_agent_registry", return_value=registry), \
+             patch("second_brain.models.get_agent_model", return_value=None):
+            results = await run_pipeline(
+                steps=["recall", "ask", "create"],
+                initial_prompt="Write about focus",
+                deps=self._deps(),
+                dependencies={"create": ["recall", "ask"]},
+            )
+
+        events = [(kind, name) for kind, name, _ in log]
+        # recall and ask overlap; create starts after both finished
+        assert events[:2] == [("start", "recall"), ("start", "ask")]
+        assert events.index(("start", "create")) > max(events.index(("end", "recall")), events.index(("end", "ask")))
+        create_prompt = next(p for kind, name, p in log if (kind, name) == ("start", "create"))
+        assert "[Context from recall]: memories" in create_prompt
+        assert "[Context from ask]: facts" in create_prompt
+        assert results["final"].summary == "post"
+        assert set(results["timings"]["steps"]) == {"recall", "ask", "create"}
+        # Parallel wall clock is below the sum of the step times
+        assert results["timings"]["total"] < sum(results["timings"]["steps"].values())
+
+    @pytest.mark.asyncio
+    async def test_default_chain_passes_previous_output_only(self):
+        log = []
+        registry = {
+            "recall": (_timed_agent(log, "recall", MagicMock(summary="memories"), 0), "Recall"),
+            "ask": (_timed_agent(log, "ask", MagicMock(summary="facts"), 0), "Ask"),
+            "learn": (_timed_agent(log, "learn", MagicMock(summary="lessons"), 0), "Learn"),
+        }
+        with patch("second_brain.agents.registry.get_agent_registry", return_value=registry), \
+             patch("second_brain.models.get_agent_model", return_value=None):
+            await run_pipeline(steps=["recall", "ask", "learn"], initial_prompt="go", deps=self._deps())
+
+        prompts = {name: p for kind, name, p in log if kind == "start"}
+        assert prompts["recall"] == "go"
+        assert prompts["ask"] == "go\n\n[Context from recall]: memories"
+        assert prompts["learn"] == "go\n\n[Context from ask]: facts"
+
+    @pytest.mark.asyncio
+    async def test_parallel_reviews_get_upstream_draft(self):
+        from second_brain.schemas import CreateResult
+
+        log = []
+        draft = CreateResult(draft="The actual post text", content_type="linkedin", mode="casual")
+        registry = {
+            "create": (_timed_agent(log, "create", draft, 0), "Create"),
+            "review": (MagicMock(), "Review"),
+            "clarity": (_timed_agent(log, "clarity", MagicMock(summary="clear")), "Clarity"),
+        }
+        review = MagicMock(overall_score=8, verdict="READY", top_strengths=[], critical_issues=[])
+        with patch("second_brain.agents.registry.get_agent_registry", return_value=registry), \
+             patch("second_brain.models.get_agent_model", return_value=None), \
+             patch("second_brain.agents.review.run_full_review", AsyncMock(return_value=review)) as mock_review:
+            results = await run_pipeline(
+                steps=["create", "review", "clarity"],
+                initial_prompt="Write a post",
+                deps=self._deps(),
+                dependencies={"review": ["create"], "clarity": ["create"]},
+            )
+
+        assert mock_review.call_args.kwargs["content"] == "The actual post text"
+        clarity_prompt = next(p for kind, name, p in log if (kind, name) == ("start", "clarity"))
+        assert "The actual post text" in clarity_prompt
+        assert results["review"] is review
+
+    @pytest.mark.asyncio
+    async def test_repeated_steps_get_unique_ids(self):
+        log = []
+        registry = {"ask": (_timed_agent(log, "ask", MagicMock(summary="a"), 0), "Ask")}
+        with patch("second_brain.agents.registry.get_agent_registry", return_value=registry), \
+             patch("second_brain.models.get_agent_model", return_value=None):
+            results = await run_pipeline(steps=["ask", "ask"], initial_prompt="go", deps=self._deps())
+
+        assert "ask" in results and "ask_2" in results
+        assert set(results["timings"]["steps"]) == {"ask", "ask_2"}
+
 
 class TestChiefOfStaffTools:
     @pytest.mark.asyncio
@@ -46,6 +46,21 @@ def mock_create_deps():
         yield deps
 
 
+@pytest.fixture
+def create_cmd_deps(mock_create_deps, brain_config):
+    """A real BrainDeps for the create command, sharing the mocked services."""
+    from second_brain.deps import BrainDeps
+
+    deps = BrainDeps(
+        config=brain_config,
+        memory_service=mock_create_deps.memory_service,
+        storage_service=mock_create_deps.storage_service,
+        content_type_registry=mock_create_deps.get_content_type_registry(),
+    )
+    with patch("second_brain.cli.create_deps", return_value=deps):
+        yield deps
+
+
 class TestCLIBasic:
     """Test CLI group and help."""
 
@@ -231,7 +246,7 @@ class TestCreateCommand:
 
     @patch("second_brain.cli.get_agent_model")
     @patch("second_brain.agents.create.create_agent")
-    def test_create_success(self, mock_agent, mock_model, runner, mock_create_deps):
+    def test_create_success(self, mock_agent, mock_model, runner, create_cmd_deps):
         mock_model.return_value = MagicMock()
         # Set up registry to return a valid type config
         type_config = MagicMock()
@@ -240,7 +255,7 @@ class TestCreateCommand:
         type_config.structure_hint = "Hook -> Body -> CTA"
         type_config.max_words = 300
         type_config.length_guidance = ""
-        registry = mock_create_deps.get_content_type_registry()
+        registry = create_cmd_deps.get_content_type_registry()
         registry.get = AsyncMock(return_value=type_config)
 
         mock_output = MagicMock()
@@ -263,7 +278,7 @@ class TestCreateCommand:
 
     @patch("second_brain.cli.get_agent_model")
     @patch("second_brain.agents.create.create_agent")
-    def test_create_voice_preload(self, mock_agent, mock_model, runner, mock_create_deps):
+    def test_create_voice_preload(self, mock_agent, mock_model, runner, create_cmd_deps):
         """create command pre-loads voice guide into agent prompt."""
         mock_model.return_value = MagicMock()
         type_config = MagicMock()
@@ -272,10 +287,10 @@ class TestCreateCommand:
         type_config.structure_hint = "Hook -> Body -> CTA"
         type_config.max_words = 300
         type_config.length_guidance = ""
-        registry = mock_create_deps.get_content_type_registry()
+        registry = create_cmd_deps.get_content_type_registry()
         registry.get = AsyncMock(return_value=type_config)
         # Pre-load voice guide with test data
-        mock_create_deps.storage_service.get_memory_content = AsyncMock(
+        create_cmd_deps.storage_service.get_memory_content = AsyncMock(
             return_value=[{"title": "My Voice", "content": "Direct and punchy, no fluff"}]
         )
         mock_output = MagicMock()
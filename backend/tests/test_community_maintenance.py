@@ -0,0 +1,93 @@
+"""Tests for the scheduled community maintenance job."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from second_brain.services.community_maintenance import (
+    CommunityMaintainer,
+    start_community_maintenance,
+)
+
+
+def _graphiti(stale=None, report=None):
+    graphiti = MagicMock()
+    graphiti.take_stale_community_groups = MagicMock(return_value=list(stale or []))
+    graphiti.update_communities = AsyncMock(
+        return_value=report or {"mode": "incremental", "assigned": 1, "drifted": 0, "recomputed": 0},
+    )
+    return graphiti
+
+
+class TestCommunityMaintainer:
+    async def test_runs_stale_groups(self):
+        graphiti = _graphiti(stale=["grp1", "grp2"])
+        maintainer = CommunityMaintainer(graphiti, interval=60, drift_threshold=0.4)
+        result = await maintainer.run_once()
+
+        assert set(result["groups"]) == {"grp1", "grp2"}
+        assert graphiti.update_communities.await_count == 2
+        assert graphiti.update_communities.await_args.kwargs["drift_threshold"] == 0.4
+        assert maintainer.runs == 1
+        assert maintainer.snapshot()["last_run"]["groups"]["grp1"]["assigned"] == 1
+
+    async def test_nothing_stale_is_a_noop(self):
+        graphiti = _graphiti()
+        maintainer = CommunityMaintainer(graphiti, interval=60)
+        result = await maintainer.run_once()
+        assert result["groups"] == {}
+        graphiti.update_communities.assert_not_awaited()
+
+    async def test_failed_group_is_requeued(self):
+        graphiti = _graphiti(stale=["grp1"])
+        graphiti.update_communities = AsyncMock(side_effect=ConnectionError("down"))
+        maintainer = CommunityMaintainer(graphiti, interval=60)
+        result = await maintainer.run_once()
+        assert result["groups"]["grp1"] == {"error": "ConnectionError"}
+        graphiti.mark_communities_stale.assert_called_once_with("grp1")
+
+    async def test_reports_progress_while_running(self):
+        graphiti = _graphiti(stale=["grp1"])
+        release = asyncio.Event()
+        seen = {}
+
+        async def _update(group, drift_threshold, progress):
+            progress("recomputing", done=1, total=3)
+            seen.update(maintainer.snapshot())
+            await release.wait()
+            return {"mode": "incremental"}
+
+        graphiti.update_communities = AsyncMock(side_effect=_update)
+        maintainer = CommunityMaintainer(graphiti, interval=60)
+        task = asyncio.create_task(maintainer.run_once())
+        await asyncio.sleep(0)
+        release.set()
+        await task
+
+        assert seen["status"] == "running"
+        assert seen["current"] == {"group": "grp1", "phase": "recomputing", "done": 1, "total": 3}
+        assert maintainer.snapshot()["status"] == "idle"
+        assert maintainer.snapshot()["current"] is None
+
+    async def test_scheduled_loop(self):
+        graphiti = _graphiti(stale=["grp1"])
+        maintainer = CommunityMaintainer(graphiti, interval=0.01)
+        maintainer.start()
+        for _ in range(100):
+            if maintainer.runs:
+                break
+            await asyncio.sleep(0.01)
+        maintainer.stop()
+        assert maintainer.runs >= 1
+
+
+class TestStartCommunityMaintenance:
+    async def test_disabled(self, brain_config):
+        brain_config.graphiti_community_refresh_seconds = 0
+        assert start_community_maintenance(_graphiti(), brain_config) is None
+
+    async def test_enabled(self, brain_config):
+        brain_config.graphiti_community_refresh_seconds = 600
+        maintainer = start_community_maintenance(_graphiti(), brain_config)
+        assert maintainer.interval == 600
+        assert maintainer.task is not None
+        maintainer.stop()
@@ -725,6 +725,30 @@ class TestMemoryProviderConfig:
             )
 
 
+class TestReviewModeConfig:
+    """Tests for review_mode config field and validator."""
+
+    def test_review_mode_default_is_parallel(self, tmp_path):
+        config = BrainConfig(
+            supabase_url="https://test.supabase.co",
+            supabase_key="test-key",
+            brain_data_path=tmp_path,
+            _env_file=None,
+        )
+        assert config.review_mode == "parallel"
+
+    def test_review_mode_invalid_raises(self, tmp_path):
+        """Unknown review_mode value raises ValidationError."""
+        with pytest.raises(ValidationError):
+            BrainConfig(
+                supabase_url="https://test.supabase.co",
+                supabase_key="test-key",
+                brain_data_path=tmp_path,
+                review_mode="serial",
+                _env_file=None,
+            )
+
+
 class TestMcpTransportConfig:
     """Tests for MCP transport config fields and validator."""
 
@@ -0,0 +1,181 @@
+"""Tests for context packs: parallel brain-context prefetch for content agents."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from pydantic_ai.messages import ModelRequest, ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from second_brain.agents.context_pack import (
+    ContextPack,
+    _fit,
+    build_context_pack,
+    with_context_pack,
+)
+
+
+def _stock(mock_deps):
+    """Give every context source something to return."""
+    storage = mock_deps.storage_service
+
+    async def memory_content(category, override_user_id=None):
+        return {
+            "style-voice": [{"title": "Voice", "content": "Short, punchy, no jargon."}],
+            "audience": [{"title": "Founders", "content": "Early-stage SaaS founders."}],
+        }.get(category, [])
+
+    storage.get_memory_content = AsyncMock(side_effect=memory_content)
+    storage.get_examples = AsyncMock(return_value=[{"title": "Launch post", "content": "We shipped."}])
+    storage.get_templates = AsyncMock(return_value=[{"name": "Hot take", "structure_hint": "Opener -> Punchline"}])
+    storage.get_patterns = AsyncMock(return_value=[
+        {"name": "Hook First", "pattern_text": "Open strong", "confidence": "HIGH"},
+    ])
+    return mock_deps
+
+
+class TestBuildContextPack:
+    async def test_fetches_all_sections(self, mock_deps):
+        pack = await build_context_pack(_stock(mock_deps), "linkedin", "AI agents")
+
+        assert list(pack.sections) == ["voice", "examples", "templates", "patterns", "knowledge", "audience"]
+        assert "Short, punchy" in pack.sections["voice"]
+        assert "Launch post" in pack.sections["examples"]
+        assert "Hot take" in pack.sections["templates"]
+        assert "Hook First" in pack.sections["patterns"]
+        assert "Test memory content" in pack.sections["knowledge"]
+        assert "Early-stage SaaS founders" in pack.sections["audience"]
+        mock_deps.storage_service.get_templates.assert_awaited_once_with(content_type="linkedin")
+
+    async def test_sources_fetched_in_parallel(self, mock_deps):
+        _stock(mock_deps)
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return []
+
+        mock_deps.storage_service.get_examples = AsyncMock(side_effect=slow)
+        mock_deps.storage_service.get_templates = AsyncMock(side_effect=slow)
+        mock_deps.storage_service.get_patterns = AsyncMock(side_effect=slow)
+
+        start = time.monotonic()
+        await build_context_pack(mock_deps, "linkedin", "AI agents")
+
+        assert time.monotonic() - start < 0.25
+
+    async def test_failed_source_is_left_out(self, mock_deps):
+        _stock(mock_deps)
+        mock_deps.storage_service.get_examples = AsyncMock(side_effect=ConnectionError("down"))
+
+        pack = await build_context_pack(mock_deps, "linkedin", "AI agents")
+
+        assert "examples" not in pack.sections
+        assert "voice" in pack.sections
+
+    async def test_only_requested_sections(self, mock_deps):
+        pack = await build_context_pack(_stock(mock_deps), "email", "follow up", sections=("voice", "examples"))
+
+        assert set(pack.sections) == {"voice", "examples"}
+        mock_deps.memory_service.search.assert_not_called()
+
+    async def test_voice_user_id_scopes_voice_and_examples(self, mock_deps):
+        await build_context_pack(_stock(mock_deps), "linkedin", "AI", voice_user_id="uttam")
+
+        mock_deps.storage_service.get_memory_content.assert_any_await("style-voice", override_user_id="uttam")
+        mock_deps.storage_service.get_examples.assert_awaited_once_with(
+            content_type="linkedin", override_user_id="uttam",
+        )
+
+
+class TestFit:
+    def test_keeps_everything_under_budget(self):
+        kept, truncated = _fit({"voice": "a" * 40, "examples": "b" * 40}, token_budget=1000)
+        assert kept == {"voice": "a" * 40, "examples": "b" * 40}
+        assert truncated == []
+
+    def test_trims_lower_priority_sections_first(self):
+        sections = {"audience": "z" * 4000, "voice": "v" * 2000, "examples": "e\n" * 1000}
+        kept, truncated = _fit(sections, token_budget=1000)
+
+        assert kept["voice"] == "v" * 2000
+        assert kept["examples"].endswith("[...truncated to fit context budget]")
+        assert "audience" not in kept
+        assert truncated == ["examples", "audience"]
+
+
+class TestRender:
+    def test_filters_sections(self):
+        pack = ContextPack("linkedin", {"voice": "## Voice", "examples": "## Examples"})
+        text = pack.render(["voice"])
+        assert text.startswith("## BRAIN CONTEXT PACK (linkedin)")
+        assert "## Voice" in text
+        assert "## Examples" not in text
+
+    def test_empty(self):
+        assert ContextPack("email").render() == ""
+
+
+class TestWithContextPack:
+    async def test_returns_copy_with_pack(self, mock_deps):
+        run_deps = await with_context_pack(_stock(mock_deps), "hook_writer", "AI agents")
+
+        assert run_deps is not mock_deps
+        assert mock_deps.context_pack is None
+        assert set(run_deps.context_pack.sections) == {"voice", "templates", "knowledge"}
+        assert run_deps.memory_service is mock_deps.memory_service
+        assert run_deps.get_content_type_registry() is mock_deps.get_content_type_registry()
+
+    async def test_create_uses_given_content_type(self, mock_deps):
+        run_deps = await with_context_pack(_stock(mock_deps), "create", "AI", content_type="newsletter")
+
+        assert run_deps.context_pack.content_type == "newsletter"
+        mock_deps.storage_service.get_examples.assert_awaited_once_with(
+            content_type="newsletter", override_user_id=None,
+        )
+
+    async def test_exclude(self, mock_deps):
+        run_deps = await with_context_pack(_stock(mock_deps), "create", "AI", exclude=("voice", "examples"))
+        assert not {"voice", "examples"} & set(run_deps.context_pack.sections)
+
+    async def test_other_agents_unchanged(self, mock_deps):
+        assert await with_context_pack(mock_deps, "recall", "AI") is mock_deps
+
+    async def test_disabled(self, mock_deps):
+        mock_deps.config.context_pack_enabled = False
+        assert await with_context_pack(mock_deps, "create", "AI") is mock_deps
+
+
+class TestAgentInstructions:
+    async def test_create_drafts_in_one_turn_from_pack(self, mock_deps):
+        from second_brain.agents.create import create_agent
+
+        seen: list[ModelRequest] = []
+
+        def model(messages, info: AgentInfo):
+            seen.append(messages[-1])
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {
+                "draft": " ".join(["word"] * 40), "content_type": "linkedin", "mode": "casual",
+            })])
+
+        run_deps = await with_context_pack(_stock(mock_deps), "create", "AI agents", content_type="linkedin")
+        with patch.object(run_deps.get_content_type_registry(), "get_all", AsyncMock(return_value={})):
+            await create_agent.run("Write about AI agents", deps=run_deps, model=FunctionModel(model))
+
+        assert len(seen) == 1
+        assert "BRAIN CONTEXT PACK (linkedin)" in seen[0].instructions
+        assert "Short, punchy" in seen[0].instructions
+
+    async def test_no_pack_no_block(self, mock_deps):
+        from second_brain.agents.email_agent import email_agent
+
+        seen: list[ModelRequest] = []
+
+        def model(messages, info: AgentInfo):
+            seen.append(messages[-1])
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {
+                "action_type": "draft", "subject": "Hi", "body": "A complete email body for the test.",
+            })])
+
+        await email_agent.run("Draft a follow-up", deps=mock_deps, model=FunctionModel(model))
+
+        assert "## BRAIN CONTEXT PACK" not in seen[0].instructions
@@ -0,0 +1,71 @@
+"""Tests for deadline propagation to blocking I/O."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from second_brain.services.deadlines import (
+    deadline,
+    install_deadline_timeouts,
+    remaining_time,
+)
+
+
+def _capturing_client(seen: list) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    return httpx.Client(transport=httpx.MockTransport(handler), timeout=300)
+
+
+class TestDeadline:
+    async def test_remaining_time_default_outside_deadline(self):
+        assert remaining_time() is None
+        assert remaining_time(5) == 5
+
+    async def test_nested_deadline_keeps_earliest(self):
+        async with deadline(1):
+            async with deadline(60):
+                assert remaining_time() <= 1
+        assert remaining_time() is None
+
+    async def test_raises_timeout_error(self):
+        with pytest.raises(TimeoutError):
+            async with deadline(0.01):
+                await asyncio.sleep(1)
+
+
+class TestDeadlineTimeouts:
+    async def test_request_timeout_clamped_to_remaining(self):
+        seen: list = []
+        client = _capturing_client(seen)
+        install_deadline_timeouts(client, default_timeout=15)
+
+        client.get("http://mem0.test/ping")
+        async with deadline(2):
+            await asyncio.to_thread(client.get, "http://mem0.test/ping")
+
+        assert seen[0]["read"] == 15
+        assert 0 < seen[1]["read"] <= 2
+        assert 0 < seen[1]["connect"] <= 2
+
+    async def test_expired_deadline_never_sends(self):
+        seen: list = []
+        client = _capturing_client(seen)
+        install_deadline_timeouts(client)
+
+        with pytest.raises(TimeoutError, match="Deadline expired"):
+            async with deadline(0.01):
+                time.sleep(0.02)  # blocks the loop, so only the hook can fire
+                client.get("http://mem0.test/ping")
+        assert seen == []
+
+    def test_install_is_idempotent_and_ignores_non_httpx(self):
+        client = httpx.Client()
+        install_deadline_timeouts(client)
+        install_deadline_timeouts(client)
+        assert len(client.event_hooks["request"]) == 1
+        install_deadline_timeouts(object())  # no-op
@@ -0,0 +1,167 @@
+"""Tests for the adaptive Graphiti episode scheduler."""
+
+import asyncio
+
+import pytest
+
+from second_brain.services.episode_scheduler import (
+    AIMDLimiter,
+    EpisodeScheduler,
+    is_rate_limit_error,
+)
+
+
+class _RateLimitError(Exception):
+    pass
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+class TestRateLimitDetection:
+    def test_by_class_name_or_status(self):
+        assert is_rate_limit_error(_RateLimitError())
+        assert is_rate_limit_error(_HTTPError(429))
+        assert not is_rate_limit_error(_HTTPError(500))
+        assert not is_rate_limit_error(TimeoutError())
+
+
+class TestAIMDLimiter:
+    async def test_fast_successes_grow_limit_to_maximum(self):
+        limiter = AIMDLimiter(initial=2, maximum=4, latency_target=1.0)
+        for _ in range(20):
+            await limiter.acquire()
+            await limiter.release(0.01)
+        assert limiter.limit == 4
+
+    async def test_slow_successes_hold_limit(self):
+        limiter = AIMDLimiter(initial=2, maximum=4, latency_target=1.0)
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(5.0)
+        assert limiter.limit == 2
+
+    async def test_rate_limit_halves_limit_with_floor(self):
+        limiter = AIMDLimiter(initial=8, maximum=8)
+        await limiter.acquire()
+        await limiter.release(0.1, _RateLimitError())
+        assert limiter.limit == 4
+        for _ in range(5):
+            await limiter.acquire()
+            await limiter.release(0.1, _HTTPError(429))
+        assert limiter.limit == 1
+
+    async def test_other_errors_hold_limit(self):
+        limiter = AIMDLimiter(initial=3)
+        await limiter.acquire()
+        await limiter.release(0.1, ValueError())
+        assert limiter.limit == 3
+        assert limiter.snapshot()["errors"] == 1
+
+    async def test_acquire_takes_only_free_slots(self):
+        limiter = AIMDLimiter(initial=3, maximum=3)
+        assert await limiter.acquire(2) == 2
+        assert await limiter.acquire(5) == 1
+        await limiter.release(0.1, slots=3)
+        assert limiter.in_flight == 0
+
+
+class TestEpisodeScheduler:
+    async def test_bounded_concurrency_and_input_order(self):
+        scheduler = EpisodeScheduler(AIMDLimiter(initial=2, maximum=2))
+        in_flight = 0
+        peak = 0
+        started = []
+
+        def job(i):
+            async def _run():
+                nonlocal in_flight, peak
+                started.append(i)
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01 * (5 - i))
+                in_flight -= 1
+                return i
+            return _run
+
+        results = await scheduler.run([job(i) for i in range(5)])
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+        assert started[:2] == [0, 1]
+
+    async def test_failures_returned_in_place(self):
+        scheduler = EpisodeScheduler(AIMDLimiter(initial=3))
+
+        async def ok():
+            return "ok"
+
+        async def bad():
+            raise ValueError("boom")
+
+        results = await scheduler.run([ok, bad, ok])
+
+        assert results[0] == "ok" and results[2] == "ok"
+        assert isinstance(results[1], ValueError)
+        assert scheduler.limiter.in_flight == 0
+
+    async def test_batches_take_free_slots_and_lanes_run_in_series(self):
+        scheduler = EpisodeScheduler(AIMDLimiter(initial=4, maximum=4))
+        active: dict = {}
+        batches = []
+
+        async def job(batch):
+            lane = batch[0][0]
+            assert not active.get(lane)
+            active[lane] = True
+            batches.append(batch)
+            await asyncio.sleep(0.01)
+            active[lane] = False
+            return [item.upper() for item in batch]
+
+        items = ["a0", "b0", "a1", "b1", "a2", "b2"]
+        results = await scheduler.run_batches(items, job, lanes=[item[0] for item in items])
+
+        assert results == ["A0", "B0", "A1", "B1", "A2", "B2"]
+        assert batches[:2] == [["a0", "a1", "a2"], ["b0"]]
+        assert [item for batch in batches for item in batch if item[0] == "b"] == ["b0", "b1", "b2"]
+        assert scheduler.limiter.in_flight == 0
+
+    async def test_failed_batch_fills_its_items(self):
+        scheduler = EpisodeScheduler(AIMDLimiter(initial=2, maximum=2))
+
+        async def job(batch):
+            if "bad" in batch:
+                raise ValueError("boom")
+            return batch
+
+        results = await scheduler.run_batches(["ok", "bad", "next"], job, lanes=[None] * 3)
+
+        assert isinstance(results[0], ValueError) and results[1] is results[0]
+        assert results[2] == "next"
+        assert scheduler.limiter.errors == 1
+        assert scheduler.limiter.in_flight == 0
+
+    def test_limiter_created_outside_a_loop(self):
+        limiter = AIMDLimiter(initial=1)
+
+        async def cycle():
+            await limiter.acquire()
+            await limiter.release(0.1)
+
+        asyncio.run(cycle())
+        asyncio.run(cycle())
+        assert limiter.successes == 2
+
+    async def test_run_one_propagates_errors(self):
+        scheduler = EpisodeScheduler(AIMDLimiter())
+
+        async def bad():
+            raise _RateLimitError()
+
+        with pytest.raises(_RateLimitError):
+            await scheduler.run_one(bad)
+        assert scheduler.limiter.rate_limited == 1
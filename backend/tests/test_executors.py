@@ -0,0 +1,171 @@
+"""Tests for per-backend bounded executors."""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from second_brain.services.deadlines import deadline
+from second_brain.services.executors import (
+    BackendExecutor,
+    configure_executors,
+    executor_stats,
+    get_executor,
+    run_blocking,
+    shutdown_executors,
+)
+from second_brain.services.retry import RetryConfig, async_retry
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors():
+    shutdown_executors()
+    yield
+    shutdown_executors(wait=True)
+
+
+class TestBackendExecutor:
+    async def test_runs_on_named_threads(self):
+        name = await run_blocking("mem0", lambda: threading.current_thread().name)
+        assert name.startswith("brain-mem0")
+
+    async def test_propagates_context_vars(self):
+        var = contextvars.ContextVar("req", default=None)
+        var.set("abc")
+        assert await run_blocking("supabase", var.get) == "abc"
+
+    async def test_worker_cap_and_queue_depth(self):
+        executor = BackendExecutor("capped", max_workers=2)
+        release = threading.Event()
+        tasks = [asyncio.create_task(executor.run(release.wait, 5)) for _ in range(5)]
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if executor.active == 2:
+                break
+        stats = executor.snapshot()
+        assert stats["active_workers"] == 2
+        assert stats["queue_depth"] == 3
+        release.set()
+        await asyncio.gather(*tasks)
+        stats = executor.snapshot()
+        assert stats["completed"] == 5
+        assert stats["queue_depth"] == 0
+        assert stats["active_workers"] == 0
+        assert stats["peak_queue_depth"] >= 3
+        assert stats["max_wait_ms"] > 0
+        executor.shutdown(wait=True)
+
+    async def test_failures_are_counted_and_raised(self):
+        def boom():
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await run_blocking("voyage", boom)
+        assert executor_stats()["voyage"]["failed"] == 1
+
+    async def test_slow_backend_does_not_stall_others(self):
+        configure_executors(_Caps(mem0=1, supabase=1))
+        release = threading.Event()
+        slow = asyncio.create_task(run_blocking("mem0", release.wait, 5))
+        queued = asyncio.create_task(run_blocking("mem0", lambda: "late"))
+        await asyncio.sleep(0.01)
+
+        # Mem0's only worker is busy; Supabase still completes immediately
+        assert await asyncio.wait_for(run_blocking("supabase", lambda: "fast"), 1) == "fast"
+        assert not queued.done()
+
+        release.set()
+        assert await queued == "late"
+        await slow
+
+
+class TestCancellation:
+    async def test_timed_out_running_call_is_counted_as_abandoned(self):
+        executor = BackendExecutor("slow", max_workers=1)
+        release = threading.Event()
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await executor.run(release.wait, 5)
+        assert executor.snapshot()["abandoned_in_flight"] == 1
+        release.set()
+        for _ in range(50):
+            if executor.snapshot()["abandoned_in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        stats = executor.snapshot()
+        assert stats["abandoned_in_flight"] == 0
+        assert stats["abandoned_total"] == 1
+        executor.shutdown(wait=True)
+
+    async def test_queued_call_is_withdrawn_on_cancel(self):
+        executor = BackendExecutor("busy", max_workers=1)
+        release = threading.Event()
+        ran = []
+        blocker = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await executor.run(ran.append, 1)
+        release.set()
+        await blocker
+        executor.shutdown(wait=True)
+        stats = executor.snapshot()
+        assert ran == []
+        assert stats["withdrawn"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["abandoned_total"] == 0
+
+    async def test_call_expired_while_queued_is_not_started(self):
+        executor = BackendExecutor("late", max_workers=1)
+        ran = []
+
+        def _hog():
+            time.sleep(0.05)
+
+        blocker = asyncio.create_task(executor.run(_hog))
+        await asyncio.sleep(0)
+        async with deadline(0.01):
+            # The task inherits the deadline but queues behind the hog past it
+            job = asyncio.ensure_future(executor.run(ran.append, 1))
+        await blocker
+        with pytest.raises(TimeoutError, match="expired while queued"):
+            await job
+        assert ran == []
+        assert executor.snapshot()["expired"] == 1
+        executor.shutdown(wait=True)
+
+
+class TestConfigureExecutors:
+    def test_caps_applied_per_backend(self):
+        configure_executors(_Caps(mem0=3, supabase=7, voyage=2, default=5))
+        assert get_executor("mem0").max_workers == 3
+        assert get_executor("supabase").max_workers == 7
+        assert get_executor("voyage").max_workers == 2
+        assert get_executor("openai").max_workers == 5
+
+    def test_reconfigure_replaces_changed_executor(self):
+        configure_executors(_Caps(mem0=3))
+        first = get_executor("mem0")
+        configure_executors(_Caps(mem0=3))
+        assert get_executor("mem0") is first
+        configure_executors(_Caps(mem0=6))
+        assert get_executor("mem0") is not first
+        assert get_executor("mem0").max_workers == 6
+
+
+class TestRetryUsesBackendExecutor:
+    async def test_async_retry_runs_on_config_backend(self):
+        cfg = RetryConfig(max_attempts=2, min_wait=0, max_wait=0, backend="openai")
+        name = await async_retry(lambda: threading.current_thread().name, config=cfg)
+        assert name.startswith("brain-openai")
+        assert executor_stats()["openai"]["completed"] == 1
+
+
+class _Caps:
+    def __init__(self, mem0=8, supabase=16, voyage=8, default=4):
+        self.mem0_max_workers = mem0
+        self.supabase_max_workers = supabase
+        self.voyage_max_workers = voyage
+        self.executor_default_max_workers = default
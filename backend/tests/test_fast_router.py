@@ -0,0 +1,106 @@
+"""Tests for the deterministic fast-path router."""
+
+import pytest
+
+from second_brain.agents.fast_router import fast_route, fast_router_stats, reset_fast_router_stats
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    reset_fast_router_stats()
+    yield
+    reset_fast_router_stats()
+
+
+class TestFastRoute:
+    @pytest.mark.parametrize("message", ["Hello!", "thanks", "hey there", "good morning"])
+    def test_conversational(self, message):
+        decision = fast_route(message)
+        assert decision.target_agent == "conversational"
+        assert decision.confidence == "HIGH"
+
+    @pytest.mark.parametrize("message,route", [
+        ("Recall my pricing decisions", "recall"),
+        ("Find my notes about onboarding", "recall"),
+        ("What do I know about churn?", "recall"),
+        ("Can you search my memory for hiring lessons", "recall"),
+        ("Write a LinkedIn post about remote work", "linkedin_writer"),
+        ("Draft a reply comment for this LinkedIn thread", "linkedin_engagement"),
+        ("Write me a short launch email for the beta", "create"),
+        ("Please draft a newsletter about Q3", "create"),
+        ("Review this draft: our product is the best", "review"),
+        ("Check the readability of this paragraph", "clarity"),
+        ("Plan my day", "coach"),
+        ("Prioritize my tasks for this week", "pmo"),
+        ("Check my inbox", "email"),
+        ("Learn from this session transcript", "learn"),
+        ("Find reusable templates in this proposal", "template_builder"),
+    ])
+    def test_unambiguous_intents(self, message, route):
+        decision = fast_route(message)
+        assert decision is not None
+        assert decision.target_agent == route
+        assert decision.reasoning
+
+    def test_complex_recall_goes_deep(self):
+        decision = fast_route("Recall everything I learned about pricing across all client projects")
+        assert decision.target_agent == "recall_deep"
+        assert decision.query_complexity == "complex"
+
+    @pytest.mark.parametrize("message", [
+        "How should I think about pricing for enterprise customers?",
+        "Recall my pricing notes and then write a LinkedIn post",
+        "Research competitors, then draft an email",
+        "pricing",
+        "My manager wants a summary of our Q3 wins",
+    ])
+    def test_uncertain_falls_through(self, message):
+        assert fast_route(message) is None
+
+    @pytest.mark.parametrize("message", [
+        "Remind me to call Bob tomorrow at 3pm",
+        "review my calendar for next week",
+        "recall is low on my classifier",
+        "look up flights to Paris",
+        "Learn from your mistakes",
+        "Score my chances of getting the deal",
+    ])
+    def test_keyword_without_its_object_falls_through(self, message):
+        assert fast_route(message) is None
+
+    @pytest.mark.parametrize("message,route", [
+        ("Remind me what we decided about pricing", "recall"),
+        ("Look up my notes on onboarding", "recall"),
+        ("Review this: our product is the best", "review"),
+        ("Critique my LinkedIn post about hiring", "review"),
+    ])
+    def test_keyword_with_its_object_routes(self, message, route):
+        assert fast_route(message).target_agent == route
+
+    @pytest.mark.parametrize("message", [
+        "create a content type for newsletters",
+        "create a message queue in rabbitmq",
+        "write a python script to parse csv",
+        "create an email account for the new hire",
+        "write a detailed python tutorial script",
+    ])
+    def test_create_needs_a_piece_of_writing(self, message):
+        assert fast_route(message) is None
+
+    @pytest.mark.parametrize("message", [
+        "Write a sales script for cold calls",
+        "Write me a follow-up message to Dana",
+        "Write a twitter thread on AI agents",
+    ])
+    def test_ambiguous_nouns_route_behind_a_content_qualifier(self, message):
+        assert fast_route(message).target_agent == "create"
+
+    def test_stats(self):
+        fast_route("hi")
+        fast_route("Recall my pricing notes")
+        fast_route("What should I focus on?")
+        stats = fast_router_stats()
+        assert stats["fast"] == 2
+        assert stats["fallthrough"] == 1
+        assert stats["fast_ratio"] == pytest.approx(0.667)
+        assert stats["routes"] == {"conversational": 1, "recall": 1}
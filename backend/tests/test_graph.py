@@ -100,6 +100,7 @@ class TestReingestVerification:
         # Configure BrainConfig mock
         mock_config = MagicMock()
         mock_config.graph_provider = "mem0"
+        mock_config.graphiti_enabled = False
         mock_config_cls.return_value = mock_config
 
         # Configure MemoryService mock
@@ -146,6 +147,7 @@ class TestGraphitiMemoryAdapterSearch:
             config = MagicMock()
             config.brain_user_id = "user1"
             config.service_timeout_seconds = 30
+            config.keepalive_interval_seconds = 0
             adapter = GraphitiMemoryAdapter(config)
             adapter._graphiti = mock_gs
             result = await adapter.search("test query")
@@ -166,6 +168,7 @@ class TestGraphitiMemoryAdapterSearch:
             config = MagicMock()
             config.brain_user_id = "user1"
             config.service_timeout_seconds = 30
+            config.keepalive_interval_seconds = 0
             adapter = GraphitiMemoryAdapter(config)
             adapter._graphiti = mock_gs
             filters = {"category": "pattern"}
@@ -182,6 +185,7 @@ class TestGraphitiMemoryAdapterSearch:
             config = MagicMock()
             config.brain_user_id = "user1"
             config.service_timeout_seconds = 30
+            config.keepalive_interval_seconds = 0
             adapter = GraphitiMemoryAdapter(config)
             adapter._graphiti = mock_gs
             result = await adapter.search("test")
@@ -199,6 +203,7 @@ class TestGraphitiMemoryAdapterSearch:
             config = MagicMock()
             config.brain_user_id = "user1"
             config.service_timeout_seconds = 30
+            config.keepalive_interval_seconds = 0
             adapter = GraphitiMemoryAdapter(config)
             adapter._graphiti = mock_gs
             result = await adapter.search_by_category("pattern", "coding")
@@ -216,6 +221,7 @@ class TestGraphitiMemoryAdapterSearch:
             config = MagicMock()
             config.brain_user_id = "user1"
             config.service_timeout_seconds = 30
+            config.keepalive_interval_seconds = 0
             adapter = GraphitiMemoryAdapter(config)
             adapter._graphiti = mock_gs
             mem = await adapter.get_by_id("ep-123")
@@ -0,0 +1,78 @@
+"""Tests for the per-group graph query cache."""
+
+from unittest.mock import patch
+
+from second_brain.services.graph_cache import GraphQueryCache
+
+
+def _put(cache, group, key, value):
+    cache.put(group, key, value, cache.generation(group))
+
+
+class TestGraphQueryCache:
+    def test_hit_after_put_and_stats(self):
+        cache = GraphQueryCache()
+        assert cache.get("g1", "k") == (False, None)
+        _put(cache, "g1", "k", [{"a": 1}])
+        assert cache.get("g1", "k") == (True, [{"a": 1}])
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_returns_copies(self):
+        cache = GraphQueryCache()
+        _put(cache, "g1", "k", [{"a": 1}])
+        _, value = cache.get("g1", "k")
+        value[0]["a"] = 2
+        assert cache.get("g1", "k")[1] == [{"a": 1}]
+
+    def test_expired_entry_is_a_miss(self):
+        cache = GraphQueryCache(ttl=10)
+        _put(cache, "g1", "k", [1])
+        with patch("second_brain.services.graph_cache.time.monotonic", return_value=1e12):
+            assert cache.get("g1", "k") == (False, None)
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidate_group_keeps_other_groups(self):
+        cache = GraphQueryCache()
+        _put(cache, "g1", "k", [1])
+        _put(cache, "g2", "k", [2])
+        _put(cache, None, "k", [3])
+        cache.invalidate("g1")
+        assert cache.get("g1", "k")[0] is False
+        assert cache.get("g2", "k") == (True, [2])
+        # Unscoped queries span every group, so they are dropped too
+        assert cache.get(None, "k")[0] is False
+
+    def test_invalidate_all(self):
+        cache = GraphQueryCache()
+        _put(cache, "g1", "k", [1])
+        _put(cache, "g2", "k", [2])
+        cache.invalidate()
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["invalidations"] == 1
+
+    def test_in_flight_result_dropped_after_invalidation(self):
+        cache = GraphQueryCache()
+        gen = cache.generation("g1")
+        cache.invalidate("g1")
+        cache.put("g1", "k", [1], gen)
+        assert cache.get("g1", "k")[0] is False
+
+        gen = cache.generation("g2")
+        cache.invalidate()  # global invalidation covers groups never seen before
+        cache.put("g2", "k", [1], gen)
+        assert cache.get("g2", "k")[0] is False
+
+    def test_lru_eviction_from_largest_group(self):
+        cache = GraphQueryCache(max_entries=3)
+        _put(cache, "small", "k", [0])
+        _put(cache, "big", "k1", [1])
+        _put(cache, "big", "k2", [2])
+        cache.get("big", "k1")  # k1 is now most recent
+        _put(cache, "big", "k3", [3])
+        assert cache.get("big", "k2")[0] is False
+        assert cache.get("big", "k1")[0] is True
+        assert cache.get("small", "k")[0] is True
+        assert cache.stats()["evictions"] == 1
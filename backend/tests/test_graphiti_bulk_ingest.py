@@ -0,0 +1,86 @@
+"""Chunked ingest against the real graphiti-core bulk path (LLM and database faked)."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("graphiti_core")
+
+from graphiti_core import Graphiti  # noqa: E402
+from graphiti_core.llm_client.client import LLMClient  # noqa: E402
+
+from second_brain.config import BrainConfig  # noqa: E402
+from second_brain.services.graphiti import GraphitiService  # noqa: E402
+
+
+class _ExtractionLLM(LLMClient):
+    """Answers every prompt with empty extractions, counting overlapping calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _generate_response(self, messages, *args, **kwargs) -> dict:
+        return {}
+
+    async def generate_response(self, messages, *args, **kwargs) -> dict:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {
+            "extracted_nodes": [], "extracted_entities": [], "nodes": [],
+            "edges": [], "entity_resolutions": [], "edge_dates": [],
+        }
+
+
+class _Embedder:
+    async def create(self, input_data):
+        return [0.0] * 8
+
+
+class _EmptyGraph:
+    async def execute_query(self, query, **params):
+        from neo4j import EagerResult
+        return EagerResult([], None, [])
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = BrainConfig(
+        graph_provider="graphiti",
+        neo4j_url="neo4j://localhost:7687",
+        neo4j_username="neo4j",
+        neo4j_password="test",
+        supabase_url="https://test.supabase.co",
+        supabase_key="test-key",
+        brain_data_path=tmp_path,
+        graphiti_ingest_concurrency=4,
+        _env_file=None,
+    )
+    service = GraphitiService(config)
+    llm = _ExtractionLLM()
+    client = Graphiti(
+        "bolt://localhost:7687", "neo4j", "test",
+        llm_client=llm, embedder=_Embedder(), cross_encoder=object(),
+    )
+    client.driver = _EmptyGraph()
+    service._client = client
+    service._initialized = True
+    return service, llm
+
+
+async def test_chunks_of_one_group_extract_concurrently(service):
+    service, llm = service
+    content = " ".join(f"Sentence {i} about the Acme launch." for i in range(600))
+
+    count = await service.add_episodes_chunked(content, group_id="acme", chunk_size=2000)
+
+    assert count > 4
+    assert llm.peak > 1
+    assert service.ingest_stats()["in_flight"] == 0
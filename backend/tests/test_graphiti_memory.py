@@ -16,6 +16,7 @@ def mock_config():
     config = MagicMock()
     config.brain_user_id = "test-user"
     config.service_timeout_seconds = 30
+    config.keepalive_interval_seconds = 0
     return config
 
 
@@ -366,6 +367,7 @@ class TestGraphitiMemoryTimeout:
         config = MagicMock()
         config.brain_user_id = "test-user"
         config.service_timeout_seconds = 0.01  # Very short timeout for tests
+        config.keepalive_interval_seconds = 0
         return config
 
     @pytest.fixture
@@ -415,6 +417,7 @@ class TestGraphitiMemoryTimeout:
         config = MagicMock()
         config.brain_user_id = "test-user"
         config.service_timeout_seconds = 42.0
+        config.keepalive_interval_seconds = 0
         mock_gs_cls.return_value = AsyncMock()
 
         adapter = GraphitiMemoryAdapter(config)
@@ -430,6 +433,7 @@ class TestGraphitiMemoryOverrideUserId:
         config = MagicMock()
         config.brain_user_id = "default-user"
         config.service_timeout_seconds = 30
+        config.keepalive_interval_seconds = 0
         return config
 
     @patch("second_brain.services.graphiti.GraphitiService")
@@ -483,67 +487,50 @@ class TestGraphitiMemoryOverrideUserId:
         assert adapter._effective_user_id("") == "default-user"
 
 
-class TestGraphitiMemoryIdleReconnect:
-    """Tests for idle reconnect logic in GraphitiMemoryAdapter."""
+class TestGraphitiMemoryKeepAlive:
+    """Idle sessions are kept alive in the background, not rebuilt per request."""
 
     @pytest.fixture
     def mock_config(self):
         config = MagicMock()
         config.brain_user_id = "test-user"
         config.service_timeout_seconds = 30
+        config.keepalive_interval_seconds = 0
+        config.keepalive_interval_seconds = 0
         return config
 
-    @patch("time.monotonic")
-    @patch("second_brain.services.graphiti.GraphitiService")
-    async def test_reconnects_after_idle_threshold(
-        self, mock_gs_cls, mock_time, mock_config
-    ):
-        """Client is re-instantiated after idle threshold exceeded."""
-        # First call at t=0
-        mock_time.return_value = 0
-        mock_gs = AsyncMock()
-        mock_gs.search = AsyncMock(return_value=[])
-        mock_gs_cls.return_value = mock_gs
-
-        adapter = GraphitiMemoryAdapter(mock_config)
-        initial_call_count = mock_gs_cls.call_count
-
-        # Simulate 5 minutes (300s) passing — exceeds 240s threshold
-        mock_time.return_value = 300
-
-        await adapter.search("test")
-
-        # Client should have been re-instantiated (2 total: init + reconnect)
-        assert mock_gs_cls.call_count == initial_call_count + 1
+    @pytest.fixture(autouse=True)
+    def _fresh_stats(self):
+        from second_brain.services.keepalive import reset_connection_stats
+        reset_connection_stats()
+        yield
+        reset_connection_stats()
 
     @patch("time.monotonic")
     @patch("second_brain.services.graphiti.GraphitiService")
-    async def test_no_reconnect_when_recent_activity(
+    async def test_idle_request_is_cold_without_reconnect(
         self, mock_gs_cls, mock_time, mock_config
     ):
-        """Client is NOT re-instantiated when activity is recent."""
+        """A request after 5 idle minutes is recorded as cold; the service is kept."""
         mock_time.return_value = 0
         mock_gs = AsyncMock()
         mock_gs.search = AsyncMock(return_value=[])
         mock_gs_cls.return_value = mock_gs
 
         adapter = GraphitiMemoryAdapter(mock_config)
-        initial_call_count = mock_gs_cls.call_count
-
-        # Simulate only 60s passing — well under 240s threshold
-        mock_time.return_value = 60
 
+        mock_time.return_value = 300
         await adapter.search("test")
 
-        # No reconnect — same call count
-        assert mock_gs_cls.call_count == initial_call_count
+        assert mock_gs_cls.call_count == 1
+        assert adapter._keepalive.stats.cold_requests == 1
 
     @patch("time.monotonic")
     @patch("second_brain.services.graphiti.GraphitiService")
     async def test_activity_updates_on_every_call(
         self, mock_gs_cls, mock_time, mock_config
     ):
-        """_last_activity is updated on every method call."""
+        """Each call refreshes activity, so steady traffic is never cold."""
         mock_time.return_value = 0
         mock_gs = AsyncMock()
         mock_gs.search = AsyncMock(return_value=[])
@@ -552,21 +539,38 @@ class TestGraphitiMemoryIdleReconnect:
 
         adapter = GraphitiMemoryAdapter(mock_config)
 
-        # First search at t=100
-        mock_time.return_value = 100
-        await adapter.search("test")
-
-        # Add at t=200 (only 100s since last activity, not 200s since init)
         mock_time.return_value = 200
+        await adapter.search("test")
+        mock_time.return_value = 400
         await adapter.add("content")
-
-        # Search at t=300 (only 100s since last activity)
-        mock_time.return_value = 300
+        mock_time.return_value = 600
         await adapter.search("test2")
 
-        # No reconnect because each call updates activity timestamp
-        # Only 1 GraphitiService instantiation (the initial one)
+        assert adapter._keepalive.stats.cold_requests == 0
+        assert adapter._keepalive.stats.warm_requests == 3
+        assert mock_gs_cls.call_count == 1
+
+    @patch("second_brain.services.graphiti.GraphitiService")
+    async def test_failed_pings_reconnect_service_in_place(self, mock_gs_cls, mock_config):
+        """Consecutive failed pings reconnect GraphitiService off the request path."""
+        service = AsyncMock()
+        service.ping = AsyncMock(side_effect=[ConnectionError("stale")] * 2 + [None] * 100)
+        mock_gs_cls.return_value = service
+
+        adapter = GraphitiMemoryAdapter(mock_config)
+        adapter._keepalive.interval = 0.01
+        adapter._keepalive._last_activity -= 300
+        adapter._keepalive._ensure_started()
+        for _ in range(100):
+            if service.reconnect.await_count:
+                break
+            await asyncio.sleep(0.01)
+        adapter._keepalive.stop()
+
+        assert adapter._graphiti is service
         assert mock_gs_cls.call_count == 1
+        service.reconnect.assert_awaited_once()
+        assert adapter._keepalive.stats.reconnects == 1
 
 
 class TestGraphitiMemoryRetry:
@@ -577,6 +581,7 @@ class TestGraphitiMemoryRetry:
         config = MagicMock()
         config.brain_user_id = "test-user"
         config.service_timeout_seconds = 30  # Normal timeout for retry tests
+        config.keepalive_interval_seconds = 0
         return config
 
     @patch("second_brain.services.graphiti.GraphitiService")
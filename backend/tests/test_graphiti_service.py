@@ -12,10 +12,14 @@ def _mock_graphiti_core():
     """Inject a mock graphiti_core module so imports don't fail."""
     mock_module = MagicMock()
     mock_module.Graphiti = MagicMock()
-    mock_module.edges.EpisodeType.text = "text"
+    mock_module.nodes.EpisodeType.text = "text"
+    # RawEpisode(**fields) -> fields, so tests can read bulk batches
+    mock_module.utils.bulk_utils.RawEpisode = dict
     with patch.dict(sys.modules, {
         "graphiti_core": mock_module,
-        "graphiti_core.edges": mock_module.edges,
+        "graphiti_core.nodes": mock_module.nodes,
+        "graphiti_core.utils": mock_module.utils,
+        "graphiti_core.utils.bulk_utils": mock_module.utils.bulk_utils,
         "graphiti_core.llm_client": MagicMock(),
         "graphiti_core.llm_client.config": MagicMock(),
         "graphiti_core.llm_client.anthropic_client": MagicMock(),
@@ -45,6 +49,14 @@ def graphiti_config(tmp_path):
     )
 
 
+def _ingested(client) -> list[str]:
+    """Episode bodies a mocked graphiti client received, single and bulk."""
+    bodies = [c.kwargs["episode_body"] for c in client.add_episode.call_args_list]
+    for call in client.add_episode_bulk.call_args_list:
+        bodies.extend(raw["content"] for raw in call.args[0])
+    return bodies
+
+
 class TestGraphitiServiceInit:
     """Test initialization and lazy setup."""
 
@@ -309,6 +321,57 @@ class TestGraphitiServiceHealth:
         result = await service.health_check()
         assert result["status"] == "unavailable"
 
+    async def test_ping_runs_trivial_query(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = MagicMock()
+        service._client.driver.execute_query = AsyncMock(return_value=([], None, None))
+        await service.ping()
+        service._client.driver.execute_query.assert_awaited_once_with("RETURN 1")
+        service._client.search.assert_not_called()
+
+    async def test_ping_raises_when_unavailable(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._init_failed = True
+        with pytest.raises(ConnectionError):
+            await service.ping()
+
+    async def test_reconnect_keeps_cache_and_scheduler(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        old = AsyncMock()
+        service._client = old
+        cache, scheduler = service._query_cache, service.episode_scheduler
+        service._episode_counts["g"] = (5, 0.0)
+
+        async def _init():
+            service._client, service._initialized = MagicMock(), True
+
+        with patch.object(service, "_initialize", side_effect=_init):
+            await service.reconnect()
+
+        old.close.assert_awaited_once()
+        assert service._initialized and service._client is not old
+        assert service._query_cache is cache and service.episode_scheduler is scheduler
+        assert service._episode_counts["g"] == (5, 0.0)
+
+    async def test_reconnect_raises_while_unreachable(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._init_failed = True
+
+        async def _init():
+            service._init_failed = True
+
+        with patch.object(service, "_initialize", side_effect=_init) as init:
+            with pytest.raises(ConnectionError):
+                await service.reconnect()
+        init.assert_awaited_once()
+        assert not service.is_available
+
 
 class TestGraphitiServiceBatch:
     """Test batch episode add."""
@@ -455,7 +518,7 @@ class TestAddEpisodesChunked:
             metadata={"source": "test"},
             chunk_size=2000,
         )
-        assert service._client.add_episode.call_count > 1
+        assert len(_ingested(service._client)) > 1
 
     async def test_empty_content_single_episode(self, graphiti_config):
         """Empty/short content produces a single episode."""
@@ -477,6 +540,204 @@ class TestAddEpisodesChunked:
         assert count == 1
 
 
+class TestConcurrentEpisodeIngest:
+    """Chunked/batch ingest runs on the shared adaptive scheduler."""
+
+    async def test_chunks_of_one_group_extract_in_bulk_batches(self, graphiti_config):
+        import asyncio
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        in_flight = 0
+        peak = 0
+
+        async def _slow_bulk(raw_episodes, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        service._client = AsyncMock()
+        service._client.add_episode_bulk = AsyncMock(side_effect=_slow_bulk)
+        count = await service.add_episodes_chunked(
+            " ".join(f"Sentence {i}." for i in range(1500)),
+            metadata={"reference_time": "2025-01-01T00:00:00+00:00"},
+            chunk_size=2000,
+            group_id="doc",
+        )
+
+        batches = [c.args[0] for c in service._client.add_episode_bulk.call_args_list]
+        assert len(batches[0]) == graphiti_config.graphiti_ingest_concurrency
+        assert count == len(_ingested(service._client)) > 3
+        # One batch of a group resolves at a time; its episodes extract together
+        assert peak == 1
+        assert all(c.kwargs["group_id"] == "doc" for c in service._client.add_episode_bulk.call_args_list)
+        times = [raw["reference_time"] for batch in batches for raw in batch]
+        assert times == sorted(times) and len(set(times)) == len(times)
+        assert times[0].isoformat() == "2025-01-01T00:00:00+00:00"
+
+    async def test_groups_ingest_concurrently(self, graphiti_config):
+        import asyncio
+        from second_brain.services.graphiti import GraphitiService
+        graphiti_config.graphiti_ingest_concurrency = 4
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        active: dict = {}
+        overlaps = []
+
+        async def _slow_add(*raw, group_id=None, **kwargs):
+            assert not active.get(group_id), "same-group batches overlapped"
+            active[group_id] = True
+            overlaps.append(sum(active.values()))
+            await asyncio.sleep(0.01)
+            active[group_id] = False
+
+        service._client = AsyncMock()
+        service._client.add_episode = AsyncMock(side_effect=_slow_add)
+        service._client.add_episode_bulk = AsyncMock(side_effect=_slow_add)
+        count = await service.add_episodes_batch([
+            {"content": f"episode {i}", "group_id": f"g{i % 2}"} for i in range(6)
+        ])
+
+        assert count == 6
+        assert max(overlaps) == 2
+        g0 = [raw["content"] for c in service._client.add_episode_bulk.call_args_list
+              if c.kwargs["group_id"] == "g0" for raw in c.args[0]]
+        assert g0 == ["episode 0", "episode 2", "episode 4"]
+
+    async def test_failed_batches_not_counted(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = AsyncMock()
+        service._client.add_episode_bulk = AsyncMock(
+            side_effect=[None, ValueError("bad extraction"), None, None, None, None],
+        )
+        count = await service.add_episodes_chunked(
+            " ".join(f"Sentence {i}." for i in range(1500)), chunk_size=2000,
+        )
+        failed = len(service._client.add_episode_bulk.call_args_list[1].args[0])
+        assert count == len(_ingested(service._client)) - failed
+
+    async def test_bulk_failures_are_not_retried(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = AsyncMock()
+        service._client.add_episode_bulk = AsyncMock(side_effect=ConnectionError("down"))
+        count = await service.add_episodes_batch([{"content": "a"}, {"content": "b"}])
+        assert count == 0
+        assert service._client.add_episode_bulk.await_count == 1
+
+    async def test_rate_limit_halves_concurrency(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+
+        class RateLimitError(Exception):
+            pass
+
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = AsyncMock()
+        service._client.add_episode = AsyncMock(side_effect=RateLimitError("429"))
+        limiter = service.episode_scheduler.limiter
+        before = limiter.limit
+
+        count = await service.add_episodes_batch([{"content": "a"}])
+
+        assert count == 0
+        assert limiter.limit == max(1, before // 2)
+        assert limiter.rate_limited == 1
+
+    async def test_batch_passes_group_id(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = AsyncMock()
+        await service.add_episodes_batch([{"content": "a", "group_id": "g1"}, {"content": "b"}])
+        calls = service._client.add_episode.call_args_list
+        assert calls[0].kwargs["group_id"] == "g1"
+        assert "group_id" not in calls[1].kwargs
+        assert calls[0].kwargs["reference_time"] < calls[1].kwargs["reference_time"]
+
+
+class TestEpisodeDedup:
+    """Content-addressed (sha256) episode deduplication."""
+
+    def _service(self, graphiti_config, existing=()):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = AsyncMock()
+        existing = set(existing)
+        lookups = []
+
+        async def _execute(query, **params):
+            if "content_key IN" in query:
+                lookups.append(params["keys"])
+                return [{"key": k} for k in params["keys"] if k in existing], None, None
+            return [], None, None
+
+        service._client.driver.execute_query = AsyncMock(side_effect=_execute)
+        service._client.add_episode = AsyncMock(
+            side_effect=lambda **kw: MagicMock(episode=MagicMock(uuid=f"uuid-{kw['name']}")),
+        )
+        return service, lookups
+
+    def test_content_key_is_stable_and_group_scoped(self):
+        from second_brain.services.graphiti import episode_content_key
+        key = episode_content_key("hello", "g1")
+        assert key == episode_content_key("hello", "g1")
+        assert len(key) == 64
+        assert key != episode_content_key("hello", "g2")
+        assert key != episode_content_key("hello!", "g1")
+
+    async def test_add_episode_skips_existing_content(self, graphiti_config):
+        from second_brain.services.graphiti import episode_content_key
+        service, _ = self._service(graphiti_config, existing={episode_content_key("seen", None)})
+        await service.add_episode("seen")
+        service._client.add_episode.assert_not_called()
+
+    async def test_add_episode_tags_new_episode_with_key(self, graphiti_config):
+        from second_brain.services.graphiti import episode_content_key
+        service, _ = self._service(graphiti_config)
+        await service.add_episode("fresh", group_id="g1")
+        service._client.add_episode.assert_called_once()
+        tag_call = service._client.driver.execute_query.call_args_list[-1]
+        assert "SET e.content_key" in tag_call.args[0]
+        assert tag_call.kwargs["key"] == episode_content_key("fresh", "g1")
+        assert tag_call.kwargs["uuid"].startswith("uuid-")
+
+    async def test_batch_single_lookup_skips_existing_and_repeats(self, graphiti_config):
+        from second_brain.services.graphiti import episode_content_key
+        service, lookups = self._service(graphiti_config, existing={episode_content_key("old", None)})
+        count = await service.add_episodes_batch([
+            {"content": "old"}, {"content": "new"}, {"content": "new"}, {"content": "other"},
+        ])
+        assert count == 2
+        assert len(lookups) == 1
+        assert sorted(_ingested(service._client)) == ["new", "other"]
+
+    async def test_bulk_batch_tags_keys_by_name(self, graphiti_config):
+        from second_brain.services.graphiti import episode_content_key
+        service, _ = self._service(graphiti_config)
+        await service.add_episodes_batch([
+            {"content": "a", "group_id": "g1"}, {"content": "b", "group_id": "g1"},
+        ])
+        tag_call = service._client.driver.execute_query.call_args_list[-1]
+        assert tag_call.args[0].startswith("UNWIND $rows")
+        assert [row["key"] for row in tag_call.kwargs["rows"]] == [
+            episode_content_key("a", "g1"), episode_content_key("b", "g1"),
+        ]
+        assert [row["content"] for row in tag_call.kwargs["rows"]] == ["a", "b"]
+
+    async def test_lookup_failure_still_ingests(self, graphiti_config):
+        service, _ = self._service(graphiti_config)
+        service._client.driver.execute_query = AsyncMock(side_effect=RuntimeError("db"))
+        count = await service.add_episodes_batch([{"content": "a"}, {"content": "b"}])
+        assert count == 2
+
+
 class TestAddEpisodeMetadata:
     """Test improved add_episode() metadata handling."""
 
@@ -693,6 +954,128 @@ class TestGetEpisodeCount:
         assert result == 0
 
 
+class TestEpisodePagination:
+    """get_episodes_page() keyset pagination by (created_at, uuid)."""
+
+    @staticmethod
+    def _service(graphiti_config, records):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._backend = "neo4j"
+        service._client = MagicMock()
+        service._client.driver = AsyncMock()
+        service._client.driver.execute_query.return_value = (records, None, None)
+        return service
+
+    @staticmethod
+    def _records(n):
+        return [
+            {"id": f"uuid-{i}", "content": f"ep {i}", "source": "test", "created_at": f"2026-01-0{9 - i}T00:00:00"}
+            for i in range(n)
+        ]
+
+    async def test_first_page_has_next_cursor(self, graphiti_config):
+        from second_brain.services.graphiti import decode_episode_cursor
+        service = self._service(graphiti_config, self._records(3))
+        page = await service.get_episodes_page("user-1", limit=2)
+        assert [e["id"] for e in page["episodes"]] == ["uuid-0", "uuid-1"]
+        assert decode_episode_cursor(page["next_cursor"]) == ("2026-01-08T00:00:00", "uuid-1")
+        cypher = service._client.driver.execute_query.call_args[0][0]
+        kwargs = service._client.driver.execute_query.call_args[1]
+        assert "ORDER BY e.created_at DESC, e.uuid DESC" in cypher
+        assert kwargs["lim"] == 3  # one extra row detects the next page
+
+    async def test_last_page_has_no_cursor(self, graphiti_config):
+        service = self._service(graphiti_config, self._records(2))
+        page = await service.get_episodes_page(limit=2)
+        assert len(page["episodes"]) == 2
+        assert page["next_cursor"] is None
+
+    async def test_cursor_filters_after_last_row(self, graphiti_config):
+        from second_brain.services.graphiti import encode_episode_cursor
+        service = self._service(graphiti_config, [])
+        cursor = encode_episode_cursor("2026-01-08T00:00:00", "uuid-1")
+        await service.get_episodes_page("user-1", limit=2, cursor=cursor)
+        cypher = service._client.driver.execute_query.call_args[0][0]
+        kwargs = service._client.driver.execute_query.call_args[1]
+        assert "e.created_at < datetime($ts)" in cypher
+        assert "e.uuid < $uid" in cypher
+        assert kwargs["ts"] == "2026-01-08T00:00:00"
+        assert kwargs["uid"] == "uuid-1"
+        assert kwargs["gid"] == "user-1"
+
+    async def test_falkordb_compares_iso_strings(self, graphiti_config):
+        from second_brain.services.graphiti import encode_episode_cursor
+        service = self._service(graphiti_config, [])
+        service._backend = "falkordb"
+        await service.get_episodes_page(cursor=encode_episode_cursor("2026-01-08", "u"))
+        cypher = service._client.driver.execute_query.call_args[0][0]
+        assert "e.created_at < $ts" in cypher
+
+    async def test_invalid_cursor_raises(self, graphiti_config):
+        service = self._service(graphiti_config, [])
+        with pytest.raises(ValueError, match="Invalid episode cursor"):
+            await service.get_episodes_page(cursor="not-a-cursor")
+
+
+class TestIncrementalEpisodeCount:
+    """get_episode_count() is maintained on writes and reconciled periodically."""
+
+    @staticmethod
+    def _service(graphiti_config, count):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = MagicMock()
+        service._client.add_episode = AsyncMock(return_value=MagicMock())
+        service._client.driver = AsyncMock()
+
+        async def _execute(query, **params):
+            if "RETURN count(e) AS cnt" in query:
+                return [{"cnt": count}], None, None
+            if "DETACH DELETE" in query and "$uuid" in query:
+                return [{"gid": "g1", "deleted": 1}], None, None
+            return [], None, None
+
+        service._client.driver.execute_query.side_effect = _execute
+        return service
+
+    @staticmethod
+    def _count_queries(service):
+        return sum(
+            "RETURN count(e) AS cnt" in c[0][0]
+            for c in service._client.driver.execute_query.call_args_list
+        )
+
+    async def test_count_served_incrementally(self, graphiti_config):
+        service = self._service(graphiti_config, 5)
+        assert await service.get_episode_count("g1") == 5
+        assert await service.get_episode_count() == 5
+        await service.add_episode("new fact", group_id="g1")
+        assert await service.get_episode_count("g1") == 6
+        assert await service.get_episode_count() == 6
+        await service.remove_episode("ep-1")
+        assert await service.get_episode_count("g1") == 5
+        assert self._count_queries(service) == 2
+
+    async def test_delete_group_zeroes_count(self, graphiti_config):
+        service = self._service(graphiti_config, 5)
+        await service.get_episode_count("g1")
+        await service.delete_group_data("g1")
+        assert await service.get_episode_count("g1") == 0
+        assert self._count_queries(service) == 1
+
+    async def test_reconciles_after_interval(self, graphiti_config):
+        config = graphiti_config.model_copy(update={"graphiti_episode_count_reconcile_seconds": 0})
+        from second_brain.services.graphiti import GraphitiService
+        service = self._service(config, 5)
+        assert isinstance(service, GraphitiService)
+        await service.get_episode_count("g1")
+        await service.get_episode_count("g1")
+        assert self._count_queries(service) == 2
+
+
 class TestDeleteGroupData:
     """Test delete_group_data() via Cypher query."""
 
@@ -753,6 +1136,8 @@ class TestTimeoutWrapping:
         config = MagicMock(spec=[])
         config.neo4j_url = None
         config.falkordb_url = None
+        config.graph_cache_ttl_seconds = 0
+        config.graphiti_episode_count_reconcile_seconds = 0
         from second_brain.services.graphiti import GraphitiService
         service = GraphitiService(config)
         assert service._timeout == 15
@@ -919,13 +1304,14 @@ class TestSearchEntities:
         assert entities == []
 
     async def test_label_fallback(self, graphiti_config):
-        """Should try Entity first, then EntityNode."""
+        """Without a full-text index: scan Entity first, then EntityNode."""
         from second_brain.services.graphiti import GraphitiService
         service = GraphitiService(graphiti_config)
         service._initialized = True
         mock_driver = AsyncMock()
-        # First call (Entity label) returns empty, second call (EntityNode) returns data
+        # Full-text query fails, Entity scan returns empty, EntityNode scan returns data
         mock_driver.execute_query.side_effect = [
+            Exception("There is no such fulltext schema index"),
             ([], None, None),
             ([{"uuid": "e1", "name": "Bob", "summary": "", "labels": [], "created_at": None}], None, None),
         ]
@@ -933,7 +1319,103 @@ class TestSearchEntities:
         entities = await service.search_entities("Bob")
         assert len(entities) == 1
         assert entities[0]["name"] == "Bob"
-        assert mock_driver.execute_query.call_count == 2
+        assert mock_driver.execute_query.call_count == 3
+        assert "CONTAINS" in mock_driver.execute_query.call_args_list[1][0][0]
+
+    async def test_fulltext_failure_remembered(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.side_effect = [
+            Exception("no such index"),
+            ([], None, None), ([], None, None),
+            ([], None, None), ([], None, None),
+        ]
+        service._client = MagicMock(driver=mock_driver)
+        await service.search_entities("Bob")
+        await service.search_entities("Bob")
+        queries = [c[0][0] for c in mock_driver.execute_query.call_args_list]
+        assert sum("fulltext" in q for q in queries) == 1
+
+    async def test_fulltext_single_ranked_query(self, graphiti_config):
+        """Neo4j: one index query over both labels, ordered by score."""
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.return_value = (
+            [
+                {"uuid": "e2", "name": "Alice Cooper", "summary": "", "labels": [], "created_at": None, "score": 0.4},
+                {"uuid": "e1", "name": "Alice", "summary": "", "labels": [], "created_at": None, "score": 2.1},
+            ],
+            None, None,
+        )
+        service._client = MagicMock(driver=mock_driver)
+        entities = await service.search_entities("alice", limit=5)
+        assert [e["uuid"] for e in entities] == ["e1", "e2"]
+        assert mock_driver.execute_query.call_count == 1
+        cypher = mock_driver.execute_query.call_args[0][0]
+        kwargs = mock_driver.execute_query.call_args[1]
+        assert "db.index.fulltext.queryNodes" in cypher
+        assert "CONTAINS" not in cypher
+        assert kwargs["index"] == "brain_entity_text"
+        assert kwargs["q"] == "alice OR alice*"
+
+    async def test_fulltext_falkordb_queries_each_label(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._backend = "falkordb"
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.return_value = ([], None, None)
+        service._client = MagicMock(driver=mock_driver)
+        await service.search_entities("Alice", group_id="user1")
+        cypher = mock_driver.execute_query.call_args[0][0]
+        assert "db.idx.fulltext.queryNodes('Entity'" in cypher
+        assert "db.idx.fulltext.queryNodes('EntityNode'" in cypher
+        assert "UNION ALL" in cypher
+        assert mock_driver.execute_query.call_args[1]["gid"] == "user1"
+        assert mock_driver.execute_query.call_args[1]["q"] == "alice|alice*"
+
+    def test_fulltext_query_escapes_lucene_syntax(self):
+        from second_brain.services.graphiti import fulltext_query
+        assert fulltext_query("C++ (beta)") == r"c\+\+ OR c\+\+* OR \(beta\) OR \(beta\)*"
+        assert fulltext_query("a:b") == r"a\:b OR a\:b*"
+        assert fulltext_query("   ") == ""
+
+    def test_fulltext_query_keywords_are_terms(self):
+        from second_brain.services.graphiti import fulltext_query
+        assert fulltext_query("sales AND marketing") == (
+            "sales OR sales* OR and OR and* OR marketing OR marketing*"
+        )
+        assert "NOT" not in fulltext_query("NOT churn OR growth")
+
+    def test_fulltext_query_redisearch_for_falkordb(self):
+        from second_brain.services.graphiti import fulltext_query
+        assert fulltext_query("Sales AND C++ (beta) x", "falkordb") == (
+            "sales|sales*|and|and*|c|beta|beta*|x"
+        )
+
+    async def test_query_error_does_not_disable_index(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.side_effect = [
+            Exception("Failed to invoke procedure: ParseException: Cannot parse 'x'"),
+            ([], None, None), ([], None, None),
+            ([{"uuid": "e1", "name": "Bob", "summary": "", "labels": [], "created_at": None, "score": 1.0}],
+             None, None),
+        ]
+        service._client = MagicMock(driver=mock_driver)
+
+        assert await service.search_entities("Bob") == []
+        entities = await service.search_entities("Bob")
+
+        assert service._entity_fulltext is True
+        assert [e["uuid"] for e in entities] == ["e1"]
+        assert "fulltext" in mock_driver.execute_query.call_args[0][0]
 
     async def test_group_id_filtering(self, graphiti_config):
         from second_brain.services.graphiti import GraphitiService
@@ -1005,43 +1487,102 @@ class TestGetEntityContext:
 class TestTraverseNeighbors:
     """Tests for traverse_neighbors BFS traversal."""
 
-    async def test_cypher_fallback(self, graphiti_config):
-        """When search_ not available, falls back to Cypher variable-length path."""
+    @staticmethod
+    def _service(graphiti_config, driver):
         from second_brain.services.graphiti import GraphitiService
         service = GraphitiService(graphiti_config)
         service._initialized = True
+        service._client = MagicMock(spec=["driver"])
+        service._client.driver = driver
+        return service
+
+    @staticmethod
+    def _edge(src, tgt, fact=None):
+        return {
+            "source_uuid": src, "source": src.upper(), "relationship": "RELATES_TO",
+            "fact": fact or f"{src}->{tgt}", "target_uuid": tgt, "target": tgt.upper(),
+        }
+
+    async def test_single_hop(self, graphiti_config):
         mock_driver = AsyncMock()
         mock_driver.execute_query.return_value = (
             [{"source": "Alice", "relationship": "KNOWS", "target": "Bob", "fact": "friends"}],
             None, None,
         )
-        # Use spec=[] so hasattr(client, "search_") returns False
-        service._client = MagicMock(spec=["driver"])
-        service._client.driver = mock_driver
-        result = await service.traverse_neighbors("e1")
+        service = self._service(graphiti_config, mock_driver)
+        result = await service.traverse_neighbors("e1", max_hops=1)
         assert len(result) == 1
         assert result[0]["source"] == "Alice"
+        assert result[0]["relationship"] == "friends"
+        assert result[0]["hop"] == 1
+
+    async def test_label_anchored_bounded_query(self, graphiti_config):
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.return_value = ([self._edge("a", "b")], None, None)
+        service = self._service(graphiti_config, mock_driver)
+        await service.traverse_neighbors("a", max_hops=1)
+        cypher = mock_driver.execute_query.call_args[0][0]
+        kwargs = mock_driver.execute_query.call_args[1]
+        assert "(s:Entity {uuid: uid})" in cypher
+        assert "*1.." not in cypher  # no variable-length expansion
+        assert kwargs["uuids"] == ["a"]
+        assert kwargs["fanout"] == graphiti_config.graphiti_traverse_fanout
+
+    async def test_bfs_expands_frontier_without_revisiting(self, graphiti_config):
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.side_effect = [
+            ([self._edge("a", "b"), self._edge("a", "c")], None, None),
+            ([self._edge("b", "a"), self._edge("c", "d")], None, None),
+            ([], None, None), ([], None, None),
+        ]
+        service = self._service(graphiti_config, mock_driver)
+        result = await service.traverse_neighbors("a", max_hops=3)
+        assert [(r["source"], r["target"], r["hop"]) for r in result] == [
+            ("A", "B", 1), ("A", "C", 1), ("B", "A", 2), ("C", "D", 2),
+        ]
+        frontiers = [c[1]["uuids"] for c in mock_driver.execute_query.call_args_list]
+        # "a" is never expanded again; hop 3 only expands the new node "d"
+        assert frontiers[:3] == [["a"], ["b", "c"], ["d"]]
+
+    async def test_stops_at_limit(self, graphiti_config):
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.return_value = (
+            [self._edge("a", f"n{i}") for i in range(10)], None, None,
+        )
+        service = self._service(graphiti_config, mock_driver)
+        result = await service.traverse_neighbors("a", max_hops=5, limit=3)
+        assert len(result) == 3
+        assert mock_driver.execute_query.call_count == 1
+
+    async def test_entity_node_label_fallback(self, graphiti_config):
+        mock_driver = AsyncMock()
+        mock_driver.execute_query.side_effect = [
+            ([], None, None),
+            ([self._edge("a", "b")], None, None),
+            ([], None, None),
+        ]
+        service = self._service(graphiti_config, mock_driver)
+        result = await service.traverse_neighbors("a", max_hops=2)
+        assert len(result) == 1
+        queries = [c[0][0] for c in mock_driver.execute_query.call_args_list]
+        assert "(s:EntityNode" in queries[1]
+        # Hop 2 stays on the label that matched
+        assert "(s:EntityNode" in queries[2] and len(queries) == 3
 
     async def test_max_hops_capped_at_5(self, graphiti_config):
-        from second_brain.services.graphiti import GraphitiService
-        service = GraphitiService(graphiti_config)
-        service._initialized = True
         mock_driver = AsyncMock()
-        mock_driver.execute_query.return_value = ([], None, None)
-        service._client = MagicMock(spec=["driver"])
-        service._client.driver = mock_driver
-        await service.traverse_neighbors("e1", max_hops=10)
-        query_arg = mock_driver.execute_query.call_args[0][0]
-        assert "*1..5" in query_arg
+        mock_driver.execute_query.side_effect = [
+            ([self._edge(f"n{i}", f"n{i + 1}")], None, None) for i in range(10)
+        ]
+        service = self._service(graphiti_config, mock_driver)
+        result = await service.traverse_neighbors("n0", max_hops=10)
+        assert len(result) == 5
+        assert mock_driver.execute_query.call_count == 5
 
     async def test_empty_on_no_connections(self, graphiti_config):
-        from second_brain.services.graphiti import GraphitiService
-        service = GraphitiService(graphiti_config)
-        service._initialized = True
         mock_driver = AsyncMock()
         mock_driver.execute_query.return_value = ([], None, None)
-        service._client = MagicMock(spec=["driver"])
-        service._client.driver = mock_driver
+        service = self._service(graphiti_config, mock_driver)
         result = await service.traverse_neighbors("e1")
         assert result == []
 
@@ -1130,6 +1671,146 @@ class TestBuildCommunities:
         service._client.build_communities_.assert_called_once_with(group_ids=["grp1"])
 
 
+class TestUpdateCommunities:
+    """Incremental community maintenance."""
+
+    def _service(self, graphiti_config, community_count=3, candidates=None, drifted=None, members=None):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        candidates = list(candidates or [])
+        queries: list[tuple[str, dict]] = []
+
+        async def _execute(cypher, **params):
+            queries.append((cypher, params))
+            if "RETURN count(c) AS cnt" in cypher:
+                return [{"cnt": community_count}], None, None
+            if "collect(c.uuid)[0] AS community" in cypher:
+                if "(n:Entity)" in cypher and candidates:
+                    rows = candidates.pop(0)
+                    return rows, None, None
+                return [], None, None
+            if "abs(size - c.brain_summary_size)" in cypher:
+                return [{"uuid": u} for u in (drifted or [])], None, None
+            if "RETURN n.uuid AS uuid" in cypher:
+                return [{"uuid": m} for m in (members or [])], None, None
+            return [], None, None
+
+        service._client = MagicMock()
+        service._client.driver.execute_query = AsyncMock(side_effect=_execute)
+        return service, queries
+
+    async def test_full_build_when_group_has_no_communities(self, graphiti_config):
+        service, _ = self._service(graphiti_config, community_count=0)
+        service.build_communities = AsyncMock(return_value=[{"uuid": "c1"}])
+        report = await service.update_communities("grp1")
+        service.build_communities.assert_awaited_once_with("grp1")
+        assert report["mode"] == "full"
+        assert report["communities"] == 1
+
+    async def test_assigns_new_entities_to_neighbour_community(self, graphiti_config):
+        service, queries = self._service(
+            graphiti_config,
+            candidates=[[{"entity": "e1", "community": "c1"}, {"entity": "e2", "community": "c2"}]],
+        )
+        report = await service.update_communities("grp1", batch_size=10)
+        assert report["mode"] == "incremental"
+        assert report["assigned"] == 2
+        writes = [p for c, p in queries if "MERGE (c)-[r:HAS_MEMBER]->(n)" in c]
+        assert [r["entity"] for r in writes[0]["rows"]] == ["e1", "e2"]
+        assert all(r["edge"] for r in writes[0]["rows"])
+        # Baselines initialized before assignment, so new members count as drift
+        baseline = next(i for i, (c, _) in enumerate(queries) if "brain_summary_size IS NULL" in c)
+        merge = next(i for i, (c, _) in enumerate(queries) if "MERGE" in c)
+        assert baseline < merge
+
+    async def test_full_batches_repeat(self, graphiti_config):
+        service, _ = self._service(
+            graphiti_config,
+            candidates=[
+                [{"entity": "e1", "community": "c1"}, {"entity": "e2", "community": "c1"}],
+                [{"entity": "e3", "community": "c1"}],
+            ],
+        )
+        report = await service.update_communities("grp1", batch_size=2)
+        assert report["assigned"] == 3
+
+    async def test_only_drifted_communities_are_resummarized(self, graphiti_config):
+        service, queries = self._service(graphiti_config, drifted=["c1", "c2"])
+        service._resummarize_community = AsyncMock(side_effect=[True, False])
+        steps = []
+        report = await service.update_communities(
+            "grp1", drift_threshold=0.5,
+            progress=lambda phase, done=0, total=0: steps.append((phase, done, total)),
+        )
+        assert report["drifted"] == 2
+        assert report["recomputed"] == 1
+        assert [c.args[1] for c in service._resummarize_community.await_args_list] == ["c1", "c2"]
+        drift_query = next(p for c, p in queries if "abs(size" in c)
+        assert drift_query["threshold"] == 0.5
+        assert ("recomputing", 2, 2) in steps
+        assert steps[0][0] == "assigning"
+
+    async def test_resummarize_keeps_community_uuid(self, graphiti_config):
+        service, queries = self._service(graphiti_config, members=["e1", "e2"])
+        community = MagicMock()
+        community.generate_name_embedding = AsyncMock()
+        community.save = AsyncMock()
+        nodes = MagicMock()
+        nodes.EntityNode.get_by_uuids = AsyncMock(return_value=["n1", "n2"])
+        ops = MagicMock()
+        ops.build_community = AsyncMock(return_value=(community, []))
+        with patch.dict(sys.modules, {
+            "graphiti_core.nodes": nodes,
+            "graphiti_core.utils": MagicMock(),
+            "graphiti_core.utils.maintenance": MagicMock(),
+            "graphiti_core.utils.maintenance.community_operations": ops,
+        }):
+            ok = await service._resummarize_community(service._client.driver, "c1")
+        assert ok is True
+        nodes.EntityNode.get_by_uuids.assert_awaited_once()
+        assert community.uuid == "c1"
+        community.save.assert_awaited_once()
+        size = next(p for c, p in queries if "SET c.brain_summary_size = $size" in c)
+        assert size == {"uuid": "c1", "size": 2}
+
+    async def test_changes_invalidate_cache(self, graphiti_config):
+        service, _ = self._service(
+            graphiti_config, candidates=[[{"entity": "e1", "community": "c1"}]],
+        )
+        service.invalidate_cache = MagicMock()
+        await service.update_communities("grp1")
+        service.invalidate_cache.assert_called_once_with("grp1")
+
+    async def test_query_failure_reports_error(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = MagicMock()
+        service._client.driver.execute_query = AsyncMock(side_effect=RuntimeError("cypher"))
+        report = await service.update_communities("grp1")
+        assert report["error"] == "RuntimeError"
+
+    async def test_unavailable(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._init_failed = True
+        report = await service.update_communities("grp1")
+        assert report["mode"] == "unavailable"
+
+    async def test_ingest_marks_group_stale(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        service._client = MagicMock()
+        service._client.add_episode = AsyncMock(return_value=None)
+        service._existing_content_keys = AsyncMock(return_value=set())
+        service._tag_content_key = AsyncMock()
+        await service.add_episode("content", group_id="grp1")
+        assert service.take_stale_community_groups() == ["grp1"]
+        assert service.take_stale_community_groups() == []
+
+
 class TestAdvancedSearch:
     """Tests for advanced_search with filters."""
 
@@ -1185,3 +1866,78 @@ class TestAdvancedSearch:
         service._init_failed = True
         result = await service.advanced_search("test")
         assert result == {"edges": [], "nodes": [], "communities": []}
+
+
+class TestGraphQueryCaching:
+    """search / get_entity_context / search_communities / advanced_search are cached per group."""
+
+    @staticmethod
+    def _service(graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(graphiti_config)
+        service._initialized = True
+        edge = MagicMock(source_node_name="Alice", fact="knows", target_node_name="Bob")
+        service._client = MagicMock()
+        service._client.search_ = AsyncMock(return_value=MagicMock(edges=[edge]))
+        service._client.add_episode = AsyncMock(return_value=MagicMock())
+        service._client.driver = AsyncMock()
+        service._client.driver.execute_query.return_value = ([], None, None)
+        return service
+
+    async def test_repeat_search_served_from_cache(self, graphiti_config):
+        service = self._service(graphiti_config)
+        first = await service.search("alice", group_id="g1")
+        second = await service.search("alice", group_id="g1")
+        assert first == second
+        assert service._client.search_.await_count == 1
+        assert service.cache_stats()["hits"] == 1
+
+    async def test_arguments_and_groups_are_distinct_keys(self, graphiti_config):
+        service = self._service(graphiti_config)
+        await service.search("alice", group_id="g1")
+        await service.search("alice", group_id="g2")
+        await service.search("alice", limit=3, group_id="g1")
+        assert service._client.search_.await_count == 3
+
+    async def test_add_episode_invalidates_its_group(self, graphiti_config):
+        service = self._service(graphiti_config)
+        await service.search("alice", group_id="g1")
+        await service.search("alice", group_id="g2")
+        await service.add_episode("Alice met Carol", group_id="g1")
+        await service.search("alice", group_id="g1")
+        await service.search("alice", group_id="g2")
+        assert service._client.search_.await_count == 3
+
+    async def test_delete_group_and_remove_episode_invalidate(self, graphiti_config):
+        service = self._service(graphiti_config)
+        await service.search("alice", group_id="g1")
+        service._client.driver.execute_query.return_value = ([{"deleted": 1}], None, None)
+        await service.delete_group_data("g1")
+        await service.search("alice", group_id="g1")
+        await service.remove_episode("ep-1")
+        await service.search("alice", group_id="g1")
+        assert service._client.search_.await_count == 3
+
+    async def test_build_communities_invalidates(self, graphiti_config):
+        service = self._service(graphiti_config)
+        community = MagicMock(uuid="c1", summary="s")
+        community.name = "Team"
+        service._client.search_.return_value = MagicMock(edges=[], communities=[community])
+        service._client.build_communities_ = AsyncMock()
+        await service.search_communities("", group_id="g1")
+        result = await service.build_communities(group_id="g1")
+        assert result[0]["name"] == "Team"
+        assert service._client.search_.await_count == 2
+
+    async def test_empty_results_not_cached(self, graphiti_config):
+        service = self._service(graphiti_config)
+        service._client.search_.return_value = MagicMock(edges=[])
+        await service.search("nobody", group_id="g1")
+        await service.search("nobody", group_id="g1")
+        assert service._client.search_.await_count == 2
+
+    async def test_disabled_with_zero_ttl(self, graphiti_config):
+        from second_brain.services.graphiti import GraphitiService
+        config = graphiti_config.model_copy(update={"graph_cache_ttl_seconds": 0})
+        service = GraphitiService(config)
+        assert service.cache_stats() is None
@@ -0,0 +1,225 @@
+"""Tests for the streaming bulk ingest engine."""
+
+import asyncio
+import csv
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from second_brain.ingest import (
+    IngestEngine,
+    IngestEstimate,
+    IngestRecord,
+    chunked,
+    estimate_ingest,
+    ingest_linkedin_csv,
+    jsonl_records,
+    linkedin_records,
+    read_csv,
+    read_jsonl,
+    read_markdown_dir,
+)
+
+
+def _write_linkedin_csv(path, n_posts, length=150):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "post", "account", "url"])
+        for i in range(n_posts):
+            writer.writerow([str(i), f"Hook line {i}\n" + "x" * length, f"acct{i % 3}", f"https://l.in/{i}"])
+
+
+def _record(i: int, memory: bool = True) -> IngestRecord:
+    return IngestRecord(
+        content=f"content {i}",
+        source_file=f"src-{i}",
+        content_type="linkedin",
+        memory_text=f"memory {i}" if memory else None,
+    )
+
+
+class TestReaders:
+    def test_linkedin_records_filters_short_and_incomplete_rows(self, tmp_path):
+        path = tmp_path / "posts.csv"
+        _write_linkedin_csv(path, 3)
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["9", "too short", "acct", "https://l.in/9"])
+            writer.writerow(["10", "y" * 200, "", "https://l.in/10"])
+            writer.writerow(["11", "z" * 200, "acct", ""])
+            writer.writerow(["only", "two"])
+
+        records = list(linkedin_records(read_csv(path), min_length=100))
+
+        assert len(records) == 3
+        first = records[0]
+        assert first.content_type == "linkedin"
+        assert first.tags == ["acct0", "linkedin"]
+        assert first.memory_metadata["hook"] == "Hook line 0"
+        assert first.memory_text.startswith("LinkedIn post by acct0:")
+
+    def test_read_jsonl_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "items.jsonl"
+        path.write_text(
+            json.dumps({"content": "a" * 20, "url": "u1"}) + "\n"
+            "\n"
+            "{not json\n"
+            + json.dumps({"content": "b" * 20, "source_file": "u2", "title": "B"}) + "\n",
+            encoding="utf-8",
+        )
+
+        records = list(jsonl_records(read_jsonl(path), content_type="email"))
+
+        assert [r.source_file for r in records] == ["u1", "u2"]
+        assert records[1].title == "B"
+        assert records[0].tags == ["email"]
+
+    def test_read_markdown_dir_skips_readme(self, tmp_path):
+        (tmp_path / "README.md").write_text("# Readme")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "cold-email.md").write_text("Hello there")
+
+        records = list(read_markdown_dir(tmp_path, content_type="email"))
+
+        assert len(records) == 1
+        assert records[0].title == "Cold Email"
+
+    def test_chunked_is_lazy(self):
+        consumed = []
+
+        def gen():
+            for i in range(5):
+                consumed.append(i)
+                yield _record(i)
+
+        it = chunked(gen(), 2)
+        assert len(next(it)) == 2
+        assert consumed == [0, 1]
+        assert [len(c) for c in it] == [2, 1]
+
+
+class TestEstimate:
+    def test_estimate_counts_batches_and_memory_calls(self):
+        records = [_record(i, memory=i % 2 == 0) for i in range(300)]
+
+        estimate = estimate_ingest(records, batch_size=128, memory_concurrency=4)
+
+        assert estimate.records == 300
+        assert estimate.embed_calls == 3
+        assert estimate.upsert_calls == 3
+        assert estimate.memory_calls == 150
+        assert estimate.estimated_seconds < estimate.serial_estimated_seconds
+
+    def test_estimate_caps_batch_size(self):
+        estimate = IngestEstimate.for_records(256, 0, 128, 4)
+        assert estimate.embed_calls == 2
+
+    async def test_dry_run_needs_no_services(self, tmp_path, mock_deps):
+        path = tmp_path / "posts.csv"
+        _write_linkedin_csv(path, 5)
+
+        result = await ingest_linkedin_csv(path, deps=mock_deps, dry_run=True)
+
+        assert isinstance(result, IngestEstimate)
+        assert result.records == 5
+        mock_deps.embedding_service.embed_batch.assert_not_called()
+        mock_deps.memory_service.add.assert_not_called()
+
+
+class TestIngestEngine:
+    async def test_batches_embeddings_with_document_input_type(self, mock_deps):
+        mock_deps.embedding_service.embed_batch = AsyncMock(
+            side_effect=lambda texts, input_type: [[0.1] * 4 for _ in texts]
+        )
+        mock_deps.storage_service.bulk_upsert_examples = AsyncMock(
+            side_effect=lambda rows: {"inserted": len(rows), "errors": 0}
+        )
+        engine = IngestEngine(mock_deps, batch_size=128)
+
+        stats = await engine.run(_record(i) for i in range(130))
+
+        assert mock_deps.embedding_service.embed_batch.await_count == 2
+        for call in mock_deps.embedding_service.embed_batch.await_args_list:
+            assert call.kwargs["input_type"] == "document"
+        assert mock_deps.storage_service.bulk_upsert_examples.await_count == 2
+        assert stats.records == 130
+        assert stats.ingested == 130
+        assert stats.memory_stored == 130
+        assert stats.errors == 0
+
+    async def test_memory_writes_are_bounded(self, mock_deps):
+        mock_deps.embedding_service.embed_batch = AsyncMock(
+            side_effect=lambda texts, input_type: [[0.1] for _ in texts]
+        )
+        mock_deps.storage_service.bulk_upsert_examples = AsyncMock(
+            return_value={"inserted": 0, "errors": 0}
+        )
+        in_flight = 0
+        peak = 0
+
+        async def _add(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        mock_deps.memory_service.add = AsyncMock(side_effect=_add)
+        engine = IngestEngine(mock_deps, batch_size=20, memory_concurrency=3)
+
+        stats = await engine.run(_record(i) for i in range(20))
+
+        assert stats.memory_stored == 20
+        assert peak <= 3
+
+    async def test_short_embedding_batch_counts_errors(self, mock_deps):
+        mock_deps.embedding_service.embed_batch = AsyncMock(return_value=[])
+        mock_deps.storage_service.bulk_upsert_examples = AsyncMock()
+        engine = IngestEngine(mock_deps)
+
+        stats = await engine.run([_record(0), _record(1, memory=False)])
+
+        mock_deps.storage_service.bulk_upsert_examples.assert_not_called()
+        assert stats.errors == 2
+        assert stats.memory_stored == 1
+
+    async def test_duplicate_urls_in_a_chunk_keep_the_last(self, mock_deps):
+        mock_deps.embedding_service.embed_batch = AsyncMock(
+            side_effect=lambda texts, input_type: [[0.1] for _ in texts]
+        )
+        mock_deps.storage_service.bulk_upsert_examples = AsyncMock(
+            side_effect=lambda rows: {"inserted": len(rows), "errors": 0}
+        )
+        records = [_record(0), _record(1), _record(2)]
+        records[2].source_file = records[0].source_file
+        engine = IngestEngine(mock_deps)
+
+        stats = await engine.run(records)
+
+        rows = mock_deps.storage_service.bulk_upsert_examples.await_args.args[0]
+        assert [r["content"] for r in rows] == ["content 1", "content 2"]
+        assert stats.records == 3
+        assert stats.duplicates == 1
+        assert stats.ingested == 2
+        assert stats.errors == 0
+        assert mock_deps.memory_service.add.await_count == 2
+
+    async def test_memory_failure_does_not_abort(self, mock_deps):
+        mock_deps.embedding_service.embed_batch = AsyncMock(return_value=[[0.1], [0.2]])
+        mock_deps.storage_service.bulk_upsert_examples = AsyncMock(
+            return_value={"inserted": 2, "errors": 0}
+        )
+        mock_deps.memory_service.add = AsyncMock(side_effect=[ConnectionError("down"), {}])
+        engine = IngestEngine(mock_deps)
+
+        stats = await engine.run([_record(0), _record(1)])
+
+        assert stats.ingested == 2
+        assert stats.memory_stored == 1
+
+    async def test_requires_embedding_service(self, mock_deps):
+        mock_deps.embedding_service = None
+        with pytest.raises(ValueError, match="Embedding service"):
+            await IngestEngine(mock_deps).run([_record(0)])
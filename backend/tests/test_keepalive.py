@@ -0,0 +1,183 @@
+"""Tests for the connection keep-alive and its metrics."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from second_brain.services.keepalive import (
+    ConnectionStats,
+    KeepAlive,
+    connection_stats,
+    get_connection_stats,
+    reset_connection_stats,
+    track_connection,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    reset_connection_stats()
+    yield
+    reset_connection_stats()
+
+
+async def _wait_for(predicate, timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+
+
+class TestConnectionStats:
+    def test_snapshot_splits_warm_and_cold(self):
+        stats = ConnectionStats("mem0")
+        stats.record_request(0.1, cold=False)
+        stats.record_request(0.3, cold=False)
+        stats.record_request(1.5, cold=True)
+        stats.record_ping(True)
+        stats.record_ping(False)
+        stats.record_reconnect()
+
+        snap = stats.snapshot()
+        assert snap["warm_requests"] == 2
+        assert snap["cold_requests"] == 1
+        assert snap["avg_warm_latency_ms"] == 200.0
+        assert snap["avg_cold_latency_ms"] == 1500.0
+        assert snap["max_cold_latency_ms"] == 1500.0
+        assert snap["pings"] == 2
+        assert snap["ping_failures"] == 1
+        assert snap["reconnects"] == 1
+        assert snap["reconnects_last_hour"] == 1
+
+    def test_empty_snapshot(self):
+        snap = ConnectionStats("x").snapshot()
+        assert snap["avg_warm_latency_ms"] == 0.0
+        assert snap["avg_cold_latency_ms"] == 0.0
+
+    def test_registry(self):
+        assert get_connection_stats("mem0") is get_connection_stats("mem0")
+        get_connection_stats("graphiti").record_request(0.01, cold=False)
+        stats = connection_stats()
+        assert set(stats) == {"mem0", "graphiti"}
+        assert stats["graphiti"]["warm_requests"] == 1
+
+
+class TestKeepAlive:
+    def test_touch_detects_cold(self):
+        ka = KeepAlive("mem0", AsyncMock(), AsyncMock(), interval=0)
+        assert ka.touch() is False
+        ka._last_activity -= 300
+        assert ka.touch() is True
+        assert ka.touch() is False
+
+    def test_touch_outside_loop_does_not_start(self):
+        ka = KeepAlive("mem0", AsyncMock(), AsyncMock(), interval=60)
+        ka.touch()
+        assert ka._task is None
+
+    async def test_disabled_interval_never_pings(self):
+        ping = AsyncMock()
+        ka = KeepAlive("mem0", ping, AsyncMock(), interval=0)
+        ka.touch()
+        assert ka._task is None
+
+    async def test_pings_when_idle(self):
+        ping = AsyncMock()
+        reconnect = AsyncMock()
+        ka = KeepAlive("mem0", ping, reconnect, interval=0.01)
+        ka.touch()
+        await _wait_for(lambda: ping.await_count >= 2)
+        ka.stop()
+
+        assert ping.await_count >= 2
+        reconnect.assert_not_awaited()
+        assert ka.stats.pings >= 2
+        assert ka.stats.ping_failures == 0
+
+    async def test_single_failure_does_not_reconnect(self):
+        ping = AsyncMock(side_effect=[ConnectionError("blip"), None, None, None, None])
+        reconnect = AsyncMock()
+        ka = KeepAlive("mem0", ping, reconnect, interval=0.01, max_failures=2)
+        ka.touch()
+        await _wait_for(lambda: ping.await_count >= 3)
+        ka.stop()
+
+        reconnect.assert_not_awaited()
+        assert ka.stats.ping_failures == 1
+
+    async def test_consecutive_failures_reconnect(self):
+        ping = AsyncMock(side_effect=ConnectionError("stale"))
+        reconnect = AsyncMock()
+        ka = KeepAlive("mem0", ping, reconnect, interval=0.01, max_failures=2)
+        ka.touch()
+        await _wait_for(lambda: reconnect.await_count >= 1)
+        ka.stop()
+
+        assert reconnect.await_count >= 1
+        assert ka.stats.reconnects == reconnect.await_count
+        assert ka.stats.snapshot()["reconnects_last_hour"] >= 1
+
+    async def test_failed_reconnect_is_not_counted(self):
+        ping = AsyncMock(side_effect=ConnectionError("down"))
+        reconnect = AsyncMock(side_effect=RuntimeError("still down"))
+        ka = KeepAlive("mem0", ping, reconnect, interval=0.01, max_failures=1)
+        ka.touch()
+        await _wait_for(lambda: reconnect.await_count >= 1)
+        ka.stop()
+
+        assert ka.stats.reconnects == 0
+        assert ka.stats.reconnect_failures == reconnect.await_count
+
+    async def test_reconnect_attempts_back_off_until_a_ping_succeeds(self):
+        ping = AsyncMock(side_effect=[ConnectionError("down")] * 3 + [None] * 50)
+        reconnect = AsyncMock(side_effect=RuntimeError("still down"))
+        ka = KeepAlive("mem0", ping, reconnect, interval=0.01, max_failures=1, max_backoff=0.03)
+
+        assert ka.retry_delay == 0.01
+        ka.touch()
+        await _wait_for(lambda: reconnect.await_count >= 2)
+        assert ka.retry_delay == 0.03  # 0.01 * 2**2, capped at max_backoff
+        await _wait_for(lambda: ping.await_count >= 4)
+        ka.stop()
+
+        assert reconnect.await_count == 3
+        assert ka.retry_delay == 0.01
+
+    async def test_stop_cancels_task(self):
+        ka = KeepAlive("mem0", AsyncMock(), AsyncMock(), interval=60)
+        ka.touch()
+        task = ka._task
+        ka.stop()
+        await asyncio.sleep(0)
+        assert task.cancelled() or task.done()
+        assert ka._task is None
+
+
+class TestTrackConnection:
+    class _Service:
+        def __init__(self):
+            self._keepalive = KeepAlive("svc", AsyncMock(), AsyncMock(), interval=0)
+
+        @track_connection
+        async def call(self, value):
+            return value
+
+        @track_connection
+        async def fail(self):
+            raise ValueError("boom")
+
+    async def test_records_warm_and_cold_requests(self):
+        svc = self._Service()
+        assert await svc.call(1) == 1
+        svc._keepalive._last_activity -= 300
+        await svc.call(2)
+
+        assert svc._keepalive.stats.warm_requests == 1
+        assert svc._keepalive.stats.cold_requests == 1
+
+    async def test_records_failed_requests(self):
+        svc = self._Service()
+        with pytest.raises(ValueError):
+            await svc.fail()
+        assert svc._keepalive.stats.warm_requests == 1
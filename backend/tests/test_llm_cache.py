@@ -0,0 +1,172 @@
+"""Tests for the SQLite LLM output cache."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from second_brain.services.llm_cache import (
+    CachedModel,
+    LLMOutputCache,
+    close_llm_caches,
+    get_llm_cache,
+    llm_cache_stats,
+    with_llm_cache,
+)
+
+
+class Verdict(BaseModel):
+    verdict: str
+
+
+@pytest.fixture(autouse=True)
+def _close_caches():
+    yield
+    close_llm_caches()
+
+
+@pytest.fixture
+def cache_config(brain_config, tmp_path):
+    return brain_config.model_copy(update={
+        "llm_cache_enabled": True,
+        "llm_cache_path": tmp_path / "llm_cache.sqlite3",
+    })
+
+
+def counting_model() -> tuple[FunctionModel, list]:
+    calls = []
+
+    def model(messages, info: AgentInfo):
+        calls.append(messages[-1])
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"verdict": "clear"})])
+
+    return FunctionModel(model), calls
+
+
+class TestLLMOutputCache:
+    def test_round_trip(self, tmp_path):
+        cache = LLMOutputCache(tmp_path / "c.sqlite3", ttl=60, max_bytes=10_000)
+        assert cache.get("k") is None
+        cache.put("k", "review", b"response")
+        assert cache.get("k") == b"response"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entries_miss(self, tmp_path):
+        cache = LLMOutputCache(tmp_path / "c.sqlite3", ttl=60, max_bytes=10_000)
+        cache.put("k", "review", b"response")
+        with patch("second_brain.services.llm_cache.time.time", return_value=10**12):
+            assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_eviction_drops_least_recently_used(self, tmp_path):
+        cache = LLMOutputCache(tmp_path / "c.sqlite3", ttl=60, max_bytes=25)
+        now = time.time()
+        with patch("second_brain.services.llm_cache.time.time", side_effect=[now, now + 1, now + 2, now + 3]):
+            cache.put("a", "review", b"x" * 10)
+            cache.put("b", "review", b"x" * 10)
+            cache.get("a")
+            cache.put("c", "review", b"x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+
+class TestCachedModel:
+    async def test_identical_run_is_replayed(self, tmp_path):
+        agent = Agent(output_type=Verdict, instructions="Judge clarity.")
+        model, calls = counting_model()
+        cached = CachedModel(model, "clarity", LLMOutputCache(tmp_path / "c.sqlite3", 60, 10**6))
+
+        first = await agent.run("Is this clear?", model=cached)
+        second = await agent.run("Is this clear?", model=cached)
+
+        assert len(calls) == 1
+        assert second.output == first.output
+        assert second.usage().input_tokens == 0
+        assert cached.cache.stats()["hits"] == 1
+
+    async def test_prompt_and_instructions_are_part_of_the_key(self, tmp_path):
+        model, calls = counting_model()
+        cached = CachedModel(model, "clarity", LLMOutputCache(tmp_path / "c.sqlite3", 60, 10**6))
+
+        await Agent(output_type=Verdict, instructions="Judge clarity.").run("Draft one", model=cached)
+        await Agent(output_type=Verdict, instructions="Judge clarity.").run("Draft two", model=cached)
+        await Agent(output_type=Verdict, instructions="Judge tone.").run("Draft one", model=cached)
+
+        assert len(calls) == 3
+
+    async def test_agent_name_is_part_of_the_key(self, tmp_path):
+        cache = LLMOutputCache(tmp_path / "c.sqlite3", 60, 10**6)
+        model, calls = counting_model()
+        agent = Agent(output_type=Verdict)
+
+        await agent.run("Draft", model=CachedModel(model, "clarity", cache))
+        await agent.run("Draft", model=CachedModel(model, "review", cache))
+
+        assert len(calls) == 2
+
+    async def test_tools_still_run_on_replay(self, tmp_path):
+        agent = Agent(output_type=Verdict)
+        tool_calls = []
+
+        @agent.tool_plain
+        def load_voice() -> str:
+            tool_calls.append(1)
+            return "Plain and direct."
+
+        def model(messages, info: AgentInfo):
+            if len(messages) == 1:
+                return ModelResponse(parts=[ToolCallPart("load_voice", {})])
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"verdict": "on voice"})])
+
+        cached = CachedModel(FunctionModel(model), "review", LLMOutputCache(tmp_path / "c.sqlite3", 60, 10**6))
+        await agent.run("Review this", model=cached)
+        result = await agent.run("Review this", model=cached)
+
+        assert result.output.verdict == "on voice"
+        assert len(tool_calls) == 2
+        assert cached.cache.stats()["hits"] == 2
+
+    async def test_cache_failure_falls_back_to_model(self, tmp_path):
+        model = FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart("ok")]))
+        cache = LLMOutputCache(tmp_path / "c.sqlite3", 60, 10**6)
+        cached = CachedModel(model, "clarity", cache)
+
+        with patch.object(cache, "get", side_effect=OSError("disk")), \
+                patch.object(cache, "put", side_effect=OSError("disk")):
+            result = await Agent().run("hi", model=cached)
+
+        assert result.output == "ok"
+        assert cache.errors == 2
+
+
+class TestWithLLMCache:
+    def test_disabled_by_default(self, brain_config):
+        model = FunctionModel(lambda m, i: ModelResponse(parts=[TextPart("ok")]))
+        assert with_llm_cache(model, "review", brain_config) is model
+
+    def test_wraps_listed_agents_only(self, cache_config):
+        model = FunctionModel(lambda m, i: ModelResponse(parts=[TextPart("ok")]))
+
+        wrapped = with_llm_cache(model, "review", cache_config)
+
+        assert isinstance(wrapped, CachedModel)
+        assert wrapped.cache is get_llm_cache(cache_config)
+        assert with_llm_cache(wrapped, "review", cache_config) is wrapped
+        assert with_llm_cache(model, "create", cache_config) is model
+        assert str(cache_config.llm_cache_path) in llm_cache_stats()
+
+    def test_get_agent_model_wraps(self, cache_config):
+        from second_brain.models import get_agent_model
+
+        model = FunctionModel(lambda m, i: ModelResponse(parts=[TextPart("ok")]))
+        with patch("second_brain.models.get_model", return_value=model):
+            assert isinstance(get_agent_model("clarity", cache_config), CachedModel)
+            assert get_agent_model("ask", cache_config) is model
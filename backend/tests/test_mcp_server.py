@@ -362,7 +362,7 @@ class TestMCPTools:
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.agents.linkedin_writer.linkedin_writer_agent")
-    async def test_create_content_tool(self, mock_agent, mock_deps_fn, mock_model_fn):
+    async def test_create_content_tool(self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps):
         from second_brain.mcp_server import create_content
         from second_brain.schemas import LinkedInPostResult
 
@@ -388,8 +388,7 @@ class TestMCPTools:
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=linkedin_config)
 
-        mock_deps = _mock_deps()
-        mock_deps.get_content_type_registry.return_value = mock_registry
+        mock_deps.content_type_registry = mock_registry
         mock_deps.storage_service.get_memory_content = AsyncMock(return_value=[])
         mock_deps.storage_service.get_examples = AsyncMock(return_value=[])
         mock_deps_fn.return_value = mock_deps
@@ -426,7 +425,7 @@ class TestMCPTools:
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.agents.linkedin_writer.linkedin_writer_agent")
-    async def test_create_content_simplified_prompt(self, mock_agent, mock_deps_fn, mock_model_fn):
+    async def test_create_content_simplified_prompt(self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps):
         """create_content routes linkedin to LinkedIn Writer with prompt."""
         from second_brain.mcp_server import create_content
         from second_brain.schemas import LinkedInPostResult
@@ -446,8 +445,7 @@ class TestMCPTools:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=linkedin_config)
-        mock_deps = _mock_deps()
-        mock_deps.get_content_type_registry.return_value = mock_registry
+        mock_deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = mock_deps
         mock_model_fn.return_value = MagicMock()
         result = await create_content(prompt="Write about AI", content_type="linkedin")
@@ -459,7 +457,7 @@ class TestMCPTools:
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.mcp_server.create_agent")
     async def test_create_content_includes_length_guidance(
-        self, mock_agent, mock_deps_fn, mock_model_fn
+        self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps
     ):
         """create_content includes length guidance in prompt when available."""
         from second_brain.mcp_server import create_content
@@ -477,8 +475,7 @@ class TestMCPTools:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=email_config)
-        mock_deps = _mock_deps()
-        mock_deps.get_content_type_registry.return_value = mock_registry
+        mock_deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = mock_deps
         mock_model_fn.return_value = MagicMock()
         result = await create_content(prompt="Write about AI", content_type="email")
@@ -490,7 +487,7 @@ class TestMCPTools:
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.mcp_server.create_agent")
     async def test_create_content_includes_max_words_fallback(
-        self, mock_agent, mock_deps_fn, mock_model_fn
+        self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps
     ):
         """create_content falls back to max_words when no length_guidance."""
         from second_brain.mcp_server import create_content
@@ -507,8 +504,7 @@ class TestMCPTools:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=email_config)
-        mock_deps = _mock_deps()
-        mock_deps.get_content_type_registry.return_value = mock_registry
+        mock_deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = mock_deps
         mock_model_fn.return_value = MagicMock()
         result = await create_content(prompt="Write about AI", content_type="email")
@@ -520,7 +516,7 @@ class TestMCPTools:
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.mcp_server.create_agent")
     async def test_create_content_delegates_voice_to_agent(
-        self, mock_agent, mock_deps_fn, mock_model_fn
+        self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps
     ):
         """create_content does NOT pre-load voice — agent tools handle it."""
         from second_brain.mcp_server import create_content
@@ -537,8 +533,7 @@ class TestMCPTools:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=email_config)
-        mock_deps = _mock_deps()
-        mock_deps.get_content_type_registry.return_value = mock_registry
+        mock_deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = mock_deps
         mock_model_fn.return_value = MagicMock()
         result = await create_content(prompt="Write about AI", content_type="email")
@@ -787,7 +782,7 @@ class TestMCPAgentFailures:
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.agents.linkedin_writer.linkedin_writer_agent")
-    async def test_create_agent_timeout(self, mock_agent, mock_deps_fn, mock_model_fn):
+    async def test_create_agent_timeout(self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps):
         """Create tool returns timeout message when agent hangs."""
         from second_brain.mcp_server import create_content
 
@@ -800,8 +795,7 @@ class TestMCPAgentFailures:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=linkedin_config)
-        mock_deps = _mock_deps()
-        mock_deps.get_content_type_registry.return_value = mock_registry
+        mock_deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = mock_deps
         mock_model_fn.return_value = MagicMock()
 
@@ -1128,6 +1122,45 @@ class TestGraphTraverse:
         assert "cannot be empty" in result
 
 
+class TestGraphEpisodes:
+    """Test graph_episodes MCP tool."""
+
+    @patch("second_brain.mcp_server._get_deps")
+    async def test_unavailable_without_graphiti(self, mock_get_deps):
+        mock_deps = _mock_deps()
+        mock_deps.graphiti_service = None
+        mock_get_deps.return_value = mock_deps
+        from second_brain.mcp_server import graph_episodes
+        result = await graph_episodes()
+        assert "unavailable" in result.lower()
+
+    @patch("second_brain.mcp_server._get_deps")
+    async def test_returns_page_with_cursor(self, mock_get_deps):
+        mock_graphiti = AsyncMock()
+        mock_graphiti.get_episodes_page = AsyncMock(return_value={
+            "episodes": [{"id": "ep-1", "content": "Met Alice", "source": "chat", "created_at": "2026-01-01T00:00:00"}],
+            "next_cursor": "cur-2",
+        })
+        mock_deps = _mock_deps(graphiti_service=mock_graphiti)
+        mock_get_deps.return_value = mock_deps
+        from second_brain.mcp_server import graph_episodes
+        result = await graph_episodes(limit=500, cursor="cur-1")
+        assert "ep-1" in result and "Met Alice" in result
+        assert "cur-2" in result
+        kwargs = mock_graphiti.get_episodes_page.call_args.kwargs
+        assert kwargs["limit"] == 100
+        assert kwargs["cursor"] == "cur-1"
+
+    @patch("second_brain.mcp_server._get_deps")
+    async def test_invalid_cursor(self, mock_get_deps):
+        mock_graphiti = AsyncMock()
+        mock_graphiti.get_episodes_page = AsyncMock(side_effect=ValueError("Invalid episode cursor"))
+        mock_get_deps.return_value = _mock_deps(graphiti_service=mock_graphiti)
+        from second_brain.mcp_server import graph_episodes
+        result = await graph_episodes(cursor="junk")
+        assert "Invalid episode cursor" in result
+
+
 class TestGraphCommunities:
     """Test graph_communities MCP tool."""
 
@@ -2014,7 +2047,7 @@ class TestOperationsMCPTools:
 
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
-    async def test_compose_email_success(self, mock_deps_fn, mock_model_fn):
+    async def test_compose_email_success(self, mock_deps_fn, mock_model_fn, mock_deps):
         from second_brain.mcp_server import compose_email
 
         with patch("second_brain.agents.email_agent.email_agent") as mock_agent:
@@ -2026,7 +2059,7 @@ class TestOperationsMCPTools:
                 status="draft",
             )
             mock_agent.run = AsyncMock(return_value=mock_result)
-            mock_deps_fn.return_value = _mock_deps()
+            mock_deps_fn.return_value = mock_deps
             mock_model_fn.return_value = MagicMock()
 
             result = await compose_email(request="Draft follow-up to John")
@@ -2043,12 +2076,12 @@ class TestOperationsMCPTools:
 
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
-    async def test_compose_email_timeout(self, mock_deps_fn, mock_model_fn):
+    async def test_compose_email_timeout(self, mock_deps_fn, mock_model_fn, mock_deps):
         from second_brain.mcp_server import compose_email
 
         with patch("second_brain.agents.email_agent.email_agent") as mock_agent:
             mock_agent.run = AsyncMock(side_effect=TimeoutError())
-            mock_deps_fn.return_value = _mock_deps()
+            mock_deps_fn.return_value = mock_deps
             mock_model_fn.return_value = MagicMock()
 
             result = await compose_email(request="test email")
@@ -2111,6 +2144,28 @@ class TestOperationsMCPTools:
             result = await run_brain_pipeline(request="Analyze my content", steps="recall,create")
             assert "Pipeline output result" in result
 
+    @patch("second_brain.mcp_server._get_model")
+    @patch("second_brain.mcp_server._get_deps")
+    async def test_run_brain_pipeline_dependencies_and_timings(self, mock_deps_fn, mock_model_fn):
+        from second_brain.mcp_server import run_brain_pipeline
+
+        with patch("second_brain.agents.utils.run_pipeline") as mock_pipeline:
+            mock_pipeline.return_value = {
+                "final": "Checked post",
+                "timings": {"steps": {"create": 4.0, "review": 2.5, "clarity": 1.25}, "total": 6.5},
+            }
+            mock_deps_fn.return_value = _mock_deps()
+            mock_model_fn.return_value = MagicMock()
+
+            result = await run_brain_pipeline(
+                request="Write and check a post", steps="create,review<create,clarity<create",
+            )
+            assert mock_pipeline.call_args.kwargs["dependencies"] == {
+                "review": ["create"], "clarity": ["create"],
+            }
+            assert result.startswith("Checked post")
+            assert "Step timings: create 4.0s, review 2.5s, clarity 1.2s (total 6.5s)" in result
+
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
     async def test_run_brain_pipeline_empty_input(self, mock_deps_fn, mock_model_fn):
@@ -2596,7 +2651,7 @@ class TestMultiUserVoice:
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.agents.linkedin_writer.linkedin_writer_agent")
-    async def test_create_content_with_user_id(self, mock_agent, mock_deps_fn, mock_model_fn):
+    async def test_create_content_with_user_id(self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps):
         """create_content with user_id injects 'Voice profile: <uid>' into prompt."""
         import second_brain.mcp_server as mod
         from second_brain.mcp_server import create_content
@@ -2607,8 +2662,8 @@ class TestMultiUserVoice:
             post_structure="freeform", word_count=10,
         )
         mock_agent.run = AsyncMock(return_value=mock_result)
-        deps = _mock_deps()
-        deps.config.allowed_user_ids_list = ["uttam", "robert", "luke", "brainforge"]
+        deps = mock_deps
+        deps.config.allowed_user_ids = "uttam,robert,luke,brainforge"
         linkedin_config = ContentTypeConfig(
             name="LinkedIn Post", default_mode="casual",
             structure_hint="Hook -> Body -> CTA", example_type="linkedin",
@@ -2616,7 +2671,7 @@ class TestMultiUserVoice:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=linkedin_config)
-        deps.get_content_type_registry = MagicMock(return_value=mock_registry)
+        deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = deps
         mock_model_fn.return_value = MagicMock()
 
@@ -2653,7 +2708,7 @@ class TestMultiUserVoice:
     @patch("second_brain.mcp_server._get_model")
     @patch("second_brain.mcp_server._get_deps")
     @patch("second_brain.agents.linkedin_writer.linkedin_writer_agent")
-    async def test_create_content_empty_user_id_uses_default(self, mock_agent, mock_deps_fn, mock_model_fn):
+    async def test_create_content_empty_user_id_uses_default(self, mock_agent, mock_deps_fn, mock_model_fn, mock_deps):
         """create_content with empty user_id does NOT inject voice profile line."""
         import second_brain.mcp_server as mod
         from second_brain.mcp_server import create_content
@@ -2664,8 +2719,8 @@ class TestMultiUserVoice:
             post_structure="freeform", word_count=10,
         )
         mock_agent.run = AsyncMock(return_value=mock_result)
-        deps = _mock_deps()
-        deps.config.allowed_user_ids_list = ["uttam", "robert", "luke", "brainforge"]
+        deps = mock_deps
+        deps.config.allowed_user_ids = "uttam,robert,luke,brainforge"
         linkedin_config = ContentTypeConfig(
             name="LinkedIn Post", default_mode="casual",
             structure_hint="Hook -> Body -> CTA", example_type="linkedin",
@@ -2673,7 +2728,7 @@ class TestMultiUserVoice:
         )
         mock_registry = MagicMock()
         mock_registry.get = AsyncMock(return_value=linkedin_config)
-        deps.get_content_type_registry = MagicMock(return_value=mock_registry)
+        deps.content_type_registry = mock_registry
         mock_deps_fn.return_value = deps
         mock_model_fn.return_value = MagicMock()
 
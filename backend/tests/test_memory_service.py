@@ -9,13 +9,14 @@ Focus areas:
 1. Retry behavior on transient failures
 2. Graceful degradation (empty results, not exceptions)
 3. Timeout handling
-4. Idle reconnect logic
+4. Keep-alive (cold requests, background reconnect)
 5. Filter format correctness
 """
 
 import asyncio
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from second_brain.config import BrainConfig
@@ -33,6 +34,7 @@ class TestMemoryServiceInit:
         config.brain_user_id = "test-user"
         config.graph_provider = "none"
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         with pytest.raises(ValueError, match="mem0_api_key is required"):
             MemoryService(config)
 
@@ -44,9 +46,14 @@ class TestMemoryServiceInit:
         config.brain_user_id = "test-user"
         config.graph_provider = "none"
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         svc = MemoryService(config)
         assert svc._client is not None
-        mock_client_cls.assert_called_once_with(api_key="test-key")
+        mock_client_cls.assert_called_once()
+        kwargs = mock_client_cls.call_args.kwargs
+        assert kwargs["api_key"] == "test-key"
+        # Pooled session whose idle connections outlive the default 5s expiry
+        assert isinstance(kwargs["client"], httpx.Client)
 
 
 class TestMemoryServiceRetry:
@@ -59,6 +66,7 @@ class TestMemoryServiceRetry:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -206,6 +214,7 @@ class TestMemoryServiceGracefulDegradation:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -285,8 +294,8 @@ class TestMemoryServiceGracefulDegradation:
         assert mock_client.delete.call_count == 3
 
 
-class TestMemoryServiceIdleReconnect:
-    """Test idle reconnect logic."""
+class TestMemoryServiceKeepAlive:
+    """Idle sessions are kept alive in the background, not rebuilt per request."""
 
     @pytest.fixture
     def mock_config(self):
@@ -295,6 +304,7 @@ class TestMemoryServiceIdleReconnect:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -302,23 +312,46 @@ class TestMemoryServiceIdleReconnect:
         config.mem0_use_criteria = True
         return config
 
+    @pytest.fixture(autouse=True)
+    def _fresh_stats(self):
+        from second_brain.services.keepalive import reset_connection_stats
+        reset_connection_stats()
+        yield
+        reset_connection_stats()
+
     @patch("time.monotonic")
     @patch("mem0.MemoryClient")
-    async def test_reconnects_after_idle_threshold(self, mock_client_cls, mock_time, mock_config):
-        """Client is re-instantiated after idle threshold exceeded."""
-        # First call at t=0
+    async def test_idle_request_is_cold_without_reconnect(self, mock_client_cls, mock_time, mock_config):
+        """A request after 5 idle minutes is recorded as cold; the client is kept."""
         mock_time.return_value = 0
         svc = MemoryService(mock_config)
         initial_call_count = mock_client_cls.call_count
-
-        # Simulate 5 minutes (300s) passing — exceeds 240s threshold
-        mock_time.return_value = 300
         mock_client_cls.return_value.search.return_value = {"results": [], "relations": []}
 
+        mock_time.return_value = 300
         await svc.search("test")
+        mock_time.return_value = 310
+        await svc.search("test")
+
+        assert mock_client_cls.call_count == initial_call_count
+        assert svc._keepalive.stats.cold_requests == 1
+        assert svc._keepalive.stats.warm_requests == 1
+
+    @patch("mem0.MemoryClient")
+    async def test_ping_uses_pooled_session(self, mock_client_cls, mock_config):
+        svc = MemoryService(mock_config)
+        await svc._ping()
+        mock_client_cls.return_value.client.get.assert_called_once_with("/v1/ping/")
+
+    @patch("mem0.MemoryClient")
+    async def test_reconnect_rebuilds_client(self, mock_client_cls, mock_config):
+        client_1, client_2 = MagicMock(name="client-1"), MagicMock(name="client-2")
+        mock_client_cls.side_effect = [client_1, client_2]
+        svc = MemoryService(mock_config)
+
+        await svc._reconnect()
 
-        # Client should have been re-instantiated (2 total: init + reconnect)
-        assert mock_client_cls.call_count == initial_call_count + 1
+        assert svc._client is client_2
 
 
 class TestMemoryServiceMultimodal:
@@ -331,6 +364,7 @@ class TestMemoryServiceMultimodal:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -423,6 +457,7 @@ class TestMemoryServiceClose:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -490,6 +525,7 @@ class TestMemoryServiceFilterMemories:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -621,6 +657,7 @@ class TestSetupCriteriaRetrieval:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -689,6 +726,7 @@ class TestUseCriteriaBypass:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -797,6 +835,7 @@ class TestSetupCustomInstructions:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -866,6 +905,7 @@ class TestMemoryServiceKeywordSearch:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True  # ENABLED
         config.mem0_rerank = False
@@ -881,6 +921,7 @@ class TestMemoryServiceKeywordSearch:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False  # DISABLED
         config.mem0_rerank = False
@@ -942,6 +983,7 @@ class TestMemoryServiceRerank:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = True  # ENABLED
@@ -957,6 +999,7 @@ class TestMemoryServiceRerank:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False  # DISABLED
@@ -998,6 +1041,7 @@ class TestMemoryServiceRerank:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
@@ -1038,6 +1082,7 @@ class TestMemoryServiceSearchByCategory:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -1114,6 +1159,7 @@ class TestMemoryServiceOverrideUserId:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -1271,6 +1317,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
@@ -1298,6 +1345,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
@@ -1324,6 +1372,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "default-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = False
@@ -1350,6 +1399,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "default-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = False
         config.mem0_rerank = False
@@ -1376,6 +1426,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
@@ -1401,6 +1452,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "default-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
@@ -1435,6 +1487,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
@@ -1460,6 +1513,7 @@ class TestMemoryServiceFeatureCombinations:
         config.brain_user_id = "test-user"
         config.memory_search_limit = 10
         config.service_timeout_seconds = 30.0
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
         config.mem0_keyword_search = True
         config.mem0_rerank = True
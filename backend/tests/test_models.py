@@ -659,3 +659,83 @@ class TestGetAgentModel:
 
         assert recall_model_name == "claude-haiku-4-5-20251001"
         assert create_model_name == "claude-opus-4"
+
+
+class TestModelRegistry:
+    """Tests for the process-wide model registry behind get_model()/get_agent_model()."""
+
+    @patch("pydantic_ai.providers.ollama.OllamaProvider")
+    @patch("pydantic_ai.models.openai.OpenAIChatModel")
+    def test_same_config_reuses_model(self, mock_openai_cls, mock_ollama_cls, tmp_path):
+        config = _make_config(tmp_path, model_provider="ollama-local")
+
+        first = get_model(config)
+        second = get_model(_make_config(tmp_path, model_provider="ollama-local"))
+
+        assert first is second
+        mock_openai_cls.assert_called_once()
+        mock_ollama_cls.assert_called_once()
+
+    @patch("pydantic_ai.providers.openai.OpenAIProvider")
+    @patch("pydantic_ai.models.openai.OpenAIChatModel")
+    def test_different_credentials_build_separate_models(self, mock_openai_cls, mock_openai_prov, tmp_path):
+        mock_openai_cls.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = get_model(_make_config(tmp_path, model_provider="openai", openai_api_key="sk-one"))
+        second = get_model(_make_config(tmp_path, model_provider="openai", openai_api_key="sk-two"))
+
+        assert first is not second
+        assert mock_openai_cls.call_count == 2
+
+    @patch("pydantic_ai.providers.ollama.OllamaProvider")
+    @patch("pydantic_ai.models.openai.OpenAIChatModel")
+    def test_agents_sharing_an_override_share_the_model(self, mock_openai_cls, mock_ollama_cls, tmp_path):
+        mock_openai_cls.side_effect = lambda *args, **kwargs: MagicMock()
+        config = _make_config(
+            tmp_path,
+            model_provider="ollama-local",
+            agent_model_overrides={"recall": "mistral:7b", "ask": "mistral:7b"},
+        )
+
+        recall_model = get_agent_model("recall", config)
+
+        assert get_agent_model("ask", config) is recall_model
+        assert get_agent_model("recall", config) is recall_model
+        assert get_agent_model("create", config) is not recall_model
+        assert mock_openai_cls.call_count == 2
+
+    @patch("pydantic_ai.providers.ollama.OllamaProvider")
+    @patch("pydantic_ai.models.openai.OpenAIChatModel")
+    def test_build_failure_not_cached(self, mock_openai_cls, mock_ollama_cls, tmp_path):
+        config = _make_config(tmp_path, model_provider="ollama-local", model_fallback_chain="")
+        model = MagicMock()
+        mock_openai_cls.side_effect = [Exception("Ollama down"), model]
+
+        with pytest.raises(RuntimeError):
+            get_model(config)
+
+        assert get_model(config) is model
+
+    @patch("pydantic_ai.providers.ollama.OllamaProvider")
+    @patch("pydantic_ai.models.openai.OpenAIChatModel")
+    def test_stats_and_clear(self, mock_openai_cls, mock_ollama_cls, tmp_path):
+        from second_brain.models import clear_model_registry, model_registry_stats
+
+        config = _make_config(tmp_path, model_provider="ollama-local")
+        get_model(config)
+        get_model(config)
+        get_model(config)
+
+        assert model_registry_stats() == {"hits": 2, "misses": 1, "models": 1, "hit_ratio": 0.667}
+        clear_model_registry()
+        assert model_registry_stats() == {"hits": 0, "misses": 0, "models": 0, "hit_ratio": 0.0}
+
+    def test_credentials_hash_hides_secrets(self):
+        from second_brain.models import _credentials_hash
+        from second_brain.providers.openai import OpenAIProvider
+
+        one = _credentials_hash(OpenAIProvider(api_key="sk-secret"))
+
+        assert "sk-secret" not in one
+        assert one == _credentials_hash(OpenAIProvider(api_key="sk-secret"))
+        assert one != _credentials_hash(OpenAIProvider(api_key="sk-other"))
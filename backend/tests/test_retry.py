@@ -0,0 +1,160 @@
+"""Tests for async-native retry and per-backend retry budgets."""
+
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from second_brain.services.retry import (
+    RetryBudget,
+    RetryConfig,
+    async_retry,
+    create_retry_decorator,
+    get_retry_budget,
+    retry_budget_stats,
+    retry_call,
+)
+
+
+def _fast(backend: str = "test", attempts: int = 3) -> RetryConfig:
+    return RetryConfig(max_attempts=attempts, min_wait=0, max_wait=0, backend=backend)
+
+
+class TestRetryCall:
+    async def test_retries_transient_then_succeeds(self):
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise ConnectionError("blip")
+            return "ok"
+
+        assert await retry_call(flaky, _fast()) == "ok"
+        assert calls == 3
+
+    async def test_non_retryable_raises_immediately(self):
+        calls = 0
+
+        async def bad():
+            nonlocal calls
+            calls += 1
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await retry_call(bad, _fast())
+        assert calls == 1
+
+    async def test_reraises_after_max_attempts(self):
+        async def down():
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await retry_call(down, _fast(attempts=2))
+
+    async def test_backoff_sleeps_on_event_loop(self):
+        cfg = RetryConfig(max_attempts=2, min_wait=0.5, max_wait=0.5, backend="sleepy")
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise OSError("reset")
+            return calls
+
+        with patch("second_brain.services.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            assert await retry_call(flaky, cfg) == 2
+        mock_sleep.assert_called_once_with(0.5)
+
+    async def test_decorator_wraps_coroutine(self):
+        calls = 0
+
+        @create_retry_decorator(_fast())
+        async def flaky(x):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError()
+            return x * 2
+
+        assert await flaky(21) == 42
+
+
+class TestAsyncRetry:
+    async def test_sync_function_retried_without_sleeping_in_thread(self):
+        threads: set[int] = set()
+        calls = 0
+
+        def flaky():
+            nonlocal calls
+            calls += 1
+            threads.add(threading.get_ident())
+            if calls < 2:
+                raise TimeoutError()
+            return "done"
+
+        assert await async_retry(flaky, config=_fast()) == "done"
+        assert calls == 2
+        assert threading.get_ident() not in threads
+
+
+class TestRetryBudget:
+    def test_failures_exhaust_budget(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+        budget.record_failure()
+        assert budget.allow_retry()
+        budget.record_failure()
+        assert not budget.allow_retry()
+        assert budget.snapshot()["retries_throttled"] == 1
+
+    def test_successes_refill_budget(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+        budget.record_failure()
+        budget.record_failure()
+        budget.record_success()
+        assert budget.allow_retry()
+
+    async def test_exhausted_budget_stops_retries(self):
+        cfg = _fast(backend="brownout", attempts=5)
+        calls = 0
+
+        async def down():
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("down")
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await retry_call(down, cfg)
+        # Budget (10 tokens, retry above 5) allows ~5 failed attempts in total
+        assert calls < 15
+        assert get_retry_budget("brownout").snapshot()["retries_throttled"] > 0
+
+    async def test_budgets_are_per_backend(self):
+        cfg_bad = _fast(backend="bad-backend", attempts=20)
+
+        async def down():
+            raise ConnectionError()
+
+        with pytest.raises(ConnectionError):
+            await retry_call(down, cfg_bad)
+        assert not get_retry_budget("bad-backend").allow_retry()
+        assert get_retry_budget("good-backend").allow_retry()
+        assert set(retry_budget_stats()) >= {"bad-backend", "good-backend"}
+
+    async def test_concurrent_callers_share_budget(self):
+        cfg = _fast(backend="shared", attempts=3)
+
+        async def down():
+            await asyncio.sleep(0)
+            raise ConnectionError()
+
+        results = await asyncio.gather(
+            *(retry_call(down, cfg) for _ in range(10)), return_exceptions=True,
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+        stats = get_retry_budget("shared").snapshot()
+        assert stats["retries_throttled"] > 0
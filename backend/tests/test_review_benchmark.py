@@ -0,0 +1,79 @@
+"""Tests for the parallel vs batched review benchmark harness."""
+
+import json
+from unittest.mock import AsyncMock
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from second_brain.review_benchmark import (
+    BENCHMARK_CORPUS,
+    compare_review_modes,
+    format_report,
+    load_corpus,
+    summarize,
+)
+from second_brain.schemas import REVIEW_DIMENSIONS
+
+
+def review_model(parallel_score: int = 9, batched_score: int = 8) -> FunctionModel:
+    """Scores every dimension; batched runs score `batched_score`, per-dimension runs `parallel_score`."""
+
+    def model(messages, info: AgentInfo):
+        tool = info.output_tools[0]
+        if "scores" in tool.parameters_json_schema["properties"]:
+            args = {"scores": [
+                {"dimension": d["name"], "score": batched_score, "status": "pass", "strengths": ["ok"]}
+                for d in REVIEW_DIMENSIONS
+            ]}
+        else:
+            prompt = messages[-1].parts[-1].content
+            name = prompt.split("**")[1]
+            args = {"dimension": name, "score": parallel_score, "status": "pass", "strengths": ["ok"]}
+        return ModelResponse(parts=[ToolCallPart(tool.name, args)])
+
+    return FunctionModel(model)
+
+
+class TestCompareReviewModes:
+    async def test_counts_calls_and_deltas(self, mock_deps):
+        mock_deps.storage_service.add_review_history = AsyncMock()
+        corpus = [{"content": "A short draft about onboarding.", "content_type": ""}]
+
+        comparisons = await compare_review_modes(mock_deps, review_model(), corpus)
+
+        runs = comparisons[0].runs
+        assert runs["parallel"].llm_calls == len(REVIEW_DIMENSIONS)
+        assert runs["batched"].llm_calls == 1
+        assert comparisons[0].score_deltas() == {d["name"]: -1 for d in REVIEW_DIMENSIONS}
+        mock_deps.storage_service.add_review_history.assert_not_awaited()
+
+    async def test_summary_and_report(self, mock_deps):
+        comparisons = await compare_review_modes(mock_deps, review_model(), BENCHMARK_CORPUS[:2])
+        summary = summarize(comparisons)
+
+        assert summary["samples"] == 2
+        assert summary["mean_overall_delta"] == -1.0
+        assert summary["verdict_agreement"] == 1.0
+        assert summary["call_reduction"] == float(len(REVIEW_DIMENSIONS))
+        assert set(summary["mean_abs_delta_by_dimension"].values()) == {1.0}
+
+        report = format_report(comparisons, summary)
+        assert "Batched uses 6.0x fewer LLM calls" in report
+
+    def test_summarize_empty(self):
+        assert summarize([]) == {"samples": 0}
+
+
+def test_load_corpus(tmp_path):
+    path = tmp_path / "drafts.json"
+    path.write_text(json.dumps([
+        {"content": "Draft one", "content_type": "email"},
+        {"content": "Draft two"},
+        {"content": ""},
+    ]))
+
+    assert load_corpus(path) == [
+        {"content": "Draft one", "content_type": "email"},
+        {"content": "Draft two", "content_type": ""},
+    ]
@@ -154,7 +154,8 @@ class TestMemoryService:
     def test_init_cloud(self, mock_mem0_cls, mock_config):
         """MemoryService initializes Mem0 cloud client with API key."""
         service = MemoryService(mock_config)
-        mock_mem0_cls.assert_called_once_with(api_key="test-mem0-key")
+        mock_mem0_cls.assert_called_once()
+        assert mock_mem0_cls.call_args.kwargs["api_key"] == "test-mem0-key"
         assert service.user_id == "ryan"
 
     def test_init_raises_without_api_key(self, tmp_path):
@@ -2478,7 +2479,7 @@ class TestStorageTimeout:
 
 
 class TestMemoryServiceResilience:
-    """Tests for MemoryService retry, timeout, and idle detection."""
+    """Tests for MemoryService retry, timeout, and keep-alive."""
 
     @pytest.fixture
     def mock_config(self, tmp_path):
@@ -2493,32 +2494,37 @@ class TestMemoryServiceResilience:
         )
 
     @patch("mem0.MemoryClient")
-    async def test_idle_detection_triggers_reconnect(self, mock_mem0_cls, mock_config):
-        """After idle threshold, cloud client should be re-instantiated."""
+    async def test_idle_request_keeps_client(self, mock_mem0_cls, mock_config):
+        """After the idle threshold the request is cold, but the client is not rebuilt."""
+        service = MemoryService(mock_config)
+        original_client = service._client
+
+        service._keepalive._last_activity = time.monotonic() - 300  # 5 min ago
+        assert service._keepalive.touch() is True
+        assert service._keepalive.touch() is False
+        assert service._client is original_client
+        service._keepalive.stop()
+
+    @patch("mem0.MemoryClient")
+    async def test_failed_pings_rebuild_client_in_background(self, mock_mem0_cls, mock_config):
+        """Consecutive failed keep-alive pings re-create the client off the request path."""
         client_1 = MagicMock(name="client-1")
+        client_1.client.get.side_effect = ConnectionError("stale")
         client_2 = MagicMock(name="client-2")
         mock_mem0_cls.side_effect = [client_1, client_2]
 
         service = MemoryService(mock_config)
-        assert service._client is client_1
-
-        # Simulate idle period
-        service._last_activity = time.monotonic() - 300  # 5 min ago
-        service._check_idle_reconnect()
+        service._keepalive.interval = 0.01
+        service._keepalive._last_activity = time.monotonic() - 300
+        service._keepalive._ensure_started()
+        for _ in range(100):
+            if service._client is client_2:
+                break
+            await asyncio.sleep(0.01)
+        service._keepalive.stop()
 
-        # Client should have been re-created
         assert service._client is client_2
-
-    @patch("mem0.MemoryClient")
-    async def test_idle_detection_skips_when_recent(self, mock_mem0_cls, mock_config):
-        """Within idle threshold, client should NOT be re-instantiated."""
-        service = MemoryService(mock_config)
-        original_client = service._client
-
-        service._last_activity = time.monotonic() - 10  # 10 sec ago
-        service._check_idle_reconnect()
-
-        assert service._client is original_client
+        assert client_1.client.get.call_count == 2
 
     @patch("mem0.MemoryClient")
     async def test_retry_on_connection_error(self, mock_mem0_cls, mock_config):
@@ -2703,6 +2709,7 @@ class TestMemoryServiceUserOverride:
         config.memory_search_limit = 10
         config.mem0_keyword_search = False
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         svc = MemoryService(config)
@@ -2725,6 +2732,7 @@ class TestMemoryServiceUserOverride:
         config.memory_search_limit = 10
         config.mem0_keyword_search = False
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         svc = MemoryService(config)
@@ -2746,6 +2754,7 @@ class TestMemoryServiceUserOverride:
         config.memory_search_limit = 10
         config.mem0_keyword_search = False
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         svc = MemoryService(config)
@@ -2763,6 +2772,7 @@ class TestMemoryServiceUserOverride:
             config.mem0_api_key = "test-key"
             config.brain_user_id = "brainforge"
             config.service_timeout_seconds = 10
+            config.keepalive_interval_seconds = 0
             config.graph_provider = "none"
             svc = MemoryService(config)
             assert svc._effective_user_id("uttam") == "uttam"
@@ -2785,6 +2795,7 @@ class TestMem0NativeRerank:
         config.mem0_keyword_search = False
         config.mem0_rerank = True
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         service = MemoryService(config)
@@ -2805,6 +2816,7 @@ class TestMem0NativeRerank:
         config.mem0_keyword_search = False
         config.mem0_rerank = False
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         service = MemoryService(config)
@@ -2825,6 +2837,7 @@ class TestMem0NativeRerank:
         config.mem0_keyword_search = False
         config.mem0_rerank = True
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         service = MemoryService(config)
@@ -2846,6 +2859,7 @@ class TestMem0NativeRerank:
         config.mem0_keyword_search = False
         config.mem0_rerank = True  # Default value
         config.service_timeout_seconds = 10
+        config.keepalive_interval_seconds = 0
         config.graph_provider = "none"
 
         service = MemoryService(config)
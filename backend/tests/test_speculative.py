@@ -0,0 +1,100 @@
+"""Tests for speculative memory retrieval during chat routing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from second_brain.agents.speculative import (
+    reset_speculative_recall_stats,
+    speculative_recall_stats,
+    start_speculative_recall,
+)
+from second_brain.services.search_result import SearchResult
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    reset_speculative_recall_stats()
+    yield
+    reset_speculative_recall_stats()
+
+
+def _deps(brain_config, search=None):
+    deps = MagicMock()
+    deps.config = brain_config
+    deps.memory_service.search = search or AsyncMock(return_value=SearchResult(
+        memories=[{"memory": "Pricing is value-based", "score": 0.9}],
+        relations=[{"source": "Pricing", "relationship": "USES", "target": "Tiers"}],
+    ))
+    return deps
+
+
+class TestSpeculativeRecall:
+    async def test_inject_prepends_prefetched_memories(self, brain_config):
+        deps = _deps(brain_config)
+        speculation = start_speculative_recall(deps, "What is my pricing approach?")
+        prompt = await speculation.inject(timeout=5)
+
+        deps.memory_service.search.assert_awaited_once_with(
+            "What is my pricing approach?", limit=brain_config.memory_search_limit,
+        )
+        assert "Pricing is value-based" in prompt
+        assert "Pricing" in prompt and "Tiers" in prompt
+        assert prompt.endswith("Request: What is my pricing approach?")
+        assert speculative_recall_stats()["used"] == 1
+
+    async def test_empty_results_leave_message_unchanged(self, brain_config):
+        deps = _deps(brain_config, search=AsyncMock(return_value=SearchResult()))
+        speculation = start_speculative_recall(deps, "pricing notes")
+        assert await speculation.inject(timeout=5) == "pricing notes"
+
+    async def test_discard_cancels_and_counts_waste(self, brain_config):
+        started = asyncio.Event()
+
+        async def _slow(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(10)
+
+        deps = _deps(brain_config, search=AsyncMock(side_effect=_slow))
+        speculation = start_speculative_recall(deps, "write a post about pricing")
+        await started.wait()
+        speculation.discard()
+        speculation.discard()
+        await asyncio.sleep(0)
+
+        assert speculation._task.cancelled()
+        stats = speculative_recall_stats()
+        assert stats["wasted"] == 1
+        assert stats["waste_ratio"] == 1.0
+
+    async def test_failed_search_falls_back_to_message(self, brain_config):
+        deps = _deps(brain_config, search=AsyncMock(side_effect=ConnectionError("down")))
+        speculation = start_speculative_recall(deps, "pricing notes")
+        assert await speculation.inject(timeout=5) == "pricing notes"
+        assert speculative_recall_stats()["failed"] == 1
+
+    async def test_timeout_falls_back_to_message(self, brain_config):
+        async def _slow(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        deps = _deps(brain_config, search=AsyncMock(side_effect=_slow))
+        speculation = start_speculative_recall(deps, "pricing notes")
+        assert await speculation.inject(timeout=0.01) == "pricing notes"
+        assert speculative_recall_stats()["failed"] == 1
+
+    async def test_not_started_for_small_talk(self, brain_config):
+        assert start_speculative_recall(_deps(brain_config), "thanks!") is None
+
+    async def test_disabled(self, brain_config):
+        brain_config.speculative_recall_enabled = False
+        assert start_speculative_recall(_deps(brain_config), "pricing notes") is None
+
+    async def test_waste_ratio(self, brain_config):
+        deps = _deps(brain_config)
+        for _ in range(3):
+            await start_speculative_recall(deps, "pricing notes").inject(timeout=5)
+        start_speculative_recall(deps, "pricing notes").discard()
+        stats = speculative_recall_stats()
+        assert stats["started"] == 4
+        assert stats["waste_ratio"] == 0.25
@@ -0,0 +1,178 @@
+"""Tests for server-sent event streaming of agent output."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent, ModelRetry
+from pydantic_ai.messages import (
+    ModelResponse,
+    RetryPromptPart,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+from second_brain.api.streaming import (
+    AgentStream,
+    PipelineStream,
+    TextDeltas,
+    partial_output,
+    sse,
+)
+
+
+class Draft(BaseModel):
+    draft: str
+    notes: str = ""
+
+
+def parse_events(raw: str) -> list[tuple[str, object]]:
+    """Split an SSE body into (event, data) pairs."""
+    events = []
+    for block in raw.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def streaming_model(*outputs: str, chunk: int = 8) -> FunctionModel:
+    """A model that streams each output's JSON as final_result args, one run per output."""
+    calls = iter(outputs)
+
+    async def stream(messages, info):
+        text = next(calls)
+        name = info.output_tools[0].name
+        for i in range(0, len(text), chunk):
+            yield {0: DeltaToolCall(name=name if i == 0 else None, json_args=text[i:i + chunk])}
+
+    async def complete(messages, info):
+        text = next(calls)
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, text)])
+
+    return FunctionModel(complete, stream_function=stream)
+
+
+class TestSse:
+    def test_format(self):
+        assert sse("delta", {"text": "hi"}) == 'event: delta\ndata: {"text": "hi"}\n\n'
+
+    def test_round_trip(self):
+        raw = sse("step", {"step": "recall"}) + sse("result", {"result": "done"})
+        assert parse_events(raw) == [("step", {"step": "recall"}), ("result", {"result": "done"})]
+
+
+class TestPartialOutput:
+    def test_parses_incomplete_json(self):
+        response = ModelResponse(parts=[ToolCallPart("final_result", '{"draft": "Hello wor')])
+        assert partial_output(response) == {"draft": "Hello wor"}
+
+    def test_dict_args(self):
+        response = ModelResponse(parts=[ToolCallPart("final_result", {"draft": "x"})])
+        assert partial_output(response) == {"draft": "x"}
+
+    def test_ignores_function_tools_and_text(self):
+        response = ModelResponse(parts=[
+            TextPart("thinking"),
+            ToolCallPart("search_memory", '{"query": "x"}'),
+        ])
+        assert partial_output(response) is None
+
+
+class TestTextDeltas:
+    def test_emits_only_new_text(self):
+        deltas = TextDeltas()
+        assert deltas.events({"draft": "Hel"}) == [sse("delta", {"field": "draft", "text": "Hel"})]
+        assert deltas.events({"draft": "Hello"}) == [sse("delta", {"field": "draft", "text": "lo"})]
+        assert deltas.events({"draft": "Hello"}) == []
+        assert deltas.sent == "Hello"
+
+    def test_picks_first_text_field(self):
+        deltas = TextDeltas()
+        deltas.events({"response": "Great", "tone": "warm"})
+        assert deltas.field == "response"
+
+    def test_waits_for_text_field(self):
+        deltas = TextDeltas()
+        assert deltas.events({}) == []
+        assert deltas.events({"hook_used": 3}) == []
+        assert deltas.field is None
+
+
+class TestAgentStream:
+    async def test_streams_deltas_then_output(self, monkeypatch):
+        monkeypatch.setattr("second_brain.api.streaming.STREAM_DEBOUNCE_SECONDS", None)
+        agent = Agent(output_type=Draft)
+        model = streaming_model('{"draft": "A complete draft about streaming"}')
+        stream = AgentStream(agent, "write", None, model)
+
+        events = parse_events("".join([e async for e in stream.events()]))
+
+        assert len(events) > 1
+        assert {name for name, _ in events} == {"delta"}
+        assert "".join(data["text"] for _, data in events) == "A complete draft about streaming"
+        assert stream.output == Draft(draft="A complete draft about streaming")
+
+    async def test_rejected_output_is_retried_in_the_same_run(self, monkeypatch):
+        monkeypatch.setattr("second_brain.api.streaming.STREAM_DEBOUNCE_SECONDS", None)
+        agent = Agent(output_type=Draft)
+
+        @agent.output_validator
+        async def at_least_three_words(ctx, output: Draft) -> Draft:
+            if len(output.draft.split()) < 3:
+                raise ModelRetry("too short")
+            return output
+
+        outputs = iter(['{"draft": "Too short"}', '{"draft": "Long enough draft now"}'])
+        requests = []
+
+        async def stream(messages, info):
+            requests.append(list(messages))
+            text = next(outputs)
+            yield {0: DeltaToolCall(name=info.output_tools[0].name, json_args=text)}
+
+        async def complete(messages, info):
+            raise AssertionError("the retry must stream, not start a plain run")
+
+        stream = AgentStream(agent, "write", None, FunctionModel(complete, stream_function=stream))
+
+        events = parse_events("".join([e async for e in stream.events()]))
+
+        assert [name for name, _ in events] == ["delta", "reset", "delta"]
+        assert events[-1][1]["text"] == "Long enough draft now"
+        assert stream.output.draft == "Long enough draft now"
+        # Two model requests in one run: the retry carries the rejected answer
+        assert len(requests) == 2
+        retry = requests[1]
+        assert any(isinstance(p, RetryPromptPart) for p in retry[-1].parts)
+        assert [p.content for p in retry[0].parts if isinstance(p, UserPromptPart)] == ["write"]
+        assert sum(isinstance(m, ModelResponse) for m in retry) == 1
+
+
+class TestPipelineStream:
+    async def test_step_events_and_results(self):
+        async def fake_pipeline(steps, initial_prompt, deps, model=None, on_step=None, **kwargs):
+            for i, step in enumerate(steps):
+                on_step({"step": step, "index": i, "total": len(steps), "status": "start"})
+                on_step({"step": step, "index": i, "total": len(steps), "status": "done"})
+            return {"final": "post"}
+
+        with patch("second_brain.agents.utils.run_pipeline", fake_pipeline):
+            stream = PipelineStream(["recall", "create"], "go", None, None)
+            events = parse_events("".join([e async for e in stream.events()]))
+
+        assert [(d["step"], d["status"]) for _, d in events] == [
+            ("recall", "start"), ("recall", "done"), ("create", "start"), ("create", "done"),
+        ]
+        assert stream.results == {"final": "post"}
+
+    async def test_pipeline_error_propagates(self):
+        async def failing_pipeline(steps, initial_prompt, deps, model=None, on_step=None, **kwargs):
+            raise RuntimeError("boom")
+
+        with patch("second_brain.agents.utils.run_pipeline", failing_pipeline):
+            stream = PipelineStream(["recall"], "go", None, None)
+            with pytest.raises(RuntimeError):
+                [e async for e in stream.events()]
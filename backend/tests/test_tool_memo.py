@@ -0,0 +1,127 @@
+"""Tests for run-scoped memoization of read-only agent tools."""
+
+import pytest
+from pydantic_ai import Agent, ModelRetry, RunContext
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from second_brain.agents.tool_memo import clear_tool_memo_stats, run_memoized, tool_memo_stats
+from second_brain.agents.utils import TOOL_ERROR_PREFIX
+from second_brain.deps import BrainDeps
+from second_brain.services.write_generation import bump_write_generation
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    clear_tool_memo_stats()
+    yield
+    clear_tool_memo_stats()
+
+
+def retrying_agent(
+    results: list[str], retries: int = 1, calls: list[dict] | None = None, write_on_retry: bool = False,
+):
+    """An agent whose validator rejects the first `retries` outputs; the model
+    makes a search call (the same one unless `calls` varies) before every answer."""
+    calls = calls or [{"query": "pricing"}]
+    agent = Agent(deps_type=BrainDeps, output_retries=retries + 1)
+    backend_calls = []
+    rejected = []
+
+    @agent.tool
+    @run_memoized
+    async def search_memory(ctx: RunContext[BrainDeps], query: str, limit: int = 5) -> str:
+        """Search memory."""
+        backend_calls.append((query, limit))
+        return results[min(len(backend_calls), len(results)) - 1]
+
+    @agent.output_validator
+    def reject_first(output: str) -> str:
+        if len(rejected) < retries:
+            rejected.append(output)
+            if write_on_retry:
+                bump_write_generation()
+            raise ModelRetry("Cite the sources.")
+        return output
+
+    def model(messages, info: AgentInfo):
+        if not any(isinstance(p, ToolReturnPart) for p in messages[-1].parts):
+            args = calls[len(rejected) % len(calls)]
+            return ModelResponse(parts=[ToolCallPart("search_memory", args)])
+        return ModelResponse(parts=[TextPart(messages[-1].parts[0].content)])
+
+    return agent, FunctionModel(model), backend_calls
+
+
+class TestRunMemoized:
+    async def test_retry_reuses_identical_call(self, mock_deps):
+        agent, model, backend_calls = retrying_agent(["Value-based pricing."], retries=2)
+
+        result = await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert result.output == "Value-based pricing."
+        assert backend_calls == [("pricing", 5)]
+        assert tool_memo_stats()["hits"] == 2
+
+    async def test_defaults_are_normalized(self, mock_deps):
+        agent, model, backend_calls = retrying_agent(
+            ["first"], calls=[{"query": "pricing"}, {"limit": 5, "query": "pricing"}],
+        )
+
+        await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert len(backend_calls) == 1
+
+    async def test_different_args_call_backend(self, mock_deps):
+        agent, model, backend_calls = retrying_agent(
+            ["first", "second"], calls=[{"query": "pricing"}, {"query": "pricing tiers"}],
+        )
+
+        result = await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert result.output == "second"
+        assert len(backend_calls) == 2
+
+    async def test_memo_is_scoped_to_one_run(self, mock_deps):
+        agent, model, backend_calls = retrying_agent(["first", "second"], retries=0)
+
+        await agent.run("How do we price?", deps=mock_deps, model=model)
+        result = await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert result.output == "second"
+        assert len(backend_calls) == 2
+
+    async def test_backend_errors_are_not_reused(self, mock_deps):
+        error = f"{TOOL_ERROR_PREFIX} search_memory unavailable: TimeoutError"
+        agent, model, backend_calls = retrying_agent([error, "recovered"])
+
+        result = await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert result.output == "recovered"
+        assert len(backend_calls) == 2
+        assert tool_memo_stats()["uncached_errors"] == 1
+
+    async def test_brain_write_invalidates(self, mock_deps):
+        agent, model, backend_calls = retrying_agent(["before", "after"], write_on_retry=True)
+
+        result = await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert result.output == "after"
+        assert len(backend_calls) == 2
+
+    async def test_disabled(self, mock_deps):
+        mock_deps.config.tool_memo_enabled = False
+        agent, model, backend_calls = retrying_agent(["first", "second"])
+
+        await agent.run("How do we price?", deps=mock_deps, model=model)
+
+        assert len(backend_calls) == 2
+        assert tool_memo_stats()["misses"] == 0
+
+    def test_preserves_tool_schema(self):
+        from second_brain.agents.recall import recall_agent
+
+        tool = recall_agent._function_toolset.tools["search_semantic_memory"]
+        assert set(tool.function_schema.json_schema["properties"]) == {"query", "voice_user_id"}
+        assert tool.takes_ctx
+        assert "Mem0" in tool.description
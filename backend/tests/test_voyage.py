@@ -128,6 +128,106 @@ class TestVoyageServiceEmbed:
         assert mock_client.multimodal_embed.call_count == 2
 
 
+class TestVoyageBatching:
+    def test_token_batches_respects_item_limit(self):
+        from second_brain.services.voyage import token_batches
+        batches = token_batches(["a"] * 300, max_items=128, max_tokens=1_000_000)
+        assert [len(b) for b in batches] == [128, 128, 44]
+
+    def test_token_batches_respects_token_budget(self):
+        from second_brain.services.voyage import estimate_tokens, token_batches
+        long_text = "x" * 4000  # ~1000 tokens
+        batches = token_batches([long_text] * 5, max_items=128, max_tokens=2 * estimate_tokens(long_text))
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_oversized_input_gets_own_batch(self):
+        from second_brain.services.voyage import token_batches
+        batches = token_batches(["short", "y" * 40_000, "short"], max_items=128, max_tokens=1_000)
+        assert batches == [[0], [1], [2]]
+
+    async def test_partial_failure_keeps_successful_batches(self, mock_voyageai, voyage_config):
+        voyage_config.embedding_batch_size = 2
+        voyage_config.voyage_batch_retries = 0
+        mock_client = MagicMock()
+
+        def _embed(inputs, **kwargs):
+            if inputs[0] == ["bad"]:
+                raise ValueError("boom")
+            result = MagicMock()
+            result.embeddings = [[float(len(t[0]))] for t in inputs]
+            return result
+
+        mock_client.multimodal_embed.side_effect = _embed
+        mock_voyageai.Client.return_value = mock_client
+
+        service = VoyageService(voyage_config)
+        result = await service.embed_batch(["a", "bb", "bad", "x", "ccc"])
+
+        assert result == [[1.0], [2.0], None, None, [3.0]]
+
+    async def test_retries_only_failed_batches(self, mock_voyageai, voyage_config):
+        voyage_config.embedding_batch_size = 1
+        voyage_config.voyage_batch_retries = 1
+        mock_client = MagicMock()
+        calls: list[str] = []
+        failed_once: set[str] = set()
+
+        def _embed(inputs, **kwargs):
+            text = inputs[0][0]
+            calls.append(text)
+            if text == "flaky" and text not in failed_once:
+                failed_once.add(text)
+                raise ValueError("transient")
+            result = MagicMock()
+            result.embeddings = [[1.0]]
+            return result
+
+        mock_client.multimodal_embed.side_effect = _embed
+        mock_voyageai.Client.return_value = mock_client
+
+        service = VoyageService(voyage_config)
+        result = await service.embed_batch(["ok", "flaky", "fine"])
+
+        assert result == [[1.0], [1.0], [1.0]]
+        assert sorted(calls) == ["fine", "flaky", "flaky", "ok"]
+
+    async def test_batches_dispatched_concurrently(self, mock_voyageai, voyage_config):
+        import threading
+        import time
+
+        voyage_config.embedding_batch_size = 1
+        voyage_config.voyage_batch_concurrency = 3
+        mock_client = MagicMock()
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def _embed(inputs, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            result = MagicMock()
+            result.embeddings = [[0.5]]
+            return result
+
+        mock_client.multimodal_embed.side_effect = _embed
+        mock_voyageai.Client.return_value = mock_client
+
+        service = VoyageService(voyage_config)
+        result = await service.embed_batch(["t"] * 6)
+
+        assert result == [[0.5]] * 6
+        assert 1 < peak <= 3
+
+    async def test_empty_input(self, voyage_config):
+        service = VoyageService(voyage_config)
+        assert await service.embed_batch([]) == []
+
+
 class TestVoyageServiceRerank:
     async def test_rerank(self, mock_voyageai, voyage_config):
         mock_client = MagicMock()
@@ -516,6 +616,9 @@ class TestVoyageServiceTimeout:
         config.voyage_rerank_top_k = 5
         config.embedding_dimensions = 1024
         config.embedding_batch_size = 128
+        config.voyage_batch_max_tokens = 100_000
+        config.voyage_batch_concurrency = 4
+        config.voyage_batch_retries = 0
         config.service_timeout_seconds = 0.01  # Very short for tests
         return config
 
@@ -557,8 +660,8 @@ class TestVoyageServiceTimeout:
 
         assert result == []
 
-    async def test_embed_batch_returns_empty_on_timeout(self, timeout_config, mock_voyageai):
-        """embed_batch() returns empty list on timeout."""
+    async def test_embed_batch_returns_none_slots_on_timeout(self, timeout_config, mock_voyageai):
+        """embed_batch() keeps positions and returns None for timed-out inputs."""
         mock_client = MagicMock()
 
         def slow_embed(*args, **kwargs):
@@ -574,7 +677,7 @@ class TestVoyageServiceTimeout:
         service = VoyageService(timeout_config)
         result = await service.embed_batch(["test1", "test2"])
 
-        assert result == []
+        assert result == [None, None]
 
     async def test_multimodal_embed_returns_empty_on_timeout(self, timeout_config, mock_voyageai):
         """multimodal_embed() returns empty list on timeout."""
@@ -0,0 +1,156 @@
+"""Tests for background service warm-up and readiness reporting."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from second_brain.api.main import create_app, lifespan
+from second_brain.deps import BrainDeps
+from second_brain.services.warmup import WarmupState, start_warmup, warm_up
+
+
+def _deps(brain_config, graphiti=None, voyage=None):
+    storage = AsyncMock()
+    storage.get_pattern_registry = AsyncMock(return_value=[])
+    storage.get_memory_content = AsyncMock(return_value=[])
+    deps = BrainDeps(
+        config=brain_config,
+        memory_service=AsyncMock(),
+        storage_service=storage,
+        graphiti_service=graphiti,
+        voyage_service=voyage,
+    )
+    registry = MagicMock()
+    registry.get_all = AsyncMock(return_value={})
+    deps.content_type_registry = registry
+    return deps
+
+
+class TestWarmUp:
+    async def test_warms_configured_services(self, brain_config):
+        graphiti = MagicMock()
+        graphiti.warm_up = AsyncMock(return_value=True)
+        deps = _deps(brain_config, graphiti=graphiti)
+        state = await warm_up(deps)
+        services = state.snapshot()
+        assert services["memory"]["status"] == "ready"
+        assert services["storage"]["status"] == "ready"
+        assert services["caches"]["status"] == "ready"
+        assert services["graphiti"]["status"] == "ready"
+        assert services["voyage"]["status"] == "disabled"
+        assert state.done
+        deps.memory_service.get_memory_count.assert_awaited_once()
+        deps.content_type_registry.get_all.assert_awaited_once()
+        deps.storage_service.get_pattern_registry.assert_awaited_once()
+        graphiti.warm_up.assert_awaited_once()
+
+    async def test_runs_concurrently(self, brain_config):
+        graphiti = MagicMock()
+        voyage = MagicMock()
+
+        async def _slow(*_args):
+            await asyncio.sleep(0.1)
+            return True
+
+        graphiti.warm_up = AsyncMock(side_effect=_slow)
+        voyage.warm_up = AsyncMock(side_effect=_slow)
+        deps = _deps(brain_config, graphiti=graphiti, voyage=voyage)
+        deps.memory_service.get_memory_count = AsyncMock(side_effect=_slow)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await warm_up(deps)
+        assert loop.time() - start < 0.25
+
+    async def test_failures_are_reported_not_raised(self, brain_config):
+        graphiti = MagicMock()
+        graphiti.warm_up = AsyncMock(return_value=False)
+        deps = _deps(brain_config, graphiti=graphiti)
+        deps.memory_service.get_memory_count = AsyncMock(side_effect=ConnectionError("down"))
+        state = await warm_up(deps, prewarm_caches=False)
+        services = state.snapshot()
+        assert services["graphiti"] == {"status": "failed", "seconds": services["graphiti"]["seconds"], "error": "RuntimeError"}
+        assert services["memory"]["error"] == "ConnectionError"
+        assert services["caches"]["status"] == "disabled"
+        assert services["storage"]["status"] == "ready"
+
+    async def test_timeout(self, brain_config):
+        deps = _deps(brain_config)
+
+        async def _hang():
+            await asyncio.sleep(10)
+
+        deps.memory_service.get_memory_count = _hang
+        state = await warm_up(deps, timeout=0.01)
+        assert state.snapshot()["memory"]["error"] == "TimeoutError"
+
+    async def test_start_warmup_runs_in_background(self, brain_config):
+        deps = _deps(brain_config)
+        gate = asyncio.Event()
+
+        async def _blocked():
+            await gate.wait()
+
+        deps.memory_service.get_memory_count = _blocked
+        state = start_warmup(deps)
+        await asyncio.sleep(0)
+        assert not state.done
+        gate.set()
+        await state.task
+        assert state.done
+
+
+class TestGraphitiInitOnce:
+    async def test_concurrent_callers_share_one_initialization(self, brain_config):
+        from second_brain.services.graphiti import GraphitiService
+        service = GraphitiService(brain_config)
+        calls = 0
+
+        async def _initialize():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            service._initialized = True
+
+        with patch.object(service, "_initialize", _initialize):
+            results = await asyncio.gather(service.warm_up(), service._ensure_init())
+        assert calls == 1
+        assert results[0] is True
+
+
+class TestReadiness:
+    def _app(self, brain_config):
+        application = create_app()
+        application.state.deps = _deps(brain_config)
+        application.state.model = MagicMock()
+        return application
+
+    def test_warming_is_not_ready(self, brain_config):
+        application = self._app(brain_config)
+        state = WarmupState()
+        state.set("graphiti", "warming")
+        application.state.warmup = state
+        response = TestClient(application).get("/api/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming"
+        assert response.json()["services"]["graphiti"]["status"] == "warming"
+
+    def test_ready_after_warmup_reports_services(self, brain_config):
+        application = self._app(brain_config)
+        state = WarmupState()
+        state.set("graphiti", "failed", error="RuntimeError")
+        state.set("memory", "ready")
+        application.state.warmup = state
+        response = TestClient(application).get("/api/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert response.json()["services"]["graphiti"]["status"] == "failed"
+
+    async def test_lifespan_starts_warmup(self, brain_config):
+        application = create_app()
+        deps = _deps(brain_config)
+        with patch("second_brain.api.main.create_deps", return_value=deps), \
+                patch("second_brain.api.main.get_model_fn", return_value=MagicMock()):
+            async with lifespan(application):
+                await application.state.warmup.task
+                assert application.state.warmup.snapshot()["memory"]["status"] == "ready"
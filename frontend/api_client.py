@@ -4,7 +4,9 @@ All methods are synchronous — Streamlit's runtime is not async.
 Uses session_state to cache the httpx client instance.
 """
 
+import json
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
@@ -68,6 +70,46 @@ def call_chat(message: str) -> dict[str, Any]:
     return call_agent("/chat", {"message": message})
 
 
+def stream_agent(endpoint: str, payload: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """Call the server-sent events variant (<endpoint>/stream) of an agent endpoint.
+
+    Yields (event, data) pairs as they arrive: routing, step, delta, reset, result.
+    Failures end the stream with ("error", {"error": str, "status_code": int}),
+    the same shape call_agent returns.
+    """
+    client = _get_client()
+    try:
+        with client.stream("POST", f"{endpoint}/stream", json=payload) as response:
+            if response.status_code >= 400:
+                response.read()
+                try:
+                    detail = response.json().get("detail", response.reason_phrase)
+                except Exception:
+                    detail = response.reason_phrase
+                logger.error("Agent stream to %s failed: %s — %s", endpoint, response.status_code, detail)
+                yield "error", {"error": detail, "status_code": response.status_code}
+                return
+            event = None
+            for line in response.iter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: ") and event:
+                    data = json.loads(line[len("data: "):])
+                    if event == "error":
+                        logger.error("Agent stream to %s failed: %s", endpoint, data)
+                        data = {"error": data.get("detail", ""), "status_code": data.get("status_code", 0)}
+                    yield event, data
+                    event = None
+    except httpx.RequestError as e:
+        logger.error("Agent stream to %s connection error: %s", endpoint, e)
+        yield "error", {"error": f"Cannot reach API: {type(e).__name__}", "status_code": 0}
+
+
+def stream_chat(message: str) -> Iterator[tuple[str, Any]]:
+    """Stream a message through the unified /chat endpoint."""
+    return stream_agent("/chat", {"message": message})
+
+
 # --- Memory methods ---
 
 def search_memory(endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -350,10 +392,16 @@ def graph_health() -> dict[str, Any]:
     return response.json()
 
 
-def graph_episodes(group_id: str | None = None) -> dict[str, Any]:
-    """List graph episodes."""
+def graph_episodes(
+    group_id: str | None = None, limit: int | None = None, cursor: str | None = None,
+) -> dict[str, Any]:
+    """List one page of graph episodes. Pass the response's next_cursor as `cursor`."""
     client = _get_client()
-    params = {"group_id": group_id} if group_id else {}
+    params: dict[str, Any] = {"group_id": group_id} if group_id else {}
+    if limit:
+        params["limit"] = limit
+    if cursor:
+        params["cursor"] = cursor
     response = client.get("/graph/episodes", params=params)
     response.raise_for_status()
     return response.json()
@@ -132,6 +132,11 @@ def _format_pipeline(data: dict[str, Any]) -> None:
     else:
         copyable_output(data)
 
+    timings = data.get("timings") or {}
+    if timings.get("steps"):
+        per_step = ", ".join(f"{step} {seconds:.1f}s" for step, seconds in timings["steps"].items())
+        st.caption(f"Steps: {per_step} — total {timings.get('total', 0):.1f}s")
+
 
 def _format_conversational(data: dict[str, Any]) -> None:
     """Format conversational (greeting/small-talk) response."""
@@ -0,0 +1,48 @@
+"""Live rendering of server-sent agent streams (api_client.stream_agent)."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import streamlit as st
+
+_STEP_ICONS = {
+    "start": ":material/progress_activity:",
+    "done": ":material/check_circle:",
+    "error": ":material/error:",
+    "skipped": ":material/skip_next:",
+}
+
+
+def render_stream(events: Iterator[tuple[str, Any]]) -> dict[str, Any]:
+    """Show routing, pipeline steps and text deltas as they arrive.
+
+    Placeholders are cleared once the stream ends so the caller can render
+    the final result with the usual formatters. Returns the `result` payload,
+    or an {"error", "status_code"} dict like call_agent().
+    """
+    status = st.empty()
+    live_text = st.empty()
+    text = ""
+    steps: dict[int, dict[str, Any]] = {}
+    try:
+        for event, data in events:
+            if event == "routing":
+                status.caption(f"Routed to **{data.get('agent', '?')}** — working...")
+            elif event == "step":
+                steps[data["index"]] = data
+                status.markdown("\n".join(
+                    f"- {_STEP_ICONS.get(s['status'], '')} {s['step']} ({s['index'] + 1}/{s['total']})"
+                    for _, s in sorted(steps.items())
+                ))
+            elif event == "delta":
+                text += data.get("text", "")
+                live_text.markdown(text + " ▌")
+            elif event == "reset":
+                text = ""
+                live_text.caption("Revising draft...")
+            elif event in ("result", "error"):
+                return data
+    finally:
+        status.empty()
+        live_text.empty()
+    return {"error": "Stream ended without a result", "status_code": 0}
@@ -19,6 +19,7 @@ API_BASE: str = FASTAPI_URL + "/api"
 # Each agent maps to a POST endpoint. Keys match the API route names.
 # input_field: the field name in the request body schema
 # extra_fields: additional optional fields the agent accepts
+# stream: endpoint has a server-sent events variant at <endpoint>/stream
 AGENTS = {
     "recall": {
         "name": "Recall",
@@ -34,6 +35,7 @@ AGENTS = {
         "icon": ":material/question_answer:",
         "description": "Ask the Second Brain a question",
         "endpoint": "/ask",
+        "stream": True,
         "input_field": "question",
         "input_label": "What's your question?",
         "extra_fields": {},
@@ -54,6 +56,7 @@ AGENTS = {
         "icon": ":material/edit:",
         "description": "Draft content in your voice using brain knowledge",
         "endpoint": "/create",
+        "stream": True,
         "input_field": "prompt",
         "input_label": "What content do you want to create?",
         "extra_fields": {
@@ -115,10 +118,11 @@ AGENTS = {
         "icon": ":material/route:",
         "description": "Run a multi-agent pipeline",
         "endpoint": "/pipeline",
+        "stream": True,
         "input_field": "request",
         "input_label": "Describe what you need (agents will be routed automatically)",
         "extra_fields": {
-            "steps": {"type": "text", "default": "", "label": "Steps (comma-separated, or leave empty for auto-routing)"},
+            "steps": {"type": "text", "default": "", "label": "Steps (comma-separated, step<a+b waits only for a and b; empty = auto-route)"},
         },
     },
     "clarity": {
@@ -6,8 +6,9 @@ from typing import Any
 import streamlit as st
 
 from config import AGENTS, DEFAULT_CONTENT_TYPES, group_content_types_by_category, cos_to_frontend_key
-from api_client import call_agent, call_chat, get_content_types
+from api_client import call_agent, get_content_types, stream_agent, stream_chat
 from components.agent_formatters import format_agent_response
+from components.streaming import render_stream
 
 logger = logging.getLogger(__name__)
 
@@ -205,7 +206,11 @@ if user_input:
         with st.chat_message("assistant"):
             with st.spinner(f"{agent_config['name']} is thinking..."):
                 try:
-                    response = call_agent(agent_config["endpoint"], payload)
+                    if agent_config.get("stream"):
+                        # Render tokens / pipeline steps as they arrive
+                        response = render_stream(stream_agent(agent_config["endpoint"], payload))
+                    else:
+                        response = call_agent(agent_config["endpoint"], payload)
                     if "error" in response:
                         _handle_error(response, history_key)
                     else:
@@ -225,7 +230,8 @@ if user_input:
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
                 try:
-                    response = call_chat(user_input)
+                    # Routing, then tokens / pipeline steps as they arrive
+                    response = render_stream(stream_chat(user_input))
                     if "error" in response:
                         _handle_error(response, history_key)
                     else:
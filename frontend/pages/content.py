@@ -6,6 +6,7 @@ from typing import Any
 import streamlit as st
 
 from components.copy_button import copyable_text
+from components.streaming import render_stream
 from config import group_content_types_by_category, KNOWLEDGE_CATEGORIES
 import api_client
 
@@ -153,7 +154,11 @@ with tab_create:
                         payload["user_id"] = voice_user_id
                     if selected_template_body:
                         payload["structure_hint"] = selected_template_body
-                    result = api_client.call_agent("/create", payload)
+                    # Draft renders token by token, then the full result below
+                    result = render_stream(api_client.stream_agent("/create", payload))
+                    if "status_code" in result:
+                        st.error(f"Content creation failed: {result['error']}")
+                        st.stop()
 
                     # Store draft for review tab
                     st.session_state["last_draft"] = result
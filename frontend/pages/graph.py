@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 from components.copy_button import copyable_text
 from components.graph_utils import relationships_to_graph
 
+_EPISODE_PAGE_SIZE = 50
+
 st.title("Knowledge Graph")
 
 # Check graph availability
@@ -120,38 +122,53 @@ with tab_episodes:
 
     group_id = st.text_input("Filter by group ID (optional)", key="ep_group")
 
-    if st.button("Load Episodes", type="primary"):
+    def _load_episode_page(cursor: str | None = None) -> None:
         with st.spinner("Loading episodes..."):
             try:
-                result = graph_episodes(group_id=group_id or None)
-                episodes = result.get("episodes", [])
-                count = result.get("count", 0)
-
-                st.subheader(f"{count} episodes")
-
-                if episodes:
-                    for i, ep in enumerate(episodes):
-                        content = ep.get("content", "No content")
-                        ep_id = ep.get("id", f"Episode {i+1}")
-                        source = ep.get("source", "unknown")
-                        created = ep.get("created_at", "")
-
-                        title = content[:80] + ("..." if len(content) > 80 else "")
-                        with st.expander(f"{title}", expanded=i < 3):
-                            st.markdown(content)
-                            copyable_text(content)
-
-                            meta_cols = st.columns(3)
-                            with meta_cols[0]:
-                                st.caption(f"**ID**: `{ep_id[:12]}...`")
-                            with meta_cols[1]:
-                                st.caption(f"**Source**: {source}")
-                            with meta_cols[2]:
-                                if created:
-                                    st.caption(f"**Created**: {str(created)[:10]}")
-                else:
-                    st.info("No episodes found. Ingest some content first.")
-
+                result = graph_episodes(
+                    group_id=group_id or None, limit=_EPISODE_PAGE_SIZE, cursor=cursor,
+                )
             except Exception:
                 logger.exception("Failed to load episodes")
                 st.error("Failed to load episodes. Please try again.")
+                return
+        st.session_state["ep_pages"].extend(result.get("episodes", []))
+        st.session_state["ep_cursor"] = result.get("next_cursor")
+
+    if st.button("Load Episodes", type="primary"):
+        st.session_state["ep_pages"] = []
+        st.session_state["ep_cursor"] = None
+        _load_episode_page()
+
+    if "ep_pages" in st.session_state:
+        episodes = st.session_state["ep_pages"]
+        more = st.session_state.get("ep_cursor") is not None
+
+        st.subheader(f"{len(episodes)}{'+' if more else ''} episodes")
+
+        if episodes:
+            for i, ep in enumerate(episodes):
+                content = ep.get("content", "No content")
+                ep_id = ep.get("id", f"Episode {i+1}")
+                source = ep.get("source", "unknown")
+                created = ep.get("created_at", "")
+
+                title = content[:80] + ("..." if len(content) > 80 else "")
+                with st.expander(f"{title}", expanded=i < 3):
+                    st.markdown(content)
+                    copyable_text(content)
+
+                    meta_cols = st.columns(3)
+                    with meta_cols[0]:
+                        st.caption(f"**ID**: `{ep_id[:12]}...`")
+                    with meta_cols[1]:
+                        st.caption(f"**Source**: {source}")
+                    with meta_cols[2]:
+                        if created:
+                            st.caption(f"**Created**: {str(created)[:10]}")
+
+            if more and st.button("Load more"):
+                _load_episode_page(st.session_state["ep_cursor"])
+                st.rerun()
+        else:
+            st.info("No episodes found. Ingest some content first.")
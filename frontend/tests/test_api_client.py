@@ -70,6 +70,55 @@ class TestCallAgent:
         assert "status_code" in result
 
 
+class TestStreamAgent:
+    """Tests for stream_agent()."""
+
+    @staticmethod
+    def _stream(mock_client, status_code: int, content: bytes) -> None:
+        response = httpx.Response(
+            status_code, content=content, request=httpx.Request("POST", "http://test"),
+        )
+        mock_client.stream.return_value.__enter__.return_value = response
+
+    def test_yields_events_in_order(self, mock_client):
+        self._stream(mock_client, 200, (
+            b'event: delta\ndata: {"field": "draft", "text": "Hel"}\n\n'
+            b'event: delta\ndata: {"field": "draft", "text": "lo"}\n\n'
+            b'event: result\ndata: {"draft": "Hello"}\n\n'
+        ))
+
+        from api_client import stream_agent
+        events = list(stream_agent("/create", {"prompt": "x"}))
+
+        mock_client.stream.assert_called_once_with("POST", "/create/stream", json={"prompt": "x"})
+        assert events == [
+            ("delta", {"field": "draft", "text": "Hel"}),
+            ("delta", {"field": "draft", "text": "lo"}),
+            ("result", {"draft": "Hello"}),
+        ]
+
+    def test_error_event_uses_call_agent_shape(self, mock_client):
+        self._stream(mock_client, 200, b'event: error\ndata: {"status_code": 504, "detail": "timed out"}\n\n')
+
+        from api_client import stream_agent
+        assert list(stream_agent("/ask", {})) == [("error", {"error": "timed out", "status_code": 504})]
+
+    def test_http_error_before_stream(self, mock_client):
+        self._stream(mock_client, 400, b'{"detail": "Unknown content type"}')
+
+        from api_client import stream_agent
+        assert list(stream_agent("/create", {})) == [
+            ("error", {"error": "Unknown content type", "status_code": 400}),
+        ]
+
+    def test_connection_error(self, mock_client):
+        mock_client.stream.side_effect = httpx.ConnectError("Connection refused")
+
+        from api_client import stream_agent
+        events = list(stream_agent("/chat", {"message": "hi"}))
+        assert events == [("error", {"error": "Cannot reach API: ConnectError", "status_code": 0})]
+
+
 class TestSearchMemory:
     """Tests for search_memory()."""
 
@@ -312,6 +361,15 @@ class TestGraphEndpoints:
         graph_episodes()
         mock_client.get.assert_called_once_with("/graph/episodes", params={})
 
+    def test_graph_episodes_next_page(self, mock_client):
+        mock_client.get.return_value = make_response(200, {"episodes": [], "next_cursor": None})
+
+        from api_client import graph_episodes
+        graph_episodes(limit=50, cursor="cur-1")
+        mock_client.get.assert_called_once_with(
+            "/graph/episodes", params={"limit": 50, "cursor": "cur-1"},
+        )
+
 
 class TestSettingsEndpoints:
     """Tests for settings-related functions."""